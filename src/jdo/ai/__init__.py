@@ -1,84 +1,205 @@
-"""AI agent module for JDO."""
+"""AI agent module for JDO.
+
+Names are re-exported lazily, so importing a light submodule such as
+jdo.ai.time_parsing does not load pydantic_ai.
+"""
 
 from __future__ import annotations
 
-from jdo.ai.agent import (
-    SYSTEM_PROMPT_TEMPLATE,
-    JDODependencies,
-    create_agent,
-    create_agent_with_model,
-    get_agent_system_prompt,
-    get_model_identifier,
-)
-from jdo.ai.context import (
-    MAX_CONTEXT_MESSAGES,
-    build_context,
-    format_conversation,
-    format_message,
-    get_system_prompt,
-    stream_response,
-)
-from jdo.ai.dates import (
-    DEFAULT_TIME,
-    ParseError,
-    VagueDateError,
-    parse_date,
-    parse_datetime,
-    parse_time,
-)
-from jdo.ai.extraction import (
-    MILESTONE_EXTRACTION_PROMPT,
-    MILESTONE_LINKAGE_PROMPT,
-    SUGGEST_METRICS_PROMPT,
-    SUGGEST_MILESTONES_PROMPT,
-    VISION_EXTRACTION_PROMPT,
-    VISION_LINKAGE_PROMPT,
-    ExtractedCommitment,
-    ExtractedGoal,
-    ExtractedMilestone,
-    ExtractedTask,
-    ExtractedVision,
-    create_extraction_agent,
-    extract_commitment,
-    extract_goal,
-    extract_milestone,
-    extract_task,
-    extract_vision,
-    get_missing_fields,
-)
-from jdo.ai.triage import (
-    CLASSIFIABLE_TYPES,
-    CONFIDENCE_THRESHOLD,
-    ClarifyingQuestion,
-    TriageAnalysis,
-    TriageClassification,
-    classify_triage_item,
-    classify_triage_item_async,
+from typing import TYPE_CHECKING
+
+from jdo.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from jdo.ai.agent import (
+        SYSTEM_PROMPT,
+        JDODependencies,
+        create_agent,
+        create_agent_with_model,
+        get_agent_system_prompt,
+        get_current_context,
+        get_model_identifier,
+    )
+    from jdo.ai.capacity import Bucket, CapacityForecast, forecast_capacity
+    from jdo.ai.context import (
+        INTERRUPTED_MARKER,
+        MAX_CONTEXT_MESSAGES,
+        build_context,
+        format_conversation,
+        format_message,
+        get_system_prompt,
+        interrupted_messages,
+        mark_interrupted,
+        stream_response,
+    )
+    from jdo.ai.dates import (
+        DEFAULT_TIME,
+        ParseError,
+        VagueDateError,
+        parse_date,
+        parse_datetime,
+        parse_time,
+    )
+    from jdo.ai.extraction import (
+        MILESTONE_EXTRACTION_PROMPT,
+        MILESTONE_LINKAGE_PROMPT,
+        PLAN_EXTRACTION_PROMPT,
+        SUGGEST_METRICS_PROMPT,
+        SUGGEST_MILESTONES_PROMPT,
+        VISION_EXTRACTION_PROMPT,
+        VISION_LINKAGE_PROMPT,
+        ExtractedCommitment,
+        ExtractedGoal,
+        ExtractedMilestone,
+        ExtractedPlan,
+        ExtractedPlanCommitment,
+        ExtractedPlanTask,
+        ExtractedTask,
+        ExtractedVision,
+        LinkCandidate,
+        create_extraction_agent,
+        extract_commitment,
+        extract_goal,
+        extract_milestone,
+        extract_plan,
+        extract_task,
+        extract_vision,
+        get_missing_fields,
+    )
+    from jdo.ai.scheduler import (
+        Priority,
+        QueueMetrics,
+        RateBudget,
+        background_priority,
+        scheduler_metrics,
+    )
+    from jdo.ai.summary import summarize_history
+    from jdo.ai.triage import (
+        CLASSIFIABLE_TYPES,
+        CONFIDENCE_THRESHOLD,
+        ClarifyingQuestion,
+        TriageAnalysis,
+        TriageClassification,
+        classify_triage_item,
+        classify_triage_item_async,
+    )
+    from jdo.ai.usage import PromptCacheStats
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "jdo.ai.agent": (
+            "SYSTEM_PROMPT",
+            "JDODependencies",
+            "create_agent",
+            "create_agent_with_model",
+            "get_agent_system_prompt",
+            "get_current_context",
+            "get_model_identifier",
+        ),
+        "jdo.ai.capacity": ("Bucket", "CapacityForecast", "forecast_capacity"),
+        "jdo.ai.context": (
+            "INTERRUPTED_MARKER",
+            "MAX_CONTEXT_MESSAGES",
+            "build_context",
+            "format_conversation",
+            "format_message",
+            "get_system_prompt",
+            "interrupted_messages",
+            "mark_interrupted",
+            "stream_response",
+        ),
+        "jdo.ai.dates": (
+            "DEFAULT_TIME",
+            "ParseError",
+            "VagueDateError",
+            "parse_date",
+            "parse_datetime",
+            "parse_time",
+        ),
+        "jdo.ai.extraction": (
+            "MILESTONE_EXTRACTION_PROMPT",
+            "MILESTONE_LINKAGE_PROMPT",
+            "PLAN_EXTRACTION_PROMPT",
+            "SUGGEST_METRICS_PROMPT",
+            "SUGGEST_MILESTONES_PROMPT",
+            "VISION_EXTRACTION_PROMPT",
+            "VISION_LINKAGE_PROMPT",
+            "ExtractedCommitment",
+            "ExtractedGoal",
+            "ExtractedMilestone",
+            "ExtractedPlan",
+            "ExtractedPlanCommitment",
+            "ExtractedPlanTask",
+            "ExtractedTask",
+            "ExtractedVision",
+            "LinkCandidate",
+            "create_extraction_agent",
+            "extract_commitment",
+            "extract_goal",
+            "extract_milestone",
+            "extract_plan",
+            "extract_task",
+            "extract_vision",
+            "get_missing_fields",
+        ),
+        "jdo.ai.scheduler": (
+            "Priority",
+            "QueueMetrics",
+            "RateBudget",
+            "background_priority",
+            "scheduler_metrics",
+        ),
+        "jdo.ai.summary": ("summarize_history",),
+        "jdo.ai.triage": (
+            "CLASSIFIABLE_TYPES",
+            "CONFIDENCE_THRESHOLD",
+            "ClarifyingQuestion",
+            "TriageAnalysis",
+            "TriageClassification",
+            "classify_triage_item",
+            "classify_triage_item_async",
+        ),
+        "jdo.ai.usage": ("PromptCacheStats",),
+    },
 )
 
 __all__ = [
     "CLASSIFIABLE_TYPES",
     "CONFIDENCE_THRESHOLD",
     "DEFAULT_TIME",
+    "INTERRUPTED_MARKER",
     "MAX_CONTEXT_MESSAGES",
     "MILESTONE_EXTRACTION_PROMPT",
     "MILESTONE_LINKAGE_PROMPT",
+    "PLAN_EXTRACTION_PROMPT",
     "SUGGEST_METRICS_PROMPT",
     "SUGGEST_MILESTONES_PROMPT",
-    "SYSTEM_PROMPT_TEMPLATE",
+    "SYSTEM_PROMPT",
     "VISION_EXTRACTION_PROMPT",
     "VISION_LINKAGE_PROMPT",
+    "Bucket",
+    "CapacityForecast",
     "ClarifyingQuestion",
     "ExtractedCommitment",
     "ExtractedGoal",
     "ExtractedMilestone",
+    "ExtractedPlan",
+    "ExtractedPlanCommitment",
+    "ExtractedPlanTask",
     "ExtractedTask",
     "ExtractedVision",
     "JDODependencies",
+    "LinkCandidate",
     "ParseError",
+    "Priority",
+    "PromptCacheStats",
+    "QueueMetrics",
+    "RateBudget",
     "TriageAnalysis",
     "TriageClassification",
     "VagueDateError",
+    "background_priority",
     "build_context",
     "classify_triage_item",
     "classify_triage_item_async",
@@ -88,16 +209,23 @@ __all__ = [
     "extract_commitment",
     "extract_goal",
     "extract_milestone",
+    "extract_plan",
     "extract_task",
     "extract_vision",
+    "forecast_capacity",
     "format_conversation",
     "format_message",
     "get_agent_system_prompt",
+    "get_current_context",
     "get_missing_fields",
     "get_model_identifier",
     "get_system_prompt",
+    "interrupted_messages",
+    "mark_interrupted",
     "parse_date",
     "parse_datetime",
     "parse_time",
+    "scheduler_metrics",
     "stream_response",
+    "summarize_history",
 ]
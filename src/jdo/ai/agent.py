@@ -1,41 +1,47 @@
-"""PydanticAI agent configuration for commitment management assistance."""
+"""PydanticAI agent configuration for commitment management assistance.
+
+PydanticAI and the provider SDKs are imported by the factory functions, so
+the REPL can import this module (and build JDODependencies) before the agent
+exists.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
 
 from loguru import logger
-from pydantic_ai import Agent
-from pydantic_ai.models import Model
-from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.models.openrouter import OpenRouterModel
-from pydantic_ai.providers.openai import OpenAIProvider
-from pydantic_ai.providers.openrouter import OpenRouterProvider
 from sqlmodel import Session
 
+from jdo.ai.tool_output import IdAliases
 from jdo.auth.api import get_credentials
 from jdo.config import get_settings
+from jdo.db.staging import StagedMutations
 from jdo.exceptions import (
+    AuthError,
+    ConfigError,
     InvalidCredentialsError,
     MissingCredentialsError,
     UnsupportedProviderError,
 )
-from jdo.utils.datetime import DEFAULT_TIMEZONE
+from jdo.utils.datetime import DEFAULT_TIMEZONE, utc_now
+
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+    from pydantic_ai.models import Model
+
+    from jdo.ai.routing import Route
 
 MIN_API_KEY_LENGTH = 10
 
-# System prompt for the commitment integrity coach
-SYSTEM_PROMPT_TEMPLATE = """\
+# System prompt for the commitment integrity coach.
+# Kept free of per-turn data so the provider can cache it as a stable prefix;
+# volatile values go in CURRENT_CONTEXT_TEMPLATE, sent after the conversation.
+SYSTEM_PROMPT = """\
 You are a commitment integrity coach for JDO. Your primary goal is to help users maintain \
 their integrity by keeping commitments and being honest about their capacity.
 
-## Current Context
-- **Today's date**: {current_date}
-- **Current time**: {current_time}
-- **Day of week**: {day_of_week}
-
-Use this to interpret relative dates like "Friday", "end of the week", "next Monday", etc.
-
 ## Core Principles
 1. **Integrity over productivity** - It's better to make fewer commitments and keep them all than \
 to over-commit and fail.
@@ -45,10 +51,19 @@ to over-commit and fail.
 ## Available Tools
 You have access to tools to query the user's context. Use them proactively:
 - `query_user_time_context` - Check available hours and current allocation
+- `query_capacity_forecast` - See committed hours per week for the coming weeks
 - `query_task_history` - Review past estimation accuracy and patterns
 - `query_commitment_time_rollup` - See time breakdown for commitments
 - `query_integrity_with_context` - Get integrity grade and coaching areas
 
+Each message ends with a User State Snapshot (active commitments, overdue items, capacity, \
+integrity grade). Answer from it when you can; use the tools for details it doesn't cover.
+
+List tools return compact tables: a `|`-separated header row, then one row per item. Items \
+are identified by short ids like `c3` (commitment) or `g1` (goal); pass these ids back to \
+other tools as-is. When a table ends with "N more", narrow the query with the listed filters \
+instead of asking for everything.
+
 ## Confirmation Flow (MANDATORY)
 
 Before ANY action that creates, updates, or deletes data, you MUST:
@@ -127,19 +142,46 @@ how to execute the work itself.
 - Recording tasks the user identifies (do not suggest tasks)
 - Tracking progress and status
 - Surfacing capacity conflicts when they exist
-- Reflecting the user's own words back in a structured way"""
+- Reflecting the user's own words back in a structured way
+- Interpreting relative dates ("Friday", "next Monday") using the Current Context block \
+attached to the latest message"""
+
+# Volatile per-turn context, appended after the user's message
+CURRENT_CONTEXT_HEADING = "## Current Context"
+CURRENT_CONTEXT_TEMPLATE = """\
+## Current Context
+- **Today's date**: {current_date}
+- **Current time**: {current_time}
+- **Day of week**: {day_of_week}
+
+Use this to interpret relative dates like "Friday", "end of the week", "next Monday", etc."""
 
 
 def get_agent_system_prompt() -> str:
-    """Generate the agent system prompt with current date/time context.
+    """Get the static agent system prompt.
+
+    The prompt is byte-identical across turns and sessions so providers can
+    serve it from their prompt cache. Date/time context is supplied per run
+    via get_current_context().
 
     Returns:
-        System prompt with current date/time injected.
+        The agent system prompt.
     """
-    from jdo.utils.datetime import utc_now
+    return SYSTEM_PROMPT
+
+
+def get_current_context(now: datetime | None = None) -> str:
+    """Render the volatile date/time context for the current turn.
+
+    Args:
+        now: Moment to describe (defaults to the current UTC time).
 
-    now = utc_now()
-    return SYSTEM_PROMPT_TEMPLATE.format(
+    Returns:
+        Current Context block to send after the user's message.
+    """
+    if now is None:
+        now = utc_now()
+    return CURRENT_CONTEXT_TEMPLATE.format(
         current_date=now.strftime("%Y-%m-%d"),
         current_time=now.strftime("%H:%M"),
         day_of_week=now.strftime("%A"),
@@ -152,9 +194,11 @@ class JDODependencies:
 
     Provides access to database session factory and user context.
 
-    Note: Tools should use `get_session()` to create their own sessions rather than
-    sharing a single session, because PydanticAI runs tools concurrently in separate
-    threads and SQLAlchemy sessions are not thread-safe.
+    Note: Query tools should use `get_session()` to create their own sessions rather
+    than sharing a single session, because PydanticAI runs tools concurrently in
+    separate threads and SQLAlchemy sessions are not thread-safe. Mutation tools
+    write through `mutations`, which serializes them and removes the rows a
+    cancelled run created.
     """
 
     session: Session
@@ -162,6 +206,10 @@ class JDODependencies:
     # User's available hours remaining for today (session-scoped, not persisted)
     # None means the user hasn't set it this session
     available_hours_remaining: float | None = None
+    # Short ids (c1, g2) shown to the model in tool output, mapped back to UUIDs
+    id_aliases: IdAliases = field(default_factory=IdAliases)
+    # Writes made by mutation tools during the current run (rolled back on cancel)
+    mutations: StagedMutations = field(default_factory=StagedMutations)
 
     def set_available_hours(self, hours: float) -> None:
         """Set the user's available hours remaining.
@@ -211,6 +259,8 @@ def create_agent_with_model(
     Returns:
         A configured Agent instance with tools registered.
     """
+    from pydantic_ai import Agent
+
     agent = Agent(
         model,
         deps_type=JDODependencies,
@@ -224,22 +274,29 @@ def create_agent_with_model(
     return agent
 
 
-def create_agent() -> Agent[JDODependencies, str]:
-    """Create a PydanticAI agent configured for commitment tracking.
+def _create_provider_model(provider_id: str, model_name: str) -> Model:
+    """Create the model for one provider, checking its credentials.
+
+    Requests go through the provider's rate-limit scheduler.
+
+    Args:
+        provider_id: AI provider ("openai" or "openrouter").
+        model_name: Model name at that provider.
 
     Returns:
-        A configured Agent instance with tools registered.
+        The provider's model.
 
     Raises:
-        MissingCredentialsError: No credentials configured for the AI provider.
+        MissingCredentialsError: No credentials configured for the provider.
         InvalidCredentialsError: Credentials have invalid format.
         UnsupportedProviderError: Provider is not supported.
     """
-    settings = get_settings()
-    provider_id = settings.ai_provider
-    model_name = settings.ai_model
+    from pydantic_ai.models.openai import OpenAIChatModel
+    from pydantic_ai.models.openrouter import OpenRouterModel
+    from pydantic_ai.providers.openai import OpenAIProvider
+    from pydantic_ai.providers.openrouter import OpenRouterProvider
 
-    logger.debug("Creating agent with provider: {}", provider_id)
+    from jdo.ai.scheduler import scheduled_model
 
     creds = get_credentials(provider_id)
     if creds is None:
@@ -252,14 +309,71 @@ def create_agent() -> Agent[JDODependencies, str]:
         logger.error("Invalid credential format for provider: {}", provider_id)
         raise InvalidCredentialsError(provider_id)
 
+    model: Model
     if provider_id == "openrouter":
-        provider = OpenRouterProvider(api_key=creds.api_key)
-        model: Model = OpenRouterModel(model_name, provider=provider)
+        model = OpenRouterModel(model_name, provider=OpenRouterProvider(api_key=creds.api_key))
     elif provider_id == "openai":
-        provider = OpenAIProvider(api_key=creds.api_key)
-        model = OpenAIChatModel(model_name, provider=provider)
+        model = OpenAIChatModel(model_name, provider=OpenAIProvider(api_key=creds.api_key))
     else:
         logger.error("Unsupported AI provider: {}", provider_id)
         raise UnsupportedProviderError(provider_id)
+    return scheduled_model(model, provider_id)
+
+
+def _create_fallback_routes(specs: list[str]) -> list[Route]:
+    """Create routes for the configured fallback models.
+
+    Fallbacks that are malformed or lack credentials are skipped with a
+    warning rather than failing startup.
+
+    Args:
+        specs: "provider:model" strings from settings.ai_fallback_models.
+
+    Returns:
+        One route per usable fallback.
+    """
+    from jdo.ai.routing import Route
+
+    routes = []
+    for spec in specs:
+        provider_id, _, model_name = spec.partition(":")
+        if not model_name:
+            logger.warning("Ignoring AI fallback model without a provider: {}", spec)
+            continue
+        try:
+            routes.append(Route(spec, _create_provider_model(provider_id, model_name)))
+        except (AuthError, ConfigError) as e:
+            logger.warning("Ignoring AI fallback model {}: {}", spec, e)
+    return routes
+
+
+def create_agent() -> Agent[JDODependencies, str]:
+    """Create a PydanticAI agent configured for commitment tracking.
+
+    With fallback models configured, requests are routed to the fastest
+    healthy provider (see jdo.ai.routing).
+
+    Returns:
+        A configured Agent instance with tools registered.
+
+    Raises:
+        MissingCredentialsError: No credentials configured for the AI provider.
+        InvalidCredentialsError: Credentials have invalid format.
+        UnsupportedProviderError: Provider is not supported.
+    """
+    from jdo.ai.routing import ModelRouter, Route, RoutedModel
+
+    settings = get_settings()
+    provider_id = settings.ai_provider
+    model_name = settings.ai_model
+
+    logger.debug("Creating agent with provider: {}", provider_id)
+
+    model = _create_provider_model(provider_id, model_name)
+    fallbacks = _create_fallback_routes(settings.ai_fallback_models)
+    if fallbacks:
+        primary = Route(f"{provider_id}:{model_name}", model)
+        router = ModelRouter([primary, *fallbacks], hedge=settings.ai_hedge_requests)
+        model = RoutedModel(router)
 
     return create_agent_with_model(model)
@@ -0,0 +1,194 @@
+"""Parallel extraction for multi-item pasted input.
+
+A meeting's worth of action items is split into items and every item is
+extracted concurrently (bounded by a semaphore, each with its own timeout)
+instead of one model round trip at a time. Top-level items become
+commitments; items indented beneath one become its tasks. The results are
+turned into a single plan draft so they can be confirmed and saved together.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel
+from pydantic_ai.models import Model
+
+from jdo.ai.extraction import (
+    ExtractedCommitment,
+    ExtractedTask,
+    extract_commitment,
+    extract_task,
+)
+from jdo.ai.scheduler import background_priority
+
+# Default number of extractions in flight at once
+DEFAULT_BATCH_CONCURRENCY = 4
+
+# Default timeout for a single item's extraction
+DEFAULT_BATCH_ITEM_TIMEOUT_SECONDS = 60.0
+
+# Leading list markers: "-", "*", "•", "1.", "2)", "[ ]", "[x]"
+_BULLET_PATTERN = re.compile(r"^(?:[-*•]|\d+[.)]|\[[ xX]?\])\s*")
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """One item split from pasted input.
+
+    Attributes:
+        text: Item text without list markers.
+        parent: Index of the commitment item this task belongs to, or None
+            for a top-level (commitment) item.
+    """
+
+    text: str
+    parent: int | None = None
+
+    @property
+    def is_task(self) -> bool:
+        """Whether the item is a task under a commitment."""
+        return self.parent is not None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Extraction outcome for one batch item.
+
+    Attributes:
+        item: The source item.
+        output: Extracted commitment or task, or None if extraction failed.
+        error: Why extraction failed, if it did.
+    """
+
+    item: BatchItem
+    output: ExtractedCommitment | ExtractedTask | None = None
+    error: str | None = None
+
+
+def split_batch_items(text: str) -> list[BatchItem]:
+    """Split pasted input into commitment and task items.
+
+    Each non-empty line is an item; list markers are stripped. Lines indented
+    deeper than the preceding top-level line are tasks of that line. A
+    single line is split on semicolons instead.
+
+    Args:
+        text: Pasted input.
+
+    Returns:
+        Items in input order.
+    """
+    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
+    if len(lines) == 1:
+        lines = [part for part in lines[0].split(";") if part.strip()]
+
+    items: list[BatchItem] = []
+    parent: int | None = None
+    parent_indent = 0
+    for line in lines:
+        indent = len(line) - len(line.lstrip())
+        content = _BULLET_PATTERN.sub("", line.strip()).strip()
+        if not content:
+            continue
+        if parent is not None and indent > parent_indent:
+            items.append(BatchItem(text=content, parent=parent))
+        else:
+            parent = len(items)
+            parent_indent = indent
+            items.append(BatchItem(text=content))
+    return items
+
+
+async def _extract_item(
+    item: BatchItem,
+    model: Model | str,
+    semaphore: asyncio.Semaphore,
+    item_timeout: float,
+) -> BatchResult:
+    """Extract one item, turning failures into an error result."""
+    messages = [{"role": "user", "content": item.text}]
+    extract = extract_task if item.is_task else extract_commitment
+    async with semaphore:
+        try:
+            async with asyncio.timeout(item_timeout):
+                output: BaseModel = await extract(messages, model)
+        except TimeoutError:
+            logger.warning(f"Batch extraction timed out: {item.text!r}")
+            return BatchResult(item=item, error="timed out")
+        except Exception as e:
+            logger.warning(f"Batch extraction failed for {item.text!r}: {e}")
+            return BatchResult(item=item, error=str(e) or type(e).__name__)
+    return BatchResult(item=item, output=output)  # type: ignore[arg-type]
+
+
+async def extract_batch(
+    items: list[BatchItem],
+    model: Model | str = "test",
+    *,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    item_timeout: float = DEFAULT_BATCH_ITEM_TIMEOUT_SECONDS,
+) -> list[BatchResult]:
+    """Extract all items concurrently.
+
+    At most ``concurrency`` extractions run at once. An item that fails or
+    exceeds ``item_timeout`` gets an error result; the others are unaffected.
+    The requests run at background priority so a bulk import cannot take the
+    whole rate budget from interactive chat.
+
+    Args:
+        items: Items from split_batch_items().
+        model: Model to use for extraction.
+        concurrency: Maximum extractions in flight.
+        item_timeout: Timeout in seconds for each item.
+
+    Returns:
+        One result per item, in item order.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    with background_priority():
+        results = await asyncio.gather(
+            *(_extract_item(item, model, semaphore, item_timeout) for item in items)
+        )
+    failed = sum(1 for r in results if r.error)
+    logger.info(f"Batch extraction: {len(results) - failed} extracted, {failed} failed")
+    return list(results)
+
+
+def batch_to_plan_data(results: list[BatchResult]) -> tuple[dict[str, Any], list[BatchResult]]:
+    """Build a plan draft from batch results.
+
+    Tasks are attached to their commitment; tasks whose commitment failed
+    are reported as failures too.
+
+    Args:
+        results: Results from extract_batch().
+
+    Returns:
+        Tuple of (plan draft for PersistenceService.save_plan(), failed results).
+    """
+    commitments: dict[int, dict[str, Any]] = {}
+    failures: list[BatchResult] = []
+    for index, result in enumerate(results):
+        output = result.output
+        if isinstance(output, ExtractedCommitment):
+            commitments[index] = {
+                "deliverable": output.deliverable,
+                "stakeholder": output.stakeholder_name,
+                "due_date": output.due_date.isoformat(),
+                "due_time": output.due_time.isoformat() if output.due_time else None,
+                "tasks": [],
+            }
+        elif isinstance(output, ExtractedTask) and result.item.parent in commitments:
+            commitments[result.item.parent]["tasks"].append(
+                {"title": output.title, "scope": output.scope}
+            )
+        elif output is not None:
+            failures.append(BatchResult(item=result.item, error="commitment not extracted"))
+        else:
+            failures.append(result)
+    return {"commitments": list(commitments.values()), "recurring_commitments": []}, failures
@@ -0,0 +1,271 @@
+"""Forward capacity forecast over a planning horizon.
+
+Buckets the estimated hours the user has committed to by day or week over a
+horizon (eight weeks by default). The forecast has two sources:
+
+- Committed: open tasks of active commitments, summed in SQL and grouped by
+  the commitment's due date. Overdue work lands in the first bucket.
+- Projected: occurrences of active recurring commitments that have not been
+  generated yet, each costed at the template's per-instance estimate.
+
+Series are ``array('d')`` columns, one value per bucket, so capacity views
+and the agent's over-allocation checks work on flat float arrays.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import date, timedelta
+from enum import Enum
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlmodel import Session, col, select
+
+from jdo.models.commitment import Commitment, CommitmentStatus
+from jdo.models.recurring_commitment import RecurringCommitment, RecurringCommitmentStatus
+from jdo.models.task import Task, TaskStatus
+from jdo.recurrence.rule import compile_rule
+from jdo.utils.datetime import today_date
+
+DEFAULT_HORIZON_DAYS = 56
+
+ACTIVE_COMMITMENT_STATUSES = (
+    CommitmentStatus.PENDING,
+    CommitmentStatus.IN_PROGRESS,
+    CommitmentStatus.AT_RISK,
+)
+
+OPEN_TASK_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+
+
+class Bucket(str, Enum):
+    """Width of a forecast bucket."""
+
+    DAY = "day"
+    WEEK = "week"
+
+    @property
+    def days(self) -> int:
+        """Number of days in one bucket."""
+        return 7 if self == Bucket.WEEK else 1
+
+
+@dataclass(frozen=True)
+class CapacityForecast:
+    """Estimated hours per bucket over a planning horizon.
+
+    Attributes:
+        start: First day of the first bucket.
+        bucket: Bucket width.
+        committed_hours: Hours from open tasks of existing commitments.
+        projected_hours: Hours from recurring occurrences not generated yet.
+        tasks_without_estimates: Open tasks in the horizon with no estimate.
+        unestimated_occurrences: Projected occurrences of templates with no
+            estimate to go on.
+    """
+
+    start: date
+    bucket: Bucket
+    committed_hours: array[float]
+    projected_hours: array[float]
+    tasks_without_estimates: int = 0
+    unestimated_occurrences: int = 0
+
+    def __len__(self) -> int:
+        """Number of buckets."""
+        return len(self.committed_hours)
+
+    @property
+    def bucket_starts(self) -> list[date]:
+        """First day of each bucket."""
+        step = self.bucket.days
+        return [self.start + timedelta(days=i * step) for i in range(len(self))]
+
+    @property
+    def total_hours(self) -> array[float]:
+        """Committed plus projected hours per bucket."""
+        return array("d", map(sum, zip(self.committed_hours, self.projected_hours, strict=True)))
+
+    def over_allocated(self, hours_per_day: float) -> list[int]:
+        """Indexes of buckets whose load exceeds the user's capacity.
+
+        Args:
+            hours_per_day: Hours the user can work per day.
+
+        Returns:
+            Bucket indexes, in order.
+        """
+        limit = hours_per_day * self.bucket.days
+        return [i for i, hours in enumerate(self.total_hours) if hours > limit]
+
+
+def _bucket_index(day: date, start: date, bucket: Bucket, size: int) -> int | None:
+    """Bucket holding a day (overdue days go to the first), or None past the horizon."""
+    index = max(0, (day - start).days // bucket.days)
+    return index if index < size else None
+
+
+def _committed_by_due_date(session: Session, end: date) -> list[tuple[date, float, int]]:
+    """Open task hours of active commitments due by ``end``, grouped by due date.
+
+    Returns:
+        Rows of (due date, estimated hours, tasks without estimates).
+    """
+    estimate = col(Task.estimated_hours)
+    statement = (
+        select(
+            Commitment.due_date,
+            func.coalesce(func.sum(estimate), 0.0),
+            func.count(col(Task.id)) - func.count(estimate),
+        )
+        .join(Commitment, col(Task.commitment_id) == col(Commitment.id))
+        .where(
+            col(Commitment.status).in_(ACTIVE_COMMITMENT_STATUSES),
+            col(Task.status).in_(OPEN_TASK_STATUSES),
+            col(Commitment.due_date) <= end,
+        )
+        .group_by(col(Commitment.due_date))
+    )
+    return [(row[0], float(row[1]), int(row[2])) for row in session.exec(statement)]
+
+
+def _template_estimate(recurring: RecurringCommitment) -> float | None:
+    """Hours from ``estimated_hours`` keys on the task templates, if any are set."""
+    estimates = [
+        float(template["estimated_hours"])
+        for template in recurring.task_templates
+        if template.get("estimated_hours") is not None
+    ]
+    return sum(estimates) if estimates else None
+
+
+def _instance_estimates(session: Session, recurring_ids: list[UUID]) -> dict[UUID, float]:
+    """Average estimated hours per generated instance, by recurring commitment.
+
+    Templates rarely carry estimates, so the hours the user put on past
+    instances are the best guess for future ones.
+    """
+    if not recurring_ids:
+        return {}
+    recurring_id = col(Commitment.recurring_commitment_id)
+    statement = (
+        select(
+            recurring_id,
+            func.sum(col(Task.estimated_hours)) / func.count(func.distinct(col(Commitment.id))),
+        )
+        .join(Task, col(Task.commitment_id) == col(Commitment.id))
+        .where(recurring_id.in_(recurring_ids), col(Task.estimated_hours).is_not(None))
+        .group_by(recurring_id)
+    )
+    return {row[0]: float(row[1]) for row in session.exec(statement) if row[1] is not None}
+
+
+def _projected_occurrences(recurring: RecurringCommitment, start: date, end: date) -> list[date]:
+    """Occurrences from start to end that the template has not generated yet."""
+    first = start
+    if recurring.last_generated_date is not None:
+        first = max(first, recurring.last_generated_date + timedelta(days=1))
+    return compile_rule(recurring).occurrences_between(
+        first, end, already_generated=recurring.instances_generated
+    )
+
+
+def forecast_capacity(
+    session: Session,
+    *,
+    start: date | None = None,
+    horizon_days: int = DEFAULT_HORIZON_DAYS,
+    bucket: Bucket = Bucket.WEEK,
+) -> CapacityForecast:
+    """Forecast allocated estimated hours per day or week.
+
+    Args:
+        session: Database session.
+        start: First day of the horizon (defaults to today).
+        horizon_days: Days to cover; rounded up to whole buckets.
+        bucket: Bucket width.
+
+    Returns:
+        The forecast.
+    """
+    start = start or today_date()
+    size = max(1, -(-horizon_days // bucket.days))
+    end = start + timedelta(days=size * bucket.days - 1)
+    committed = array("d", [0.0]) * size
+    projected = array("d", [0.0]) * size
+
+    without_estimates = 0
+    for due, hours, missing in _committed_by_due_date(session, end):
+        index = _bucket_index(due, start, bucket, size)
+        if index is not None:
+            committed[index] += hours
+            without_estimates += missing
+
+    templates = session.exec(
+        select(RecurringCommitment).where(
+            RecurringCommitment.status == RecurringCommitmentStatus.ACTIVE
+        )
+    ).all()
+    history = _instance_estimates(session, [recurring.id for recurring in templates])
+    unestimated = 0
+    for recurring in templates:
+        occurrences = _projected_occurrences(recurring, start, end)
+        hours = _template_estimate(recurring)
+        if hours is None:
+            hours = history.get(recurring.id)
+        if hours is None:
+            unestimated += len(occurrences)
+            continue
+        for day in occurrences:
+            index = _bucket_index(day, start, bucket, size)
+            if index is not None:
+                projected[index] += hours
+
+    return CapacityForecast(
+        start=start,
+        bucket=bucket,
+        committed_hours=committed,
+        projected_hours=projected,
+        tasks_without_estimates=without_estimates,
+        unestimated_occurrences=unestimated,
+    )
+
+
+def format_forecast_for_ai(forecast: CapacityForecast, hours_per_day: float | None = None) -> str:
+    """Format a forecast as a compact table for AI consumption.
+
+    Args:
+        forecast: The forecast to format.
+        hours_per_day: The user's daily capacity, used to flag over-allocated
+            buckets (omit when unknown).
+
+    Returns:
+        One line per bucket plus a summary of over-allocated buckets.
+    """
+    over = set(forecast.over_allocated(hours_per_day)) if hours_per_day is not None else set()
+    lines = [f"{forecast.bucket.value} | committed | projected | total"]
+    rows = zip(
+        forecast.bucket_starts,
+        forecast.committed_hours,
+        forecast.projected_hours,
+        forecast.total_hours,
+        strict=True,
+    )
+    for index, (starts, committed, projected, total) in enumerate(rows):
+        flag = " OVER" if index in over else ""
+        lines.append(
+            f"{starts.isoformat()} | {committed:.1f} | {projected:.1f} | {total:.1f}{flag}"
+        )
+    if hours_per_day is not None:
+        limit = hours_per_day * forecast.bucket.days
+        if over:
+            lines.append(f"Over-allocated {forecast.bucket.value}s (>{limit:.1f}h): {len(over)}")
+        else:
+            lines.append(f"No {forecast.bucket.value} exceeds {limit:.1f}h")
+    if forecast.tasks_without_estimates:
+        lines.append(f"Tasks missing estimates: {forecast.tasks_without_estimates}")
+    if forecast.unestimated_occurrences:
+        lines.append(f"Recurring occurrences without estimates: {forecast.unestimated_occurrences}")
+    return "\n".join(lines)
@@ -7,10 +7,18 @@ for the JDO conversational interface.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator
-
-from pydantic_ai import Agent
-from pydantic_ai.messages import ModelRequest, ModelResponse
+import dataclasses
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import aclosing
+
+from pydantic_ai import Agent, AgentRun
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    UserPromptPart,
+)
 
 from jdo.ai.agent import JDODependencies
 from jdo.ai.timeout import AI_STREAM_TIMEOUT_SECONDS
@@ -18,6 +26,9 @@ from jdo.ai.timeout import AI_STREAM_TIMEOUT_SECONDS
 # Maximum number of messages to include in context (excluding system prompt)
 MAX_CONTEXT_MESSAGES = 50
 
+# Appended to a response the user interrupted, so the model knows it was cut off
+INTERRUPTED_MARKER = "[Response interrupted by the user]"
+
 # System prompt for the JDO conversational AI
 JDO_SYSTEM_PROMPT = """\
 You are JDO, a commitment tracking assistant that helps users manage their promises.
@@ -133,6 +144,80 @@ def build_context(
     return formatted
 
 
+def mark_interrupted(text: str) -> str:
+    """Mark a partial response as interrupted for the conversation history.
+
+    Args:
+        text: The text streamed before the interruption (may be empty).
+
+    Returns:
+        The text followed by INTERRUPTED_MARKER.
+    """
+    return f"{text.rstrip()}\n\n{INTERRUPTED_MARKER}" if text.strip() else INTERRUPTED_MARKER
+
+
+def interrupted_messages(
+    run_messages: Sequence[ModelMessage], partial_text: str
+) -> list[ModelMessage]:
+    """Reduce an interrupted run to its prompt and the partial response.
+
+    Tool calls and returns are dropped (their writes were rolled back, and a
+    call without its return is not valid history), keeping only the run's
+    first request (the user prompt, with the system prompt on the first run).
+
+    Args:
+        run_messages: Messages the run produced before it was cancelled.
+        partial_text: Text streamed before the interruption.
+
+    Returns:
+        Messages to append to the native history (empty if the run had not
+        started).
+    """
+    if not run_messages or not isinstance(run_messages[0], ModelRequest):
+        return []
+    return [
+        run_messages[0],
+        ModelResponse(parts=[TextPart(content=mark_interrupted(partial_text))]),
+    ]
+
+
+def strip_turn_context(messages: Sequence[ModelMessage], context: str) -> list[ModelMessage]:
+    """Remove the per-turn context from a run's user prompt before storing it.
+
+    The context (date, time, user snapshot) is only current for the request
+    it was sent with. Storing it would resend every earlier snapshot on each
+    later turn, so stored history keeps just the user's own prompt and only
+    the newest request carries a snapshot.
+
+    Args:
+        messages: Messages produced by the run.
+        context: The context that was appended to the prompt.
+
+    Returns:
+        The messages with the context removed from user prompt parts.
+    """
+    result: list[ModelMessage] = []
+    for message in messages:
+        if isinstance(message, ModelRequest):
+            parts = [
+                dataclasses.replace(part, content=_without_context(part.content, context))
+                if isinstance(part, UserPromptPart) and not isinstance(part.content, str)
+                else part
+                for part in message.parts
+            ]
+            message = dataclasses.replace(message, parts=parts)  # noqa: PLW2901
+        result.append(message)
+    return result
+
+
+def _without_context(content: Sequence[object], context: str) -> str | list[object]:
+    """Drop the context item from multi-part prompt content."""
+    kept = [item for item in content if item != context]
+    if len(kept) == 1 and isinstance(kept[0], str):
+        return kept[0]
+    return kept
+
+
 def _convert_to_model_messages(
     messages: list[dict[str, str]],
 ) -> list[ModelRequest | ModelResponse]:
@@ -144,8 +229,6 @@ def _convert_to_model_messages(
     Returns:
         List of ModelRequest (user) or ModelResponse (assistant) objects.
     """
-    from pydantic_ai.messages import TextPart, UserPromptPart
-
     result: list[ModelRequest | ModelResponse] = []
     for msg in messages:
         role = msg["role"]
@@ -160,11 +243,40 @@ def _convert_to_model_messages(
     return result
 
 
+async def _stream_run_text(run: AgentRun[JDODependencies, str]) -> AsyncIterator[str]:
+    """Yield the text streamed by each model request of an agent run.
+
+    Args:
+        run: The run opened with ``agent.iter()``.
+
+    Yields:
+        Text chunks as they arrive from the AI.
+    """
+    from pydantic_graph import End
+
+    async for node in run:
+        # Check if this is a model request node (where we can stream text)
+        if Agent.is_model_request_node(node):
+            # Stream text from this node
+            async with node.stream(run.ctx) as request_stream:
+                async for chunk in request_stream.stream_text(delta=True):
+                    yield chunk
+        elif isinstance(node, End):
+            # Run complete - no more output
+            pass
+        # Other node types (UserPromptNode, CallToolsNode) don't produce
+        # streamable text output - they handle tool execution internally
+
+
 async def stream_response(
     agent: Agent[JDODependencies, str],
     prompt: str,
     deps: JDODependencies,
     message_history: list[dict[str, str]] | None = None,
+    *,
+    model_history: Sequence[ModelMessage] | None = None,
+    on_complete: Callable[[list[ModelMessage]], None] | None = None,
+    context: str | None = None,
 ) -> AsyncIterator[str]:
     """Stream AI response chunks, properly handling tool calls.
 
@@ -172,39 +284,71 @@ async def stream_response(
     tool calls and streams all text output including responses generated after
     tool execution.
 
+    When ``model_history`` is provided it is passed to the agent as-is, so
+    tool-call and tool-return parts from earlier turns are preserved and no
+    per-turn conversion is needed. ``message_history`` dicts are only converted
+    when no native history is given.
+
+    Volatile ``context`` (date, time, user snapshot) is sent after the prompt in
+    the final user message, so the system prompt and earlier turns form a
+    byte-identical prefix that providers can serve from their prompt cache.
+    It is stripped from the messages passed to ``on_complete`` (see
+    strip_turn_context()).
+
     Args:
         agent: The PydanticAI agent to use.
         prompt: The user's prompt.
         deps: Agent dependencies including database session.
         message_history: Optional conversation history for multi-turn context.
+        model_history: Optional native PydanticAI history (takes precedence).
+        on_complete: Called with the messages produced by this run once the
+            run finishes, so callers can append them to their native history.
+        context: Optional per-turn context appended after the prompt.
 
     Yields:
         Text chunks as they arrive from the AI.
 
+    Rows created by mutation tools are recorded in ``deps.mutations``. If the
+    stream is cancelled (the user interrupted it) or fails, they are deleted
+    again, and an interrupted run is passed to ``on_complete`` as the prompt
+    plus the partial text (see interrupted_messages()).
+
     Raises:
         TimeoutError: If streaming exceeds timeout.
+        asyncio.CancelledError: If the consuming task is cancelled.
     """
-    from pydantic_graph import End
-
-    # Convert message history to PydanticAI format if provided
-    model_history = None
-    if message_history:
-        model_history = _convert_to_model_messages(message_history)
-
-    # Wrap entire stream with timeout
-    async with asyncio.timeout(AI_STREAM_TIMEOUT_SECONDS):
-        # Use agent.iter() for proper handling of tool calls during streaming
-        # This ensures we get all text output including responses after tool execution
-        async with agent.iter(prompt, deps=deps, message_history=model_history) as run:
-            async for node in run:
-                # Check if this is a model request node (where we can stream text)
-                if Agent.is_model_request_node(node):
-                    # Stream text from this node
-                    async with node.stream(run.ctx) as request_stream:
-                        async for chunk in request_stream.stream_text(delta=True):
+    history: Sequence[ModelMessage] | None = None
+    if model_history is not None:
+        history = model_history or None
+    elif message_history:
+        # Fall back to converting simple dict history (loses tool call parts)
+        history = _convert_to_model_messages(message_history)
+
+    user_prompt: str | list[str] = [prompt, context] if context else prompt
+    streamed: list[str] = []
+
+    def complete(messages: Sequence[ModelMessage]) -> None:
+        if on_complete is not None:
+            on_complete(strip_turn_context(messages, context) if context else list(messages))
+
+    try:
+        # Wrap entire stream with timeout
+        async with asyncio.timeout(AI_STREAM_TIMEOUT_SECONDS):
+            # Use agent.iter() for proper handling of tool calls during streaming
+            # This ensures we get all text output including responses after tool execution
+            async with agent.iter(user_prompt, deps=deps, message_history=history) as run:
+                try:
+                    async with aclosing(_stream_run_text(run)) as chunks:
+                        async for chunk in chunks:
+                            streamed.append(chunk)
                             yield chunk
-                elif isinstance(node, End):
-                    # Run complete - no more output
-                    pass
-                # Other node types (UserPromptNode, CallToolsNode) don't produce
-                # streamable text output - they handle tool execution internally
+                except asyncio.CancelledError:
+                    complete(interrupted_messages(run.new_messages(), "".join(streamed)))
+                    raise
+
+                deps.mutations.commit()
+                complete(run.new_messages())
+    except BaseException:
+        # Cancelled, timed out or failed: nothing the run's tools wrote survives
+        deps.mutations.rollback()
+        raise
@@ -5,8 +5,11 @@ Uses PydanticAI structured output to extract fields from natural language.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import date, time
 from typing import Any
+from uuid import UUID
 
 from pydantic import BaseModel, Field, model_validator
 from pydantic_ai import Agent
@@ -15,9 +18,13 @@ from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.models.openrouter import OpenRouterModel
 from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.providers.openrouter import OpenRouterProvider
+from pydantic_ai.usage import RunUsage
 
+from jdo.ai.agent import get_current_context
 from jdo.ai.context import get_system_prompt
+from jdo.ai.scheduler import scheduled_model
 from jdo.ai.timeout import AI_TIMEOUT_SECONDS, with_ai_timeout
+from jdo.ai.usage import log_cache_usage
 from jdo.auth.api import get_credentials
 from jdo.config import get_settings
 
@@ -124,6 +131,20 @@ Common patterns to recognize:
 Be specific about the recurrence pattern.
 """
 
+PLAN_EXTRACTION_PROMPT = """\
+Extract the user's whole plan from the conversation in one pass:
+- commitments: each one-off promise (deliverable, stakeholder_name, due_date,
+  due_time if stated) with the concrete tasks the user named for it
+- recurring_commitments: promises that repeat, using the same recurrence rules
+  as single recurring extraction (daily/weekly/monthly/yearly, days_of_week
+  0=Monday..6=Sunday, interval for "every other", week_of_month 5 for "last")
+
+Only include tasks the user actually stated; do not invent steps.
+A "Link candidates" table may follow the conversation. Set goal_id or
+milestone_id on a commitment only by copying a key from that table when the
+commitment clearly contributes to it; otherwise leave them empty.
+"""
+
 
 class ExtractedCommitment(BaseModel):
     """Extracted commitment fields from conversation."""
@@ -269,9 +290,92 @@ class ExtractedRecurringCommitment(BaseModel):
             raise ValueError(msg)
 
 
+class ExtractedPlanTask(BaseModel):
+    """A task named for a commitment within an extracted plan."""
+
+    title: str = Field(description="A clear title for the task")
+    scope: str | None = Field(default=None, description="What specifically needs to be done")
+    estimated_hours: float | None = Field(
+        default=None, description="Estimated hours if the user gave one"
+    )
+
+
+class ExtractedPlanCommitment(ExtractedCommitment):
+    """A commitment within an extracted plan, with its tasks and links."""
+
+    tasks: list[ExtractedPlanTask] = Field(
+        default_factory=list, description="Tasks the user named for this commitment"
+    )
+    goal_id: str | None = Field(
+        default=None, description="Key of a goal from the link candidates (e.g. g1)"
+    )
+    milestone_id: str | None = Field(
+        default=None, description="Key of a milestone from the link candidates (e.g. m1)"
+    )
+
+
+class ExtractedPlan(BaseModel):
+    """A full entity graph extracted from conversation in a single call."""
+
+    commitments: list[ExtractedPlanCommitment] = Field(
+        default_factory=list, description="One-off commitments with their tasks"
+    )
+    recurring_commitments: list[ExtractedRecurringCommitment] = Field(
+        default_factory=list, description="Commitments that repeat on a schedule"
+    )
+
+    def to_draft_data(self) -> dict[str, Any]:
+        """Convert to the draft dict accepted by PersistenceService.save_plan().
+
+        Link fields must already be resolved to entity ids (see extract_plan).
+
+        Returns:
+            Plan draft data.
+        """
+        return {
+            "commitments": [
+                {
+                    "deliverable": c.deliverable,
+                    "stakeholder": c.stakeholder_name,
+                    "due_date": c.due_date.isoformat(),
+                    "due_time": c.due_time.isoformat() if c.due_time else None,
+                    "goal_id": c.goal_id,
+                    "milestone_id": c.milestone_id,
+                    "tasks": [t.model_dump() for t in c.tasks],
+                }
+                for c in self.commitments
+            ],
+            "recurring_commitments": [
+                {**r.model_dump(mode="json"), "recurrence_type": r.recurrence_type.lower()}
+                for r in self.recurring_commitments
+            ],
+        }
+
+
+@dataclass(frozen=True)
+class LinkCandidate:
+    """An existing goal or milestone the plan's commitments may link to.
+
+    Attributes:
+        key: Short key shown to the model (e.g. g1, m2).
+        kind: "goal" or "milestone".
+        entity_id: The entity UUID.
+        title: Entity title.
+        goal_id: For milestones, the parent goal UUID.
+    """
+
+    key: str
+    kind: str
+    entity_id: UUID
+    title: str
+    goal_id: UUID | None = None
+
+
 def _create_model_with_credentials() -> Model:
     """Create a PydanticAI model with credentials from settings.
 
+    Requests go through the provider's rate-limit scheduler.
+
     Returns:
         A configured Model instance.
 
@@ -287,14 +391,15 @@ def _create_model_with_credentials() -> Model:
         msg = f"No credentials found for provider: {provider_id}"
         raise ValueError(msg)
 
+    model: Model
     if provider_id == "openrouter":
-        provider = OpenRouterProvider(api_key=creds.api_key)
-        return OpenRouterModel(model_name, provider=provider)
-    if provider_id == "openai":
-        provider = OpenAIProvider(api_key=creds.api_key)
-        return OpenAIChatModel(model_name, provider=provider)
-    msg = f"Unsupported AI provider: {provider_id}"
-    raise ValueError(msg)
+        model = OpenRouterModel(model_name, provider=OpenRouterProvider(api_key=creds.api_key))
+    elif provider_id == "openai":
+        model = OpenAIChatModel(model_name, provider=OpenAIProvider(api_key=creds.api_key))
+    else:
+        msg = f"Unsupported AI provider: {provider_id}"
+        raise ValueError(msg)
+    return scheduled_model(model, provider_id)
 
 
 def create_extraction_agent(
@@ -317,6 +422,9 @@ def create_extraction_agent(
     if isinstance(model, str) and model != "test":
         model = _create_model_with_credentials()
 
+    # Static shared prefix + static schema guidance: identical for every call of a
+    # given extraction type, so providers can cache it. Per-call data (today's date,
+    # the conversation) goes in the user message instead.
     system_prompt = f"{get_system_prompt()}\n\n{extraction_prompt}"
 
     return Agent(
@@ -343,6 +451,40 @@ def _format_conversation_for_extraction(messages: list[dict[str, str]]) -> str:
     return "\n\n".join(parts)
 
 
+async def _run_extraction(
+    agent: Agent[None, BaseModel],
+    messages: list[dict[str, str]],
+    extra: Sequence[str] = (),
+    usage: RunUsage | None = None,
+) -> BaseModel:
+    """Run an extraction agent over a conversation.
+
+    The conversation is followed by any extra per-call sections and then the
+    current date/time context, so relative dates resolve correctly without
+    making the system prompt volatile.
+
+    Args:
+        agent: Agent from create_extraction_agent().
+        messages: Conversation history.
+        extra: Additional per-call prompt sections.
+        usage: Optional usage object the run's token counts are added to.
+
+    Returns:
+        The extracted model instance.
+
+    Raises:
+        TimeoutError: If AI call exceeds timeout.
+    """
+    conversation = _format_conversation_for_extraction(messages)
+    result = await with_ai_timeout(
+        agent.run([conversation, *extra, get_current_context()], usage=usage),
+        AI_TIMEOUT_SECONDS,
+    )
+    label = getattr(agent.output_type, "__name__", "output")
+    log_cache_usage(f"extract {label}", result.usage)
+    return result.output
+
+
 async def extract_commitment(
     messages: list[dict[str, str]],
     model: Model | str = "test",
@@ -360,10 +502,7 @@ async def extract_commitment(
         TimeoutError: If AI call exceeds timeout.
     """
     agent = create_extraction_agent(model, ExtractedCommitment, COMMITMENT_EXTRACTION_PROMPT)
-    conversation = _format_conversation_for_extraction(messages)
-
-    result = await with_ai_timeout(agent.run(conversation), AI_TIMEOUT_SECONDS)
-    return result.output  # type: ignore[return-value]
+    return await _run_extraction(agent, messages)  # type: ignore[return-value]
 
 
 async def extract_goal(
@@ -383,10 +522,7 @@ async def extract_goal(
         TimeoutError: If AI call exceeds timeout.
     """
     agent = create_extraction_agent(model, ExtractedGoal, GOAL_EXTRACTION_PROMPT)
-    conversation = _format_conversation_for_extraction(messages)
-
-    result = await with_ai_timeout(agent.run(conversation), AI_TIMEOUT_SECONDS)
-    return result.output  # type: ignore[return-value]
+    return await _run_extraction(agent, messages)  # type: ignore[return-value]
 
 
 async def extract_task(
@@ -406,10 +542,7 @@ async def extract_task(
         TimeoutError: If AI call exceeds timeout.
     """
     agent = create_extraction_agent(model, ExtractedTask, TASK_EXTRACTION_PROMPT)
-    conversation = _format_conversation_for_extraction(messages)
-
-    result = await with_ai_timeout(agent.run(conversation), AI_TIMEOUT_SECONDS)
-    return result.output  # type: ignore[return-value]
+    return await _run_extraction(agent, messages)  # type: ignore[return-value]
 
 
 async def extract_vision(
@@ -429,10 +562,7 @@ async def extract_vision(
         TimeoutError: If AI call exceeds timeout.
     """
     agent = create_extraction_agent(model, ExtractedVision, VISION_EXTRACTION_PROMPT)
-    conversation = _format_conversation_for_extraction(messages)
-
-    result = await with_ai_timeout(agent.run(conversation), AI_TIMEOUT_SECONDS)
-    return result.output  # type: ignore[return-value]
+    return await _run_extraction(agent, messages)  # type: ignore[return-value]
 
 
 async def extract_milestone(
@@ -452,10 +582,7 @@ async def extract_milestone(
         TimeoutError: If AI call exceeds timeout.
     """
     agent = create_extraction_agent(model, ExtractedMilestone, MILESTONE_EXTRACTION_PROMPT)
-    conversation = _format_conversation_for_extraction(messages)
-
-    result = await with_ai_timeout(agent.run(conversation), AI_TIMEOUT_SECONDS)
-    return result.output  # type: ignore[return-value]
+    return await _run_extraction(agent, messages)  # type: ignore[return-value]
 
 
 async def extract_recurring_commitment(
@@ -477,10 +604,68 @@ async def extract_recurring_commitment(
     agent = create_extraction_agent(
         model, ExtractedRecurringCommitment, RECURRING_COMMITMENT_EXTRACTION_PROMPT
     )
-    conversation = _format_conversation_for_extraction(messages)
+    return await _run_extraction(agent, messages)  # type: ignore[return-value]
+
+
+def _format_link_candidates(candidates: Sequence[LinkCandidate]) -> str:
+    """Render link candidates as a compact table for the plan prompt."""
+    lines = ["Link candidates:", "key|kind|title"]
+    lines.extend(f"{c.key}|{c.kind}|{c.title}" for c in candidates)
+    return "\n".join(lines)
+
 
-    result = await with_ai_timeout(agent.run(conversation), AI_TIMEOUT_SECONDS)
-    return result.output  # type: ignore[return-value]
+def _resolve_plan_links(plan: ExtractedPlan, candidates: Sequence[LinkCandidate]) -> None:
+    """Replace candidate keys on plan commitments with entity ids.
+
+    Unknown keys are dropped. A milestone link implies its parent goal.
+
+    Args:
+        plan: Extracted plan, modified in place.
+        candidates: Candidates offered to the model.
+    """
+    by_key = {c.key.lower(): c for c in candidates}
+    for commitment in plan.commitments:
+        goal = by_key.get((commitment.goal_id or "").strip().lower())
+        milestone = by_key.get((commitment.milestone_id or "").strip().lower())
+        goal_id = goal.entity_id if goal and goal.kind == "goal" else None
+        milestone_id = None
+        if milestone and milestone.kind == "milestone":
+            milestone_id = milestone.entity_id
+            goal_id = milestone.goal_id or goal_id
+        commitment.goal_id = str(goal_id) if goal_id else None
+        commitment.milestone_id = str(milestone_id) if milestone_id else None
+
+
+async def extract_plan(
+    messages: list[dict[str, str]],
+    model: Model | str = "test",
+    *,
+    link_candidates: Sequence[LinkCandidate] = (),
+    usage: RunUsage | None = None,
+) -> ExtractedPlan:
+    """Extract a whole plan (commitments, tasks, links, recurrences) in one call.
+
+    Replaces a chain of per-entity extractions with a single structured call.
+    Existing goals and milestones are offered as short keys; links the model
+    picks are resolved back to entity ids on the returned plan.
+
+    Args:
+        messages: Conversation history.
+        model: Model to use for extraction.
+        link_candidates: Goals and milestones commitments may link to.
+        usage: Optional usage object the call's token counts are added to.
+
+    Returns:
+        ExtractedPlan with goal_id/milestone_id holding entity ids (or None).
+
+    Raises:
+        TimeoutError: If AI call exceeds timeout.
+    """
+    agent = create_extraction_agent(model, ExtractedPlan, PLAN_EXTRACTION_PROMPT)
+    extra = [_format_link_candidates(link_candidates)] if link_candidates else []
+    plan: ExtractedPlan = await _run_extraction(agent, messages, extra, usage)  # type: ignore[assignment]
+    _resolve_plan_links(plan, link_candidates)
+    return plan
 
 
 def get_missing_fields(
@@ -0,0 +1,137 @@
+"""Local pre-ranking of goal and milestone link candidates.
+
+Rather than offering every active goal and milestone to the plan extraction
+call, candidates are ranked locally with BM25 against the user's text. Only
+the top few are sent; when one match clearly wins it is resolved outright
+and nothing is sent at all.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from sqlmodel import Session, select
+
+from jdo.ai.extraction import ExtractedPlan, LinkCandidate
+from jdo.models.goal import Goal, GoalStatus
+from jdo.models.milestone import Milestone, MilestoneStatus
+from jdo.utils.ranking import BM25Index, RankedMatch, is_unambiguous
+
+# Maximum goals and milestones (each) offered to the model
+LINK_CANDIDATE_LIMIT = 5
+
+OPEN_MILESTONE_STATUSES = (MilestoneStatus.PENDING, MilestoneStatus.IN_PROGRESS)
+
+# Indexes are kept across calls and synced with the current entities, so only
+# goals and milestones that changed since the last call are re-tokenized.
+_goal_index = BM25Index()
+_milestone_index = BM25Index()
+
+
+@dataclass(frozen=True)
+class LinkSelection:
+    """Link candidates chosen for one plan extraction.
+
+    Attributes:
+        candidates: Candidates to offer the model, best first.
+        resolved: Candidate matched unambiguously; when set, no candidates
+            are offered and the link is applied after extraction.
+    """
+
+    candidates: list[LinkCandidate] = field(default_factory=list)
+    resolved: LinkCandidate | None = None
+
+
+def _goal_text(goal: Goal) -> str:
+    return f"{goal.title} {goal.problem_statement} {goal.solution_vision}"
+
+
+def _milestone_text(milestone: Milestone, goal: Goal) -> str:
+    return f"{milestone.title} {milestone.description or ''} {goal.title}"
+
+
+def select_link_candidates(
+    session: Session,
+    text: str,
+    *,
+    limit: int = LINK_CANDIDATE_LIMIT,
+) -> LinkSelection:
+    """Rank active goals and open milestones against the user's text.
+
+    Args:
+        session: Database session.
+        text: The user's description of the commitment(s).
+        limit: Maximum goals and milestones (each) to offer.
+
+    Returns:
+        LinkSelection with the top candidates, or a single resolved candidate.
+    """
+    goals = {g.id: g for g in session.exec(select(Goal).where(Goal.status == GoalStatus.ACTIVE))}
+    if not goals:
+        return LinkSelection()
+    milestones = {
+        m.id: m
+        for m in session.exec(
+            select(Milestone)
+            .where(Milestone.goal_id.in_(list(goals)))  # type: ignore[attr-defined]
+            .where(Milestone.status.in_(OPEN_MILESTONE_STATUSES))  # type: ignore[attr-defined]
+        )
+    }
+
+    _goal_index.sync({gid: _goal_text(g) for gid, g in goals.items()})
+    _milestone_index.sync(
+        {mid: _milestone_text(m, goals[m.goal_id]) for mid, m in milestones.items()}
+    )
+    goal_matches = _goal_index.rank(text)
+    milestone_matches = _milestone_index.rank(text)
+
+    def goal_candidate(match: RankedMatch, index: int) -> LinkCandidate:
+        goal = goals[match.key]  # type: ignore[index]
+        return LinkCandidate(key=f"g{index}", kind="goal", entity_id=goal.id, title=goal.title)
+
+    def milestone_candidate(match: RankedMatch, index: int) -> LinkCandidate:
+        milestone = milestones[match.key]  # type: ignore[index]
+        return LinkCandidate(
+            key=f"m{index}",
+            kind="milestone",
+            entity_id=milestone.id,
+            title=milestone.title,
+            goal_id=milestone.goal_id,
+        )
+
+    # A milestone is the more specific link, so it wins when both resolve
+    if is_unambiguous(milestone_matches):
+        return LinkSelection(resolved=milestone_candidate(milestone_matches[0], 1))
+    if is_unambiguous(goal_matches) and not milestone_matches:
+        return LinkSelection(resolved=goal_candidate(goal_matches[0], 1))
+
+    candidates = [goal_candidate(m, i) for i, m in enumerate(goal_matches[:limit], start=1)]
+    candidates.extend(
+        milestone_candidate(m, i) for i, m in enumerate(milestone_matches[:limit], start=1)
+    )
+    return LinkSelection(candidates=candidates)
+
+
+def apply_resolved_link(plan: ExtractedPlan, resolved: LinkCandidate) -> None:
+    """Link plan commitments to a locally resolved goal or milestone.
+
+    A single commitment takes the link; with several, only commitments whose
+    own deliverable also ranks the resolved entity first are linked.
+
+    Args:
+        plan: Extracted plan, modified in place.
+        resolved: The unambiguous candidate from select_link_candidates().
+    """
+    index = _milestone_index if resolved.kind == "milestone" else _goal_index
+    goal_id: UUID | None = resolved.goal_id if resolved.kind == "milestone" else resolved.entity_id
+    for commitment in plan.commitments:
+        if commitment.goal_id or commitment.milestone_id:
+            continue
+        if len(plan.commitments) > 1:
+            matches = index.rank(commitment.deliverable)
+            if not matches or matches[0].key != resolved.entity_id:
+                continue
+        commitment.goal_id = str(goal_id) if goal_id else None
+        if resolved.kind == "milestone":
+            commitment.milestone_id = str(resolved.entity_id)
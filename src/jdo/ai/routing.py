@@ -0,0 +1,469 @@
+"""Latency-aware routing across AI providers.
+
+The chat agent can be configured with fallback models (``ai_fallback_models``).
+RoutedModel keeps rolling time-to-first-token and error statistics for each
+route and sends every request to the fastest healthy one. A streaming request
+is hedged: if the chosen route has not produced its first token by its usual
+p90 latency, the next route is started too and whichever answers first wins
+(the other request is cancelled). Repeated failures open a circuit breaker so
+a failing provider is skipped until a cooldown has passed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import statistics
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterator, Sequence
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from types import TracebackType
+from typing import Any, Self
+
+import httpx
+from loguru import logger
+from pydantic_ai.exceptions import ModelAPIError
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters, StreamedResponse
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+from pydantic_ai.tools import RunContext
+
+from jdo.ai.timeout import AI_TIMEOUT_SECONDS
+
+# Samples kept per route for latency percentiles and error rate
+ROUTE_WINDOW_SIZE = 20
+
+# Hedge only once a route has this many latency samples...
+MIN_HEDGE_SAMPLES = 5
+# ...after the route's p90 time to first token...
+HEDGE_PERCENTILE = 0.9
+# ...but never sooner than this (avoids doubling requests on very fast routes)
+MIN_HEDGE_DELAY_SECONDS = 0.25
+
+# Consecutive failures that open a route's circuit, and how long it stays open
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_COOLDOWN_SECONDS = 30.0
+
+# Each failure in the window adds this fraction to a route's expected latency
+ERROR_RATE_PENALTY = 4.0
+
+# Failures that send a request to the next route (anything else propagates)
+ROUTABLE_ERRORS: tuple[type[Exception], ...] = (
+    ModelAPIError,
+    httpx.HTTPError,
+    OSError,
+    TimeoutError,
+)
+
+Clock = Callable[[], float]
+
+
+class CircuitState(str, Enum):
+    """State of a route's circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreaker:
+    """Stops sending requests to a route after repeated failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens; once
+    ``cooldown`` seconds have passed a single trial request is let through
+    (half-open), and its outcome closes or re-opens the circuit.
+    """
+
+    failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD
+    cooldown: float = CIRCUIT_COOLDOWN_SECONDS
+    clock: Clock = time.monotonic
+    consecutive_failures: int = 0
+    opened_at: float | None = None
+    _trial_in_flight: bool = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        if self.opened_at is None:
+            return CircuitState.CLOSED
+        if self.clock() - self.opened_at >= self.cooldown:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (claims the half-open trial).
+
+        Returns:
+            True if the circuit is closed, or half-open with no trial running.
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def release(self) -> None:
+        """Give back a claimed half-open trial that was abandoned (e.g. cancelled)."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        self.consecutive_failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.consecutive_failures >= self.failure_threshold:
+            self.opened_at = self.clock()
+
+
+@dataclass
+class RouteStats:
+    """Rolling latency and outcome samples for one route."""
+
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=ROUTE_WINDOW_SIZE))
+    outcomes: deque[bool] = field(default_factory=lambda: deque(maxlen=ROUTE_WINDOW_SIZE))
+
+    def record_latency(self, seconds: float) -> None:
+        """Record a time to first token (or to a complete non-streamed response)."""
+        self.latencies.append(seconds)
+
+    def record_outcome(self, *, ok: bool) -> None:
+        """Record whether a request succeeded."""
+        self.outcomes.append(ok)
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of recent requests that failed (0.0 with no samples)."""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    @property
+    def median_latency(self) -> float | None:
+        """Median recent latency, or None with no samples."""
+        return statistics.median(self.latencies) if self.latencies else None
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Latency at a percentile (nearest rank), or None with no samples.
+
+        Args:
+            percentile: Percentile as a fraction, e.g. 0.9.
+
+        Returns:
+            The latency in seconds.
+        """
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        rank = max(0, min(len(ordered) - 1, math.ceil(percentile * len(ordered)) - 1))
+        return ordered[rank]
+
+
+@dataclass
+class Route:
+    """One provider/model the router can send requests to.
+
+    Attributes:
+        name: Display name, e.g. "openrouter:openai/gpt-5.1-mini".
+        model: The pydantic-ai model for this route.
+        stats: Rolling latency and error samples.
+        breaker: Circuit breaker for repeated failures.
+    """
+
+    name: str
+    model: Model
+    stats: RouteStats = field(default_factory=RouteStats)
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+
+    @property
+    def expected_latency(self) -> float:
+        """Median latency inflated by the recent error rate.
+
+        An untried route scores 0.0 so it gets measured; a route that has only
+        failed scores infinity.
+        """
+        median = self.stats.median_latency
+        if median is None:
+            return math.inf if self.stats.error_rate else 0.0
+        return median * (1 + ERROR_RATE_PENALTY * self.stats.error_rate)
+
+    def record_success(self, latency: float | None = None) -> None:
+        """Record a successful request.
+
+        Args:
+            latency: Time to first token, if measured.
+        """
+        if latency is not None:
+            self.stats.record_latency(latency)
+        self.stats.record_outcome(ok=True)
+        self.breaker.record_success()
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+        self.stats.record_outcome(ok=False)
+        self.breaker.record_failure()
+        if self.breaker.state != CircuitState.CLOSED:
+            logger.warning(f"Circuit open for AI route {self.name}")
+
+
+class ModelRouter:
+    """Orders routes by expected latency and health."""
+
+    def __init__(self, routes: Sequence[Route], *, hedge: bool = True) -> None:
+        """Initialize the router.
+
+        Args:
+            routes: Routes in configured priority order (used to break ties).
+            hedge: Whether streaming requests may be hedged.
+
+        Raises:
+            ValueError: If no routes are given.
+        """
+        if not routes:
+            msg = "At least one route is required"
+            raise ValueError(msg)
+        self.routes = list(routes)
+        self.hedge = hedge
+
+    def ranked(self) -> list[Route]:
+        """Routes to try, best first.
+
+        Routes whose circuit is open are left out; the rest are ordered by
+        expected latency, with configured order breaking ties (so untried
+        routes are tried in order).
+
+        Returns:
+            Routes in the order they should be tried (empty if every circuit is open).
+        """
+        available = [route for route in self.routes if route.breaker.state != CircuitState.OPEN]
+        return sorted(available, key=lambda route: route.expected_latency)
+
+    def admitted(self) -> Iterator[Route]:
+        """Yield routes to try in rank order, each admitted by its circuit when reached.
+
+        Circuits are checked lazily so a half-open trial is only claimed by a
+        route that is actually tried.
+
+        Yields:
+            Routes to try, best first.
+        """
+        for route in self.ranked():
+            if route.breaker.allow():
+                yield route
+
+    def hedge_delay(self, route: Route) -> float | None:
+        """How long to wait for a route's first token before hedging.
+
+        Args:
+            route: The route the request was sent to.
+
+        Returns:
+            Delay in seconds, or None if the request should not be hedged.
+        """
+        if not self.hedge or len(route.stats.latencies) < MIN_HEDGE_SAMPLES:
+            return None
+        threshold = route.stats.latency_percentile(HEDGE_PERCENTILE)
+        return max(MIN_HEDGE_DELAY_SECONDS, threshold or 0.0)
+
+
+@dataclass
+class _OpenStream:
+    """A route's stream that has produced its first token."""
+
+    route: Route
+    response: StreamedResponse
+    exit_stack: AsyncExitStack
+
+
+class RoutedModel(WrapperModel):
+    """A model that routes each request to the fastest healthy provider.
+
+    Profile, name and settings come from the primary (first) route, so the
+    agent behaves as if it were talking to that model.
+    """
+
+    def __init__(self, router: ModelRouter, *, clock: Clock = time.perf_counter) -> None:
+        """Initialize the routed model.
+
+        Args:
+            router: Router holding the routes.
+            clock: Clock used to measure time to first token.
+        """
+        super().__init__(router.routes[0].model)
+        self.router = router
+        self._clock = clock
+
+    async def __aenter__(self) -> Self:
+        """Enter every route's model so their HTTP clients stay open."""
+        for route in self.router.routes:
+            await route.model.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        """Exit every route's model."""
+        for route in self.router.routes:
+            await route.model.__aexit__(exc_type, exc_val, exc_tb)
+        return None
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        """Send a non-streamed request, failing over between routes in rank order."""
+        last_error: Exception | None = None
+        for route in self.router.admitted():
+            started = self._clock()
+            try:
+                async with asyncio.timeout(AI_TIMEOUT_SECONDS):
+                    response = await route.model.request(
+                        messages, model_settings, model_request_parameters
+                    )
+            except asyncio.CancelledError:
+                route.breaker.release()
+                raise
+            except ROUTABLE_ERRORS as e:
+                route.record_failure()
+                logger.warning(f"AI route {route.name} failed: {e}")
+                last_error = e
+                continue
+            route.record_success(self._clock() - started)
+            return response
+        raise _no_route_error(last_error)
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        """Stream from the first route to produce a token, hedging slow routes."""
+        stream = await self._open_stream(
+            messages, model_settings, model_request_parameters, run_context
+        )
+        async with stream.exit_stack:
+            try:
+                yield stream.response
+            except ROUTABLE_ERRORS:
+                stream.route.record_failure()
+                raise
+
+    async def _open_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None,
+    ) -> _OpenStream:
+        """Race routes for the first token: start the best, hedge or fail over to the rest."""
+
+        async def attempt(route: Route) -> _OpenStream:
+            exit_stack = AsyncExitStack()
+            started = self._clock()
+            try:
+                # Providers read the first chunk before handing over the stream,
+                # so opening it measures time to first token
+                response = await exit_stack.enter_async_context(
+                    route.model.request_stream(
+                        messages, model_settings, model_request_parameters, run_context
+                    )
+                )
+            except BaseException as e:
+                await exit_stack.aclose()
+                if isinstance(e, asyncio.CancelledError):
+                    route.breaker.release()
+                raise
+            route.record_success(self._clock() - started)
+            return _OpenStream(route, response, exit_stack)
+
+        race = _StreamRace(self.router, attempt)
+        try:
+            first = race.start_next()
+            hedge_delay = self.router.hedge_delay(first) if first else None
+            while race.running:
+                done, _ = await asyncio.wait(
+                    race.running, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedge_delay = None
+                    if hedge := race.start_next():
+                        logger.info(f"No first token yet; hedging AI request to {hedge.name}")
+                    continue
+                stream = race.settle(done)
+                if stream is not None:
+                    return stream
+                if not race.running:
+                    race.start_next()
+            raise _no_route_error(race.last_error)
+        finally:
+            await race.cancel_losers()
+
+
+class _StreamRace:
+    """Attempts racing to produce the first token of one streamed request."""
+
+    def __init__(
+        self, router: ModelRouter, attempt: Callable[[Route], Coroutine[Any, Any, _OpenStream]]
+    ) -> None:
+        self._attempt = attempt
+        self._routes = router.admitted()
+        self.running: dict[asyncio.Task[_OpenStream], Route] = {}
+        self.last_error: Exception | None = None
+
+    def start_next(self) -> Route | None:
+        """Start the next admitted route, if any is left."""
+        route = next(self._routes, None)
+        if route is not None:
+            self.running[asyncio.create_task(self._attempt(route))] = route
+        return route
+
+    def settle(self, done: set[asyncio.Task[_OpenStream]]) -> _OpenStream | None:
+        """Take the first successful attempt; record failures of the others.
+
+        Raises:
+            Exception: An attempt's error that is not a routable failure.
+        """
+        for task in done:
+            route = self.running.pop(task)
+            error = task.exception()
+            if error is None:
+                return task.result()
+            if not isinstance(error, ROUTABLE_ERRORS):
+                raise error
+            route.record_failure()
+            logger.warning(f"AI route {route.name} failed: {error}")
+            self.last_error = error
+        return None
+
+    async def cancel_losers(self) -> None:
+        """Cancel attempts still running and close any stream that opened anyway."""
+        for task in self.running:
+            task.cancel()
+        results = await asyncio.gather(*self.running, return_exceptions=True)
+        for result in results:
+            if isinstance(result, _OpenStream):
+                await result.exit_stack.aclose()
+
+
+def _no_route_error(last_error: Exception | None) -> Exception:
+    # With every circuit open, fail fast instead of waiting on a provider known to be down
+    return last_error or ModelAPIError("routed", "No AI provider is available (circuits open)")
@@ -0,0 +1,421 @@
+"""Client-side rate limiting and prioritization of AI calls.
+
+Every provider model is wrapped in a ScheduledModel, so chat, extraction,
+triage and summarization requests all pass through one ProviderScheduler per
+provider. The scheduler keeps a sliding one-minute window of requests and
+tokens and holds a request back when it would exceed the provider's
+requests-per-minute or tokens-per-minute budget (``ai_requests_per_minute`` /
+``ai_tokens_per_minute``).
+
+Interactive REPL turns take priority: background work (triage, bulk
+extraction, history summaries) only runs while no interactive request is
+waiting, keeps below a share of the budget so a user turn always has room,
+and backs off after the provider reports a rate limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from enum import IntEnum
+from typing import Any
+
+from loguru import logger
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters, StreamedResponse
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+from pydantic_ai.tools import RunContext
+
+from jdo.ai.tool_output import estimate_tokens
+from jdo.config import get_settings
+
+# Length of the sliding window the per-minute budgets apply to
+RATE_WINDOW_SECONDS = 60.0
+
+# Background work is only admitted below this share of either budget
+BACKGROUND_HEADROOM = 0.8
+
+# How long background work pauses after the provider answers 429 Too Many Requests
+RATE_LIMIT_BACKOFF_SECONDS = 15.0
+
+# Longest single sleep while queued, so a newly queued interactive request
+# is noticed by waiting background requests promptly
+MAX_QUEUE_POLL_SECONDS = 0.5
+
+# Output tokens reserved for a request that does not set max_tokens
+DEFAULT_OUTPUT_TOKEN_RESERVE = 512
+
+HTTP_TOO_MANY_REQUESTS = 429
+
+Clock = Callable[[], float]
+Sleep = Callable[[float], Awaitable[None]]
+
+
+class Priority(IntEnum):
+    """Scheduling priority of an AI call (lower runs first)."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_current_priority: ContextVar[Priority] = ContextVar(
+    "jdo_ai_priority", default=Priority.INTERACTIVE
+)
+
+
+def current_priority() -> Priority:
+    """Priority of AI calls made from the current context."""
+    return _current_priority.get()
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """Run AI calls made inside the block as background work.
+
+    The priority is a context variable, so it carries over into tasks and
+    (via run_sync_with_timeout) worker threads started inside the block.
+    """
+    token = _current_priority.set(Priority.BACKGROUND)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+@dataclass(frozen=True)
+class RateBudget:
+    """Per-minute limits for one provider (None means unlimited).
+
+    Attributes:
+        requests_per_minute: Maximum requests started per minute.
+        tokens_per_minute: Maximum input plus output tokens per minute.
+    """
+
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+
+
+@dataclass
+class QueueMetrics:
+    """Queueing statistics for one priority.
+
+    Attributes:
+        depth: Requests currently waiting for budget.
+        max_depth: Largest queue depth seen.
+        admitted: Requests sent to the provider.
+        delayed: Admitted requests that had to wait first.
+        total_wait_seconds: Total time admitted requests spent waiting.
+        max_wait_seconds: Longest wait of a single request.
+    """
+
+    depth: int = 0
+    max_depth: int = 0
+    admitted: int = 0
+    delayed: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Average wait per admitted request (0.0 when nothing admitted)."""
+        if self.admitted == 0:
+            return 0.0
+        return self.total_wait_seconds / self.admitted
+
+
+@dataclass
+class _Grant:
+    """One admitted request's share of the window."""
+
+    at: float
+    tokens: int
+
+
+@dataclass
+class ProviderScheduler:
+    """Admits AI requests to one provider within its rate budget.
+
+    Thread-safe: synchronous callers run their own event loop in a worker
+    thread, so state is guarded by a lock and waiting is done by polling
+    rather than with loop-bound primitives.
+    """
+
+    name: str
+    budget: RateBudget = field(default_factory=RateBudget)
+    clock: Clock = time.monotonic
+    sleep: Sleep = asyncio.sleep
+    _window: deque[_Grant] = field(default_factory=deque)
+    _waiting: Counter[Priority] = field(default_factory=Counter)
+    _metrics: dict[Priority, QueueMetrics] = field(
+        default_factory=lambda: {priority: QueueMetrics() for priority in Priority}
+    )
+    _backoff_until: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def metrics(self) -> dict[Priority, QueueMetrics]:
+        """Snapshot of the queueing statistics per priority."""
+        with self._lock:
+            return {
+                priority: replace(metrics, depth=self._waiting[priority])
+                for priority, metrics in self._metrics.items()
+            }
+
+    async def acquire(self, priority: Priority, tokens: int) -> _Grant:
+        """Wait until a request fits the budget and record it in the window.
+
+        Args:
+            priority: Priority of the request.
+            tokens: Estimated input plus output tokens.
+
+        Returns:
+            The grant, to be settled with the actual token count.
+        """
+        started = self.clock()
+        metrics = self._metrics[priority]
+        with self._lock:
+            self._waiting[priority] += 1
+            metrics.max_depth = max(metrics.max_depth, self._waiting[priority])
+        try:
+            while True:
+                with self._lock:
+                    now = self.clock()
+                    delay = self._delay(priority, tokens, now)
+                    if delay <= 0:
+                        grant = _Grant(now, tokens)
+                        self._window.append(grant)
+                        break
+                await self.sleep(min(delay, MAX_QUEUE_POLL_SECONDS))
+        finally:
+            with self._lock:
+                self._waiting[priority] -= 1
+
+        waited = grant.at - started
+        with self._lock:
+            metrics.admitted += 1
+            metrics.total_wait_seconds += waited
+            metrics.max_wait_seconds = max(metrics.max_wait_seconds, waited)
+            if waited > 0:
+                metrics.delayed += 1
+        if waited > 0:
+            logger.debug(
+                f"{priority.name.lower()} AI request to {self.name} waited {waited:.2f}s "
+                "for rate budget"
+            )
+        return grant
+
+    def settle(self, grant: _Grant, tokens: int) -> None:
+        """Replace a grant's estimate with the tokens the provider reported.
+
+        Args:
+            grant: Grant returned by acquire().
+            tokens: Actual input plus output tokens (ignored if not reported).
+        """
+        if tokens > 0:
+            with self._lock:
+                grant.tokens = tokens
+
+    def record_rate_limited(self) -> None:
+        """Pause background requests after the provider reported a rate limit."""
+        with self._lock:
+            self._backoff_until = self.clock() + RATE_LIMIT_BACKOFF_SECONDS
+        logger.warning(f"{self.name} rate limit reached; pausing background AI requests")
+
+    def _delay(self, priority: Priority, tokens: int, now: float) -> float:
+        """Seconds until a request may be admitted (0.0 if it may go now)."""
+        while self._window and now - self._window[0].at >= RATE_WINDOW_SECONDS:
+            self._window.popleft()
+
+        if priority == Priority.BACKGROUND:
+            if self._waiting[Priority.INTERACTIVE]:
+                return MAX_QUEUE_POLL_SECONDS
+            if now < self._backoff_until:
+                return self._backoff_until - now
+            share = BACKGROUND_HEADROOM
+        else:
+            share = 1.0
+
+        delay = 0.0
+        if self.budget.requests_per_minute is not None:
+            allowed = max(1, int(self.budget.requests_per_minute * share))
+            delay = max(delay, self._delay_until_free(allowed, _grant_count, 1, now))
+        if self.budget.tokens_per_minute is not None:
+            allowed = max(1, int(self.budget.tokens_per_minute * share))
+            delay = max(delay, self._delay_until_free(allowed, _grant_tokens, tokens, now))
+        return delay
+
+    def _delay_until_free(
+        self, allowed: int, cost: Callable[[_Grant], int], needed: int, now: float
+    ) -> float:
+        """Seconds until enough of the window expires for ``needed`` more units.
+
+        A request larger than the whole budget is admitted once the window is
+        empty rather than never.
+        """
+        used = sum(cost(grant) for grant in self._window)
+        if not self._window or used + needed <= allowed:
+            return 0.0
+        for grant in self._window:
+            used -= cost(grant)
+            if used + needed <= allowed:
+                return grant.at + RATE_WINDOW_SECONDS - now
+        return self._window[-1].at + RATE_WINDOW_SECONDS - now
+
+
+def _grant_count(_grant: _Grant) -> int:
+    return 1
+
+
+def _grant_tokens(grant: _Grant) -> int:
+    return grant.tokens
+
+
+def estimate_request_tokens(
+    messages: list[ModelMessage], model_settings: ModelSettings | None
+) -> int:
+    """Estimate a request's input tokens plus its output allowance.
+
+    Args:
+        messages: Messages sent to the model.
+        model_settings: Request settings (``max_tokens`` caps the output).
+
+    Returns:
+        Estimated total tokens.
+    """
+    serialized = ModelMessagesTypeAdapter.dump_json(messages).decode()
+    output_reserve = (model_settings or {}).get("max_tokens") or DEFAULT_OUTPUT_TOKEN_RESERVE
+    return estimate_tokens(serialized) + output_reserve
+
+
+class ScheduledModel(WrapperModel):
+    """A model whose requests are admitted by a ProviderScheduler."""
+
+    def __init__(self, wrapped: Model | str, scheduler: ProviderScheduler) -> None:
+        """Initialize the scheduled model.
+
+        Args:
+            wrapped: The provider model (or a "provider:model" identifier).
+            scheduler: Scheduler for the model's provider.
+        """
+        super().__init__(wrapped)  # type: ignore[arg-type]
+        self.scheduler = scheduler
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        """Wait for budget, then send a non-streamed request."""
+        grant = await self.scheduler.acquire(
+            current_priority(), estimate_request_tokens(messages, model_settings)
+        )
+        with self._watch_rate_limit():
+            response = await self.wrapped.request(
+                messages, model_settings, model_request_parameters
+            )
+        self.scheduler.settle(grant, response.usage.total_tokens)
+        return response
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        """Wait for budget, then stream a request."""
+        grant = await self.scheduler.acquire(
+            current_priority(), estimate_request_tokens(messages, model_settings)
+        )
+        with self._watch_rate_limit():
+            async with self.wrapped.request_stream(
+                messages, model_settings, model_request_parameters, run_context
+            ) as response:
+                yield response
+        self.scheduler.settle(grant, response.usage.total_tokens)
+
+    @contextmanager
+    def _watch_rate_limit(self) -> Iterator[None]:
+        try:
+            yield
+        except ModelHTTPError as e:
+            if e.status_code == HTTP_TOO_MANY_REQUESTS:
+                self.scheduler.record_rate_limited()
+            raise
+
+
+_schedulers: dict[str, ProviderScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(provider: str) -> ProviderScheduler:
+    """Get the shared scheduler for a provider, creating it from settings.
+
+    Args:
+        provider: Provider identifier, e.g. "openai".
+
+    Returns:
+        The provider's scheduler.
+    """
+    with _schedulers_lock:
+        scheduler = _schedulers.get(provider)
+        if scheduler is None:
+            settings = get_settings()
+            budget = RateBudget(
+                requests_per_minute=settings.ai_requests_per_minute.get(provider),
+                tokens_per_minute=settings.ai_tokens_per_minute.get(provider),
+            )
+            scheduler = _schedulers[provider] = ProviderScheduler(provider, budget)
+        return scheduler
+
+
+def scheduled_model(model: Model | str, provider: str) -> ScheduledModel:
+    """Wrap a provider model so its requests go through the provider's scheduler.
+
+    Args:
+        model: The provider model (or a "provider:model" identifier).
+        provider: Provider identifier.
+
+    Returns:
+        The scheduled model.
+    """
+    return ScheduledModel(model, get_scheduler(provider))
+
+
+def scheduler_metrics() -> dict[str, dict[Priority, QueueMetrics]]:
+    """Queue depth and wait statistics for every provider used so far."""
+    with _schedulers_lock:
+        schedulers = dict(_schedulers)
+    return {name: scheduler.metrics() for name, scheduler in schedulers.items()}
+
+
+def format_scheduler_metrics() -> str:
+    """Render queueing statistics per provider and priority as plain text (shown by /jobs)."""
+    lines = ["AI request queue", "=" * 40]
+    metrics = scheduler_metrics()
+    if not metrics:
+        lines.append("No AI requests yet")
+    for provider, by_priority in sorted(metrics.items()):
+        for priority, queue in sorted(by_priority.items()):
+            lines.append(
+                f"{provider} {priority.name.lower():<11} {queue.admitted} sent, "
+                f"{queue.delayed} delayed, wait mean {queue.mean_wait_seconds * 1000:.0f} ms "
+                f"max {queue.max_wait_seconds * 1000:.0f} ms, "
+                f"queue {queue.depth} (max {queue.max_depth})"
+            )
+    return "\n".join(lines)
+
+
+def reset_schedulers() -> None:
+    """Forget all schedulers (e.g. after rate-limit settings change, or in tests)."""
+    with _schedulers_lock:
+        _schedulers.clear()
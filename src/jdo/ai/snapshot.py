@@ -0,0 +1,183 @@
+"""Pre-computed user-state snapshot attached to each agent run.
+
+Most turns need the same facts: what is active, what is overdue, how much
+capacity is left and the integrity grade. Sending them with the turn saves
+the model a tool round trip. The snapshot is rebuilt only when the database
+changes (or the hour or available hours change); the query tools remain for
+drill-down.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, col, select
+
+from jdo.ai.time_context import get_time_context
+from jdo.ai.tool_output import COMMITMENT_ALIAS, IdAliases, format_compact_table
+from jdo.db.session import TableVersion, get_data_version, get_session, get_table_versions
+from jdo.integrity.service import IntegrityService
+from jdo.models import CleanupPlan, Commitment, CommitmentStatus, Stakeholder, Task
+from jdo.utils.datetime import as_utc, utc_now
+
+if TYPE_CHECKING:
+    from jdo.ai.agent import JDODependencies
+
+SNAPSHOT_HEADING = "## User State Snapshot"
+
+# Soonest-due active commitments listed in the snapshot
+SNAPSHOT_COMMITMENT_LIMIT = 10
+
+# Token budget for the commitment table inside the snapshot
+SNAPSHOT_TOKEN_BUDGET = 400
+
+ACTIVE_STATUSES = (
+    CommitmentStatus.PENDING,
+    CommitmentStatus.IN_PROGRESS,
+    CommitmentStatus.AT_RISK,
+)
+
+# Tables the snapshot reads; writes to them from other processes invalidate it
+SNAPSHOT_TABLES = (Commitment, Stakeholder, Task, CleanupPlan)
+
+# Inputs that invalidate a snapshot: (in-process data version, table versions,
+# current UTC hour, available hours). The hour is included so commitments flip
+# to overdue as their due_at passes.
+SnapshotKey = tuple[int, tuple[TableVersion, ...], datetime, float | None]
+
+
+@dataclass(frozen=True)
+class StateSnapshot:
+    """A rendered snapshot of the user's state.
+
+    Attributes:
+        version: Increments each time the snapshot is rebuilt.
+        key: Inputs the snapshot was built from.
+        text: Rendered snapshot for the agent.
+    """
+
+    version: int
+    key: SnapshotKey
+    text: str
+
+
+def _format_capacity(session: Session, available_hours: float | None) -> str:
+    """Render the capacity line."""
+    context = get_time_context(session, available_hours=available_hours)
+    if context.available_hours is None:
+        return f"Capacity: available hours not set; {context.allocated_hours:.1f}h allocated"
+    line = (
+        f"Capacity: {context.available_hours:.1f}h available, "
+        f"{context.allocated_hours:.1f}h allocated, "
+        f"{context.remaining_capacity:.1f}h remaining"
+    )
+    if context.over_allocated:
+        line += " (over-allocated)"
+    return line
+
+
+def render_state_snapshot(
+    session: Session,
+    aliases: IdAliases,
+    *,
+    available_hours: float | None = None,
+    version: int = 1,
+) -> str:
+    """Render the user-state snapshot from the database.
+
+    Args:
+        session: Database session.
+        aliases: Id aliases shared with the query tools.
+        available_hours: User's available hours for today, if set.
+        version: Snapshot version shown in the heading.
+
+    Returns:
+        Snapshot text with summary lines and a table of the soonest-due commitments.
+    """
+    now = utc_now()
+    commitments = session.exec(
+        select(Commitment, Stakeholder)
+        .join(Stakeholder, Commitment.stakeholder_id == Stakeholder.id)
+        .where(Commitment.status.in_(ACTIVE_STATUSES))
+        .order_by(col(Commitment.due_at))
+    ).all()
+    overdue_ids = {c.id for c, _ in commitments if c.due_at and as_utc(c.due_at) < now}
+
+    overdue = len(overdue_ids)
+    at_risk = sum(1 for c, _ in commitments if c.status == CommitmentStatus.AT_RISK)
+    metrics = IntegrityService().calculate_integrity_metrics(session)
+
+    lines = [
+        f"{SNAPSHOT_HEADING} (v{version})",
+        f"Active commitments: {len(commitments)} ({overdue} overdue, {at_risk} at risk)",
+        _format_capacity(session, available_hours),
+        f"Integrity: {metrics.letter_grade} ({metrics.composite_score:.0f}/100)",
+    ]
+    if commitments:
+        rows = [
+            (
+                aliases.alias(COMMITMENT_ALIAS, c.id),
+                c.deliverable,
+                s.name,
+                c.due_date,
+                "overdue" if c.id in overdue_ids else c.status,
+            )
+            for c, s in commitments
+        ]
+        lines.append(
+            format_compact_table(
+                ("id", "deliverable", "stakeholder", "due", "status"),
+                rows,
+                token_budget=SNAPSHOT_TOKEN_BUDGET,
+                limit=SNAPSHOT_COMMITMENT_LIMIT,
+            )
+        )
+    lines.append("Answer from this snapshot; call query tools only for details beyond it.")
+    return "\n".join(lines)
+
+
+class StateSnapshotCache:
+    """Holds the latest snapshot and rebuilds it only when its inputs change."""
+
+    def __init__(self) -> None:
+        """Initialize with no snapshot."""
+        self._snapshot: StateSnapshot | None = None
+
+    def get(self, deps: JDODependencies) -> StateSnapshot | None:
+        """Get an up-to-date snapshot, rebuilding it if the database changed.
+
+        Args:
+            deps: Agent dependencies (available hours and id aliases).
+
+        Returns:
+            The snapshot, or None if it could not be built.
+        """
+        hour = utc_now().replace(minute=0, second=0, microsecond=0)
+        version = (self._snapshot.version if self._snapshot else 0) + 1
+        try:
+            with get_session() as session:
+                key: SnapshotKey = (
+                    get_data_version(),
+                    get_table_versions(session, SNAPSHOT_TABLES),
+                    hour,
+                    deps.available_hours_remaining,
+                )
+                if self._snapshot is not None and self._snapshot.key == key:
+                    return self._snapshot
+                text = render_state_snapshot(
+                    session,
+                    deps.id_aliases,
+                    available_hours=deps.available_hours_remaining,
+                    version=version,
+                )
+        except SQLAlchemyError as e:
+            logger.warning(f"Failed to build state snapshot: {e}")
+            return self._snapshot
+
+        self._snapshot = StateSnapshot(version=version, key=key, text=text)
+        logger.debug(f"Rebuilt user state snapshot v{version}")
+        return self._snapshot
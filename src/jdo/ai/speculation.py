@@ -0,0 +1,183 @@
+"""Speculative plan extraction after a commitment proposal.
+
+When the assistant ends a turn by proposing a commitment ("Does this look
+right?"), the user usually just answers "yes". Extracting the plan only then
+adds a full model round trip to the confirmation. With speculation enabled
+(``ai_speculative_extraction``), the REPL starts the extraction in the
+background as soon as the proposal has streamed; an affirmative answer takes
+the finished draft and saves it straight away, while any other input cancels
+it. SpeculationStats tracks how often the guess pays off and how many tokens
+were spent on speculations that were thrown away.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from pydantic_ai.usage import RunUsage
+
+    from jdo.ai.extraction import ExtractedPlan
+
+# A proposal names a commitment (or its fields) and asks the user to confirm it
+_PROPOSAL_PATTERN = re.compile(r"\b(commitments?|deliverable|stakeholder)\b", re.IGNORECASE)
+_CONFIRMATION_PATTERN = re.compile(
+    r"(look(s)? (right|good|correct)|\(yes/no|shall i (create|save|add)|"
+    r"should i (create|save|add)|want me to (create|save|add)|confirm)[^\n]*\?",
+    re.IGNORECASE,
+)
+
+PlanExtractor = Callable[["RunUsage"], Awaitable["ExtractedPlan"]]
+
+
+def looks_like_commitment_proposal(response: str) -> bool:
+    """Whether an assistant response proposes a commitment for confirmation.
+
+    Args:
+        response: The assistant's complete response text.
+
+    Returns:
+        True if the response mentions a commitment and asks to confirm it.
+    """
+    # Only called on model output, so the AI stack is loaded by now
+    from jdo.ai.context import INTERRUPTED_MARKER
+
+    if not response or INTERRUPTED_MARKER in response:
+        return False
+    return bool(_PROPOSAL_PATTERN.search(response) and _CONFIRMATION_PATTERN.search(response))
+
+
+@dataclass
+class SpeculationStats:
+    """Outcomes of speculative extractions.
+
+    Attributes:
+        launched: Speculations started.
+        hits: Speculations whose draft was saved on confirmation.
+        misses: Speculations that finished but were unusable (failed or empty).
+        cancelled: Speculations discarded because the user changed course.
+        used_tokens: Tokens spent on hits.
+        wasted_tokens: Tokens spent on misses and cancelled speculations.
+    """
+
+    launched: int = 0
+    hits: int = 0
+    misses: int = 0
+    cancelled: int = 0
+    used_tokens: int = 0
+    wasted_tokens: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of resolved speculations that were used (0.0 when none resolved)."""
+        resolved = self.hits + self.misses + self.cancelled
+        if resolved == 0:
+            return 0.0
+        return self.hits / resolved
+
+
+class SpeculativeExtraction:
+    """Runs at most one background plan extraction for the next confirmation."""
+
+    def __init__(self) -> None:
+        """Initialize with nothing in flight."""
+        self.stats = SpeculationStats()
+        self._task: asyncio.Task[ExtractedPlan] | None = None
+        # Set by start(); only read while a speculation exists
+        self._usage: RunUsage
+
+    @property
+    def active(self) -> bool:
+        """Whether a speculation is running or waiting to be taken."""
+        return self._task is not None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the running speculation has finished."""
+        return self._task is not None and self._task.done()
+
+    def start(self, extract: PlanExtractor) -> None:
+        """Start extracting in the background, replacing any earlier speculation.
+
+        Must be called with a running event loop. The extraction runs at
+        background priority so it never delays the user's next turn.
+
+        Args:
+            extract: Runs the extraction, accumulating token usage into the
+                RunUsage it is given.
+        """
+        from pydantic_ai.usage import RunUsage
+
+        from jdo.ai.scheduler import background_priority
+
+        self.discard()
+        self._usage = RunUsage()
+        with background_priority():
+            self._task = asyncio.create_task(extract(self._usage))
+        self.stats.launched += 1
+        logger.debug("Started speculative plan extraction")
+
+    async def take(self) -> ExtractedPlan | None:
+        """Wait for the speculation and claim its plan.
+
+        Returns:
+            The extracted plan if it contains anything to save, else None.
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return None
+        try:
+            plan = await task
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        except Exception as e:
+            logger.warning(f"Speculative extraction failed: {e}")
+            plan = None
+        tokens = self._usage.total_tokens
+        if plan is None or not (plan.commitments or plan.recurring_commitments):
+            self.stats.misses += 1
+            self.stats.wasted_tokens += tokens
+            self._log_outcome("miss")
+            return None
+        self.stats.hits += 1
+        self.stats.used_tokens += tokens
+        self._log_outcome("hit")
+        return plan
+
+    def discard(self) -> None:
+        """Cancel the speculation (the user moved on); its tokens count as wasted."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        self.stats.cancelled += 1
+        self.stats.wasted_tokens += self._usage.total_tokens
+        self._log_outcome("cancelled")
+
+    def format_stats(self) -> str:
+        """Render the speculation outcomes as plain text (shown by /jobs)."""
+        stats = self.stats
+        lines = ["Speculative extraction", "=" * 40]
+        if stats.launched == 0:
+            lines.append("None launched yet")
+        else:
+            lines.append(
+                f"{stats.launched} launched: {stats.hits} hit(s), {stats.misses} miss(es), "
+                f"{stats.cancelled} cancelled (hit rate {stats.hit_rate:.0%})"
+            )
+            lines.append(f"Tokens: {stats.used_tokens} used, {stats.wasted_tokens} wasted")
+        return "\n".join(lines)
+
+    def _log_outcome(self, outcome: str) -> None:
+        stats = self.stats
+        logger.info(
+            f"Speculative extraction {outcome}: hit rate {stats.hit_rate:.0%} "
+            f"({stats.hits}/{stats.launched}), {stats.wasted_tokens} tokens wasted"
+        )
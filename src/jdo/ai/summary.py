@@ -0,0 +1,59 @@
+"""Rolling conversation summary for long REPL sessions.
+
+Folds conversation turns evicted from the token-budgeted history into a
+compact summary so commitments discussed earlier are not lost.
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+from pydantic_ai.models import Model
+
+from jdo.ai.extraction import create_extraction_agent
+from jdo.ai.scheduler import background_priority
+from jdo.ai.timeout import AI_TIMEOUT_SECONDS, with_ai_timeout
+
+HISTORY_SUMMARY_PROMPT = """\
+Update the running summary of this conversation with the new messages below.
+Keep it short (a few bullet points). Preserve:
+- Commitments, tasks, goals, and visions discussed (deliverable, stakeholder, due date)
+- Decisions the user made and anything they confirmed or declined
+- Open questions that still need an answer
+
+Drop small talk and anything already captured in the previous summary.
+"""
+
+
+class HistorySummary(BaseModel):
+    """Compact summary of earlier conversation turns."""
+
+    summary: str = Field(description="Bullet-point summary of the conversation so far")
+
+
+async def summarize_history(
+    previous_summary: str | None,
+    messages: list[dict[str, str]],
+    model: Model | str = "test",
+) -> str:
+    """Fold evicted messages into the rolling conversation summary.
+
+    Runs at background priority, behind interactive turns.
+
+    Args:
+        previous_summary: The current summary, if any.
+        messages: Evicted messages with 'role' and 'content' keys.
+        model: Model to use for summarization.
+
+    Returns:
+        The updated summary text.
+
+    Raises:
+        TimeoutError: If AI call exceeds timeout.
+    """
+    agent = create_extraction_agent(model, HistorySummary, HISTORY_SUMMARY_PROMPT)
+    conversation = "\n\n".join(f"{msg['role'].upper()}: {msg['content']}" for msg in messages)
+    prompt = f"PREVIOUS SUMMARY:\n{previous_summary or '(none)'}\n\nNEW MESSAGES:\n{conversation}"
+
+    with background_priority():
+        result = await with_ai_timeout(agent.run(prompt), AI_TIMEOUT_SECONDS)
+    return result.output.summary  # type: ignore[attr-defined]
@@ -7,7 +7,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from sqlmodel import Session, select
+from sqlalchemy import func
+from sqlmodel import Session, col, select
 
 from jdo.models.commitment import Commitment, CommitmentStatus
 from jdo.models.task import Task, TaskStatus
@@ -73,43 +74,27 @@ def calculate_allocated_hours(session: Session) -> tuple[float, int, int]:
     Returns:
         Tuple of (total_hours, task_count, tasks_without_estimates).
     """
-    # Get active commitment IDs
     active_statuses = [
         CommitmentStatus.PENDING,
         CommitmentStatus.IN_PROGRESS,
         CommitmentStatus.AT_RISK,
     ]
-    active_commitments = session.exec(
-        select(Commitment.id).where(Commitment.status.in_(active_statuses))  # type: ignore[union-attr]
-    ).all()
-    active_commitment_ids = set(active_commitments)
-
-    if not active_commitment_ids:
-        return 0.0, 0, 0
-
-    # Get tasks for active commitments
     task_statuses = [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]
-    tasks = session.exec(
-        select(Task).where(
-            Task.status.in_(task_statuses),  # type: ignore[union-attr]
+    estimate = col(Task.estimated_hours)
+    total_hours, task_count, with_estimates = session.exec(
+        select(
+            func.coalesce(func.sum(estimate), 0.0),
+            func.count(col(Task.id)),
+            func.count(estimate),
         )
-    ).all()
-
-    # Filter to active commitments and calculate
-    total_hours = 0.0
-    task_count = 0
-    without_estimates = 0
-
-    for task in tasks:
-        if task.commitment_id not in active_commitment_ids:
-            continue
-        task_count += 1
-        if task.estimated_hours is not None:
-            total_hours += task.estimated_hours
-        else:
-            without_estimates += 1
+        .join(Commitment, col(Task.commitment_id) == col(Commitment.id))
+        .where(
+            col(Commitment.status).in_(active_statuses),
+            col(Task.status).in_(task_statuses),
+        )
+    ).one()
 
-    return total_hours, task_count, without_estimates
+    return float(total_hours), task_count, task_count - with_estimates
 
 
 def get_time_context(session: Session, available_hours: float | None = None) -> TimeContext:
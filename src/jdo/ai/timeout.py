@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+import contextvars
 from collections.abc import Awaitable, Callable
 from typing import TypeVar
 
@@ -50,7 +51,9 @@ def run_sync_with_timeout(
     """Run a synchronous function with a timeout.
 
     Uses ThreadPoolExecutor to run the function in a separate thread
-    and enforces a timeout on the result.
+    and enforces a timeout on the result. The function runs in a copy of
+    the caller's context, so context variables (e.g. AI call priority)
+    carry over.
 
     Args:
         func: The function to call.
@@ -65,7 +68,7 @@ def run_sync_with_timeout(
         TimeoutError: If the operation times out.
     """
     with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(func, *args, **kwargs)
+        future = executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
         try:
             return future.result(timeout=timeout)
         except concurrent.futures.TimeoutError as e:
@@ -0,0 +1,265 @@
+"""Compact, token-budgeted encoding for agent tool output.
+
+Tool results are sent back to the model on every turn that uses them, so they
+are encoded as a header row plus one ``|``-separated line per row, with short
+id aliases (``c1``, ``g2``) instead of UUIDs and ISO dates. Rows are added
+until the per-call token budget is spent; the remainder is reported as a
+"N more" tail so the model can narrow the query with filters.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from datetime import date, datetime, time
+from enum import Enum
+from uuid import UUID
+
+# Approximate characters per token (matches the REPL history estimate)
+CHARS_PER_TOKEN = 4
+
+# Default and bounds for the per-call token budget a tool may spend
+DEFAULT_TOOL_TOKEN_BUDGET = 800
+MIN_TOOL_TOKEN_BUDGET = 100
+MAX_TOOL_TOKEN_BUDGET = 4000
+
+# Default number of rows a list tool returns before truncating
+DEFAULT_TOOL_ROW_LIMIT = 25
+
+FIELD_SEPARATOR = "|"
+
+# Escape character for LIKE patterns built from model-supplied text
+LIKE_ESCAPE = "\\"
+
+# Alias prefixes per entity type
+COMMITMENT_ALIAS = "c"
+GOAL_ALIAS = "g"
+MILESTONE_ALIAS = "m"
+VISION_ALIAS = "v"
+TASK_ALIAS = "t"
+
+
+class IdAliases:
+    """Session-stable short aliases for entity UUIDs.
+
+    The model sees ``c3`` instead of a 36-character UUID; tools map the alias
+    back to the UUID when the model passes it as an argument. Aliases are
+    never reused within a session, so ids quoted in earlier turns stay valid.
+    Tools run in worker threads and may assign aliases concurrently, so
+    assignment is locked.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty alias table."""
+        self._by_id: dict[UUID, str] = {}
+        self._by_alias: dict[str, UUID] = {}
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def alias(self, prefix: str, entity_id: UUID | str) -> str:
+        """Get (or assign) the alias for an entity id.
+
+        Args:
+            prefix: Entity prefix (e.g. COMMITMENT_ALIAS).
+            entity_id: The entity UUID.
+
+        Returns:
+            Short alias such as ``c1``.
+        """
+        uuid = entity_id if isinstance(entity_id, UUID) else UUID(entity_id)
+        with self._lock:
+            existing = self._by_id.get(uuid)
+            if existing is not None:
+                return existing
+            count = self._counters.get(prefix, 0) + 1
+            self._counters[prefix] = count
+            alias = f"{prefix}{count}"
+            self._by_id[uuid] = alias
+            self._by_alias[alias] = uuid
+            return alias
+
+    def resolve(self, value: str) -> UUID:
+        """Map an alias or full UUID string back to a UUID.
+
+        Args:
+            value: Alias previously returned by alias(), or a UUID string.
+
+        Returns:
+            The entity UUID.
+
+        Raises:
+            ValueError: If the value is neither a known alias nor a UUID.
+        """
+        key = value.strip()
+        uuid = self._by_alias.get(key.lower())
+        if uuid is not None:
+            return uuid
+        try:
+            return UUID(key)
+        except ValueError:
+            msg = f"Unknown id '{value}'"
+            raise ValueError(msg) from None
+
+    def __len__(self) -> int:
+        """Number of aliases assigned."""
+        return len(self._by_alias)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of tool output.
+
+    Args:
+        text: Text to estimate.
+
+    Returns:
+        Approximate token count (at least 1 for non-empty text).
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def clamp_token_budget(token_budget: int) -> int:
+    """Clamp a model-supplied token budget to the allowed range.
+
+    Args:
+        token_budget: Requested budget.
+
+    Returns:
+        Budget within [MIN_TOOL_TOKEN_BUDGET, MAX_TOOL_TOKEN_BUDGET].
+    """
+    return max(MIN_TOOL_TOKEN_BUDGET, min(token_budget, MAX_TOOL_TOKEN_BUDGET))
+
+
+def like_contains(text: str) -> str:
+    """Build a LIKE pattern matching text as a literal substring.
+
+    ``%`` and ``_`` in the text are escaped with LIKE_ESCAPE, so the pattern
+    must be used with ``escape=LIKE_ESCAPE``.
+
+    Args:
+        text: Substring to search for.
+
+    Returns:
+        Pattern of the form ``%text%``.
+    """
+    escaped = (
+        text.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+    return f"%{escaped}%"
+
+
+def fit_to_budget(text: str, token_budget: int = DEFAULT_TOOL_TOKEN_BUDGET) -> str:
+    """Trim free-form tool output to the per-call token budget.
+
+    Whole lines are kept in order until the next one would exceed the budget;
+    the rest are reported in a "N more lines" tail. A first line that alone
+    exceeds the budget is cut short.
+
+    Args:
+        text: Newline-separated tool output.
+        token_budget: Maximum approximate tokens for the output.
+
+    Returns:
+        The text, truncated if it is over budget.
+    """
+    budget = clamp_token_budget(token_budget)
+    if estimate_tokens(text) <= budget:
+        return text
+
+    lines = text.split("\n")
+    kept: list[str] = []
+    # Reserve room for the tail line so truncated output stays within budget
+    used = 8
+    for line in lines:
+        cost = estimate_tokens(line) + 1
+        if used + cost > budget:
+            if not kept:
+                kept.append(line[: (budget - used) * CHARS_PER_TOKEN] + "...")
+            break
+        kept.append(line)
+        used += cost
+    omitted = len(lines) - len(kept)
+    if omitted > 0:
+        kept.append(f"... {omitted} more lines")
+    return "\n".join(kept)
+
+
+def format_cell(value: object) -> str:
+    """Encode one table cell.
+
+    Dates and times use ISO format, enums their value, None an empty cell.
+    Separators and newlines inside text are replaced so every row stays on
+    one line.
+
+    Args:
+        value: Cell value.
+
+    Returns:
+        Encoded cell text.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="minutes")
+    if isinstance(value, time):
+        return value.isoformat(timespec="minutes")
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float):
+        return f"{value:g}"
+    text = str(value)
+    return " ".join(text.replace(FIELD_SEPARATOR, "/").split())
+
+
+def format_compact_table(
+    columns: Sequence[str],
+    rows: Sequence[Sequence[object]],
+    *,
+    token_budget: int = DEFAULT_TOOL_TOKEN_BUDGET,
+    limit: int = DEFAULT_TOOL_ROW_LIMIT,
+    filters: Sequence[str] = (),
+    empty_message: str = "No results.",
+) -> str:
+    """Encode rows as a header line plus one separator-joined line per row.
+
+    Rows are taken in order until ``limit`` rows are emitted or the next row
+    would exceed ``token_budget``. Omitted rows are reported in a tail line
+    that names the filters the model can use to narrow the query.
+
+    Args:
+        columns: Column names for the header row.
+        rows: Row values, in display order.
+        token_budget: Maximum approximate tokens for the whole output.
+        limit: Maximum number of rows to emit.
+        filters: Names of the filter arguments the tool accepts.
+        empty_message: Text returned when there are no rows.
+
+    Returns:
+        The encoded table.
+    """
+    if not rows:
+        return empty_message
+
+    budget = clamp_token_budget(token_budget)
+    header = FIELD_SEPARATOR.join(columns)
+    lines = [header]
+    # Reserve room for the tail line so truncated output stays within budget
+    used = estimate_tokens(header) + 16
+    for row in rows[: max(limit, 1)]:
+        line = FIELD_SEPARATOR.join(format_cell(value) for value in row)
+        cost = estimate_tokens(line) + 1
+        if used + cost > budget and len(lines) > 1:
+            break
+        lines.append(line)
+        used += cost
+
+    omitted = len(rows) - (len(lines) - 1)
+    if omitted > 0:
+        tail = f"... {omitted} more"
+        if filters:
+            tail += f", refine with filters: {', '.join(filters)}"
+        lines.append(tail)
+    return "\n".join(lines)
@@ -6,20 +6,32 @@ to help users manage their commitments, goals, milestones, and visions.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-
-from jdo.utils.datetime import today_date
-
-if TYPE_CHECKING:
-    pass
+from datetime import date
+from typing import Any
 from uuid import UUID
 
 from loguru import logger
 from pydantic_ai import Agent, RunContext
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import Select
 
 from jdo.ai.agent import JDODependencies
+from jdo.ai.capacity import Bucket, forecast_capacity, format_forecast_for_ai
 from jdo.ai.time_context import format_time_context_for_ai, get_time_context
+from jdo.ai.tool_output import (
+    COMMITMENT_ALIAS,
+    DEFAULT_TOOL_ROW_LIMIT,
+    DEFAULT_TOOL_TOKEN_BUDGET,
+    GOAL_ALIAS,
+    LIKE_ESCAPE,
+    MILESTONE_ALIAS,
+    TASK_ALIAS,
+    VISION_ALIAS,
+    IdAliases,
+    fit_to_budget,
+    format_compact_table,
+    like_contains,
+)
 from jdo.db.persistence import PersistenceService, ValidationError
 from jdo.db.session import get_session
 from jdo.db.task_history_service import TaskHistoryService
@@ -35,12 +47,7 @@ from jdo.models import (
 )
 from jdo.models.integrity_metrics import IntegrityMetrics
 from jdo.models.task_history import TaskEventType, TaskHistoryEntry
-from jdo.output.formatters import (
-    format_commitment_list_plain,
-    format_milestones_plain,
-    format_overdue_commitments_plain,
-    format_visions_plain,
-)
+from jdo.utils.datetime import today_date, utc_now
 
 # Coaching threshold constants
 COACHING_ON_TIME_THRESHOLD = 0.8
@@ -50,23 +57,80 @@ COACHING_ESTIMATION_THRESHOLD = 0.7
 MIN_TASKS_FOR_ESTIMATION_COACHING = 5
 
 
-def get_current_commitments(session: Session) -> list[dict[str, Any]]:
+def _filter_commitments(
+    statement: Select[tuple[Commitment, Stakeholder]],
+    *,
+    stakeholder: str | None = None,
+    search: str | None = None,
+    due_before: date | None = None,
+    due_after: date | None = None,
+) -> Select[tuple[Commitment, Stakeholder]]:
+    """Narrow a Commitment/Stakeholder select with optional tool filters.
+
+    Args:
+        statement: Select over Commitment joined to Stakeholder.
+        stakeholder: Case-insensitive substring of the stakeholder name.
+        search: Case-insensitive substring of the deliverable.
+        due_before: Only commitments due on or before this date.
+        due_after: Only commitments due on or after this date.
+
+    Returns:
+        The filtered statement.
+    """
+    if stakeholder:
+        statement = statement.where(
+            col(Stakeholder.name).ilike(like_contains(stakeholder), escape=LIKE_ESCAPE)
+        )
+    if search:
+        statement = statement.where(
+            col(Commitment.deliverable).ilike(like_contains(search), escape=LIKE_ESCAPE)
+        )
+    if due_before is not None:
+        statement = statement.where(Commitment.due_date <= due_before)
+    if due_after is not None:
+        statement = statement.where(Commitment.due_date >= due_after)
+    return statement
+
+
+def get_current_commitments(
+    session: Session,
+    *,
+    status: CommitmentStatus | None = None,
+    stakeholder: str | None = None,
+    search: str | None = None,
+    due_before: date | None = None,
+    due_after: date | None = None,
+) -> list[dict[str, Any]]:
     """Get pending and in-progress commitments.
 
     Args:
         session: Database session.
+        status: Only this status (must be pending or in_progress to match).
+        stakeholder: Case-insensitive substring of the stakeholder name.
+        search: Case-insensitive substring of the deliverable.
+        due_before: Only commitments due on or before this date.
+        due_after: Only commitments due on or after this date.
 
     Returns:
         List of commitment dicts with id, deliverable, stakeholder_name, due_date, status.
     """
     logger.debug("Querying current commitments")
     # Query commitments with stakeholder join
-    commitments = session.exec(
+    statement = (
         select(Commitment, Stakeholder)
         .join(Stakeholder, Commitment.stakeholder_id == Stakeholder.id)
         .where(Commitment.status.in_([CommitmentStatus.PENDING, CommitmentStatus.IN_PROGRESS]))
-        .order_by(Commitment.due_date)
-    ).all()
+    )
+    if status is not None:
+        statement = statement.where(Commitment.status == status)
+    statement = _filter_commitments(
+        statement,
+        stakeholder=stakeholder,
+        search=search,
+        due_before=due_before,
+        due_after=due_after,
+    )
+    commitments = session.exec(statement.order_by(col(Commitment.due_at))).all()
 
     return [
         {
@@ -83,25 +147,33 @@ def get_current_commitments(session: Session) -> list[dict[str, Any]]:
     ]
 
 
-def get_overdue_commitments(session: Session) -> list[dict[str, Any]]:
+def get_overdue_commitments(
+    session: Session,
+    *,
+    stakeholder: str | None = None,
+    search: str | None = None,
+) -> list[dict[str, Any]]:
     """Get commitments past their due date.
 
     Args:
         session: Database session.
+        stakeholder: Case-insensitive substring of the stakeholder name.
+        search: Case-insensitive substring of the deliverable.
 
     Returns:
         List of overdue commitment dicts.
     """
-    today = today_date()
-    commitments = session.exec(
+    now = utc_now()
+    statement = (
         select(Commitment, Stakeholder)
         .join(Stakeholder, Commitment.stakeholder_id == Stakeholder.id)
         .where(
-            Commitment.due_date < today,
+            col(Commitment.due_at) < now,
             Commitment.status.in_([CommitmentStatus.PENDING, CommitmentStatus.IN_PROGRESS]),
         )
-        .order_by(Commitment.due_date)
-    ).all()
+    )
+    statement = _filter_commitments(statement, stakeholder=stakeholder, search=search)
+    commitments = session.exec(statement.order_by(col(Commitment.due_at))).all()
 
     return [
         {
@@ -110,29 +182,37 @@ def get_overdue_commitments(session: Session) -> list[dict[str, Any]]:
             "stakeholder_name": s.name,
             "due_date": c.due_date.isoformat(),
             "status": c.status.value,
-            "days_overdue": (today - c.due_date).days,
+            "days_overdue": (now.date() - c.due_date).days,
         }
         for c, s in commitments
     ]
 
 
-def get_commitments_for_goal(session: Session, goal_id: str) -> list[dict[str, Any]]:
+def get_commitments_for_goal(
+    session: Session,
+    goal_id: str,
+    *,
+    status: CommitmentStatus | None = None,
+) -> list[dict[str, Any]]:
     """Get commitments for a specific goal.
 
     Args:
         session: Database session.
         goal_id: UUID of the goal.
+        status: Only commitments with this status.
 
     Returns:
         List of commitment dicts for the goal.
     """
     goal_uuid = UUID(goal_id)
-    commitments = session.exec(
+    statement = (
         select(Commitment, Stakeholder)
         .join(Stakeholder, Commitment.stakeholder_id == Stakeholder.id)
         .where(Commitment.goal_id == goal_uuid)
-        .order_by(Commitment.due_date)
-    ).all()
+    )
+    if status is not None:
+        statement = statement.where(Commitment.status == status)
+    commitments = session.exec(statement.order_by(col(Commitment.due_at))).all()
 
     return [
         {
@@ -205,79 +285,280 @@ def get_visions_due_for_review(session: Session) -> list[dict[str, Any]]:
     ]
 
 
+def _parse_date_filter(value: str | None, name: str) -> date | None:
+    """Parse an optional ISO date tool argument.
+
+    Args:
+        value: Date string from the model (YYYY-MM-DD) or None.
+        name: Argument name for the error message.
+
+    Returns:
+        Parsed date, or None when not given.
+
+    Raises:
+        ValueError: If the value is not an ISO date.
+    """
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        msg = f"{name} must be YYYY-MM-DD, got '{value}'"
+        raise ValueError(msg) from None
+
+
+def _parse_status_filter(value: str | None) -> CommitmentStatus | None:
+    """Parse an optional commitment status tool argument.
+
+    Args:
+        value: Status value from the model or None.
+
+    Returns:
+        Parsed status, or None when not given.
+
+    Raises:
+        ValueError: If the value is not a commitment status.
+    """
+    if not value:
+        return None
+    try:
+        return CommitmentStatus(value.strip().lower())
+    except ValueError:
+        valid = ", ".join(s.value for s in CommitmentStatus)
+        msg = f"status must be one of: {valid}"
+        raise ValueError(msg) from None
+
+
+def _format_commitment_rows(
+    commitments: list[dict[str, Any]],
+    aliases: IdAliases,
+    *,
+    token_budget: int,
+    limit: int,
+    filters: tuple[str, ...],
+    overdue: bool = False,
+) -> str:
+    """Encode commitment dicts as a compact table with aliased ids.
+
+    The last column is the linked goal, or days overdue when ``overdue`` is set.
+    """
+    rows = []
+    for c in commitments:
+        due = f"{c['due_date']}T{c['due_time'][:5]}" if c.get("due_time") else c["due_date"]
+        if overdue:
+            last = c["days_overdue"]
+        else:
+            last = aliases.alias(GOAL_ALIAS, c["goal_id"]) if c.get("goal_id") else None
+        rows.append(
+            (
+                aliases.alias(COMMITMENT_ALIAS, c["id"]),
+                c["deliverable"],
+                c["stakeholder_name"],
+                due,
+                c["status"],
+                last,
+            )
+        )
+    return format_compact_table(
+        (
+            "id",
+            "deliverable",
+            "stakeholder",
+            "due",
+            "status",
+            "days_overdue" if overdue else "goal",
+        ),
+        rows,
+        token_budget=token_budget,
+        limit=limit,
+        filters=filters,
+        empty_message="No commitments found.",
+    )
+
+
 def _register_commitment_tools(agent: Agent[JDODependencies, str]) -> None:
     """Register commitment-related query tools."""
 
-    @agent.tool_plain
-    def query_current_commitments() -> str:
-        """Get all pending and in-progress commitments.
+    @agent.tool
+    def query_current_commitments(
+        ctx: RunContext[JDODependencies],
+        *,
+        stakeholder: str | None = None,
+        status: str | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        search: str | None = None,
+        limit: int = DEFAULT_TOOL_ROW_LIMIT,
+        token_budget: int = DEFAULT_TOOL_TOKEN_BUDGET,
+    ) -> str:
+        """Get pending and in-progress commitments as a compact table, soonest due first.
 
-        Returns a list of current commitments with deliverable, stakeholder, due date, and status.
+        Args:
+            ctx: Run context; its id aliases map short ids to UUIDs.
+            stakeholder: Only commitments for stakeholders whose name contains this.
+            status: Only this status (pending or in_progress).
+            due_before: Only commitments due on or before this date (YYYY-MM-DD).
+            due_after: Only commitments due on or after this date (YYYY-MM-DD).
+            search: Only commitments whose deliverable contains this text.
+            limit: Maximum rows to return.
+            token_budget: Approximate token budget for the result.
         """
+        try:
+            status_filter = _parse_status_filter(status)
+            before = _parse_date_filter(due_before, "due_before")
+            after = _parse_date_filter(due_after, "due_after")
+        except ValueError as e:
+            return f"Invalid filter: {e}"
         # Use a dedicated session to avoid concurrency issues with parallel tool calls
         with get_session() as session:
-            result = get_current_commitments(session)
-            return format_commitment_list_plain(result)
+            result = get_current_commitments(
+                session,
+                status=status_filter,
+                stakeholder=stakeholder,
+                search=search,
+                due_before=before,
+                due_after=after,
+            )
+        return _format_commitment_rows(
+            result,
+            ctx.deps.id_aliases,
+            token_budget=token_budget,
+            limit=limit,
+            filters=("stakeholder", "status", "due_before", "due_after", "search"),
+        )
 
-    @agent.tool_plain
-    def query_overdue_commitments() -> str:
-        """Get all commitments that are past their due date.
+    @agent.tool
+    def query_overdue_commitments(
+        ctx: RunContext[JDODependencies],
+        stakeholder: str | None = None,
+        search: str | None = None,
+        limit: int = DEFAULT_TOOL_ROW_LIMIT,
+        token_budget: int = DEFAULT_TOOL_TOKEN_BUDGET,
+    ) -> str:
+        """Get commitments past their due date as a compact table, most overdue first.
 
-        Returns a list of overdue commitments with days overdue.
+        Args:
+            ctx: Run context; its id aliases map short ids to UUIDs.
+            stakeholder: Only commitments for stakeholders whose name contains this.
+            search: Only commitments whose deliverable contains this text.
+            limit: Maximum rows to return.
+            token_budget: Approximate token budget for the result.
         """
         # Use a dedicated session to avoid concurrency issues with parallel tool calls
         with get_session() as session:
-            result = get_overdue_commitments(session)
-            return format_overdue_commitments_plain(result)
+            result = get_overdue_commitments(session, stakeholder=stakeholder, search=search)
+        return _format_commitment_rows(
+            result,
+            ctx.deps.id_aliases,
+            token_budget=token_budget,
+            limit=limit,
+            filters=("stakeholder", "search"),
+            overdue=True,
+        )
 
-    @agent.tool_plain
-    def query_commitments_for_goal(goal_id: str) -> str:
-        """Get all commitments linked to a specific goal.
+    @agent.tool
+    def query_commitments_for_goal(
+        ctx: RunContext[JDODependencies],
+        goal_id: str,
+        status: str | None = None,
+        limit: int = DEFAULT_TOOL_ROW_LIMIT,
+        token_budget: int = DEFAULT_TOOL_TOKEN_BUDGET,
+    ) -> str:
+        """Get commitments linked to a specific goal as a compact table.
 
         Args:
-            goal_id: The UUID of the goal to query commitments for.
-
-        Returns:
-            Commitments for the specified goal as a string.
+            ctx: Run context; its id aliases map short ids to UUIDs.
+            goal_id: The goal id (short id like g1, or UUID).
+            status: Only commitments with this status.
+            limit: Maximum rows to return.
+            token_budget: Approximate token budget for the result.
         """
+        aliases = ctx.deps.id_aliases
+        try:
+            goal_uuid = aliases.resolve(goal_id)
+            status_filter = _parse_status_filter(status)
+        except ValueError as e:
+            return f"Invalid argument: {e}"
         # Use a dedicated session to avoid concurrency issues with parallel tool calls
         with get_session() as session:
-            result = get_commitments_for_goal(session, goal_id)
-            if not result:
-                return f"No commitments found for goal {goal_id}."
-            return format_commitment_list_plain(result)
+            result = get_commitments_for_goal(session, str(goal_uuid), status=status_filter)
+        if not result:
+            return f"No commitments found for goal {goal_id}."
+        return _format_commitment_rows(
+            result, aliases, token_budget=token_budget, limit=limit, filters=("status",)
+        )
 
 
 def _register_milestone_vision_tools(agent: Agent[JDODependencies, str]) -> None:
     """Register milestone and vision-related query tools."""
 
-    @agent.tool_plain
-    def query_milestones_for_goal(goal_id: str) -> str:
-        """Get all milestones for a specific goal.
+    @agent.tool
+    def query_milestones_for_goal(
+        ctx: RunContext[JDODependencies],
+        goal_id: str,
+        limit: int = DEFAULT_TOOL_ROW_LIMIT,
+        token_budget: int = DEFAULT_TOOL_TOKEN_BUDGET,
+    ) -> str:
+        """Get milestones for a specific goal as a compact table, sorted by target date.
 
         Args:
-            goal_id: The UUID of the goal to query milestones for.
-
-        Returns:
-            Milestones for the specified goal sorted by target date.
+            ctx: Run context; its id aliases map short ids to UUIDs.
+            goal_id: The goal id (short id like g1, or UUID).
+            limit: Maximum rows to return.
+            token_budget: Approximate token budget for the result.
         """
+        aliases = ctx.deps.id_aliases
+        try:
+            goal_uuid = aliases.resolve(goal_id)
+        except ValueError as e:
+            return f"Invalid argument: {e}"
         # Use a dedicated session to avoid concurrency issues with parallel tool calls
         with get_session() as session:
-            result = get_milestones_for_goal(session, goal_id)
-            if not result:
-                return f"No milestones found for goal {goal_id}."
-            return format_milestones_plain(result)
+            result = get_milestones_for_goal(session, str(goal_uuid))
+        if not result:
+            return f"No milestones found for goal {goal_id}."
+        rows = [
+            (aliases.alias(MILESTONE_ALIAS, m["id"]), m["title"], m["target_date"], m["status"])
+            for m in result
+        ]
+        return format_compact_table(
+            ("id", "title", "target", "status"), rows, token_budget=token_budget, limit=limit
+        )
 
-    @agent.tool_plain
-    def query_visions_due_for_review() -> str:
-        """Get all visions that are due for review.
+    @agent.tool
+    def query_visions_due_for_review(
+        ctx: RunContext[JDODependencies],
+        limit: int = DEFAULT_TOOL_ROW_LIMIT,
+        token_budget: int = DEFAULT_TOOL_TOKEN_BUDGET,
+    ) -> str:
+        """Get visions due for review (next review date today or earlier) as a compact table.
 
-        Returns visions where next_review_date is today or in the past.
+        Args:
+            ctx: Run context; its id aliases map short ids to UUIDs.
+            limit: Maximum rows to return.
+            token_budget: Approximate token budget for the result.
         """
         # Use a dedicated session to avoid concurrency issues with parallel tool calls
         with get_session() as session:
             result = get_visions_due_for_review(session)
-            return format_visions_plain(result)
+        aliases = ctx.deps.id_aliases
+        rows = [
+            (
+                aliases.alias(VISION_ALIAS, v["id"]),
+                v["title"],
+                v["timeframe"],
+                v["next_review_date"],
+                v["days_overdue"],
+            )
+            for v in result
+        ]
+        return format_compact_table(
+            ("id", "title", "timeframe", "review_due", "days_overdue"),
+            rows,
+            token_budget=token_budget,
+            limit=limit,
+            empty_message="No visions due for review.",
+        )
 
 
 def _get_recent_task_history(session: Session, limit: int = 20) -> list[TaskHistoryEntry]:
@@ -345,15 +626,52 @@ def _get_coaching_areas(metrics: IntegrityMetrics) -> list[str]:
     return coaching_areas
 
 
+def _register_capacity_tools(agent: Agent[JDODependencies, str]) -> None:
+    """Register forward capacity forecast tools."""
+
+    @agent.tool_plain
+    def query_capacity_forecast(
+        weeks: int = 8,
+        hours_per_day: float | None = None,
+        token_budget: int = DEFAULT_TOOL_TOKEN_BUDGET,
+    ) -> str:
+        """Forecast the user's committed hours per week over the coming weeks.
+
+        Combines open task estimates (by due date) with projected recurring
+        commitments. Use this before accepting work due beyond today.
+
+        Args:
+            weeks: Weeks to forecast (1-26).
+            hours_per_day: The user's usual working hours per day; when given,
+                over-allocated weeks are flagged.
+            token_budget: Approximate token budget for the result.
+
+        Returns:
+            Committed, projected, and total hours per week.
+        """
+        weeks = max(1, min(weeks, 26))
+        # Use a dedicated session to avoid concurrency issues with parallel tool calls
+        with get_session() as session:
+            forecast = forecast_capacity(session, horizon_days=weeks * 7, bucket=Bucket.WEEK)
+        return fit_to_budget(format_forecast_for_ai(forecast, hours_per_day), token_budget)
+
+
 def _register_time_coaching_tools(agent: Agent[JDODependencies, str]) -> None:
     """Register time management and coaching query tools."""
 
     @agent.tool
-    def query_user_time_context(ctx: RunContext[JDODependencies]) -> str:
+    def query_user_time_context(
+        ctx: RunContext[JDODependencies],
+        token_budget: int = DEFAULT_TOOL_TOKEN_BUDGET,
+    ) -> str:
         """Get the user's current time context for coaching decisions.
 
         Returns available hours, allocated hours, remaining capacity, and utilization.
         Use this to check if user is over-committed before accepting new tasks.
+
+        Args:
+            ctx: Run context; carries the user's available hours.
+            token_budget: Approximate token budget for the result.
         """
         # Use a dedicated session to avoid concurrency issues with parallel tool calls
         with get_session() as session:
@@ -361,12 +679,14 @@ def _register_time_coaching_tools(agent: Agent[JDODependencies, str]) -> None:
                 session,
                 available_hours=ctx.deps.available_hours_remaining,
             )
-            return format_time_context_for_ai(context)
+            return fit_to_budget(format_time_context_for_ai(context), token_budget)
 
-    @agent.tool_plain
+    @agent.tool
     def query_task_history(
+        ctx: RunContext[JDODependencies],
         commitment_id: str | None = None,
         limit: int = 20,
+        token_budget: int = DEFAULT_TOOL_TOKEN_BUDGET,
     ) -> str:
         """Get task completion history for pattern analysis.
 
@@ -374,43 +694,59 @@ def _register_time_coaching_tools(agent: Agent[JDODependencies, str]) -> None:
         Can filter by commitment_id for commitment-specific history.
 
         Args:
-            commitment_id: Optional commitment UUID to filter history.
+            ctx: Run context; its id aliases map short ids to UUIDs.
+            commitment_id: Optional commitment id (short id like c1, or UUID) to filter history.
             limit: Maximum entries to return (default 20).
+            token_budget: Approximate token budget for the result.
 
         Returns:
             Task history with timestamps, estimates, and actual hours categories.
         """
+        try:
+            commitment_uuid = ctx.deps.id_aliases.resolve(commitment_id) if commitment_id else None
+        except ValueError as e:
+            return f"Invalid argument: {e}"
         # Use a dedicated session to avoid concurrency issues with parallel tool calls
         with get_session() as session:
             service = TaskHistoryService(session)
 
-            if commitment_id:
-                entries = service.get_history_for_commitment(UUID(commitment_id))
+            if commitment_uuid:
+                entries = service.get_history_for_commitment(commitment_uuid)
             else:
                 entries = _get_recent_task_history(session, limit)
 
             if not entries:
                 return "No task history found."
 
-            return _format_task_history_entries(entries, limit)
+            return fit_to_budget(_format_task_history_entries(entries, limit), token_budget)
 
-    @agent.tool_plain
-    def query_commitment_time_rollup(commitment_id: str) -> str:
+    @agent.tool
+    def query_commitment_time_rollup(
+        ctx: RunContext[JDODependencies],
+        commitment_id: str,
+        token_budget: int = DEFAULT_TOOL_TOKEN_BUDGET,
+    ) -> str:
         """Get time rollup for a specific commitment.
 
         Shows total/remaining/completed estimated hours and task counts.
         Use this to understand workload breakdown for a commitment.
 
         Args:
-            commitment_id: UUID of the commitment.
+            ctx: Run context; its id aliases map short ids to UUIDs.
+            commitment_id: The commitment id (short id like c1, or UUID).
+            token_budget: Approximate token budget for the result.
 
         Returns:
             Time breakdown including estimate coverage percentage.
         """
+        try:
+            commitment_uuid = ctx.deps.id_aliases.resolve(commitment_id)
+        except ValueError as e:
+            return f"Invalid argument: {e}"
         # Use a dedicated session to avoid concurrency issues with parallel tool calls
         with get_session() as session:
             service = TimeRollupService(session)
-            rollup = service.get_rollup(UUID(commitment_id))
+            rollup = service.get_rollup(commitment_uuid)
 
             lines = [
                 f"Total estimated hours: {rollup.total_estimated_hours:.1f}",
@@ -421,14 +757,17 @@ def _register_time_coaching_tools(agent: Agent[JDODependencies, str]) -> None:
                 f"({rollup.estimate_coverage * 100:.0f}% coverage)",
             ]
 
-            return "\n".join(lines)
+            return fit_to_budget("\n".join(lines), token_budget)
 
     @agent.tool_plain
-    def query_integrity_with_context() -> str:
+    def query_integrity_with_context(token_budget: int = DEFAULT_TOOL_TOKEN_BUDGET) -> str:
         """Get user's integrity metrics with coaching context.
 
         Returns letter grade, component scores, and areas needing attention.
         Use this to provide integrity-based coaching and feedback.
+
+        Args:
+            token_budget: Approximate token budget for the result.
         """
         # Use a dedicated session to avoid concurrency issues with parallel tool calls
         with get_session() as session:
@@ -461,17 +800,19 @@ def _register_time_coaching_tools(agent: Agent[JDODependencies, str]) -> None:
             lines.append("")
             lines.append("Areas to focus on: " + ", ".join(coaching_areas))
 
-        return "\n".join(lines)
+        return fit_to_budget("\n".join(lines), token_budget)
 
 
 def _register_mutation_tools(agent: Agent[JDODependencies, str]) -> None:
     """Register data mutation tools for creating/updating entities."""
 
-    @agent.tool_plain
+    @agent.tool
     def create_commitment(
+        ctx: RunContext[JDODependencies],
         deliverable: str,
         stakeholder: str,
         due_date: str,
+        *,
         due_time: str | None = None,
         goal_id: str | None = None,
         milestone_id: str | None = None,
@@ -479,17 +820,25 @@ def _register_mutation_tools(agent: Agent[JDODependencies, str]) -> None:
         """Create a new commitment.
 
         Args:
+            ctx: Run context; its id aliases map short ids to UUIDs.
             deliverable: What will be delivered.
             stakeholder: Who the commitment is for.
             due_date: When it's due (YYYY-MM-DD format).
             due_time: Optional time (HH:MM format).
-            goal_id: Optional UUID of linked goal.
-            milestone_id: Optional UUID of linked milestone.
+            goal_id: Optional linked goal id (short id like g1, or UUID).
+            milestone_id: Optional linked milestone id (short id like m1, or UUID).
 
         Returns:
             Confirmation message with commitment ID.
         """
-        with get_session() as session:
+        aliases = ctx.deps.id_aliases
+        try:
+            goal_uuid = aliases.resolve(goal_id) if goal_id else None
+            milestone_uuid = aliases.resolve(milestone_id) if milestone_id else None
+        except ValueError as e:
+            return f"Error creating commitment: {e}"
+        # Removed again if the run is cancelled; validation fails before anything is written
+        with ctx.deps.mutations.session() as session:
             service = PersistenceService(session)
 
             try:
@@ -499,19 +848,19 @@ def _register_mutation_tools(agent: Agent[JDODependencies, str]) -> None:
                         "stakeholder": stakeholder,
                         "due_date": due_date,
                         "due_time": due_time,
-                        "goal_id": goal_id,
-                        "milestone_id": milestone_id,
+                        "goal_id": str(goal_uuid) if goal_uuid else None,
+                        "milestone_id": str(milestone_uuid) if milestone_uuid else None,
                     }
                 )
-                session.commit()
             except ValidationError as e:
-                session.rollback()
                 return f"Error creating commitment: {e}"
             else:
-                return f"Created commitment '{commitment.deliverable}' (ID: {commitment.id})"
+                alias = aliases.alias(COMMITMENT_ALIAS, commitment.id)
+                return f"Created commitment '{commitment.deliverable}' (ID: {alias})"
 
-    @agent.tool_plain
+    @agent.tool
     def add_task_to_commitment(
+        ctx: RunContext[JDODependencies],
         title: str,
         commitment_id: str,
         scope: str | None = None,
@@ -520,15 +869,21 @@ def _register_mutation_tools(agent: Agent[JDODependencies, str]) -> None:
         """Add a task to an existing commitment.
 
         Args:
+            ctx: Run context; its id aliases map short ids to UUIDs.
             title: Task title.
-            commitment_id: UUID of parent commitment.
+            commitment_id: Parent commitment id (short id like c1, or UUID).
             scope: What "done" means (defaults to title).
             estimated_hours: Optional time estimate.
 
         Returns:
             Confirmation message with task ID.
         """
-        with get_session() as session:
+        aliases = ctx.deps.id_aliases
+        try:
+            commitment_uuid = aliases.resolve(commitment_id)
+        except ValueError as e:
+            return f"Error adding task: {e}"
+        with ctx.deps.mutations.session() as session:
             service = PersistenceService(session)
 
             try:
@@ -536,16 +891,15 @@ def _register_mutation_tools(agent: Agent[JDODependencies, str]) -> None:
                     {
                         "title": title,
                         "scope": scope,
-                        "commitment_id": commitment_id,
+                        "commitment_id": str(commitment_uuid),
                         "estimated_hours": estimated_hours,
                     }
                 )
-                session.commit()
             except ValidationError as e:
-                session.rollback()
                 return f"Error adding task: {e}"
             else:
-                return f"Added task '{task.title}' to commitment (Task ID: {task.id})"
+                alias = aliases.alias(TASK_ALIAS, task.id)
+                return f"Added task '{task.title}' to commitment (Task ID: {alias})"
 
 
 def register_tools(agent: Agent[JDODependencies, str]) -> None:
@@ -558,5 +912,6 @@ def register_tools(agent: Agent[JDODependencies, str]) -> None:
     _register_commitment_tools(agent)
     _register_milestone_vision_tools(agent)
     _register_time_coaching_tools(agent)
+    _register_capacity_tools(agent)
     _register_mutation_tools(agent)
     logger.debug("AI agent tools registered")
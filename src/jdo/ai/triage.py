@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 
+from jdo.ai.scheduler import background_priority, scheduled_model
 from jdo.ai.timeout import AI_TIMEOUT_SECONDS, run_sync_with_timeout, with_ai_timeout
 from jdo.config import get_settings
 from jdo.models.draft import EntityType
@@ -138,7 +139,7 @@ def _get_triage_agent() -> Agent[None, TriageClassification | ClarifyingQuestion
         Configured agent with structured output.
     """
     settings = get_settings()
-    model = f"{settings.ai_provider}:{settings.ai_model}"
+    model = scheduled_model(f"{settings.ai_provider}:{settings.ai_model}", settings.ai_provider)
 
     return Agent(
         model,
@@ -151,7 +152,8 @@ def classify_triage_item(text: str) -> TriageAnalysis:
     """Classify a captured text item into an entity type.
 
     Uses AI to analyze the text and suggest an appropriate entity type
-    (commitment, goal, task, vision, or milestone).
+    (commitment, goal, task, vision, or milestone). Runs at background
+    priority, behind interactive chat.
 
     Args:
         text: The raw captured text to classify.
@@ -167,7 +169,8 @@ def classify_triage_item(text: str) -> TriageAnalysis:
     prompt = f"Classify this captured text:\n\n{text}"
 
     # Wrap sync AI call with timeout via ThreadPoolExecutor
-    result = run_sync_with_timeout(agent.run_sync, prompt, timeout=AI_TIMEOUT_SECONDS)
+    with background_priority():
+        result = run_sync_with_timeout(agent.run_sync, prompt, timeout=AI_TIMEOUT_SECONDS)
     output = result.output
 
     if isinstance(output, TriageClassification):
@@ -212,7 +215,8 @@ async def classify_triage_item_async(text: str) -> TriageAnalysis:
     prompt = f"Classify this captured text:\n\n{text}"
 
     # Wrap async AI call with timeout
-    result = await with_ai_timeout(agent.run(prompt))
+    with background_priority():
+        result = await with_ai_timeout(agent.run(prompt))
     output = result.output
 
     if isinstance(output, TriageClassification):
@@ -0,0 +1,84 @@
+"""Prompt-cache accounting for AI responses.
+
+Providers report how many input tokens were served from their prompt cache.
+Tracking cached vs uncached input shows whether the static prompt prefix is
+actually being reused across turns.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from pydantic_ai.messages import ModelMessage
+    from pydantic_ai.usage import RequestUsage, RunUsage
+
+
+def log_cache_usage(label: str, usage: RequestUsage | RunUsage) -> None:
+    """Log cached vs uncached input tokens for one response or run.
+
+    Args:
+        label: What produced the usage (e.g. model name or extraction type).
+        usage: Usage reported by PydanticAI.
+    """
+    cached = usage.cache_read_tokens
+    logger.debug(
+        f"{label}: {usage.input_tokens} input tokens "
+        f"({cached} cached, {usage.input_tokens - cached} uncached), "
+        f"{usage.output_tokens} output tokens"
+    )
+
+
+@dataclass
+class PromptCacheStats:
+    """Running totals of cached and uncached input tokens.
+
+    Attributes:
+        responses: Number of model responses recorded.
+        input_tokens: Total input tokens across responses.
+        cached_input_tokens: Input tokens served from the provider's prompt cache.
+    """
+
+    responses: int = 0
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+
+    @property
+    def uncached_input_tokens(self) -> int:
+        """Input tokens that were billed at the full rate."""
+        return self.input_tokens - self.cached_input_tokens
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of input tokens served from cache (0.0 when nothing recorded)."""
+        if self.input_tokens == 0:
+            return 0.0
+        return self.cached_input_tokens / self.input_tokens
+
+    def record(self, usage: RequestUsage | RunUsage, label: str = "response") -> None:
+        """Add one response's usage to the totals.
+
+        Args:
+            usage: Usage reported by PydanticAI.
+            label: Label for the debug log line.
+        """
+        self.responses += 1
+        self.input_tokens += usage.input_tokens
+        self.cached_input_tokens += usage.cache_read_tokens
+        log_cache_usage(label, usage)
+
+    def record_messages(self, messages: Sequence[ModelMessage]) -> None:
+        """Record the usage of every model response in a run's messages.
+
+        Args:
+            messages: Messages produced by an agent run.
+        """
+        from pydantic_ai.messages import ModelResponse
+
+        for message in messages:
+            if isinstance(message, ModelResponse):
+                self.record(message.usage, label=message.model_name or "response")
@@ -2,22 +2,22 @@
 
 Provides both interactive REPL (default) and fire-and-forget CLI commands
 like `jdo capture "text"` for quick capture from scripts and shortcuts.
+
+Each command imports what it needs when it runs, so `jdo --help` loads only
+click and a capture doesn't load the AI stack or Alembic.
 """
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 import click
 
-from jdo.auth.api import is_authenticated, save_credentials
-from jdo.auth.models import ApiKeyCredentials
-from jdo.db import create_db_and_tables, get_session
-from jdo.db.migrations import (
-    create_revision,
-    downgrade_database,
-    get_migration_status,
-    upgrade_database,
-)
-from jdo.models.draft import Draft, EntityType
+from jdo.export.options import DEFAULT_WINDOW_DAYS, RecurringMode
+
+# Near-duplicates listed after a capture
+MAX_DUPLICATES_SHOWN = 3
 
 
 @click.group(invoke_without_command=True)
@@ -47,8 +47,13 @@ def capture(text: str) -> None:
         jdo capture "Call mom about birthday plans"
         jdo capture "Review quarterly report"
     """
-    # Ensure database is initialized
-    create_db_and_tables()
+    from jdo.db.duplicates import find_near_duplicates, same_text
+    from jdo.db.schema import ensure_schema
+    from jdo.db.session import get_session
+    from jdo.models.draft import Draft, EntityType
+
+    # Ensure database schema is up to date
+    ensure_schema()
 
     # Create a triage item (Draft with UNKNOWN type)
     draft = Draft(
@@ -57,9 +62,89 @@ def capture(text: str) -> None:
     )
 
     with get_session() as session:
-        session.add(draft)
+        duplicates = find_near_duplicates(session, text)
+        # The same text is already in the queue: merge by not capturing again.
+        # Matching terms alone is not enough ("Pay invoice 5" vs "Pay invoice 6").
+        same = next((d for d in duplicates if d.kind == "draft" and same_text(d.text, text)), None)
+        if same is None:
+            session.add(draft)
+
+    if same is not None:
+        click.echo(f"Already captured: {same.text}")
+        return
 
     click.echo(f"Captured: {text}")
+    for duplicate in duplicates[:MAX_DUPLICATES_SHOWN]:
+        click.echo(f"  Possible duplicate of {duplicate.kind}: {duplicate.text}")
+
+
+@cli.command()
+@click.argument("file", type=click.File("r"))
+@click.option(
+    "--concurrency",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum extractions in flight (default: JDO_BATCH_CONCURRENCY)",
+)
+@click.option("--yes", "-y", is_flag=True, help="Save without asking for confirmation")
+def ingest(file: click.utils.LazyFile, concurrency: int | None, *, yes: bool) -> None:
+    """Create commitments from a file of action items.
+
+    Each line is an item; lines indented beneath an item become its tasks.
+    Items are extracted in parallel, shown in one table, and saved together.
+    Use - as FILE to read from stdin.
+
+    Example:
+        jdo ingest meeting-notes.txt
+        pbpaste | jdo ingest -
+    """
+    import asyncio
+
+    from rich.console import Console
+
+    from jdo.ai.agent import get_model_identifier
+    from jdo.ai.batch import batch_to_plan_data, extract_batch, split_batch_items
+    from jdo.config import get_settings
+    from jdo.db.persistence import PersistenceService, ValidationError
+    from jdo.db.schema import ensure_schema
+    from jdo.db.session import get_session
+    from jdo.output.formatters import format_batch_proposal
+
+    items = split_batch_items(file.read())
+    if not items:
+        click.echo("No items found.")
+        return
+
+    settings = get_settings()
+    results = asyncio.run(
+        extract_batch(
+            items,
+            get_model_identifier(),
+            concurrency=concurrency or settings.batch_concurrency,
+            item_timeout=settings.batch_item_timeout,
+        )
+    )
+    plan_data, failures = batch_to_plan_data(results)
+    Console().print(
+        format_batch_proposal(plan_data, [(f.item.text, f.error or "failed") for f in failures])
+    )
+
+    count = len(plan_data["commitments"])
+    if not count:
+        msg = "No commitments could be extracted."
+        raise click.ClickException(msg)
+    if not yes and not click.confirm(f"Save {count} commitment(s)?", default=True):
+        click.echo("Cancelled.")
+        return
+
+    ensure_schema()
+    try:
+        with get_session() as session:
+            saved = PersistenceService(session).save_plan(plan_data)
+    except ValidationError as e:
+        raise click.ClickException(str(e)) from e
+    click.echo(f"Saved {len(saved.commitments)} commitment(s) and {len(saved.tasks)} task(s).")
 
 
 @cli.group()
@@ -75,6 +160,8 @@ def auth() -> None:
 @auth.command("status")
 def auth_status() -> None:
     """Show credential status for configured AI providers."""
+    from jdo.auth.api import is_authenticated
+
     providers = ["openai", "openrouter", "anthropic", "google"]
     click.echo("Credential status:")
     for provider in providers:
@@ -101,6 +188,9 @@ def auth_set(provider: str, api_key: tuple[str, ...]) -> None:
         jdo auth set openai sk-your-api-key
         jdo auth set openrouter sk-or-your-key
     """
+    from jdo.auth.api import save_credentials
+    from jdo.auth.models import ApiKeyCredentials
+
     if api_key:
         key = " ".join(api_key)
     else:
@@ -119,9 +209,76 @@ def auth_set(provider: str, api_key: tuple[str, ...]) -> None:
     click.echo(f"✓ {provider} credentials saved successfully")
 
 
+@cli.group()
+def export() -> None:
+    """Export commitments to other tools."""
+
+
+@export.command("ics")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the feed to FILE, only if the data changed (default: stdout)",
+)
+@click.option("--feed", is_flag=True, help="Write the local feed file in the data directory")
+@click.option(
+    "--recurring",
+    type=click.Choice([mode.value for mode in RecurringMode]),
+    default=RecurringMode.RRULE.value,
+    show_default=True,
+    help="Export recurring commitments as RRULEs or expanded occurrences",
+)
+@click.option(
+    "--window-days",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WINDOW_DAYS,
+    show_default=True,
+    help="Days of recurring occurrences to expand",
+)
+@click.option("--force", is_flag=True, help="Rewrite the file even if nothing changed")
+def export_ics(
+    output: Path | None, recurring: str, window_days: int, *, feed: bool, force: bool
+) -> None:
+    """Export commitments as an iCalendar (.ics) feed.
+
+    Without --output or --feed the calendar is streamed to stdout. A feed file
+    is rewritten only when its commitments changed (tracked in a manifest next
+    to it), so it is cheap to run on a schedule and subscribe to.
+
+    Example:
+        jdo export ics > commitments.ics
+        jdo export ics --feed
+        jdo export ics -o ~/Calendars/jdo.ics --recurring expand
+    """
+    from jdo.db.schema import ensure_schema
+    from jdo.db.session import get_session
+    from jdo.export import IcsOptions, export_ics_feed, write_ics
+    from jdo.paths import get_ics_feed_path
+
+    options = IcsOptions(recurring=RecurringMode(recurring), window_days=window_days)
+    if feed and output is None:
+        output = get_ics_feed_path()
+
+    ensure_schema()
+    with get_session() as session:
+        if output is None:
+            write_ics(session, sys.stdout, options)
+            return
+        result = export_ics_feed(session, output, options, force=force)
+
+    if result.written:
+        click.echo(f"Wrote {result.events} event(s) to {result.path}")
+    else:
+        click.echo(f"{result.path} is up to date")
+
+
 @db.command("status")
 def db_status() -> None:
     """Show current migration status."""
+    from jdo.db.migrations import get_migration_status
+
     click.echo("Current migration status:")
     get_migration_status()
 
@@ -130,6 +287,8 @@ def db_status() -> None:
 @click.option("--revision", "-r", default="head", help="Target revision (default: head)")
 def db_upgrade(revision: str) -> None:
     """Upgrade database to a later version."""
+    from jdo.db.migrations import upgrade_database
+
     click.echo(f"Upgrading database to: {revision}")
     upgrade_database(revision)
     click.echo("Database upgraded successfully.")
@@ -139,6 +298,8 @@ def db_upgrade(revision: str) -> None:
 @click.option("--revision", "-r", default="-1", help="Target revision (default: -1)")
 def db_downgrade(revision: str) -> None:
     """Downgrade database to an earlier version."""
+    from jdo.db.migrations import downgrade_database
+
     click.echo(f"Downgrading database to: {revision}")
     downgrade_database(revision)
     click.echo("Database downgraded successfully.")
@@ -149,6 +310,8 @@ def db_downgrade(revision: str) -> None:
 @click.option("--autogenerate/--no-autogenerate", default=True, help="Auto-detect changes")
 def db_revision(message: str, *, autogenerate: bool) -> None:
     """Create a new migration revision."""
+    from jdo.db.migrations import create_revision
+
     click.echo(f"Creating new revision: {message}")
     result = create_revision(message, autogenerate=autogenerate)
     if result:
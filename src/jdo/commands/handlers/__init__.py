@@ -34,6 +34,7 @@ from jdo.commands.handlers.utility_handlers import (
     EditHandler,
     HelpHandler,
     HoursHandler,
+    JobsHandler,
     ListHandler,
     ReviewHandler,
     ShowHandler,
@@ -78,6 +79,7 @@ def _register_handlers() -> None:
             CommandType.ABANDON: AbandonHandler,
             CommandType.HOURS: HoursHandler,
             CommandType.RECOVER: RecoverHandler,
+            CommandType.JOBS: JobsHandler,
         }
     )
 
@@ -117,6 +119,7 @@ __all__ = [
     "HelpHandler",
     "HoursHandler",
     "IntegrityHandler",
+    "JobsHandler",
     "ListHandler",
     "MilestoneHandler",
     "RecoverHandler",
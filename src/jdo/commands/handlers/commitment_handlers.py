@@ -14,6 +14,12 @@ from jdo.db.persistence import PersistenceService
 from jdo.db.session import get_session
 from jdo.integrity import IntegrityService
 
+# /atrisk flag that marks every overdue commitment at once
+ALL_OVERDUE_FLAG = "--all-overdue"
+
+# Reason used in notification drafts when --all-overdue is given none
+DEFAULT_OVERDUE_REASON = "This commitment is past its due date"
+
 
 class CommitHandler(CommandHandler):
     """Handler for /commit command - creates commitments.
@@ -172,9 +178,10 @@ class AtRiskHandler(CommandHandler):
     """Handler for /atrisk command - marks commitment as at-risk.
 
     Starts the Honor-Your-Word protocol: notify stakeholders, clean up impact.
+    ``/atrisk --all-overdue [reason]`` marks every overdue commitment at once.
     """
 
-    def execute(self, cmd: ParsedCommand, context: dict[str, Any]) -> HandlerResult:  # noqa: ARG002
+    def execute(self, cmd: ParsedCommand, context: dict[str, Any]) -> HandlerResult:
         """Execute /atrisk command.
 
         Args:
@@ -184,6 +191,9 @@ class AtRiskHandler(CommandHandler):
         Returns:
             HandlerResult for at-risk workflow.
         """
+        if cmd.args and cmd.args[0].lower() == ALL_OVERDUE_FLAG:
+            return self._mark_all_overdue(" ".join(cmd.args[1:]))
+
         current_commitment = context.get("current_commitment")
         available_commitments = context.get("available_commitments", [])
 
@@ -256,6 +266,39 @@ class AtRiskHandler(CommandHandler):
             needs_confirmation=False,
         )
 
+    def _mark_all_overdue(self, reason: str) -> HandlerResult:
+        """Mark every overdue commitment at-risk in one transaction."""
+        reason = reason.strip() or DEFAULT_OVERDUE_REASON
+        with get_session() as session:
+            service = IntegrityService()
+            commitment_ids = service.get_overdue_commitment_ids(session)
+            if not commitment_ids:
+                return HandlerResult(
+                    message="No overdue commitments. Nothing to mark at-risk.",
+                    panel_update=None,
+                    draft_data=None,
+                    needs_confirmation=False,
+                )
+            results = service.mark_commitments_at_risk_bulk(session, commitment_ids, reason)
+
+            lines = [f"Marked {len(results)} overdue commitment(s) as at-risk:", ""]
+            lines.extend(
+                f"  - {r.commitment.deliverable} (due {r.commitment.due_date.isoformat()})"
+                for r in results
+            )
+            lines.append("")
+            lines.append(
+                "A notification task is at the top of each one. "
+                "Let your stakeholders know, then use /cleanup to plan the rest."
+            )
+
+        return HandlerResult(
+            message="\n".join(lines),
+            panel_update=None,
+            draft_data=None,
+            needs_confirmation=False,
+        )
+
     def _prompt_for_commitment_selection(self, commitments: list[dict[str, Any]]) -> HandlerResult:
         """Prompt user to select which commitment is at-risk."""
         # Filter to only active commitments
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from sqlmodel import col, select
 
 from jdo.commands.handlers.base import CommandHandler, HandlerResult
 from jdo.commands.parser import ParsedCommand
+from jdo.models.vision import Vision, VisionStatus
+from jdo.utils.ranking import BM25Index, is_unambiguous
+
+if TYPE_CHECKING:
+    from sqlmodel import Session
+
+# Maximum visions listed when asking which one a goal serves
+VISION_PROMPT_LIMIT = 5
 
 
 class GoalHandler(CommandHandler):
@@ -49,8 +59,16 @@ class GoalHandler(CommandHandler):
         if not draft_data["solution_vision"]:
             missing_fields.append("solution_vision")
 
-        # Check if we should prompt for vision linkage
-        available_visions = context.get("available_visions", [])
+        # Check if we should prompt for vision linkage; rank visions locally so
+        # a clear match links outright and otherwise only the best few are listed
+        available_visions = context.get("available_visions")
+        if available_visions is None:
+            available_visions = self._load_visions(context.get("db_session"))
+        linked_vision = None
+        if available_visions and not draft_data.get("vision_id") and not missing_fields:
+            available_visions, linked_vision = self._rank_visions(available_visions, draft_data)
+            if linked_vision is not None:
+                draft_data["vision_id"] = linked_vision.get("id")
         prompt_for_vision = available_visions and not draft_data.get("vision_id")
 
         # Build response message
@@ -61,7 +79,7 @@ class GoalHandler(CommandHandler):
             message = self._build_vision_prompt(available_visions, draft_data)
             needs_confirmation = False
         else:
-            message = self._build_confirmation_message(draft_data)
+            message = self._build_confirmation_message(draft_data, linked_vision)
             needs_confirmation = True
 
         return HandlerResult(
@@ -98,6 +116,49 @@ class GoalHandler(CommandHandler):
             return "What would you like to call this goal?"
         return "I need more information about this goal."
 
+    def _load_visions(self, db_session: Session | None) -> list[dict[str, Any]]:
+        """Load the active visions a new goal can be linked to.
+
+        Args:
+            db_session: Database session (None when the handler runs without one).
+
+        Returns:
+            Vision dicts (id, title, narrative), oldest first.
+        """
+        if db_session is None:
+            return []
+        visions = db_session.exec(
+            select(Vision)
+            .where(Vision.status == VisionStatus.ACTIVE)
+            .order_by(col(Vision.created_at))
+        )
+        return [{"id": v.id, "title": v.title, "narrative": v.narrative} for v in visions]
+
+    def _rank_visions(
+        self,
+        available_visions: list[dict[str, Any]],
+        draft_data: dict[str, Any],
+    ) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+        """Rank visions by relevance to the goal.
+
+        Returns:
+            Tuple of (best visions to list, unambiguously matching vision or None).
+        """
+        index = BM25Index()
+        for i, vision in enumerate(available_visions):
+            index.add(i, f"{vision.get('title') or ''} {vision.get('narrative') or ''}")
+        query = " ".join(
+            str(draft_data.get(name) or "")
+            for name in ("title", "problem_statement", "solution_vision")
+        )
+        matches = index.rank(query)
+        if is_unambiguous(matches):
+            return available_visions, available_visions[matches[0].key]  # type: ignore[index]
+
+        matched = [m.key for m in matches]
+        order = matched + [i for i in range(len(available_visions)) if i not in matched]
+        return [available_visions[i] for i in order[:VISION_PROMPT_LIMIT]], None  # type: ignore[index]
+
     def _build_vision_prompt(
         self,
         available_visions: list[dict[str, Any]],
@@ -114,12 +175,18 @@ class GoalHandler(CommandHandler):
         lines.append("Enter a number to select, or 'skip' to create without a vision link.")
         return "\n".join(lines)
 
-    def _build_confirmation_message(self, draft_data: dict[str, Any]) -> str:
+    def _build_confirmation_message(
+        self,
+        draft_data: dict[str, Any],
+        linked_vision: dict[str, Any] | None = None,
+    ) -> str:
         """Build a confirmation message with draft summary."""
         lines = ["Here's the goal I'll create:", ""]
         lines.append(f"  Title: {draft_data['title']}")
         lines.append(f"  Problem: {draft_data['problem_statement'][:50]}...")
         lines.append(f"  Vision: {draft_data['solution_vision'][:50]}...")
+        if linked_vision is not None:
+            lines.append(f"  Serves vision: {linked_vision.get('title') or 'Untitled'}")
         lines.append("")
         lines.append("Does this look right? (yes to confirm)")
         return "\n".join(lines)
@@ -1,12 +1,13 @@
 """Utility command handler implementations.
 
-Includes handlers for help, show, view, cancel, edit, type, hours, list,
-review, and triage commands.
+Includes handlers for help, show, view, cancel, edit, type, hours, jobs,
+list, review, and triage commands.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, ClassVar
+from uuid import UUID
 
 from loguru import logger
 from rich import box
@@ -18,10 +19,11 @@ from sqlmodel import select
 from jdo.ai.time_parsing import format_hours, parse_time_input
 from jdo.commands.handlers.base import CommandHandler, HandlerResult
 from jdo.commands.parser import ParsedCommand
+from jdo.db.duplicates import DuplicateMatch, find_near_duplicates
 from jdo.db.navigation import NavigationService
-from jdo.db.session import get_visions_due_for_review
+from jdo.db.session import delete_draft, get_visions_due_for_review
 from jdo.models.commitment import Commitment, CommitmentStatus
-from jdo.models.draft import EntityType
+from jdo.models.draft import Draft, EntityType
 from jdo.models.goal import Goal
 from jdo.models.vision import Vision
 from jdo.output.formatters import (
@@ -31,8 +33,6 @@ from jdo.output.formatters import (
 )
 
 if TYPE_CHECKING:
-    from uuid import UUID
-
     from sqlmodel import Session as DBSession
 
     from jdo.repl.session import Session
@@ -256,7 +256,9 @@ class HelpHandler(CommandHandler):
             "  3. Propose a resolution or new timeline\n"
             "  4. AI drafts a notification message\n"
             "  5. A notification task is created at position 0\n\n"
-            "Completing the notification task maintains your integrity score."
+            "Completing the notification task maintains your integrity score.\n\n"
+            "/atrisk --all-overdue [reason] marks every overdue commitment at-risk\n"
+            "at once, each with its own cleanup plan and notification task."
         ),
         "cleanup": (
             "/cleanup - View or update cleanup plan\n\n"
@@ -300,6 +302,17 @@ class HelpHandler(CommandHandler):
             "  /hours 90min  - Set 90 minutes (1.5 hours) available\n\n"
             "The AI will warn you when task estimates exceed available time."
         ),
+        "jobs": (
+            "/jobs - Show background maintenance jobs\n\n"
+            "Housekeeping runs in the background while the REPL is open:\n"
+            "  - dashboard:  rebuild the dashboard data\n"
+            "  - milestones: mark milestones past their target date as missed\n"
+            "  - recurring:  generate due recurring commitment instances\n"
+            "  - reviews:    count visions and goals due for review\n"
+            "  - drafts:     count drafts old enough to expire\n\n"
+            "Shows each job's interval, run count, and last/mean duration.\n"
+            "Intervals are set with JDO_MAINTENANCE_INTERVALS."
+        ),
         "recover": (
             "/recover - Recover an at-risk commitment\n\n"
             "Moves an at-risk commitment back to in-progress status.\n"
@@ -364,6 +377,7 @@ class HelpHandler(CommandHandler):
             "  /triage       - Process captured items",
             "  /hours        - Set available hours for time coaching",
             "  /integrity    - Show integrity dashboard",
+            "  /jobs         - Show background maintenance jobs",
             "",
             "[cyan]Other[/cyan]",
             "  /help (/h)    - Show this help",
@@ -457,7 +471,7 @@ class ListHandler(CommandHandler):
         # Update session's last_list_items for /1, /2 shortcuts
         session: Session | None = context.get("session")
         if session is not None and goals:
-            from uuid import UUID  # noqa: PLC0415
+            from uuid import UUID
 
             session.set_last_list_items([("goal", UUID(g["id"])) for g in goals[:5]])
 
@@ -499,7 +513,7 @@ class ListHandler(CommandHandler):
         # Update session's last_list_items for /1, /2 shortcuts
         session: Session | None = context.get("session")
         if session is not None and visions:
-            from uuid import UUID  # noqa: PLC0415
+            from uuid import UUID
 
             session.set_last_list_items([("vision", UUID(v["id"])) for v in visions[:5]])
 
@@ -703,9 +717,9 @@ class ViewHandler(CommandHandler):
         db_session: DBSession,
     ) -> HandlerResult:
         """View entity by full or partial UUID."""
-        from uuid import UUID  # noqa: PLC0415
+        from uuid import UUID
 
-        from jdo.models import Commitment, Goal, Vision  # noqa: PLC0415
+        from jdo.models import Commitment, Goal, Vision
 
         partial_id = partial_id.lower().strip()
 
@@ -759,7 +773,7 @@ class ViewHandler(CommandHandler):
         db_session: DBSession,
     ) -> HandlerResult:
         """Look up entity by type and ID, then display."""
-        from jdo.models import Commitment, Goal, Vision  # noqa: PLC0415
+        from jdo.models import Commitment, Goal, Vision
 
         model_map = {
             "commitment": Commitment,
@@ -798,7 +812,7 @@ class ViewHandler(CommandHandler):
         db_session: DBSession,  # noqa: ARG002
     ) -> HandlerResult:
         """Display entity details and update context."""
-        from jdo.repl.session import EntityContext  # noqa: PLC0415
+        from jdo.repl.session import EntityContext
 
         entity_id = entity.id
         short_id = str(entity_id)[:6]
@@ -840,7 +854,7 @@ class ViewHandler(CommandHandler):
 
     def _print_commitment_details(self, commitment: Commitment) -> None:
         """Print commitment details using Rich."""
-        from rich.panel import Panel  # noqa: PLC0415
+        from rich.panel import Panel
 
         lines = [
             f"[bold]Deliverable:[/bold] {commitment.deliverable}",
@@ -859,7 +873,7 @@ class ViewHandler(CommandHandler):
 
     def _print_goal_details(self, goal: Goal) -> None:
         """Print goal details using Rich."""
-        from rich.panel import Panel  # noqa: PLC0415
+        from rich.panel import Panel
 
         lines = [
             f"[bold]Title:[/bold] {goal.title}",
@@ -879,7 +893,7 @@ class ViewHandler(CommandHandler):
 
     def _print_vision_details(self, vision: Vision) -> None:
         """Print vision details using Rich."""
-        from rich.panel import Panel  # noqa: PLC0415
+        from rich.panel import Panel
 
         lines = [
             f"[bold]Title:[/bold] {vision.title}",
@@ -1147,27 +1161,67 @@ class HoursHandler(CommandHandler):
         )
 
 
+class JobsHandler(CommandHandler):
+    """Handler for /jobs command - shows background job timings and AI metrics."""
+
+    def execute(self, cmd: ParsedCommand, context: dict[str, Any]) -> HandlerResult:  # noqa: ARG002
+        """Execute /jobs command.
+
+        Args:
+            cmd: The parsed command.
+            context: Context with the REPL session.
+
+        Returns:
+            HandlerResult with per-job timings, prompt-cache, tool-call and
+            speculation metrics, and the AI request queue statistics.
+        """
+        # Imports PydanticAI, so only when /jobs runs rather than at startup
+        from jdo.ai.scheduler import format_scheduler_metrics
+
+        session: Session | None = context.get("session")
+        scheduler = session.maintenance if session is not None else None
+        if scheduler is None:
+            message = "Background maintenance is not running."
+        else:
+            message = scheduler.format_stats()
+        if session is not None:
+            message = f"{message}\n\n{session.format_agent_stats()}"
+            message = f"{message}\n\n{session.speculation.format_stats()}"
+        message = f"{message}\n\n{format_scheduler_metrics()}"
+        return HandlerResult(
+            message=message,
+            panel_update=None,
+            draft_data=None,
+            needs_confirmation=False,
+        )
+
+
 class TriageHandler(CommandHandler):
     """Handler for /triage command - processes captured items.
 
     Triage workflow:
     1. Get next item from triage queue (FIFO order)
-    2. AI analyzes and suggests entity type
-    3. User confirms, changes type, deletes, or skips
-    4. Repeat until queue empty or user exits
+    2. Near-duplicates of existing items are offered for merging first
+       (``/triage merge`` drops the item, ``/triage keep`` analyzes it anyway)
+    3. AI analyzes and suggests entity type
+    4. User confirms, changes type, deletes, or skips
+    5. Repeat until queue empty or user exits
     """
 
-    def execute(self, cmd: ParsedCommand, context: dict[str, Any]) -> HandlerResult:  # noqa: ARG002
+    MERGE_ACTIONS: ClassVar[frozenset[str]] = frozenset({"m", "merge"})
+    KEEP_ACTIONS: ClassVar[frozenset[str]] = frozenset({"k", "keep"})
+
+    def execute(self, cmd: ParsedCommand, context: dict[str, Any]) -> HandlerResult:
         """Execute /triage command.
 
         Args:
-            cmd: The parsed command.
+            cmd: The parsed command (optional action: merge/m or keep/k).
             context: Context with triage items and state.
 
         Returns:
             HandlerResult with triage item display and options.
         """
-        # Get triage items from context (populated by chat screen)
+        # Get triage items from context (the REPL loads the queue for /triage)
         triage_items = context.get("triage_items", [])
         current_index = context.get("triage_index", 0)
 
@@ -1192,8 +1246,19 @@ class TriageHandler(CommandHandler):
 
         # Get AI analysis from context (populated by chat screen)
         analysis = context.get("triage_analysis")
+        action = cmd.args[0].lower() if cmd.args else None
 
         if analysis is None:
+            if action in self.MERGE_ACTIONS:
+                return self._merge_duplicate(cmd, current_item, context)
+            # Near-duplicates are flagged locally, before spending an AI call,
+            # unless the user chose to keep the item
+            if action not in self.KEEP_ACTIONS:
+                duplicate = self._find_duplicate(current_item, context)
+                if duplicate is not None:
+                    return self._show_duplicate(
+                        current_item, duplicate, current_index, len(triage_items)
+                    )
             # First time viewing this item - show it and trigger analysis
             return self._show_item_for_analysis(current_item, current_index, len(triage_items))
 
@@ -1202,6 +1267,129 @@ class TriageHandler(CommandHandler):
             current_item, analysis, current_index, len(triage_items)
         )
 
+    def _find_duplicate(
+        self, item: dict[str, Any], context: dict[str, Any]
+    ) -> DuplicateMatch | None:
+        """Find the closest existing item or commitment to a triage item.
+
+        Args:
+            item: The triage item data.
+            context: Handler context (uses db_session when present).
+
+        Returns:
+            The most similar match, or None.
+        """
+        db_session = context.get("db_session")
+        raw_text = item.get("raw_text")
+        if db_session is None or not raw_text:
+            return None
+        try:
+            matches = find_near_duplicates(db_session, raw_text)
+        except SQLAlchemyError as e:
+            logger.warning(f"Near-duplicate lookup failed: {e}")
+            return None
+        # Item ids may be UUIDs or their string form; never match the item itself
+        item_id = str(item.get("id"))
+        return next((m for m in matches if str(m.entity_id) != item_id), None)
+
+    def _show_duplicate(
+        self, item: dict[str, Any], duplicate: DuplicateMatch, index: int, total: int
+    ) -> HandlerResult:
+        """Show a triage item flagged as a near-duplicate.
+
+        Args:
+            item: The triage item data.
+            duplicate: The existing item it resembles.
+            index: Current item index.
+            total: Total number of items.
+
+        Returns:
+            HandlerResult with merge/keep options and no analysis request.
+        """
+        raw_text = item.get("raw_text") or "Unknown"
+        similarity = f"{duplicate.similarity:.0%} similar"
+
+        lines = [
+            f"Triage item {index + 1} of {total}:",
+            "",
+            f'  "{raw_text}"',
+            "",
+            f'Looks like a duplicate of {duplicate.kind}: "{duplicate.text}" ({similarity})',
+            "",
+            "Options:",
+            "  [m] Merge - drop this item, keep the existing one (/triage m)",
+            "  [k] Keep - analyze it anyway (/triage k)",
+            "  [s] Skip  [q] Quit",
+        ]
+
+        return HandlerResult(
+            message="\n".join(lines),
+            panel_update={
+                "mode": "triage",
+                "item": item,
+                "index": index,
+                "total": total,
+                "needs_analysis": False,
+                "duplicate_of": {
+                    "kind": duplicate.kind,
+                    "id": str(duplicate.entity_id),
+                    "text": duplicate.text,
+                    "similarity": duplicate.similarity,
+                },
+            },
+            draft_data=None,
+            needs_confirmation=False,
+        )
+
+    def _merge_duplicate(
+        self, cmd: ParsedCommand, item: dict[str, Any], context: dict[str, Any]
+    ) -> HandlerResult:
+        """Drop a triage item in favour of its near-duplicate, then show the next one.
+
+        Args:
+            cmd: The /triage command (its action argument is dropped for the next item).
+            item: The triage item to drop.
+            context: Handler context (uses db_session).
+
+        Returns:
+            HandlerResult confirming the merge, followed by the next item.
+        """
+        duplicate = self._find_duplicate(item, context)
+        db_session = context.get("db_session")
+        if duplicate is None or db_session is None:
+            return HandlerResult(
+                message="Nothing to merge: this item has no near-duplicate.",
+                panel_update=None,
+                draft_data=None,
+                needs_confirmation=False,
+            )
+
+        try:
+            draft = db_session.get(Draft, UUID(str(item.get("id"))))
+            if draft is not None:
+                delete_draft(db_session, draft)
+        except (ValueError, SQLAlchemyError) as e:
+            logger.warning(f"Failed to merge triage item: {e}")
+            return HandlerResult(
+                message=f"Could not merge this item: {e}",
+                panel_update=None,
+                draft_data=None,
+                needs_confirmation=False,
+            )
+
+        # The merged item leaves the queue, so the next one takes its index
+        remaining = [i for i in context.get("triage_items", []) if i is not item]
+        next_cmd = ParsedCommand(command_type=cmd.command_type, args=[], raw_text=cmd.raw_text)
+        following = self.execute(next_cmd, {**context, "triage_items": remaining})
+        merged = f'Merged into {duplicate.kind}: "{duplicate.text}" (item removed).'
+        panel_update = {**(following.panel_update or {}), "merged_id": str(item.get("id"))}
+        return HandlerResult(
+            message=f"{merged}\n\n{following.message}",
+            panel_update=panel_update,
+            draft_data=None,
+            needs_confirmation=False,
+        )
+
     def _show_item_for_analysis(
         self, item: dict[str, Any], index: int, total: int
     ) -> HandlerResult:
@@ -37,6 +37,7 @@ class CommandType(str, Enum):
     ABANDON = "abandon"  # Mark commitment as abandoned
     HOURS = "hours"  # Set available hours for time coaching
     RECOVER = "recover"  # Recover at-risk commitment to in_progress
+    JOBS = "jobs"  # Show background maintenance job timings
     MESSAGE = "message"  # Not a command, just a regular message
 
 
@@ -91,6 +92,7 @@ _COMMAND_MAP: dict[str, CommandType] = {
     "abandon": CommandType.ABANDON,
     "hours": CommandType.HOURS,
     "recover": CommandType.RECOVER,
+    "jobs": CommandType.JOBS,
 }
 
 # Aliases that expand to other commands with args
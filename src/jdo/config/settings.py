@@ -36,6 +36,28 @@ class JDOSettings(BaseSettings):
     # AI Provider settings
     ai_provider: AIProvider = "openai"
     ai_model: str = "gpt-5.1-mini"
+    # Extra "provider:model" routes for the chat agent, e.g. "openrouter:openai/gpt-5.1-mini";
+    # requests go to the fastest healthy route (see jdo.ai.routing)
+    ai_fallback_models: list[str] = []
+    # Start a second route when the first is slower than usual to produce a token
+    ai_hedge_requests: bool = True
+    # Client-side rate limits per provider, e.g. {"openai": 500}; providers not
+    # listed are unlimited (see jdo.ai.scheduler)
+    ai_requests_per_minute: dict[str, int] = {}
+    ai_tokens_per_minute: dict[str, int] = {}
+    # Extract the plan in the background while a commitment proposal awaits
+    # confirmation, so "yes" saves it without another round trip
+    ai_speculative_extraction: bool = False
+
+    # Bulk ingestion settings (/commit --batch, jdo ingest)
+    batch_concurrency: int = 4
+    batch_item_timeout: float = 60.0
+
+    # Background maintenance in the REPL (see jdo.repl.maintenance): per-job
+    # interval overrides in seconds, e.g. {"recurring": 300}; 0 disables a job
+    maintenance_enabled: bool = True
+    maintenance_intervals: dict[str, float] = {}
+    maintenance_jitter: float = 0.1
 
     # Database settings
     database_path: Path | None = None
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+from jdo.db.bulk import (
+    delete_created_after,
+    delete_expired_drafts,
+    mark_overdue_milestones_missed,
+)
 from jdo.db.engine import get_engine, reset_engine
 from jdo.db.migrations import create_db_and_tables
+from jdo.db.schema import ensure_schema
 from jdo.db.session import (
     delete_draft,
+    get_data_version,
     get_overdue_milestones,
     get_pending_drafts,
     get_session,
+    get_table_versions,
     get_visions_due_for_review,
     update_overdue_milestones,
 )
@@ -20,12 +28,18 @@ __all__ = [
     "TimeRollup",
     "TimeRollupService",
     "create_db_and_tables",
+    "delete_created_after",
     "delete_draft",
+    "delete_expired_drafts",
+    "ensure_schema",
+    "get_data_version",
     "get_engine",
     "get_overdue_milestones",
     "get_pending_drafts",
     "get_session",
+    "get_table_versions",
     "get_visions_due_for_review",
+    "mark_overdue_milestones_missed",
     "reset_engine",
     "update_overdue_milestones",
 ]
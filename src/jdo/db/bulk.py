@@ -0,0 +1,209 @@
+"""Set-based bulk maintenance operations.
+
+Each operation is a single ``UPDATE ... WHERE`` or ``DELETE ... WHERE ...
+RETURNING id`` statement instead of loading rows and changing them one ORM
+object at a time. The side effects of the per-object paths are kept:
+
+- ``updated_at`` is stamped on updated rows (mapper events don't fire for
+  bulk statements, so it is set explicitly)
+- the data version is bumped, so dashboard and snapshot caches rebuild
+- objects already loaded in the session are synchronized
+- each operation logs what it changed, like the per-object paths
+
+With ``chunk_size``, matching ids are selected and written ``chunk_size`` rows
+per statement, which keeps each write transaction short on large tables.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import ColumnElement, delete, update
+from sqlmodel import Session, SQLModel, col, select
+
+from jdo.models import Commitment, Draft, Goal, Milestone, Stakeholder, Task, Vision
+from jdo.models.draft import DRAFT_EXPIRY_DAYS, EntityType
+from jdo.models.milestone import MilestoneStatus
+from jdo.utils.datetime import today_date, utc_now
+
+# Milestone statuses that become MISSED once the target date passes
+OPEN_MILESTONE_STATUSES = (MilestoneStatus.PENDING, MilestoneStatus.IN_PROGRESS)
+
+# Models removed by delete_created_after, in foreign key dependency order
+CLEANUP_ORDER: tuple[type[SQLModel], ...] = (
+    Task,
+    Commitment,
+    Milestone,
+    Goal,
+    Stakeholder,
+    Vision,
+)
+
+Criteria = tuple[ColumnElement[bool], ...]
+
+
+def _write_returning_ids(
+    session: Session,
+    model: type[SQLModel],
+    criteria: Criteria,
+    write: Callable[[Criteria], Any],
+    chunk_size: int | None,
+) -> list[UUID]:
+    """Run a bulk write, optionally in chunks, and return the affected ids.
+
+    Args:
+        session: Database session.
+        model: Model whose table is written.
+        criteria: WHERE criteria selecting the rows.
+        write: Builds the UPDATE/DELETE statement (with RETURNING id) for criteria.
+        chunk_size: Rows per statement, or None for a single statement.
+
+    Returns:
+        Ids of the affected rows.
+    """
+    if chunk_size is None:
+        return list(session.exec(write(criteria)).scalars())
+    if chunk_size < 1:
+        msg = f"chunk_size must be positive, got {chunk_size}"
+        raise ValueError(msg)
+
+    id_column = col(model.id)  # type: ignore[attr-defined]
+    affected: list[UUID] = []
+    while True:
+        # Rows leave the criteria once written, so the next chunk is always the first
+        ids = list(session.exec(select(id_column).where(*criteria).limit(chunk_size)))
+        if not ids:
+            return affected
+        affected.extend(session.exec(write((*criteria, id_column.in_(ids)))).scalars())
+
+
+def _delete_returning_ids(
+    session: Session,
+    model: type[SQLModel],
+    criteria: Criteria,
+    chunk_size: int | None,
+) -> list[UUID]:
+    """Delete the rows matching criteria and return their ids."""
+    id_column = col(model.id)  # type: ignore[attr-defined]
+    return _write_returning_ids(
+        session,
+        model,
+        criteria,
+        lambda where: (
+            delete(model)
+            .where(*where)
+            .returning(id_column)
+            .execution_options(synchronize_session="fetch")
+        ),
+        chunk_size,
+    )
+
+
+def mark_overdue_milestones_missed(
+    session: Session,
+    *,
+    today: date | None = None,
+    chunk_size: int | None = None,
+) -> list[UUID]:
+    """Mark every pending or in-progress milestone past its target date as missed.
+
+    Bulk equivalent of calling ``Milestone.mark_missed()`` on each result of
+    ``get_overdue_milestones``.
+
+    Args:
+        session: Database session.
+        today: Date to compare target dates against (defaults to today).
+        chunk_size: Rows per statement, or None for a single statement.
+
+    Returns:
+        Ids of the milestones marked missed.
+    """
+    cutoff = today or today_date()
+    criteria: Criteria = (
+        col(Milestone.status).in_(OPEN_MILESTONE_STATUSES),
+        col(Milestone.target_date) < cutoff,
+    )
+    ids = _write_returning_ids(
+        session,
+        Milestone,
+        criteria,
+        lambda where: (
+            update(Milestone)
+            .where(*where)
+            .values(status=MilestoneStatus.MISSED, updated_at=utc_now())
+            .returning(col(Milestone.id))
+            .execution_options(synchronize_session="fetch")
+        ),
+        chunk_size,
+    )
+    if ids:
+        logger.info(f"Marked {len(ids)} overdue milestone(s) as missed")
+    return ids
+
+
+def delete_expired_drafts(
+    session: Session,
+    *,
+    now: datetime | None = None,
+    chunk_size: int | None = None,
+) -> list[UUID]:
+    """Delete drafts (excluding triage items) for which ``Draft.is_expired()`` is true.
+
+    Args:
+        session: Database session.
+        now: Current time (defaults to now, UTC).
+        chunk_size: Rows per statement, or None for a single statement.
+
+    Returns:
+        Ids of the deleted drafts.
+    """
+    threshold = (now or utc_now()) - timedelta(days=DRAFT_EXPIRY_DAYS)
+    criteria: Criteria = (
+        col(Draft.entity_type) != EntityType.UNKNOWN,
+        col(Draft.created_at) < threshold,
+    )
+    ids = _delete_returning_ids(session, Draft, criteria, chunk_size)
+    if ids:
+        logger.info(f"Deleted {len(ids)} expired draft(s)")
+    return ids
+
+
+def delete_created_after(
+    session: Session,
+    created_after: datetime,
+    *,
+    chunk_size: int | None = None,
+) -> dict[type[SQLModel], list[UUID]]:
+    """Delete every entity created at or after a timestamp, in dependency order.
+
+    Older commitments linked to a deleted goal are unlinked first, as the ORM
+    does when a goal is deleted through the session.
+
+    Args:
+        session: Database session.
+        created_after: Delete entities created at or after this time.
+        chunk_size: Rows per statement, or None for one statement per table.
+
+    Returns:
+        Deleted ids per model, in CLEANUP_ORDER.
+    """
+    deleted: dict[type[SQLModel], list[UUID]] = {}
+    for model in CLEANUP_ORDER:
+        created_at = col(model.created_at)  # type: ignore[attr-defined]
+        if model is Goal:
+            new_goals = select(col(Goal.id)).where(created_at >= created_after)
+            session.exec(
+                update(Commitment)
+                .where(col(Commitment.goal_id).in_(new_goals))
+                .values(goal_id=None, updated_at=utc_now())
+                .execution_options(synchronize_session="fetch")
+            )
+        deleted[model] = _delete_returning_ids(
+            session, model, (created_at >= created_after,), chunk_size
+        )
+        logger.debug(f"Deleted {len(deleted[model])} {model.__tablename__}")
+    return deleted
@@ -0,0 +1,158 @@
+"""Near-duplicate detection for captured items and commitments.
+
+Captured text (``Draft.partial_data["raw_text"]``) and active commitment
+deliverables are kept in an in-memory MinHash index. Before each lookup the
+draft and commitment tables are probed with get_table_versions(), and the
+index is reloaded when they changed, whichever process wrote to them
+(``jdo capture`` writes from its own process). Lookups between writes do not
+read any rows.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from jdo.db.session import TableVersion, get_table_versions
+from jdo.models import Commitment, Draft
+from jdo.models.commitment import CommitmentStatus
+from jdo.utils.similarity import NearDuplicateIndex
+
+# Minimum Jaccard similarity of the term sets to flag a near-duplicate
+DUPLICATE_THRESHOLD = 0.5
+
+# Commitments that can still be duplicated by a new capture
+ACTIVE_COMMITMENT_STATUSES = frozenset(
+    {CommitmentStatus.PENDING, CommitmentStatus.IN_PROGRESS, CommitmentStatus.AT_RISK}
+)
+
+DuplicateKind = Literal["draft", "commitment"]
+
+# Tables the index is built from
+_INDEXED_TABLES = (Draft, Commitment)
+
+
+@dataclass(frozen=True)
+class DuplicateMatch:
+    """An existing item that looks like the same thing.
+
+    Attributes:
+        kind: "draft" (captured item) or "commitment".
+        entity_id: Id of the existing entity.
+        text: Its raw text or deliverable.
+        similarity: Jaccard similarity in [0, 1]; 1.0 means the same terms.
+    """
+
+    kind: DuplicateKind
+    entity_id: UUID
+    text: str
+    similarity: float
+
+
+class _DuplicateIndex:
+    """The process-wide index plus the table versions it was loaded at."""
+
+    def __init__(self) -> None:
+        self.index = NearDuplicateIndex()
+        self.texts: dict[tuple[DuplicateKind, UUID], str] = {}
+        self.engine: Engine | None = None
+        self.versions: tuple[TableVersion, ...] | None = None
+
+    def reset(self) -> None:
+        self.index = NearDuplicateIndex()
+        self.texts.clear()
+        self.engine = None
+        self.versions = None
+
+    def put(self, key: tuple[DuplicateKind, UUID], text: str | None) -> None:
+        if text:
+            self.index.add(key, text)
+            self.texts[key] = text
+
+    def ensure_current(self, session: Session) -> None:
+        engine = session.get_bind()
+        versions = get_table_versions(session, _INDEXED_TABLES)
+        if self.engine is engine and self.versions == versions:
+            return
+        self.reset()
+        # Columns rather than entities, so objects already in the session's
+        # identity map cannot hide what another process wrote
+        for draft_id, partial_data in session.exec(select(Draft.id, Draft.partial_data)):
+            self.put(("draft", draft_id), _raw_text(partial_data))
+        for commitment_id, deliverable in session.exec(
+            select(Commitment.id, Commitment.deliverable).where(
+                Commitment.status.in_(ACTIVE_COMMITMENT_STATUSES)  # type: ignore[attr-defined]
+            )
+        ):
+            self.put(("commitment", commitment_id), deliverable)
+        self.engine = engine  # type: ignore[assignment]
+        self.versions = versions
+        logger.debug(f"Loaded near-duplicate index with {len(self.index)} entries")
+
+
+_state = _DuplicateIndex()
+
+
+def _raw_text(partial_data: dict[str, object] | None) -> str | None:
+    raw_text = (partial_data or {}).get("raw_text")
+    return raw_text if isinstance(raw_text, str) else None
+
+
+def same_text(left: str, right: str) -> bool:
+    """Check whether two texts are the same, ignoring case and whitespace.
+
+    Args:
+        left: First text.
+        right: Second text.
+
+    Returns:
+        True if the normalized texts are identical.
+    """
+    return " ".join(left.casefold().split()) == " ".join(right.casefold().split())
+
+
+def find_near_duplicates(
+    session: Session,
+    text: str,
+    *,
+    threshold: float = DUPLICATE_THRESHOLD,
+    exclude: UUID | None = None,
+    kinds: tuple[DuplicateKind, ...] = ("draft", "commitment"),
+) -> list[DuplicateMatch]:
+    """Find captured items and active commitments that match ``text``.
+
+    Args:
+        session: Database session (probed for changes; rows are read only
+            when the tables changed since the last lookup).
+        text: Text to check.
+        threshold: Minimum similarity to report.
+        exclude: Entity id to leave out (e.g. the item being triaged).
+        kinds: Which kinds of entries to search.
+
+    Returns:
+        Matches, most similar first.
+    """
+    _state.ensure_current(session)
+    matches = []
+    for key, similarity in _state.index.query(text, threshold):
+        kind, entity_id = key  # type: ignore[misc]
+        if kind in kinds and entity_id != exclude:
+            matches.append(
+                DuplicateMatch(
+                    kind=kind,
+                    entity_id=entity_id,
+                    text=_state.texts[key],  # type: ignore[index]
+                    similarity=similarity,
+                )
+            )
+    return matches
+
+
+def reset_duplicate_index() -> None:
+    """Drop the index; it is reloaded on the next lookup."""
+    _state.reset()
@@ -1,15 +1,16 @@
 """Database schema management and migrations.
 
 This module provides database table creation and migration management
-using Alembic for versioned schema changes.
+using Alembic for versioned schema changes. The migration scripts are package
+data (jdo/migrations). Alembic is imported only by the migration commands, so
+creating tables doesn't load it.
 """
 
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from alembic import command
-from alembic.config import Config
 from sqlmodel import SQLModel
 
 from jdo.db.engine import get_engine
@@ -17,19 +18,29 @@ from jdo.db.engine import get_engine
 # Import all models to ensure they're registered with SQLModel.metadata
 from jdo.models import Commitment, Goal, Stakeholder, Task  # noqa: F401
 
+if TYPE_CHECKING:
+    from alembic.config import Config
 
-def get_alembic_config() -> Config:
+
+# Migration scripts, shipped inside the package
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+
+
+def get_alembic_config(*, configure_logging: bool = True) -> Config:
     """Get Alembic configuration for the project.
 
+    Args:
+        configure_logging: Whether env.py applies the logging setup in
+            alembic.ini (off when jdo migrates the database at startup).
+
     Returns:
         Alembic Config object pointing to migrations directory.
     """
-    # Find the migrations directory relative to this file
-    migrations_dir = Path(__file__).parent.parent.parent.parent / "migrations"
-    config_path = migrations_dir / "alembic.ini"
+    from alembic.config import Config
 
-    cfg = Config(str(config_path))
-    cfg.set_main_option("script_location", str(migrations_dir))
+    cfg = Config(str(MIGRATIONS_DIR / "alembic.ini"))
+    cfg.set_main_option("script_location", str(MIGRATIONS_DIR))
+    cfg.attributes["configure_logging"] = configure_logging
 
     return cfg
 
@@ -49,6 +60,8 @@ def get_migration_status() -> None:
 
     Prints current migration head and pending migrations to stdout.
     """
+    from alembic import command
+
     cfg = get_alembic_config()
     command.current(cfg, verbose=True)
 
@@ -59,6 +72,8 @@ def upgrade_database(revision: str = "head") -> None:
     Args:
         revision: Target revision (default "head" for latest).
     """
+    from alembic import command
+
     cfg = get_alembic_config()
     command.upgrade(cfg, revision)
 
@@ -69,6 +84,8 @@ def downgrade_database(revision: str = "-1") -> None:
     Args:
         revision: Target revision (default "-1" for one step back).
     """
+    from alembic import command
+
     cfg = get_alembic_config()
     command.downgrade(cfg, revision)
 
@@ -80,5 +97,7 @@ def create_revision(message: str, *, autogenerate: bool = True) -> None:
         message: Description of the migration.
         autogenerate: Whether to auto-detect model changes.
     """
+    from alembic import command
+
     cfg = get_alembic_config()
     command.revision(cfg, message=message, autogenerate=autogenerate)
@@ -6,6 +6,7 @@ Handlers return draft_data dicts, and this service converts them to database ent
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import date, time, timedelta
 from typing import Any
 from uuid import UUID
@@ -41,6 +42,21 @@ class ValidationError(PersistenceError):
     """Error raised when draft data validation fails."""
 
 
+@dataclass
+class SavedPlan:
+    """Entities created by PersistenceService.save_plan().
+
+    Attributes:
+        commitments: Saved one-off commitments, in plan order.
+        tasks: Saved tasks across all commitments, in plan order.
+        recurring_commitments: Saved recurring commitment templates.
+    """
+
+    commitments: list[Commitment] = field(default_factory=list)
+    tasks: list[Task] = field(default_factory=list)
+    recurring_commitments: list[RecurringCommitment] = field(default_factory=list)
+
+
 class PersistenceService:
     """Service for persisting entities to the database.
 
@@ -126,14 +142,14 @@ class PersistenceService:
         # Validate required fields
         self._require_fields(draft_data, ["deliverable", "stakeholder", "due_date"])
 
-        # Get or create stakeholder
-        stakeholder = self.get_or_create_stakeholder(draft_data["stakeholder"])
-
-        # Parse due_date
+        # Parse everything before writing, so invalid input leaves no stakeholder behind
         due_date = self._parse_date(draft_data["due_date"])
-
-        # Parse optional due_time
         due_time = self._parse_time(draft_data.get("due_time"))
+        goal_id = self._parse_uuid(draft_data.get("goal_id"))
+        milestone_id = self._parse_uuid(draft_data.get("milestone_id"))
+
+        # Get or create stakeholder
+        stakeholder = self.get_or_create_stakeholder(draft_data["stakeholder"])
 
         # Create commitment
         commitment = Commitment(
@@ -141,8 +157,8 @@ class PersistenceService:
             stakeholder_id=stakeholder.id,
             due_date=due_date,
             due_time=due_time if due_time else DEFAULT_DUE_TIME,
-            goal_id=self._parse_uuid(draft_data.get("goal_id")),
-            milestone_id=self._parse_uuid(draft_data.get("milestone_id")),
+            goal_id=goal_id,
+            milestone_id=milestone_id,
         )
 
         self.session.add(commitment)
@@ -428,6 +444,118 @@ class PersistenceService:
         )
         return recurring
 
+    def save_plan(self, plan_data: dict[str, Any]) -> SavedPlan:
+        """Save a whole extracted plan: commitments, their tasks and recurring commitments.
+
+        Every entry is validated before anything is written, stakeholders are
+        resolved with one query, and commitments and tasks are flushed together.
+        Nothing is committed here; the caller commits once (or rolls back), so
+        the plan is saved in a single transaction.
+
+        Args:
+            plan_data: Dict with plan fields:
+                - commitments (optional): List of commitment drafts as accepted by
+                  save_commitment(), each with an optional ``tasks`` list of
+                  task drafts (title required; scope, estimated_hours optional)
+                - recurring_commitments (optional): List of drafts as accepted by
+                  save_recurring_commitment()
+
+        Returns:
+            SavedPlan with the created entities.
+
+        Raises:
+            ValidationError: If the plan is empty or any entry is invalid.
+        """
+        commitment_drafts: list[dict[str, Any]] = plan_data.get("commitments") or []
+        recurring_drafts: list[dict[str, Any]] = plan_data.get("recurring_commitments") or []
+        if not commitment_drafts and not recurring_drafts:
+            msg = "Plan has no commitments"
+            raise ValidationError(msg)
+
+        # Validate everything first so an invalid entry writes nothing
+        for draft in commitment_drafts:
+            self._require_fields(draft, ["deliverable", "stakeholder", "due_date"])
+            self._parse_date(draft["due_date"])
+            self._parse_time(draft.get("due_time"))
+            for task_draft in draft.get("tasks") or []:
+                self._require_fields(task_draft, ["title"])
+        for draft in recurring_drafts:
+            self._require_fields(
+                draft, ["deliverable_template", "stakeholder_name", "recurrence_type"]
+            )
+            try:
+                RecurrenceType(draft["recurrence_type"].lower())
+            except ValueError as e:
+                msg = f"Invalid recurrence_type: {draft['recurrence_type']}"
+                raise ValidationError(msg) from e
+
+        stakeholders = self._get_or_create_stakeholders(
+            [draft["stakeholder"] for draft in commitment_drafts]
+        )
+
+        saved = SavedPlan()
+        for draft in commitment_drafts:
+            due_time = self._parse_time(draft.get("due_time"))
+            commitment = Commitment(
+                deliverable=draft["deliverable"],
+                stakeholder_id=stakeholders[draft["stakeholder"].strip().lower()].id,
+                due_date=self._parse_date(draft["due_date"]),
+                due_time=due_time if due_time else DEFAULT_DUE_TIME,
+                goal_id=self._parse_uuid(draft.get("goal_id")),
+                milestone_id=self._parse_uuid(draft.get("milestone_id")),
+            )
+            saved.commitments.append(commitment)
+            for order, task_draft in enumerate(draft.get("tasks") or []):
+                saved.tasks.append(
+                    Task(
+                        title=task_draft["title"],
+                        scope=task_draft.get("scope") or task_draft["title"],
+                        commitment_id=commitment.id,
+                        order=order,
+                        sub_tasks=[],
+                        estimated_hours=task_draft.get("estimated_hours"),
+                    )
+                )
+
+        self.session.add_all([*saved.commitments, *saved.tasks])
+        self.session.flush()
+        if saved.tasks:
+            TaskHistoryService(self.session).log_tasks_created(saved.tasks)
+
+        saved.recurring_commitments.extend(
+            self.save_recurring_commitment(draft) for draft in recurring_drafts
+        )
+
+        logger.info(
+            f"Saved plan: {len(saved.commitments)} commitments, {len(saved.tasks)} tasks, "
+            f"{len(saved.recurring_commitments)} recurring"
+        )
+        return saved
+
+    def _get_or_create_stakeholders(self, names: list[str]) -> dict[str, Stakeholder]:
+        """Resolve many stakeholder names with one query, creating missing ones.
+
+        Args:
+            names: Stakeholder names (matched case-insensitively).
+
+        Returns:
+            Stakeholders keyed by lower-cased, stripped name.
+        """
+        wanted = {name.strip().lower(): name.strip() for name in names}
+        if not wanted:
+            return {}
+
+        statement = select(Stakeholder).where(func.lower(Stakeholder.name).in_(list(wanted)))
+        found = {s.name.lower(): s for s in self.session.exec(statement).all()}
+
+        for key, name in wanted.items():
+            if key not in found:
+                stakeholder = Stakeholder(name=name, type=StakeholderType.PERSON)
+                self.session.add(stakeholder)
+                found[key] = stakeholder
+                logger.info(f"Created new stakeholder: {name} (id={stakeholder.id})")
+        return found
+
     def get_commitment_velocity(self, days: int = 7) -> tuple[int, int]:
         """Get commitment creation and completion velocity over a time window.
 
@@ -472,10 +600,10 @@ class PersistenceService:
             ValidationError: If any required field is missing or empty.
         """
         missing = []
-        for field in required:
-            value = draft_data.get(field)
+        for name in required:
+            value = draft_data.get(name)
             if value is None or (isinstance(value, str) and not value.strip()):
-                missing.append(field)
+                missing.append(name)
 
         if missing:
             msg = f"Missing required fields: {', '.join(missing)}"
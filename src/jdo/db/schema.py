@@ -0,0 +1,167 @@
+"""Schema version check at startup.
+
+The schema this code expects is identified by the Alembic head revision and a
+fingerprint of the SQLModel metadata. Once a database has been brought up to
+date, both are recorded in the ``jdo_meta`` table and a digest of them is
+stored in ``PRAGMA user_version``. On launch, ``ensure_schema()`` reads only
+that pragma. Tables are created and pending migrations are applied only when
+the pragma does not match.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from functools import cache
+
+from loguru import logger
+from sqlalchemy import Column, Connection, Engine, MetaData, String, Table, inspect
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlmodel import SQLModel
+
+from jdo.db.engine import get_engine
+from jdo.db.migrations import create_db_and_tables, get_alembic_config
+from jdo.utils.datetime import utc_now
+
+# Alembic head revision this code expects; bump it with every new migration
+SCHEMA_REVISION = "f4a2c6e8b1d3"
+
+# Revision matching databases that older releases built with create_all alone,
+# without recording any migration history
+LEGACY_BASELINE_REVISION = "a1b2c3d4e5f6"
+
+# Key/value facts about the database itself (schema revision and fingerprint)
+JDO_META = Table(
+    "jdo_meta",
+    SQLModel.metadata,
+    Column("key", String, primary_key=True),
+    Column("value", String, nullable=False),
+)
+
+# PRAGMA user_version is a signed 32-bit integer; keep it positive and non-zero
+USER_VERSION_MASK = 0x7FFFFFFF
+
+
+def schema_fingerprint(metadata: MetaData = SQLModel.metadata) -> str:
+    """Hash the DDL for every table and index in the metadata.
+
+    Args:
+        metadata: Metadata to fingerprint (defaults to the app's models).
+
+    Returns:
+        Hex SHA-256 of the SQLite DDL, in table and index name order.
+    """
+    dialect = sqlite.dialect()
+    digest = hashlib.sha256()
+    for table in sorted(metadata.tables.values(), key=lambda t: t.name):
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    return digest.hexdigest()
+
+
+def user_version_for(revision: str, fingerprint: str) -> int:
+    """Derive the PRAGMA user_version value for a revision and fingerprint.
+
+    Args:
+        revision: Alembic revision.
+        fingerprint: Schema fingerprint from schema_fingerprint().
+
+    Returns:
+        A positive 31-bit integer.
+    """
+    digest = hashlib.sha256(f"{revision}:{fingerprint}".encode()).digest()
+    return int.from_bytes(digest[:4], "big") & USER_VERSION_MASK or 1
+
+
+@cache
+def expected_user_version() -> int:
+    """PRAGMA user_version of a database matching this code's schema."""
+    return user_version_for(SCHEMA_REVISION, schema_fingerprint())
+
+
+def read_user_version(connection: Connection) -> int:
+    """Read PRAGMA user_version (0 for a database jdo has never stamped)."""
+    return connection.exec_driver_sql("PRAGMA user_version").scalar_one()
+
+
+def _has_model_columns(connection: Connection) -> bool:
+    """Whether every existing table already has every column the models define."""
+    inspector = inspect(connection)
+    existing = set(inspector.get_table_names())
+    for table in SQLModel.metadata.sorted_tables:
+        if table.name not in existing:
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        if not set(table.columns.keys()) <= columns:
+            return False
+    return True
+
+
+def _record_schema_version(engine: Engine) -> None:
+    """Write the revision and fingerprint to jdo_meta and PRAGMA user_version."""
+    fingerprint = schema_fingerprint()
+    rows = {
+        "schema_revision": SCHEMA_REVISION,
+        "schema_fingerprint": fingerprint,
+        "schema_updated_at": utc_now().isoformat(),
+    }
+    upsert = sqlite.insert(JDO_META)
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[JDO_META.c.key], set_={"value": upsert.excluded.value}
+    )
+    with engine.begin() as connection:
+        connection.execute(upsert, [{"key": k, "value": v} for k, v in rows.items()])
+        # PRAGMA values can't be bound parameters; this one is an int we computed
+        connection.exec_driver_sql(
+            f"PRAGMA user_version = {user_version_for(SCHEMA_REVISION, fingerprint)}"
+        )
+
+
+def ensure_schema() -> bool:
+    """Bring the database schema up to date, if it isn't already.
+
+    A database whose PRAGMA user_version matches needs nothing else. Otherwise:
+
+    - a database with migration history is upgraded to the head revision
+    - a database without migration history whose tables lack model columns
+      was built by an older release; it is stamped at
+      LEGACY_BASELINE_REVISION and upgraded to the head revision
+    - missing tables are created (a new database gets all of them)
+    - any other database without migration history is stamped at the head
+      revision
+    - the revision and fingerprint are recorded
+
+    Returns:
+        True if the schema was checked and updated, False if it already matched.
+    """
+    engine = get_engine()
+    with engine.connect() as connection:
+        if read_user_version(connection) == expected_user_version():
+            return False
+        tables = set(inspect(connection).get_table_names())
+        versioned = "alembic_version" in tables
+        legacy = bool(tables) and not versioned and not _has_model_columns(connection)
+
+    from alembic import command
+
+    cfg = get_alembic_config(configure_logging=False)
+    if legacy:
+        logger.warning(
+            "Database has no migration history; upgrading it from the pre-migration schema"
+        )
+        command.stamp(cfg, LEGACY_BASELINE_REVISION)
+    if versioned or legacy:
+        logger.info("Applying pending database migrations")
+        command.upgrade(cfg, "head")
+    create_db_and_tables()
+    if not (versioned or legacy):
+        if tables:
+            logger.warning(
+                "Database has no migration history; recording it at the current revision"
+            )
+        command.stamp(cfg, "head")
+
+    _record_schema_version(engine)
+    logger.info(f"Database schema is at revision {SCHEMA_REVISION}")
+    return True
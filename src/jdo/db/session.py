@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from uuid import UUID
 
 from loguru import logger
-from sqlmodel import Session, func, select
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState
+from sqlmodel import Session, SQLModel, col, func, or_, select
 
+from jdo.db.bulk import mark_overdue_milestones_missed
 from jdo.db.engine import get_engine
 from jdo.models import Commitment, Draft, Goal, Milestone, RecurringCommitment, Vision
 from jdo.models.commitment import CommitmentStatus
@@ -21,8 +24,71 @@ from jdo.models.stakeholder import Stakeholder
 from jdo.models.task import Task
 from jdo.models.vision import VisionStatus
 from jdo.recurrence.calculator import get_next_due_date
-from jdo.recurrence.generator import generate_instance, should_generate_instance
-from jdo.utils.datetime import today_date, utc_now
+from jdo.recurrence.generator import DEFAULT_GENERATION_WINDOW_DAYS, generate_instance
+from jdo.recurrence.rule import occurrences_between
+from jdo.utils.datetime import as_utc, today_date, utc_now
+
+# Incremented whenever any ORM session writes; lets caches detect DB changes
+_data_version = 0
+
+
+def get_data_version() -> int:
+    """Get the in-process database change counter.
+
+    The counter increases whenever a session flushes changes or runs a bulk
+    UPDATE/DELETE, so derived caches can rebuild only after a write. Writes
+    by other processes are not counted; see get_table_versions().
+
+    Returns:
+        Current data version.
+    """
+    return _data_version
+
+
+def _bump_data_version(*_args: object) -> None:
+    """Record that the database was (or is about to be) changed."""
+    global _data_version
+    _data_version += 1
+
+
+def _bump_on_bulk_write(orm_execute_state: ORMExecuteState) -> None:
+    """Record bulk UPDATE/DELETE statements, which bypass flush."""
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        _bump_data_version()
+
+
+event.listen(Session, "after_flush", _bump_data_version)
+event.listen(Session, "do_orm_execute", _bump_on_bulk_write)
+
+# Per table: (row count, latest updated_at)
+TableVersion = tuple[int, datetime | None]
+
+
+def get_table_versions(
+    session: Session, models: Sequence[type[SQLModel]]
+) -> tuple[TableVersion, ...]:
+    """Probe tables for changes made by any process.
+
+    get_data_version() only sees writes made in this process. Other processes
+    (``jdo capture``, ``jdo ingest``) write to the same file, so caches that
+    outlive a command also compare the row count and latest ``updated_at`` of
+    the tables they read. Inserts and deletes change the count; updates
+    change ``updated_at``. All tables are probed in one statement.
+
+    Args:
+        session: Database session.
+        models: Table models with an ``updated_at`` column.
+
+    Returns:
+        (row count, latest updated_at) per model, in the order given.
+    """
+    columns = []
+    for model in models:
+        updated_at = col(model.updated_at)  # type: ignore[attr-defined]
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        columns.append(select(func.max(updated_at)).scalar_subquery())
+    row = session.exec(select(*columns)).one()  # type: ignore[call-overload]
+    return tuple((row[i], row[i + 1]) for i in range(0, len(row), 2))
 
 
 @contextmanager
@@ -92,7 +158,7 @@ def get_overdue_milestones(session: Session) -> list[Milestone]:
 
 
 def update_overdue_milestones(session: Session) -> int:
-    """Mark all overdue milestones as missed.
+    """Mark all overdue milestones as missed with a single UPDATE.
 
     Args:
         session: Database session.
@@ -100,11 +166,7 @@ def update_overdue_milestones(session: Session) -> int:
     Returns:
         Number of milestones marked as missed.
     """
-    overdue = get_overdue_milestones(session)
-    for milestone in overdue:
-        milestone.mark_missed()
-        session.add(milestone)
-    return len(overdue)
+    return len(mark_overdue_milestones_missed(session))
 
 
 def get_pending_drafts(session: Session) -> list[Draft]:
@@ -173,19 +235,71 @@ def get_active_recurring_commitments(session: Session) -> list[RecurringCommitme
     return list(session.exec(statement).all())
 
 
+def get_recurring_commitments_due(
+    session: Session,
+    today: date,
+    window_days: int = DEFAULT_GENERATION_WINDOW_DAYS,
+) -> list[RecurringCommitment]:
+    """Get active templates that may need instances, with one indexed range query.
+
+    Selects templates whose next due date falls within the generation window,
+    plus templates with no next due date yet (never generated, or created
+    before the column existed), skipping any already checked today.
+
+    Args:
+        session: Database session.
+        today: The current date.
+        window_days: Number of days ahead to look for due dates.
+
+    Returns:
+        Templates to generate instances for.
+    """
+    window_end = today + timedelta(days=window_days)
+    statement = select(RecurringCommitment).where(
+        RecurringCommitment.status == RecurringCommitmentStatus.ACTIVE,
+        or_(
+            col(RecurringCommitment.next_due_date) <= window_end,
+            col(RecurringCommitment.next_due_date).is_(None),
+        ),
+        or_(
+            col(RecurringCommitment.generation_checked_on).is_(None),
+            col(RecurringCommitment.generation_checked_on) < today,
+        ),
+    )
+    return list(session.exec(statement).all())
+
+
+def _due_dates_to_generate(
+    recurring: RecurringCommitment, today: date, window_days: int
+) -> list[date]:
+    """Due dates of every missed instance through today, else the next one in the window."""
+    reference_date = recurring.last_generated_date or (today - timedelta(days=1))
+    missed = occurrences_between(recurring, reference_date + timedelta(days=1), today)
+    if missed:
+        return missed
+    next_due = get_next_due_date(recurring, after_date=reference_date)
+    if next_due is None or next_due > today + timedelta(days=window_days):
+        return []
+    return [next_due]
+
+
 def check_and_generate_recurring_instances(
     session: Session,
     current_date: datetime | None = None,
+    window_days: int = DEFAULT_GENERATION_WINDOW_DAYS,
 ) -> list[tuple[Commitment, list[Task]]]:
-    """Check all active recurring commitments and generate instances if due.
+    """Check active recurring commitments and generate instances if due.
 
     This is the main trigger function called when viewing upcoming commitments.
-    It checks all active recurring commitments and generates new instances
-    for those that are due within the generation window.
+    Templates are selected by their indexed next due date, and each one gets
+    every instance it missed up to today (or its next instance, if that falls
+    within the generation window) in a single batch. Templates are marked as
+    checked for the day, so repeated calls on the same day do no work.
 
     Args:
         session: Database session.
         current_date: Current date for calculation. If None, uses today.
+        window_days: Number of days ahead to look for due dates.
 
     Returns:
         List of (Commitment, list[Task]) tuples for generated instances.
@@ -196,37 +310,24 @@ def check_and_generate_recurring_instances(
     today = current_date.date()
     generated: list[tuple[Commitment, list[Task]]] = []
 
-    # Get all active recurring commitments
-    recurring_list = get_active_recurring_commitments(session)
-
-    for recurring in recurring_list:
-        # Check if we should generate
-        if not should_generate_instance(recurring, today):
-            continue
+    for recurring in get_recurring_commitments_due(session, today, window_days):
+        recurring.generation_checked_on = today
+        due_dates = _due_dates_to_generate(recurring, today, window_days)
+        generated.extend(generate_instance(recurring, due_date=due) for due in due_dates)
 
-        # Calculate the next due date
-        reference_date = recurring.last_generated_date or (today - timedelta(days=1))
-        next_due = get_next_due_date(recurring, after_date=reference_date)
-
-        if next_due is None:
-            continue
-
-        # Generate the instance
-        commitment, tasks = generate_instance(recurring, due_date=next_due)
-
-        # Update the recurring commitment tracking
-        recurring.last_generated_date = next_due
-        recurring.instances_generated += 1
-        recurring.updated_at = current_date
-
-        # Save all entities
+        if due_dates:
+            # Update the recurring commitment tracking
+            recurring.last_generated_date = due_dates[-1]
+            recurring.instances_generated += len(due_dates)
+            recurring.updated_at = current_date
         session.add(recurring)
-        session.add(commitment)
-        for task in tasks:
-            session.add(task)
 
-        generated.append((commitment, tasks))
+    # One batch for all new rows (client-side ids let SQLAlchemy insert them together)
+    session.add_all([commitment for commitment, _ in generated])
+    session.add_all([task for _, tasks in generated for task in tasks])
 
+    if generated:
+        logger.info(f"Generated {len(generated)} recurring commitment instance(s)")
     return generated
 
 
@@ -368,8 +469,8 @@ def get_dashboard_commitments(
 ) -> list[dict]:
     """Get commitments for dashboard display.
 
-    Returns active commitments ordered by due date, with status
-    and overdue information calculated.
+    Returns active commitments ordered by their UTC deadline (due_at),
+    with status and overdue information calculated.
 
     Args:
         session: Database session.
@@ -381,7 +482,8 @@ def get_dashboard_commitments(
     # Import here to avoid circular dependency
     from jdo.output.formatters import format_relative_date  # noqa: PLC0415
 
-    today = today_date()
+    now = utc_now()
+    today = now.date()
     active_statuses = [
         CommitmentStatus.PENDING,
         CommitmentStatus.IN_PROGRESS,
@@ -391,7 +493,7 @@ def get_dashboard_commitments(
     statement = (
         select(Commitment)
         .where(Commitment.status.in_(active_statuses))
-        .order_by(Commitment.due_date.asc())
+        .order_by(col(Commitment.due_at).asc())
         .limit(limit)
     )
     commitments = list(session.exec(statement).all())
@@ -399,9 +501,9 @@ def get_dashboard_commitments(
     result = []
     for c in commitments:
         # Determine status string
-        is_overdue = c.due_date is not None and c.due_date < today
+        is_overdue = c.due_at is not None and as_utc(c.due_at) < now
         if is_overdue:
-            days_overdue = (today - c.due_date).days
+            days_overdue = max((today - c.due_date).days, 0)
             status = "overdue"
             due_display = f"OVERDUE ({days_overdue}d)"
         elif c.status == CommitmentStatus.AT_RISK:
@@ -0,0 +1,97 @@
+"""Compensated database writes for one agent run.
+
+Each mutation tool call writes through its own short session that commits
+when the call returns, so the SQLite write lock is held for one tool call
+rather than for the whole run and background maintenance can write between
+calls. The ids of rows the run inserts are recorded; if the run is cancelled
+or fails, those rows are deleted again, so an interrupted turn leaves nothing
+behind. Tools run in worker threads, so tool calls are serialized with a lock.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel
+
+from jdo.db.engine import get_engine
+
+
+def _new_session() -> Session:
+    return Session(get_engine())
+
+
+class StagedMutations:
+    """Records the rows one agent run creates, so they can be removed on cancel."""
+
+    def __init__(self, session_factory: Callable[[], Session] = _new_session) -> None:
+        """Initialize with nothing recorded.
+
+        Args:
+            session_factory: Creates a session per tool call (default: the app engine).
+        """
+        self._session_factory = session_factory
+        self._created: list[tuple[type[SQLModel], UUID]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether the run has created rows that a rollback would remove."""
+        return bool(self._created)
+
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        """Open a session for one tool call, committed when the block exits.
+
+        Rows inserted through the session are recorded for rollback(). If the
+        block raises, the call's writes are rolled back and nothing is recorded.
+
+        Yields:
+            A new session.
+        """
+        with self._lock, self._session_factory() as session:
+            created: list[tuple[type[SQLModel], UUID]] = []
+
+            def record_inserts(flushed: Session, *_args: object) -> None:
+                created.extend((type(obj), obj.id) for obj in flushed.new)
+
+            event.listen(session, "after_flush", record_inserts)
+            try:
+                yield session
+                session.commit()
+            except BaseException:
+                session.rollback()
+                raise
+            self._created.extend(created)
+
+    def commit(self) -> None:
+        """Keep the run's writes (they are already committed) and forget them."""
+        with self._lock:
+            if self._created:
+                logger.debug(f"Kept {len(self._created)} rows written by the agent run")
+            self._created.clear()
+
+    def rollback(self) -> None:
+        """Delete the rows the run created.
+
+        Waits for a tool still writing (e.g. one that was running in a worker
+        thread when the run was cancelled) to finish first. Rows already gone
+        are skipped. Deletes go through the ORM, which orders them by foreign
+        key and applies its cascades.
+        """
+        with self._lock:
+            if not self._created:
+                return
+            with self._session_factory() as session:
+                for model, entity_id in reversed(self._created):
+                    entity = session.get(model, entity_id)
+                    if entity is not None:
+                        session.delete(entity)
+                session.commit()
+            logger.info(f"Removed {len(self._created)} rows written by the cancelled agent run")
+            self._created.clear()
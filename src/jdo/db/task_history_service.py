@@ -106,6 +106,30 @@ class TaskHistoryService:
             estimated_hours=task.estimated_hours,
         )
 
+    def log_tasks_created(self, tasks: list[Task]) -> list[TaskHistoryEntry]:
+        """Log CREATED events for many new tasks with a single flush.
+
+        Args:
+            tasks: The newly created tasks.
+
+        Returns:
+            The created TaskHistoryEntry records, in task order.
+        """
+        entries = [
+            TaskHistoryEntry(
+                task_id=task.id,
+                commitment_id=task.commitment_id,
+                event_type=TaskEventType.CREATED,
+                new_status=task.status,
+                estimated_hours=task.estimated_hours,
+            )
+            for task in tasks
+        ]
+        self.session.add_all(entries)
+        self.session.flush()
+        logger.debug(f"Logged task history: created for {len(entries)} tasks")
+        return entries
+
     def log_status_change(
         self,
         task: Task,
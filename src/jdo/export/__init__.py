@@ -0,0 +1,45 @@
+"""Export of commitments to other tools.
+
+Exporters are re-exported lazily so the CLI can read the options without
+loading the database layer.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from jdo.export.options import DEFAULT_WINDOW_DAYS, IcsOptions, RecurringMode
+from jdo.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from jdo.export.ics import (
+        FeedResult,
+        compute_etag,
+        export_ics_feed,
+        iter_ics,
+        write_ics,
+    )
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "jdo.export.ics": (
+            "FeedResult",
+            "compute_etag",
+            "export_ics_feed",
+            "iter_ics",
+            "write_ics",
+        ),
+    },
+)
+
+__all__ = [
+    "DEFAULT_WINDOW_DAYS",
+    "FeedResult",
+    "IcsOptions",
+    "RecurringMode",
+    "compute_etag",
+    "export_ics_feed",
+    "iter_ics",
+    "write_ics",
+]
@@ -0,0 +1,581 @@
+"""iCalendar (RFC 5545) export of commitments and recurring commitments.
+
+Commitments become events at their deadline, written in UTC. Recurring
+templates become either one event with an RRULE that starts at the next
+instance not yet generated, or one event per occurrence over a window
+(``RecurringMode.EXPAND``). Patterns an RRULE can't reproduce exactly, such
+as day 29/30 clamped to February or a fifth weekday, are always expanded.
+RRULE events keep their local time across DST changes, so they start in the
+template's timezone, which the calendar defines in a VTIMEZONE.
+
+Lines come from a generator and rows are read in batches, so the export
+streams. export_ics_feed writes a feed file with a manifest holding an ETag
+over cheap per-table aggregates, and skips the rewrite when nothing changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+from typing import IO
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from loguru import logger
+from sqlmodel import Session, col, func, select
+
+from jdo.db.session import get_table_versions
+from jdo.export.options import IcsOptions, RecurringMode
+from jdo.models.commitment import Commitment, CommitmentStatus
+from jdo.models.recurring_commitment import (
+    EndType,
+    RecurrenceType,
+    RecurringCommitment,
+    RecurringCommitmentStatus,
+)
+from jdo.models.stakeholder import Stakeholder
+from jdo.recurrence.calculator import get_next_due_date
+from jdo.recurrence.rule import compile_rule
+from jdo.utils.datetime import DEFAULT_DUE_TIME, deadline_utc, today_date, utc_now
+
+# Rows fetched per database round trip while streaming
+STREAM_BATCH_SIZE = 500
+
+# RFC 5545 content lines are folded at 75 octets
+MAX_LINE_OCTETS = 75
+
+PRODID = "-//jdo//Commitments//EN"
+UID_DOMAIN = "jdo.local"
+
+# Bumped when the output format changes, so existing feeds are rewritten
+FEED_FORMAT_VERSION = 2
+
+# UTC offset changes listed in each VTIMEZONE: from a year back to this many ahead
+VTIMEZONE_YEARS = 10
+
+# Sampling step when looking for offset changes (zones change at most once per step)
+_OFFSET_SCAN_STEP = timedelta(hours=12)
+
+_RRULE_WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+_RRULE_FREQ = {
+    RecurrenceType.DAILY: "DAILY",
+    RecurrenceType.WEEKLY: "WEEKLY",
+    RecurrenceType.MONTHLY: "MONTHLY",
+    RecurrenceType.YEARLY: "YEARLY",
+}
+# Week-of-month values RRULE BYDAY expresses the same way the calculator does
+_RRULE_WEEKS = frozenset({1, 2, 3, 4, -1})
+# Fewest and most days a month can have (others have 31; February varies)
+_MIN_MONTH_DAYS = {2: 28, 4: 30, 6: 30, 9: 30, 11: 30}
+_MAX_MONTH_DAYS = {2: 29, 4: 30, 6: 30, 9: 30, 11: 30}
+_SHORTEST_MONTH = 28
+_LONGEST_MONTH = 31
+
+_EXPORTED_STATUSES = (
+    CommitmentStatus.PENDING,
+    CommitmentStatus.IN_PROGRESS,
+    CommitmentStatus.AT_RISK,
+    CommitmentStatus.COMPLETED,
+)
+
+
+@dataclass(frozen=True)
+class FeedResult:
+    """Outcome of export_ics_feed.
+
+    Attributes:
+        path: The feed file.
+        etag: Fingerprint of the exported rows and options.
+        written: False if the feed was already up to date.
+        events: Events written (None when not written).
+    """
+
+    path: Path
+    etag: str
+    written: bool
+    events: int | None = None
+
+
+def escape_text(value: str) -> str:
+    """Escape a TEXT property value (RFC 5545 section 3.3.11).
+
+    Args:
+        value: Raw text.
+
+    Returns:
+        The escaped value.
+    """
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """Fold a content line at 75 octets and terminate it with CRLF.
+
+    Args:
+        line: An unfolded content line.
+
+    Returns:
+        The folded line, ending in CRLF.
+    """
+    if len(line.encode()) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+    parts: list[str] = []
+    current, size, limit = "", 0, MAX_LINE_OCTETS
+    for char in line:
+        width = len(char.encode())
+        if size + width > limit:
+            parts.append(current)
+            # Continuation lines start with a space, which counts toward the limit
+            current, size, limit = "", 0, MAX_LINE_OCTETS - 1
+        current += char
+        size += width
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _format_local(moment: datetime) -> str:
+    return moment.strftime("%Y%m%dT%H%M%S")
+
+
+def _format_utc(moment: datetime) -> str:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _format_offset(offset: timedelta) -> str:
+    sign = "-" if offset < timedelta(0) else "+"
+    hours, rest = divmod(int(abs(offset).total_seconds()), 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{sign}{hours:02d}{minutes:02d}" + (f"{seconds:02d}" if seconds else "")
+
+
+def _utc_start(day: date, at: time | None, timezone: str) -> str:
+    return f"DTSTART:{_format_utc(deadline_utc(day, at, timezone))}"
+
+
+def _zoned_start(day: date, at: time, timezone: str) -> str:
+    return f"DTSTART;TZID={timezone}:{_format_local(datetime.combine(day, at))}"
+
+
+def _utc_offset(moment: datetime, zone: ZoneInfo) -> timedelta:
+    return moment.astimezone(zone).utcoffset() or timedelta(0)
+
+
+def _offset_changes(zone: ZoneInfo, start: datetime, end: datetime) -> Iterator[datetime]:
+    """UTC instants in [start, end) at which the zone's UTC offset changes."""
+    moment = start
+    offset = _utc_offset(moment, zone)
+    while moment < end:
+        following = moment + _OFFSET_SCAN_STEP
+        following_offset = _utc_offset(following, zone)
+        if following_offset != offset:
+            # Bisect to the first second with the new offset
+            low, high = int(moment.timestamp()), int(following.timestamp())
+            while high - low > 1:
+                middle = (low + high) // 2
+                if _utc_offset(datetime.fromtimestamp(middle, UTC), zone) == offset:
+                    low = middle
+                else:
+                    high = middle
+            yield datetime.fromtimestamp(high, UTC)
+            offset = following_offset
+        moment = following
+
+
+def _vtimezone(timezone: str, start: date, end: date) -> Iterator[str]:
+    """VTIMEZONE for a zone, with its offset changes between two dates.
+
+    Each distinct observance (standard or daylight, offsets and name) is one
+    component whose later onsets are listed as RDATEs. Past the end date,
+    calendar apps keep the last observance (most also know the IANA TZID).
+    """
+    zone = ZoneInfo(timezone)
+    begin = datetime.combine(start, time.min, tzinfo=UTC)
+    # Observance -> local onset times, in order of each observance's first onset
+    observances: dict[tuple[str, timedelta, timedelta, str], list[datetime]] = {}
+
+    def observe(moment: datetime, offset_from: timedelta) -> None:
+        local = moment.astimezone(zone)
+        kind = "DAYLIGHT" if local.dst() else "STANDARD"
+        key = (kind, offset_from, _utc_offset(moment, zone), local.tzname() or "")
+        # Onsets are local times in the offset in effect before the change
+        observances.setdefault(key, []).append((moment + offset_from).replace(tzinfo=None))
+
+    observe(begin, _utc_offset(begin, zone))
+    for change in _offset_changes(zone, begin, datetime.combine(end, time.min, tzinfo=UTC)):
+        observe(change, _utc_offset(change - timedelta(seconds=1), zone))
+
+    yield "BEGIN:VTIMEZONE"
+    yield f"TZID:{timezone}"
+    for (kind, offset_from, offset_to, name), onsets in observances.items():
+        yield f"BEGIN:{kind}"
+        yield f"DTSTART:{_format_local(onsets[0])}"
+        if len(onsets) > 1:
+            yield "RDATE:" + ",".join(_format_local(onset) for onset in onsets[1:])
+        yield f"TZOFFSETFROM:{_format_offset(offset_from)}"
+        yield f"TZOFFSETTO:{_format_offset(offset_to)}"
+        if name:
+            yield f"TZNAME:{escape_text(name)}"
+        yield f"END:{kind}"
+    yield "END:VTIMEZONE"
+
+
+def _vtimezones(session: Session, today: date) -> Iterator[str]:
+    """VTIMEZONEs for the zones of active recurring templates."""
+    statement = (
+        select(RecurringCommitment.timezone)
+        .where(RecurringCommitment.status == RecurringCommitmentStatus.ACTIVE)
+        .distinct()
+        .order_by(col(RecurringCommitment.timezone))
+    )
+    start = date(today.year - 1, 1, 1)
+    end = date(today.year + VTIMEZONE_YEARS, 12, 31)
+    for timezone in session.exec(statement).all():
+        try:
+            lines = list(_vtimezone(timezone, start, end))
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning(f"Unknown timezone {timezone!r}; calendar apps may misplace its events")
+            continue
+        yield from lines
+
+
+def _event(  # noqa: PLR0913
+    uid: str,
+    summary: str,
+    dtstart: str,
+    *,
+    modified: datetime,
+    description: str,
+    category: str,
+    rrule: str | None = None,
+) -> Iterator[str]:
+    modified_utc = _format_utc(modified)
+    yield "BEGIN:VEVENT"
+    yield f"UID:{uid}"
+    yield f"DTSTAMP:{modified_utc}"
+    yield f"LAST-MODIFIED:{modified_utc}"
+    yield dtstart
+    if rrule:
+        yield f"RRULE:{rrule}"
+    yield f"SUMMARY:{escape_text(summary)}"
+    yield f"DESCRIPTION:{escape_text(description)}"
+    yield f"CATEGORIES:{category}"
+    yield "END:VEVENT"
+
+
+def to_rrule(recurring: RecurringCommitment) -> str | None:
+    """Translate a template's pattern into an RRULE, if one matches it exactly.
+
+    The calculator clamps a day of month to short months and lets a fifth
+    weekday run into the next month, where an RRULE would skip the month;
+    patterns that hit those cases return None. The RRULE assumes DTSTART is
+    an occurrence.
+
+    Args:
+        recurring: The recurring commitment template.
+
+    Returns:
+        The RRULE value, or None if the pattern must be expanded.
+    """
+    parts = [f"FREQ={_RRULE_FREQ[recurring.recurrence_type]}"]
+    if recurring.interval != 1:
+        parts.append(f"INTERVAL={recurring.interval}")
+
+    if recurring.recurrence_type == RecurrenceType.WEEKLY:
+        days = sorted(recurring.days_of_week or [])
+        parts.extend(("BYDAY=" + ",".join(_RRULE_WEEKDAYS[day] for day in days), "WKST=MO"))
+    elif recurring.recurrence_type in (RecurrenceType.MONTHLY, RecurrenceType.YEARLY):
+        by_date = _rrule_by_date(recurring)
+        if by_date is None:
+            return None
+        parts.extend(by_date)
+
+    if recurring.end_type == EndType.AFTER_COUNT and recurring.end_after_count is not None:
+        parts.append(f"COUNT={recurring.end_after_count - recurring.instances_generated}")
+    elif recurring.end_type == EndType.BY_DATE and recurring.end_by_date is not None:
+        zone = ZoneInfo(recurring.timezone)
+        until = datetime.combine(recurring.end_by_date, time.max, tzinfo=zone)
+        parts.append(f"UNTIL={_format_utc(until)}")
+    return ";".join(parts)
+
+
+def _rrule_by_date(recurring: RecurringCommitment) -> list[str] | None:
+    """BYMONTH/BYMONTHDAY/BYDAY parts for a monthly or yearly pattern."""
+    parts: list[str] = []
+    month = recurring.month_of_year
+    if recurring.recurrence_type == RecurrenceType.YEARLY:
+        parts.append(f"BYMONTH={month}")
+        fewest = _MIN_MONTH_DAYS.get(month or 1, _LONGEST_MONTH)
+        most = _MAX_MONTH_DAYS.get(month or 1, _LONGEST_MONTH)
+    else:
+        fewest, most = _SHORTEST_MONTH, _LONGEST_MONTH
+
+    day = recurring.day_of_month
+    if day is not None:
+        if day <= fewest:
+            parts.append(f"BYMONTHDAY={day}")
+        elif day >= most:
+            # Clamped to the month's last day every time
+            parts.append("BYMONTHDAY=-1")
+        else:
+            # Clamped only in some months (e.g. day 30 monthly)
+            return None
+        return parts
+
+    week, days = recurring.week_of_month, recurring.days_of_week
+    if week in _RRULE_WEEKS and days:
+        parts.append(f"BYDAY={week}{_RRULE_WEEKDAYS[days[0]]}")
+        return parts
+    return None
+
+
+def _stakeholder_names(session: Session) -> dict[UUID, str]:
+    rows = session.exec(select(Stakeholder.id, Stakeholder.name))
+    return dict(rows.all())
+
+
+def _commitment_events(session: Session, names: dict[UUID, str]) -> Iterator[str]:
+    statement = (
+        select(Commitment)
+        .where(col(Commitment.status).in_(_EXPORTED_STATUSES))
+        .order_by(col(Commitment.due_date), col(Commitment.id))
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+    for commitment in session.exec(statement):
+        description = f"For {names.get(commitment.stakeholder_id, 'unknown')}"
+        if commitment.notes:
+            description += f"\n\n{commitment.notes}"
+        yield from _event(
+            f"commitment-{commitment.id}@{UID_DOMAIN}",
+            commitment.deliverable,
+            _utc_start(commitment.due_date, commitment.due_time, commitment.timezone),
+            modified=commitment.updated_at,
+            description=description,
+            category=commitment.status.value,
+        )
+
+
+def _recurring_events(
+    session: Session, names: dict[UUID, str], options: IcsOptions, today: date
+) -> Iterator[str]:
+    statement = (
+        select(RecurringCommitment)
+        .where(RecurringCommitment.status == RecurringCommitmentStatus.ACTIVE)
+        .order_by(col(RecurringCommitment.id))
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+    window_end = today + timedelta(days=options.window_days)
+    for recurring in session.exec(statement):
+        # Instances already generated are exported as commitments
+        reference = recurring.last_generated_date or (today - timedelta(days=1))
+        first = get_next_due_date(recurring, after_date=reference)
+        if first is None:
+            continue
+        at = recurring.due_time or DEFAULT_DUE_TIME
+        description = f"For {names.get(recurring.stakeholder_id, 'unknown')} (recurring)"
+        if recurring.notes:
+            description += f"\n\n{recurring.notes}"
+        rrule = to_rrule(recurring) if options.recurring == RecurringMode.RRULE else None
+        if rrule is not None:
+            yield from _event(
+                f"recurring-{recurring.id}@{UID_DOMAIN}",
+                recurring.deliverable_template,
+                _zoned_start(first, at, recurring.timezone),
+                modified=recurring.updated_at,
+                description=description,
+                category="recurring",
+                rrule=rrule,
+            )
+            continue
+        occurrences = compile_rule(recurring).iter_occurrences(
+            first, window_end, already_generated=recurring.instances_generated
+        )
+        for day in occurrences:
+            yield from _event(
+                f"recurring-{recurring.id}-{day:%Y%m%d}@{UID_DOMAIN}",
+                recurring.deliverable_template,
+                _utc_start(day, at, recurring.timezone),
+                modified=recurring.updated_at,
+                description=description,
+                category="recurring",
+            )
+
+
+def iter_ics(
+    session: Session, options: IcsOptions | None = None, *, today: date | None = None
+) -> Iterator[str]:
+    """Generate the calendar as folded, CRLF-terminated content lines.
+
+    Args:
+        session: Database session.
+        options: Export options (defaults to RRULEs for recurring templates).
+        today: Date recurring expansion starts from (defaults to today).
+
+    Yields:
+        Content lines.
+    """
+    options = options or IcsOptions()
+    today = today or today_date()
+    names = _stakeholder_names(session)
+    yield fold_line("BEGIN:VCALENDAR")
+    yield fold_line("VERSION:2.0")
+    yield fold_line(f"PRODID:{PRODID}")
+    yield fold_line("CALSCALE:GREGORIAN")
+    yield fold_line("X-WR-CALNAME:jdo commitments")
+    if options.recurring == RecurringMode.RRULE:
+        for line in _vtimezones(session, today):
+            yield fold_line(line)
+    for line in _commitment_events(session, names):
+        yield fold_line(line)
+    for line in _recurring_events(session, names, options, today):
+        yield fold_line(line)
+    yield fold_line("END:VCALENDAR")
+
+
+def write_ics(
+    session: Session,
+    stream: IO[str],
+    options: IcsOptions | None = None,
+    *,
+    today: date | None = None,
+) -> int:
+    """Stream the calendar to a text stream.
+
+    Open files with ``newline=""`` so the CRLF line endings are kept.
+
+    Args:
+        session: Database session.
+        stream: Destination.
+        options: Export options.
+        today: Date recurring expansion starts from (defaults to today).
+
+    Returns:
+        Number of events written.
+    """
+    events = 0
+    for line in iter_ics(session, options, today=today):
+        if line == "BEGIN:VEVENT\r\n":
+            events += 1
+        stream.write(line)
+    return events
+
+
+def compute_etag(
+    session: Session, options: IcsOptions | None = None, *, today: date | None = None
+) -> str:
+    """Fingerprint everything the export depends on.
+
+    Hashes the row count and latest ``updated_at`` of the commitment,
+    recurring template and stakeholder tables, plus the options and date, so
+    checking for changes costs three aggregate lookups rather than a read of
+    every row. ``updated_at`` is stamped on every flushed change to these
+    models (and by the bulk writers in jdo.db.bulk), so any change to an
+    exported row moves the aggregates.
+
+    Args:
+        session: Database session.
+        options: Export options.
+        today: Date recurring expansion starts from (defaults to today).
+
+    Returns:
+        A hex digest that changes whenever the feed would.
+    """
+    options = options or IcsOptions()
+    today = today or today_date()
+    versions = get_table_versions(session, (Commitment, RecurringCommitment, Stakeholder))
+    fingerprint = (FEED_FORMAT_VERSION, options.recurring.value, options.window_days, today)
+    return hashlib.sha256(repr((fingerprint, versions)).encode()).hexdigest()
+
+
+def _last_modified(session: Session) -> datetime | None:
+    latest = [
+        session.exec(select(func.max(Commitment.updated_at))).one(),
+        session.exec(select(func.max(RecurringCommitment.updated_at))).one(),
+    ]
+    present = [moment for moment in latest if moment is not None]
+    return max(present) if present else None
+
+
+def manifest_path(feed_path: Path) -> Path:
+    """The manifest file kept next to a feed.
+
+    Args:
+        feed_path: The feed file.
+
+    Returns:
+        Path of the manifest.
+    """
+    return feed_path.with_name(feed_path.name + ".manifest.json")
+
+
+def _read_manifest(path: Path) -> dict[str, object]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def export_ics_feed(
+    session: Session,
+    path: Path,
+    options: IcsOptions | None = None,
+    *,
+    force: bool = False,
+    today: date | None = None,
+) -> FeedResult:
+    """Write the calendar feed file, unless the rows it is built from are unchanged.
+
+    The feed is streamed to a temporary file and moved into place, so a
+    calendar app never reads a half-written feed. The manifest next to it
+    records the ETag and last-modified time.
+
+    Args:
+        session: Database session.
+        path: Feed file to write.
+        options: Export options.
+        force: Rewrite even if the ETag matches.
+        today: Date recurring expansion starts from (defaults to today).
+
+    Returns:
+        What was done.
+    """
+    options = options or IcsOptions()
+    etag = compute_etag(session, options, today=today)
+    manifest = manifest_path(path)
+    if not force and path.exists() and _read_manifest(manifest).get("etag") == etag:
+        logger.debug(f"Calendar feed {path} is up to date")
+        return FeedResult(path=path, etag=etag, written=False)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    with temporary.open("w", encoding="utf-8", newline="") as stream:
+        events = write_ics(session, stream, options, today=today)
+    temporary.replace(path)
+
+    last_modified = _last_modified(session)
+    manifest.write_text(
+        json.dumps(
+            {
+                "etag": etag,
+                "last_modified": _format_utc(last_modified) if last_modified else None,
+                "generated_at": _format_utc(utc_now()),
+                "events": events,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    logger.info(f"Wrote calendar feed {path} ({events} events)")
+    return FeedResult(path=path, etag=etag, written=True, events=events)
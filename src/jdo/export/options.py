@@ -0,0 +1,34 @@
+"""Options for commitment export.
+
+Kept apart from the exporters so the CLI can build its options without
+importing the database layer.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+
+# Days of recurring occurrences listed when expanding
+DEFAULT_WINDOW_DAYS = 90
+
+
+class RecurringMode(str, Enum):
+    """How recurring commitments are exported."""
+
+    RRULE = "rrule"
+    EXPAND = "expand"
+
+
+@dataclass(frozen=True)
+class IcsOptions:
+    """Export options.
+
+    Attributes:
+        recurring: Export templates as RRULEs or as expanded occurrences.
+        window_days: Days ahead to expand occurrences (expand mode, and
+            patterns an RRULE can't express).
+    """
+
+    recurring: RecurringMode = RecurringMode.RRULE
+    window_days: int = DEFAULT_WINDOW_DAYS
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from sqlmodel import Session, func, select
+from sqlalchemy import ColumnElement, DateTime, and_, or_
+from sqlmodel import Session, col, func, select
 
 from jdo.models.cleanup_plan import CleanupPlan, CleanupPlanStatus
 from jdo.models.commitment import Commitment, CommitmentStatus
@@ -18,7 +20,7 @@ from jdo.models.integrity_metrics import (
 from jdo.models.stakeholder import Stakeholder
 from jdo.models.task import Task, TaskStatus
 from jdo.models.task_history import TaskEventType, TaskHistoryEntry
-from jdo.utils.datetime import today_date, utc_now
+from jdo.utils.datetime import as_utc, utc_now
 
 # Constants for risk detection
 HOURS_24 = 24
@@ -36,6 +38,53 @@ AFFECTING_SCORE_DAYS = 30  # Days to look back for affecting commitments
 MAX_AFFECTING_COMMITMENTS = 5  # Maximum commitments to show in affecting list
 
 
+# Statuses that can be at-risk
+RISK_STATUSES = (CommitmentStatus.PENDING, CommitmentStatus.IN_PROGRESS)
+
+
+def _last_activity() -> ColumnElement[datetime]:
+    """Latest of a commitment's updated_at, its tasks' updated_at and its task history.
+
+    The correlated MAX lookups are served by the (commitment_id, updated_at)
+    and (commitment_id, created_at) indexes.
+    """
+    latest_task = (
+        select(func.max(Task.updated_at))
+        .where(col(Task.commitment_id) == col(Commitment.id))
+        .correlate(Commitment)
+        .scalar_subquery()
+    )
+    latest_event = (
+        select(func.max(TaskHistoryEntry.created_at))
+        .where(col(TaskHistoryEntry.commitment_id) == col(Commitment.id))
+        .correlate(Commitment)
+        .scalar_subquery()
+    )
+    updated = col(Commitment.updated_at)
+    # SQLite's multi-argument max() is the scalar GREATEST
+    return func.max(
+        updated,
+        func.coalesce(latest_task, updated),
+        func.coalesce(latest_event, updated),
+        type_=DateTime,
+    )
+
+
+def _may_have_changed(
+    last_activity: ColumnElement[datetime], since: datetime, now: datetime
+) -> ColumnElement[bool]:
+    """Commitments whose risk category may differ from what it was at ``since``."""
+    due_at = col(Commitment.due_at)
+    day = timedelta(hours=HOURS_24)
+    return or_(
+        last_activity >= since,
+        due_at.between(since, now),  # became overdue
+        due_at.between(since + day, now + day),  # entered the due-soon window
+        due_at.between(since + 2 * day, now + 2 * day),  # entered the stalled window
+        last_activity.between(since - day, now - day),  # went quiet for 24 hours
+    )
+
+
 @dataclass
 class RiskSummary:
     """Summary of detected risks on application launch."""
@@ -43,6 +92,8 @@ class RiskSummary:
     overdue_commitments: list[Commitment] = field(default_factory=list)
     due_soon_commitments: list[Commitment] = field(default_factory=list)
     stalled_commitments: list[Commitment] = field(default_factory=list)
+    cleared_ids: set[UUID] = field(default_factory=set)
+    checked_at: datetime | None = None
 
     @property
     def total_risks(self) -> int:
@@ -237,6 +288,140 @@ class IntegrityService:
             notification_task=notification_task,
         )
 
+    def mark_commitments_at_risk_bulk(
+        self,
+        session: Session,
+        commitment_ids: Sequence[UUID],
+        reason: str,
+        impact_description: str | None = None,
+    ) -> list[AtRiskResult]:
+        """Mark many commitments as at-risk in one transaction.
+
+        Same outcome as calling mark_commitment_at_risk for each id, but the
+        commitments, stakeholders, existing cleanup plans and notification
+        tasks are each fetched with one IN query, missing plans and tasks are
+        added together, and the session commits once.
+
+        Args:
+            session: Database session
+            commitment_ids: IDs of commitments to mark at-risk
+            reason: Why the commitments are at risk
+            impact_description: Optional description of impact
+
+        Returns:
+            AtRiskResult per commitment, in the order of commitment_ids
+
+        Raises:
+            ValueError: If any commitment is not found (nothing is changed)
+        """
+        ids = list(dict.fromkeys(commitment_ids))
+        if not ids:
+            return []
+
+        commitments = {
+            c.id: c for c in session.exec(select(Commitment).where(col(Commitment.id).in_(ids)))
+        }
+        missing = [str(i) for i in ids if i not in commitments]
+        if missing:
+            msg = f"Commitments not found: {', '.join(missing)}"
+            raise ValueError(msg)
+
+        stakeholder_ids = {c.stakeholder_id for c in commitments.values()}
+        stakeholder_names = dict(
+            session.exec(
+                select(Stakeholder.id, Stakeholder.name).where(
+                    col(Stakeholder.id).in_(stakeholder_ids)
+                )
+            ).all()
+        )
+        cleanup_plans: dict[UUID, CleanupPlan] = {}
+        for plan in session.exec(
+            select(CleanupPlan).where(col(CleanupPlan.commitment_id).in_(ids))
+        ):
+            cleanup_plans.setdefault(plan.commitment_id, plan)
+        notification_tasks: dict[UUID, Task] = {}
+        for task in session.exec(
+            select(Task).where(
+                col(Task.commitment_id).in_(ids),
+                Task.is_notification_task == True,  # noqa: E712
+            )
+        ):
+            notification_tasks.setdefault(task.commitment_id, task)
+
+        now = utc_now()
+        new_tasks: list[Task] = []
+        new_plans: list[CleanupPlan] = []
+        results = []
+        for commitment_id in ids:
+            commitment = commitments[commitment_id]
+            commitment.status = CommitmentStatus.AT_RISK
+            commitment.marked_at_risk_at = now
+            commitment.updated_at = now
+
+            cleanup_plan = cleanup_plans.get(commitment_id)
+            if cleanup_plan is None:
+                cleanup_plan = CleanupPlan(
+                    commitment_id=commitment_id,
+                    impact_description=impact_description,
+                    status=CleanupPlanStatus.PLANNED,
+                )
+                new_plans.append(cleanup_plan)
+
+            notification_task = notification_tasks.get(commitment_id)
+            if notification_task is None:
+                stakeholder_name = stakeholder_names.get(commitment.stakeholder_id, "stakeholder")
+                notification_task = Task(
+                    commitment_id=commitment_id,
+                    title=f"Notify {stakeholder_name} about at-risk commitment",
+                    scope=self._generate_notification_scope(
+                        commitment=commitment,
+                        stakeholder_name=stakeholder_name,
+                        reason=reason,
+                        impact_description=impact_description,
+                    ),
+                    order=0,
+                    is_notification_task=True,
+                    status=TaskStatus.PENDING,
+                )
+                new_tasks.append(notification_task)
+                cleanup_plan.notification_task_id = notification_task.id
+
+            results.append(
+                AtRiskResult(
+                    commitment=commitment,
+                    cleanup_plan=cleanup_plan,
+                    notification_task=notification_task,
+                )
+            )
+
+        # Tasks first: new cleanup plans reference them
+        session.add_all(new_tasks)
+        session.flush()
+        session.add_all(new_plans)
+        session.commit()
+
+        return results
+
+    def get_overdue_commitment_ids(self, session: Session) -> list[UUID]:
+        """IDs of pending or in-progress commitments past their due time, oldest first.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Commitment IDs ordered by due_at
+        """
+        return list(
+            session.exec(
+                select(Commitment.id)
+                .where(
+                    col(Commitment.status).in_(RISK_STATUSES),
+                    col(Commitment.due_at) < utc_now(),
+                )
+                .order_by(col(Commitment.due_at))
+            )
+        )
+
     def recover_commitment(
         self,
         session: Session,
@@ -425,79 +610,72 @@ Mark this task complete after you've sent the notification."""
             tasks_with_estimates=tasks_with_estimates,
         )
 
-    def detect_risks(self, session: Session) -> RiskSummary:
+    def detect_risks(self, session: Session, *, since: datetime | None = None) -> RiskSummary:
         """Detect at-risk commitments for proactive alerting.
 
         Checks for:
-        1. Overdue commitments (due_date < today, status pending/in_progress)
+        1. Overdue commitments (due_at < now, status pending/in_progress)
         2. Commitments due within 24 hours with status=pending
-        3. Stalled in_progress commitments (due within 48h, no task activity in 24h)
+        3. Stalled in_progress commitments (due within 48h, no activity in 24h)
+
+        All three come from one query: a range scan of active commitments due
+        within 48 hours on the (status, due_at) index, with each row's latest
+        activity (commitment update, task update or task history event) looked
+        up through the per-commitment composite indexes.
+
+        With ``since`` (typically the previous summary's checked_at), only
+        commitments whose category may have changed since then are checked:
+        those with activity after ``since`` and those a deadline or inactivity
+        threshold has passed over since then. Commitments changed since then
+        that are no longer at risk (completed, abandoned, rescheduled or
+        active again) are listed in ``cleared_ids``, so a caller merging the
+        result into an earlier summary can drop them.
 
         Args:
             session: Database session
+            since: Check only commitments that may have changed after this time.
 
         Returns:
             RiskSummary with categorized at-risk commitments
         """
-        today = today_date()
         now = utc_now()
-        in_24_hours = today + timedelta(days=1)  # Tomorrow
-        in_48_hours = today + timedelta(days=2)  # Day after tomorrow
+        in_24_hours = now + timedelta(hours=HOURS_24)
+        in_48_hours = now + timedelta(hours=HOURS_48)
         hours_24_ago = now - timedelta(hours=HOURS_24)
 
-        # Statuses that can be at-risk
-        active_statuses = [CommitmentStatus.PENDING, CommitmentStatus.IN_PROGRESS]
-
-        # 1. Overdue commitments
-        overdue = list(
-            session.exec(
-                select(Commitment).where(
-                    Commitment.due_date < today,
-                    Commitment.status.in_(active_statuses),  # type: ignore[union-attr]
-                )
-            ).all()
+        last_activity = _last_activity()
+        candidates = and_(
+            col(Commitment.status).in_(RISK_STATUSES),
+            col(Commitment.due_at) <= in_48_hours,
         )
-
-        # 2. Due within 24 hours and still pending
-        due_soon = list(
-            session.exec(
-                select(Commitment).where(
-                    Commitment.due_date >= today,
-                    Commitment.due_date <= in_24_hours,
-                    Commitment.status == CommitmentStatus.PENDING,
-                )
-            ).all()
+        statement = select(Commitment, last_activity.label("last_activity")).order_by(
+            col(Commitment.due_at)
         )
-
-        # 3. Stalled: in_progress, due within 48h, no recent task activity
-        # For simplicity, we check commitments in_progress due within 48h
-        # A more complete implementation would track task.updated_at
-        potentially_stalled = list(
-            session.exec(
-                select(Commitment).where(
-                    Commitment.due_date >= today,
-                    Commitment.due_date <= in_48_hours,
-                    Commitment.status == CommitmentStatus.IN_PROGRESS,
+        if since is None:
+            statement = statement.where(candidates)
+        else:
+            statement = statement.where(
+                or_(
+                    and_(candidates, _may_have_changed(last_activity, since, now)),
+                    # Changed since the last check: it may have left the candidates
+                    col(Commitment.updated_at) >= since,
                 )
-            ).all()
-        )
+            )
 
-        # Filter to those with no recent task updates
-        # For now, we'll use commitment.updated_at as a proxy
-        stalled = []
-        for c in potentially_stalled:
-            updated = c.updated_at
-            # Handle timezone-naive datetimes from SQLite
-            if updated.tzinfo is None:
-                updated = updated.replace(tzinfo=UTC)
-            if updated < hours_24_ago:
-                stalled.append(c)
-
-        return RiskSummary(
-            overdue_commitments=overdue,
-            due_soon_commitments=due_soon,
-            stalled_commitments=stalled,
-        )
+        summary = RiskSummary(checked_at=now)
+        for commitment, activity in session.exec(statement):
+            due_at = as_utc(commitment.due_at) if commitment.due_at else now
+            if commitment.status not in RISK_STATUSES or due_at > in_48_hours:
+                summary.cleared_ids.add(commitment.id)
+            elif due_at < now:
+                summary.overdue_commitments.append(commitment)
+            elif commitment.status == CommitmentStatus.PENDING and due_at <= in_24_hours:
+                summary.due_soon_commitments.append(commitment)
+            elif commitment.status != CommitmentStatus.PENDING and as_utc(activity) < hours_24_ago:
+                summary.stalled_commitments.append(commitment)
+            else:
+                summary.cleared_ids.add(commitment.id)
+        return summary
 
     def _calculate_notification_timeliness(self, session: Session) -> float:
         """Calculate average notification timeliness score.
@@ -3,23 +3,19 @@
 This module configures Alembic for SQLModel migrations with SQLite support.
 """
 
-import sys
 from logging.config import fileConfig
-from pathlib import Path
 
 from alembic import context
 from sqlalchemy import engine_from_config, pool
 from sqlmodel import SQLModel
 
-# Add the project root to sys.path for model imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
-
-# Import all models to ensure they're registered with SQLModel.metadata
-# This is required for autogenerate to detect model changes
 # Get settings for database path
-from jdo.config.settings import get_settings  # noqa: E402
-from jdo.models import (  # noqa: E402, F401
+from jdo.config.settings import get_settings
+
+# Import all models (and the schema meta table) to ensure they're registered
+# with SQLModel.metadata. This is required for autogenerate to detect changes
+from jdo.db.schema import JDO_META  # noqa: F401
+from jdo.models import (  # noqa: F401
     CleanupPlan,
     Commitment,
     Draft,
@@ -34,8 +30,9 @@ from jdo.models import (  # noqa: E402, F401
 # Alembic Config object for access to .ini file values
 config = context.config
 
-# Configure Python logging from alembic.ini
-if config.config_file_name is not None:
+# Configure Python logging from alembic.ini, except when jdo migrates the
+# database itself at startup (see jdo.db.schema)
+if config.config_file_name is not None and config.attributes.get("configure_logging", True):
     fileConfig(config.config_file_name)
 
 # Set target metadata for autogenerate support
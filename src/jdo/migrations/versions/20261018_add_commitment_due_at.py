@@ -0,0 +1,82 @@
+"""add_commitment_due_at.
+
+Revision ID: d7a41c09e5b2
+Revises: c3d9e2f71a84
+Create Date: 2026-10-18
+
+Add commitments.due_at, the UTC instant of due_date + due_time in the
+commitment's timezone, with an index so overdue and due-soon checks are range
+scans. Existing rows are backfilled in batches; timezone conversion needs
+zoneinfo, so each batch is computed in Python and written with executemany.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+from jdo.utils.datetime import deadline_utc
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a41c09e5b2"
+down_revision: str | None = "c3d9e2f71a84"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Rows read and updated per backfill batch
+BACKFILL_BATCH_SIZE = 500
+
+_commitments = sa.table(
+    "commitments",
+    sa.column("id", sa.Uuid()),
+    sa.column("due_date", sa.Date()),
+    sa.column("due_time", sa.Time()),
+    sa.column("timezone", sa.String()),
+    sa.column("due_at", sa.DateTime()),
+)
+
+
+def _backfill_due_at(connection: sa.Connection) -> None:
+    """Fill due_at for every row, BACKFILL_BATCH_SIZE rows at a time (keyset on id)."""
+    update = (
+        sa.update(_commitments)
+        .where(_commitments.c.id == sa.bindparam("row_id"))
+        .values(due_at=sa.bindparam("new_due_at"))
+    )
+    last_id = None
+    while True:
+        query = sa.select(
+            _commitments.c.id,
+            _commitments.c.due_date,
+            _commitments.c.due_time,
+            _commitments.c.timezone,
+        ).order_by(_commitments.c.id)
+        if last_id is not None:
+            query = query.where(_commitments.c.id > last_id)
+        rows = connection.execute(query.limit(BACKFILL_BATCH_SIZE)).all()
+        if not rows:
+            return
+        connection.execute(
+            update,
+            [
+                {
+                    "row_id": row.id,
+                    "new_due_at": deadline_utc(row.due_date, row.due_time, row.timezone),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Apply migration changes."""
+    op.add_column("commitments", sa.Column("due_at", sa.DateTime(), nullable=True))
+    _backfill_due_at(op.get_bind())
+    op.create_index("ix_commitments_due_at", "commitments", ["due_at"])
+
+
+def downgrade() -> None:
+    """Revert migration changes."""
+    op.drop_index("ix_commitments_due_at", "commitments")
+    op.drop_column("commitments", "due_at")
@@ -0,0 +1,35 @@
+"""add_jdo_meta.
+
+Revision ID: f4a2c6e8b1d3
+Revises: e18b6f3a9c70
+Create Date: 2026-10-18
+
+Key/value table recording the schema revision and fingerprint the database was
+last brought up to date with (see jdo.db.schema).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a2c6e8b1d3"
+down_revision: str | None = "e18b6f3a9c70"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Apply migration changes."""
+    op.create_table(
+        "jdo_meta",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("value", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+
+
+def downgrade() -> None:
+    """Revert migration changes."""
+    op.drop_table("jdo_meta")
@@ -0,0 +1,40 @@
+"""add_recurring_next_due_date.
+
+Revision ID: c3d9e2f71a84
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18
+
+Add an indexed next_due_date to recurring_commitments so due templates can be
+selected with a range query, and generation_checked_on to record the day
+instance generation last ran. Existing rows keep next_due_date NULL; they are
+picked up and filled in by the next generation run.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d9e2f71a84"
+down_revision: str | None = "a1b2c3d4e5f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Apply migration changes."""
+    op.add_column("recurring_commitments", sa.Column("next_due_date", sa.Date(), nullable=True))
+    op.add_column(
+        "recurring_commitments", sa.Column("generation_checked_on", sa.Date(), nullable=True)
+    )
+    op.create_index(
+        "ix_recurring_commitments_next_due_date", "recurring_commitments", ["next_due_date"]
+    )
+
+
+def downgrade() -> None:
+    """Revert migration changes."""
+    op.drop_index("ix_recurring_commitments_next_due_date", "recurring_commitments")
+    op.drop_column("recurring_commitments", "generation_checked_on")
+    op.drop_column("recurring_commitments", "next_due_date")
@@ -0,0 +1,39 @@
+"""add_risk_detection_indexes.
+
+Revision ID: e18b6f3a9c70
+Revises: d7a41c09e5b2
+Create Date: 2026-10-18
+
+Composite indexes for single-query risk detection: active commitments are
+range-scanned by (status, due_at), and each one's latest task update and task
+history event are found through (commitment_id, updated_at) and
+(commitment_id, created_at).
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e18b6f3a9c70"
+down_revision: str | None = "d7a41c09e5b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Apply migration changes."""
+    op.create_index("ix_commitments_status_due_at", "commitments", ["status", "due_at"])
+    op.create_index("ix_tasks_commitment_id_updated_at", "tasks", ["commitment_id", "updated_at"])
+    op.create_index(
+        "ix_task_history_commitment_id_created_at",
+        "task_history",
+        ["commitment_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Revert migration changes."""
+    op.drop_index("ix_task_history_commitment_id_created_at", "task_history")
+    op.drop_index("ix_tasks_commitment_id_updated_at", "tasks")
+    op.drop_index("ix_commitments_status_due_at", "commitments")
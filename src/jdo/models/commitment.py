@@ -5,14 +5,14 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, ForeignKey, Uuid
+from sqlalchemy import Column, ForeignKey, Index, Uuid, event, inspect
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
     from jdo.models.goal import Goal
     from jdo.models.stakeholder import Stakeholder
 
-from jdo.utils.datetime import DEFAULT_DUE_TIME, DEFAULT_TIMEZONE, utc_now
+from jdo.utils.datetime import DEFAULT_DUE_TIME, DEFAULT_TIMEZONE, deadline_utc, utc_now
 
 
 class CommitmentStatus(str, Enum):
@@ -33,6 +33,8 @@ class Commitment(SQLModel, table=True):
     """
 
     __tablename__ = "commitments"
+    # Risk detection scans active statuses by deadline
+    __table_args__ = (Index("ix_commitments_status_due_at", "status", "due_at"),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     deliverable: str = Field(min_length=1)
@@ -50,6 +52,8 @@ class Commitment(SQLModel, table=True):
     due_date: date
     due_time: time = Field(default=DEFAULT_DUE_TIME)
     timezone: str = Field(default=DEFAULT_TIMEZONE)
+    # UTC instant of due_date + due_time in timezone; kept in sync on flush
+    due_at: datetime | None = Field(default=None, index=True)
     status: CommitmentStatus = Field(default=CommitmentStatus.PENDING)
     completed_at: datetime | None = Field(default=None)
     notes: str | None = Field(default=None)
@@ -89,3 +93,22 @@ class Commitment(SQLModel, table=True):
             True if orphan (no goal_id AND no milestone_id), False otherwise.
         """
         return self.goal_id is None and self.milestone_id is None
+
+
+def _sync_due_at(_mapper: object, _connection: object, target: Commitment) -> None:
+    """Keep the indexed UTC due_at in step with the local deadline fields."""
+    target.due_at = deadline_utc(target.due_date, target.due_time, target.timezone)
+
+
+def _touch_updated_at(_mapper: object, _connection: object, target: Commitment) -> None:
+    """Stamp updated_at on every flushed change (status, completion, ...).
+
+    A value the writer set itself (e.g. the time a risk was detected) is kept.
+    """
+    if not inspect(target).attrs.updated_at.history.has_changes():
+        target.updated_at = utc_now()
+
+
+event.listen(Commitment, "before_insert", _sync_due_at)
+event.listen(Commitment, "before_update", _sync_due_at)
+event.listen(Commitment, "before_update", _touch_updated_at)
@@ -7,11 +7,14 @@ from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON
+from sqlalchemy import JSON, event, inspect
 from sqlmodel import Column, Field, SQLModel
 
 from jdo.utils.datetime import utc_now
 
+# Drafts older than this many days are flagged for an expiration prompt
+DRAFT_EXPIRY_DAYS = 7
+
 
 class EntityType(str, Enum):
     """Type of entity being drafted."""
@@ -49,6 +52,15 @@ class Draft(SQLModel, table=True):
         Returns:
             True if draft is MORE than 7 days old (not exactly 7), False otherwise.
         """
-        expiration_threshold = utc_now() - timedelta(days=7)
+        expiration_threshold = utc_now() - timedelta(days=DRAFT_EXPIRY_DAYS)
         # Use <= to ensure exactly 7 days is NOT expired (strictly more than 7 days)
         return self.created_at < expiration_threshold
+
+
+def _touch_updated_at(_mapper: object, _connection: object, target: Draft) -> None:
+    """Stamp updated_at when a draft is edited (e.g. reclassified in triage)."""
+    if not inspect(target).attrs.updated_at.history.has_changes():
+        target.updated_at = utc_now()
+
+
+event.listen(Draft, "before_update", _touch_updated_at)
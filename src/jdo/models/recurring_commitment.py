@@ -9,7 +9,7 @@ from uuid import UUID, uuid4
 
 from pydantic import BaseModel, model_validator
 from pydantic import Field as PydanticField
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, event, inspect
 from sqlmodel import Field, SQLModel
 
 from jdo.utils.datetime import DEFAULT_TIMEZONE, utc_now
@@ -121,6 +121,12 @@ class RecurringCommitment(SQLModel, table=True):
     last_generated_date: date | None = Field(default=None)
     instances_generated: int = Field(default=0)
 
+    # Next instance due date after last_generated_date (None before the first
+    # instance or once the recurrence has ended); kept in sync on every write
+    next_due_date: date | None = Field(default=None, index=True)
+    # Day instance generation last ran for this template
+    generation_checked_on: date | None = Field(default=None)
+
     # Timestamps
     created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime = Field(default_factory=utc_now)
@@ -229,3 +235,25 @@ class RecurringCommitment(SQLModel, table=True):
     def set_task_templates(self, templates: list[TaskTemplate]) -> None:
         """Set task_templates from TaskTemplate objects."""
         self.task_templates = [t.model_dump() for t in templates]
+
+
+def _sync_next_due_date(_mapper: object, _connection: object, target: RecurringCommitment) -> None:
+    """Keep a template's indexed next_due_date in step with its pattern and progress."""
+    # The calculator imports this module, so it can only be imported once this one has loaded
+    from jdo.recurrence.calculator import get_next_due_date
+
+    if target.last_generated_date is None:
+        target.next_due_date = None
+        return
+    target.next_due_date = get_next_due_date(target, after_date=target.last_generated_date)
+
+
+def _touch_updated_at(_mapper: object, _connection: object, target: RecurringCommitment) -> None:
+    """Stamp updated_at when a template changes, unless the writer set it."""
+    if not inspect(target).attrs.updated_at.history.has_changes():
+        target.updated_at = utc_now()
+
+
+event.listen(RecurringCommitment, "before_insert", _sync_next_due_date)
+event.listen(RecurringCommitment, "before_update", _sync_next_due_date)
+event.listen(RecurringCommitment, "before_update", _touch_updated_at)
@@ -5,6 +5,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from sqlalchemy import event, inspect
 from sqlmodel import Field, Relationship, SQLModel
 
 from jdo.utils.datetime import utc_now
@@ -41,3 +42,12 @@ class Stakeholder(SQLModel, table=True):
 
     # Relationships - use List["ClassName"] syntax without __future__ annotations
     commitments: list["Commitment"] = Relationship(back_populates="stakeholder")
+
+
+def _touch_updated_at(_mapper: object, _connection: object, target: Stakeholder) -> None:
+    """Stamp updated_at when a stakeholder is edited, unless the writer set it."""
+    if not inspect(target).attrs.updated_at.history.has_changes():
+        target.updated_at = utc_now()
+
+
+event.listen(Stakeholder, "before_update", _touch_updated_at)
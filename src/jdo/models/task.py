@@ -8,7 +8,7 @@ from typing import Any
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, field_validator
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Index, event
 from sqlmodel import Field, SQLModel
 
 from jdo.utils.datetime import utc_now
@@ -80,6 +80,8 @@ class Task(SQLModel, table=True):
     """
 
     __tablename__ = "tasks"
+    # Latest task activity per commitment (stalled detection)
+    __table_args__ = (Index("ix_tasks_commitment_id_updated_at", "commitment_id", "updated_at"),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     commitment_id: UUID = Field(foreign_key="commitments.id")
@@ -120,3 +122,11 @@ class Task(SQLModel, table=True):
     def set_sub_tasks(self, sub_tasks: list[SubTask]) -> None:
         """Set sub_tasks from SubTask objects."""
         self.sub_tasks = [st.model_dump() for st in sub_tasks]
+
+
+def _touch_updated_at(_mapper: object, _connection: object, target: Task) -> None:
+    """Stamp updated_at on every flushed change, so it reflects task activity."""
+    target.updated_at = utc_now()
+
+
+event.listen(Task, "before_update", _touch_updated_at)
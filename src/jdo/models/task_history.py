@@ -6,6 +6,7 @@ from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 from jdo.models.task import ActualHoursCategory, TaskStatus
@@ -33,6 +34,10 @@ class TaskHistoryEntry(SQLModel, table=True):
     """
 
     __tablename__ = "task_history"
+    # Latest history event per commitment (stalled detection)
+    __table_args__ = (
+        Index("ix_task_history_commitment_id_created_at", "commitment_id", "created_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     task_id: UUID = Field(foreign_key="tasks.id", index=True)
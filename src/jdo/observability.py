@@ -12,14 +12,18 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-import sentry_sdk
 from loguru import logger
-from sentry_sdk.integrations.loguru import LoguruIntegration
-from sentry_sdk.tracing import NoOpSpan, Transaction
+
+from jdo.utils.lazy import lazy_import
 
 if TYPE_CHECKING:
+    from sentry_sdk.tracing import NoOpSpan, Transaction
+
     from jdo.config.settings import JDOSettings
 
+# The SDK loads on first use, keeping it off the CLI start-up path
+sentry_sdk = lazy_import("sentry_sdk")
+
 # Application version for Sentry release tracking
 APP_VERSION = "0.1.0"
 
@@ -40,6 +44,8 @@ def init_sentry(settings: JDOSettings) -> bool:
         logger.debug("Sentry DSN not configured, skipping initialization")
         return False
 
+    from sentry_sdk.integrations.loguru import LoguruIntegration
+
     sentry_sdk.init(
         dsn=settings.sentry_dsn,
         environment=settings.environment,
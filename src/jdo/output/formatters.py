@@ -6,7 +6,7 @@ Provides consistent formatting for commitments, goals, tasks, and other entities
 from __future__ import annotations
 
 from datetime import UTC, date, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from rich import box
 from rich.console import Console
@@ -271,6 +271,95 @@ def format_commitment_proposal(
     return Panel(content, title="[cyan]New Commitment[/cyan]", border_style="cyan")
 
 
+def format_plan_proposal(
+    plan_data: dict[str, Any],
+    *,
+    link_titles: dict[str, str] | None = None,
+) -> Panel:
+    """Format an extracted plan (commitments, tasks, recurring) for confirmation.
+
+    Args:
+        plan_data: Plan draft data as accepted by PersistenceService.save_plan().
+        link_titles: Titles of linked goals/milestones keyed by entity id.
+
+    Returns:
+        Rich Panel with the whole plan and a single confirmation prompt.
+    """
+    titles = link_titles or {}
+    commitments = plan_data.get("commitments") or []
+    recurring = plan_data.get("recurring_commitments") or []
+    task_count = sum(len(c.get("tasks") or []) for c in commitments)
+
+    content = Text()
+    for index, commitment in enumerate(commitments, start=1):
+        content.append(f"{index}. {commitment['deliverable']}", style="bold")
+        content.append(f" for {commitment['stakeholder']}, due {commitment['due_date']}")
+        if commitment.get("due_time"):
+            content.append(f" at {commitment['due_time'][:5]}")
+        content.append("\n")
+        for label, key in (("Goal", "goal_id"), ("Milestone", "milestone_id")):
+            title = titles.get(commitment.get(key) or "")
+            if title:
+                content.append(f"   {label}: ", style="dim")
+                content.append(f"{title}\n")
+        for task in commitment.get("tasks") or []:
+            content.append(f"   - {task['title']}")
+            if task.get("estimated_hours"):
+                content.append(f" ({task['estimated_hours']:g}h)", style="dim")
+            content.append("\n")
+
+    for item in recurring:
+        content.append("Recurring: ", style="bold")
+        content.append(
+            f"{item['deliverable_template']} for {item['stakeholder_name']} "
+            f"({item['recurrence_type']})\n"
+        )
+
+    content.append(
+        f"\n{len(commitments)} commitment(s), {task_count} task(s), {len(recurring)} recurring\n",
+        style="dim",
+    )
+    content.append("Does this look right?", style="dim italic")
+    content.append(" (yes/no/refine)", style="dim")
+
+    return Panel(content, title="[cyan]New Plan[/cyan]", border_style="cyan")
+
+
+def format_batch_proposal(
+    plan_data: dict[str, Any],
+    failures: list[tuple[str, str]] | None = None,
+) -> Table:
+    """Format bulk-ingested items as one confirmation table.
+
+    Args:
+        plan_data: Plan draft data as accepted by PersistenceService.save_plan().
+        failures: (item text, reason) for items that could not be extracted.
+
+    Returns:
+        Rich Table with one row per commitment and task, then failed items.
+    """
+    table = Table(title="Batch Proposal", box=box.ROUNDED)
+    table.add_column("#", style="cyan", width=4)
+    table.add_column("Item", width=36)
+    table.add_column("Stakeholder", width=15)
+    table.add_column("Due", width=12)
+
+    for index, commitment in enumerate(plan_data.get("commitments") or [], start=1):
+        table.add_row(
+            str(index),
+            commitment["deliverable"],
+            commitment["stakeholder"],
+            commitment["due_date"],
+        )
+        for task in commitment.get("tasks") or []:
+            table.add_row("", f"  - {task['title']}", "", "", style="dim")
+
+    for text, reason in failures or []:
+        table.add_row("!", f"{text} ({reason})", "", "", style="red")
+
+    return table
+
+
 def format_commitment_list_plain(commitments: list[dict]) -> str:
     """Format a list of commitment dicts as plain text for AI tools.
 
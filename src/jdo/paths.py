@@ -51,6 +51,15 @@ def get_auth_path() -> Path:
     return get_data_dir() / "auth.json"
 
 
+def get_ics_feed_path() -> Path:
+    """Get the path to the local calendar feed written by ``jdo export ics --feed``.
+
+    Returns:
+        Path to jdo.ics in the data directory.
+    """
+    return get_data_dir() / "jdo.ics"
+
+
 def get_log_dir() -> Path:
     """Get the log directory for jdo.
 
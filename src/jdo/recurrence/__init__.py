@@ -5,11 +5,15 @@ from __future__ import annotations
 from jdo.recurrence.calculator import get_next_due_date
 from jdo.recurrence.formatter import format_pattern_summary, ordinal_suffix
 from jdo.recurrence.generator import generate_instance, should_generate_instance
+from jdo.recurrence.rule import RecurrenceRule, compile_rule, occurrences_between
 
 __all__ = [
+    "RecurrenceRule",
+    "compile_rule",
     "format_pattern_summary",
     "generate_instance",
     "get_next_due_date",
+    "occurrences_between",
     "ordinal_suffix",
     "should_generate_instance",
 ]
@@ -0,0 +1,364 @@
+"""Compiled recurrence rules for expanding occurrences over a date range.
+
+get_next_due_date answers one question, "what is the next due date?", and
+re-derives the pattern (sorting weekdays, month lengths, type dispatch) on
+every call. A RecurrenceRule compiles a template's pattern once: weekly rules
+precompute the offset from every weekday to the next occurrence, and the
+step function for the pattern type is chosen up front. Stepping from one
+occurrence to the next is then constant time on integer day ordinals, so
+listing the k occurrences in a range costs O(k).
+
+Occurrences match chaining get_next_due_date exactly: the first is the next
+due date after the day before the range, each later one the next due date
+after the previous, with the template's end conditions applied.
+"""
+
+from __future__ import annotations
+
+import calendar
+import itertools
+from collections.abc import Callable, Iterator
+from datetime import date, timedelta
+from functools import lru_cache
+
+from jdo.models.recurring_commitment import (
+    EndType,
+    RecurrenceType,
+    RecurringCommitment,
+    RecurringCommitmentStatus,
+)
+
+# Month constants
+MONTHS_IN_YEAR = 12
+DAYS_IN_WEEK = 7
+
+# Days per month in a common year (February gains a day in leap years)
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Distinct recurrence patterns whose compiled rules are kept
+RULE_CACHE_SIZE = 256
+
+
+def _days_in_month(year: int, month: int) -> int:
+    if month == 2 and calendar.isleap(year):  # noqa: PLR2004
+        return 29
+    return _MONTH_DAYS[month - 1]
+
+
+def _add_months(year: int, month: int, months: int) -> tuple[int, int]:
+    index = year * MONTHS_IN_YEAR + month - 1 + months
+    return index // MONTHS_IN_YEAR, index % MONTHS_IN_YEAR + 1
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The nth weekday of a month (n=-1 for the last), as in the calculator.
+
+    Like the calculator, n=5 may run into the following month.
+    """
+    if n > 0:
+        first = date(year, month, 1).toordinal()
+        days_until = (weekday - (first + 6) % DAYS_IN_WEEK) % DAYS_IN_WEEK
+        return date.fromordinal(first + days_until + (n - 1) * DAYS_IN_WEEK)
+    last = date(year, month, _days_in_month(year, month)).toordinal()
+    days_back = ((last + 6) % DAYS_IN_WEEK - weekday) % DAYS_IN_WEEK
+    return date.fromordinal(last - days_back + (n + 1) * DAYS_IN_WEEK)
+
+
+class RecurrenceRule:
+    """A recurrence pattern compiled for fast stepping and range expansion.
+
+    Create rules with compile_rule so identical patterns share one instance.
+    """
+
+    __slots__ = (
+        "_day",
+        "_month",
+        "_step",
+        "_week",
+        "_week_offsets",
+        "_weekday",
+        "active",
+        "day_of_month",
+        "days_of_week",
+        "end_after_count",
+        "end_by_date",
+        "interval",
+        "month_of_year",
+        "recurrence_type",
+        "week_of_month",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        recurrence_type: RecurrenceType,
+        *,
+        interval: int = 1,
+        days_of_week: tuple[int, ...] | None = None,
+        day_of_month: int | None = None,
+        week_of_month: int | None = None,
+        month_of_year: int | None = None,
+        end_by_date: date | None = None,
+        end_after_count: int | None = None,
+        active: bool = True,
+    ) -> None:
+        """Compile a recurrence pattern.
+
+        Args:
+            recurrence_type: Daily, weekly, monthly or yearly.
+            interval: Repeat every N days/weeks/months/years.
+            days_of_week: Weekdays (0=Monday) for weekly rules; the first is
+                the weekday of week-of-month patterns.
+            day_of_month: Day of month for monthly/yearly rules.
+            week_of_month: Week of month (1-5, -1 for last) with days_of_week.
+            month_of_year: Month for yearly rules.
+            end_by_date: No occurrences after this date.
+            end_after_count: Total number of occurrences the template allows.
+            active: False for paused templates, which have no occurrences.
+
+        Raises:
+            ValueError: If the pattern lacks the fields its type requires.
+        """
+        self.recurrence_type = recurrence_type
+        self.interval = interval
+        self.days_of_week = days_of_week
+        self.day_of_month = day_of_month
+        self.week_of_month = week_of_month
+        self.month_of_year = month_of_year
+        self.end_by_date = end_by_date
+        self.end_after_count = end_after_count
+        self.active = active
+        # Pattern fields the step functions read, resolved once
+        self._day = day_of_month or 0
+        self._month = month_of_year or 0
+        self._week = week_of_month or 0
+        self._weekday = days_of_week[0] if days_of_week else 0
+        self._week_offsets: tuple[int, ...] = ()
+        self._step = self._select_step()
+
+    def _select_step(self) -> Callable[[date], date]:
+        """Pick the step function for the pattern, validating its fields."""
+        if self.recurrence_type == RecurrenceType.DAILY:
+            return self._next_daily
+        if self.recurrence_type == RecurrenceType.WEEKLY:
+            if not self.days_of_week:
+                msg = "Weekly recurrence requires days_of_week"
+                raise ValueError(msg)
+            self._week_offsets = self._compile_week_offsets(
+                sorted(self.days_of_week), self.interval
+            )
+            return self._next_weekly
+        if self.recurrence_type in (RecurrenceType.MONTHLY, RecurrenceType.YEARLY):
+            return self._select_calendar_step()
+        msg = f"Unknown recurrence type: {self.recurrence_type}"
+        raise ValueError(msg)
+
+    def _select_calendar_step(self) -> Callable[[date], date]:
+        """Pick the step function for a monthly or yearly pattern."""
+        monthly = self.recurrence_type == RecurrenceType.MONTHLY
+        if not monthly and self.month_of_year is None:
+            msg = "Yearly recurrence requires month_of_year"
+            raise ValueError(msg)
+        if self.day_of_month is not None:
+            return self._next_monthly_by_day if monthly else self._next_yearly_by_day
+        if self.week_of_month is not None and self.days_of_week:
+            return self._next_monthly_by_week if monthly else self._next_yearly_by_week
+        kind = "Monthly" if monthly else "Yearly"
+        msg = f"{kind} recurrence requires day_of_month or week_of_month+days_of_week"
+        raise ValueError(msg)
+
+    @staticmethod
+    def _compile_week_offsets(sorted_days: list[int], interval: int) -> tuple[int, ...]:
+        """Days from each weekday (0-6) to the next occurrence."""
+        offsets = []
+        for weekday in range(DAYS_IN_WEEK):
+            later = next((day for day in sorted_days if day > weekday), None)
+            if later is not None:
+                offsets.append(later - weekday)
+                continue
+            days_until_first = (DAYS_IN_WEEK - weekday + sorted_days[0]) % DAYS_IN_WEEK
+            offsets.append((days_until_first or DAYS_IN_WEEK) + (interval - 1) * DAYS_IN_WEEK)
+        return tuple(offsets)
+
+    def next_after(self, after_date: date) -> date:
+        """The next date matching the pattern, ignoring end conditions and pausing.
+
+        Args:
+            after_date: Find the first occurrence after this date.
+
+        Returns:
+            The next occurrence.
+        """
+        return self._step(after_date)
+
+    def iter_occurrences(
+        self, start: date, end: date, *, already_generated: int = 0
+    ) -> Iterator[date]:
+        """Yield occurrences from start to end (inclusive), in order.
+
+        Args:
+            start: First date of the range.
+            end: Last date of the range.
+            already_generated: Instances the template has generated so far,
+                counted against its end_after_count.
+
+        Yields:
+            Occurrence dates.
+        """
+        if not self.active or end < start:
+            return
+        last = end if self.end_by_date is None else min(end, self.end_by_date)
+        occurrences = self._expand(start - timedelta(days=1), last)
+        if self.end_after_count is not None:
+            remaining = self.end_after_count - already_generated
+            if remaining <= 0:
+                return
+            occurrences = itertools.islice(occurrences, remaining)
+        yield from occurrences
+
+    def occurrences_between(
+        self, start: date, end: date, *, already_generated: int = 0
+    ) -> list[date]:
+        """List occurrences from start to end (inclusive).
+
+        Args:
+            start: First date of the range.
+            end: Last date of the range.
+            already_generated: Instances the template has generated so far.
+
+        Returns:
+            Occurrence dates in order.
+        """
+        return list(self.iter_occurrences(start, end, already_generated=already_generated))
+
+    def _expand(self, after: date, last: date) -> Iterator[date]:
+        """Yield successive occurrences after ``after`` up to ``last``."""
+        last_ordinal = last.toordinal()
+        if self.recurrence_type == RecurrenceType.DAILY:
+            first = after.toordinal() + self.interval
+            yield from map(date.fromordinal, range(first, last_ordinal + 1, self.interval))
+            return
+        if self.recurrence_type == RecurrenceType.WEEKLY:
+            offsets = self._week_offsets
+            ordinal = after.toordinal()
+            # Ordinal 1 (0001-01-01) is a Monday, so weekday = (ordinal + 6) % 7
+            ordinal += offsets[(ordinal + 6) % DAYS_IN_WEEK]
+            while ordinal <= last_ordinal:
+                yield date.fromordinal(ordinal)
+                ordinal += offsets[(ordinal + 6) % DAYS_IN_WEEK]
+            return
+        current = self._step(after)
+        while current <= last:
+            yield current
+            current = self._step(current)
+
+    def _next_daily(self, after_date: date) -> date:
+        return after_date + timedelta(days=self.interval)
+
+    def _next_weekly(self, after_date: date) -> date:
+        return after_date + timedelta(days=self._week_offsets[after_date.weekday()])
+
+    def _clamped_day(self, year: int, month: int) -> date:
+        return date(year, month, min(self._day, _days_in_month(year, month)))
+
+    def _next_monthly_by_day(self, after_date: date) -> date:
+        target = self._clamped_day(after_date.year, after_date.month)
+        if after_date.day >= target.day:
+            year, month = _add_months(after_date.year, after_date.month, self.interval)
+            target = self._clamped_day(year, month)
+        return target
+
+    def _next_monthly_by_week(self, after_date: date) -> date:
+        target = _nth_weekday(after_date.year, after_date.month, self._weekday, self._week)
+        if target <= after_date:
+            year, month = _add_months(after_date.year, after_date.month, self.interval)
+            target = _nth_weekday(year, month, self._weekday, self._week)
+        return target
+
+    def _next_yearly_by_day(self, after_date: date) -> date:
+        target = self._clamped_day(after_date.year, self._month)
+        if target <= after_date:
+            target = self._clamped_day(after_date.year + self.interval, self._month)
+        return target
+
+    def _next_yearly_by_week(self, after_date: date) -> date:
+        target = _nth_weekday(after_date.year, self._month, self._weekday, self._week)
+        if target <= after_date:
+            year = after_date.year + self.interval
+            target = _nth_weekday(year, self._month, self._weekday, self._week)
+        return target
+
+
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def _compiled_rule(  # noqa: PLR0913
+    recurrence_type: RecurrenceType,
+    interval: int,
+    *,
+    days_of_week: tuple[int, ...] | None,
+    day_of_month: int | None,
+    week_of_month: int | None,
+    month_of_year: int | None,
+    end_by_date: date | None,
+    end_after_count: int | None,
+    active: bool,
+) -> RecurrenceRule:
+    return RecurrenceRule(
+        recurrence_type,
+        interval=interval,
+        days_of_week=days_of_week,
+        day_of_month=day_of_month,
+        week_of_month=week_of_month,
+        month_of_year=month_of_year,
+        end_by_date=end_by_date,
+        end_after_count=end_after_count,
+        active=active,
+    )
+
+
+def compile_rule(recurring: RecurringCommitment) -> RecurrenceRule:
+    """Get the compiled rule for a recurring commitment's current pattern.
+
+    Rules are cached by pattern (type, interval, days, end conditions,
+    paused), so repeated calls are cheap and an edited template gets a rule
+    for its new pattern.
+
+    Args:
+        recurring: The recurring commitment template.
+
+    Returns:
+        The compiled rule.
+
+    Raises:
+        ValueError: If the pattern lacks the fields its type requires.
+    """
+    return _compiled_rule(
+        recurring.recurrence_type,
+        recurring.interval,
+        days_of_week=tuple(recurring.days_of_week) if recurring.days_of_week is not None else None,
+        day_of_month=recurring.day_of_month,
+        week_of_month=recurring.week_of_month,
+        month_of_year=recurring.month_of_year,
+        end_by_date=recurring.end_by_date if recurring.end_type == EndType.BY_DATE else None,
+        end_after_count=(
+            recurring.end_after_count if recurring.end_type == EndType.AFTER_COUNT else None
+        ),
+        active=recurring.status != RecurringCommitmentStatus.PAUSED,
+    )
+
+
+def occurrences_between(recurring: RecurringCommitment, start: date, end: date) -> list[date]:
+    """List a recurring commitment's due dates from start to end (inclusive).
+
+    Equivalent to calling get_next_due_date repeatedly from the day before
+    ``start`` while counting each date as a generated instance.
+
+    Args:
+        recurring: The recurring commitment template.
+        start: First date of the range.
+        end: Last date of the range.
+
+    Returns:
+        Due dates in order.
+    """
+    return compile_rule(recurring).occurrences_between(
+        start, end, already_generated=recurring.instances_generated
+    )
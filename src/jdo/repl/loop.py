@@ -7,8 +7,12 @@ session state management, and hybrid input handling.
 from __future__ import annotations
 
 import asyncio
+import signal
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, aclosing, contextmanager, suppress
+from datetime import UTC, datetime, time, timedelta
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
@@ -16,31 +20,38 @@ from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import WordCompleter
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.history import InMemoryHistory
+from prompt_toolkit.input import create_input
 from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.key_binding.key_processor import KeyPressEvent
+from prompt_toolkit.key_binding.key_processor import KeyPress, KeyPressEvent
+from prompt_toolkit.keys import Keys
 from prompt_toolkit.styles import Style
 from rich import box
 from rich.console import Console
 from rich.live import Live
-from rich.markdown import Markdown
 from rich.table import Table
 from rich.text import Text
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import select
+from sqlmodel import col, select
 
-from jdo.ai.agent import JDODependencies, create_agent, get_model_identifier
-from jdo.ai.context import stream_response
-from jdo.ai.extraction import extract_commitment
+from jdo.ai.agent import (
+    JDODependencies,
+    create_agent,
+    get_current_context,
+    get_model_identifier,
+)
+from jdo.ai.speculation import looks_like_commitment_proposal
 from jdo.ai.timeout import AI_STREAM_TIMEOUT_SECONDS
 from jdo.auth.api import is_authenticated
 from jdo.config import get_settings
-from jdo.db import create_db_and_tables, get_session
+from jdo.db import ensure_schema, get_session
+from jdo.db.duplicates import find_near_duplicates
 from jdo.db.navigation import NavigationService
-from jdo.db.persistence import PersistenceService
+from jdo.db.persistence import PersistenceService, ValidationError
 from jdo.db.session import (
     get_dashboard_commitments,
     get_dashboard_goals,
     get_triage_count,
+    get_triage_items,
     get_visions_due_for_review,
 )
 from jdo.integrity.service import IntegrityService
@@ -55,20 +66,41 @@ from jdo.output.dashboard import (
     format_dashboard,
 )
 from jdo.output.formatters import (
+    format_batch_proposal,
     format_commitment_list,
-    format_commitment_proposal,
     format_empty_list,
+    format_plan_proposal,
 )
-from jdo.repl.session import PendingDraft, Session
+from jdo.repl.maintenance import JobResult, MaintenanceScheduler, default_jobs
+from jdo.repl.session import DashboardCacheUpdate, PendingDraft, Session, get_tiktoken_counter
 from jdo.utils.datetime import today_date, utc_now
 
 if TYPE_CHECKING:
     from pydantic_ai import Agent
+    from pydantic_ai.usage import RunUsage
     from sqlmodel import Session as DBSession
 
+    from jdo.ai.extraction import ExtractedPlan
+    from jdo.commands.parser import ParsedCommand
+
 # Console instance for Rich output
 console = Console()
 
+# /commit flag for a pasted block of items
+BATCH_FLAG = "--batch"
+
+# Near-duplicate commitments flagged before /commit extraction
+MAX_DUPLICATES_SHOWN = 3
+
+# Answers that confirm or reject a pending draft
+AFFIRMATIVE_RESPONSES = frozenset({"yes", "y", "correct", "do it", "looks good", "ok", "okay"})
+NEGATIVE_RESPONSES = frozenset({"no", "n", "cancel", "never mind", "nope"})
+
+# Keys that interrupt a streaming response
+INTERRUPT_KEYS = frozenset({Keys.Escape, Keys.ControlC})
+# How long to wait for the rest of an escape sequence before treating Esc as a key
+ESCAPE_KEY_DELAY_SECONDS = 0.05
+
 
 def _show_activity_heading(session: Session) -> None:
     """Display the current activity heading if set.
@@ -154,6 +186,25 @@ def _is_first_run(db_session: DBSession) -> bool:
     return vision_count is None
 
 
+def _get_triage_queue(db_session: DBSession) -> list[dict[str, Any]]:
+    """Get the captured items waiting for triage, oldest first.
+
+    Args:
+        db_session: Database session.
+
+    Returns:
+        Triage item dicts (id, raw_text, created_at) for TriageHandler.
+    """
+    return [
+        {
+            "id": str(draft.id),
+            "raw_text": (draft.partial_data or {}).get("raw_text"),
+            "created_at": draft.created_at,
+        }
+        for draft in get_triage_items(db_session)
+    ]
+
+
 def _get_at_risk_commitments(db_session: DBSession) -> list[Commitment]:
     """Get commitments that are at-risk or overdue.
 
@@ -163,18 +214,18 @@ def _get_at_risk_commitments(db_session: DBSession) -> list[Commitment]:
     Returns:
         List of at-risk or overdue commitments.
     """
-    today = today_date()
-
-    # Get commitments that are at-risk status OR overdue (past due date but not completed)
+    # Open commitments due by the end of today (UTC), served by the
+    # (status, due_at) index as a range scan per status
+    end_of_today = datetime.combine(today_date() + timedelta(days=1), time.min, tzinfo=UTC)
     statement = select(Commitment).where(
-        Commitment.status.in_(
+        col(Commitment.status).in_(
             [
                 CommitmentStatus.AT_RISK,
                 CommitmentStatus.PENDING,
                 CommitmentStatus.IN_PROGRESS,
             ]
         ),
-        Commitment.due_date <= today,
+        col(Commitment.due_at) < end_of_today,
     )
     return list(db_session.exec(statement).all())
 
@@ -286,6 +337,98 @@ def _show_startup_guidance(db_session: DBSession, session: Session) -> None:
         console.print()
 
 
+def _build_turn_context(session: Session, deps: JDODependencies) -> str:
+    """Build the per-turn context: current date/time plus the user-state snapshot.
+
+    Args:
+        session: Current session state (holds the snapshot cache).
+        deps: Agent dependencies.
+
+    Returns:
+        Context block to send after the user's message.
+    """
+    context = get_current_context()
+    snapshot = session.state_snapshot.get(deps)
+    if snapshot is None:
+        return context
+    return f"{context}\n\n{snapshot.text}"
+
+
+@contextmanager
+def _interrupt_keys(task: asyncio.Task[None]) -> Iterator[None]:
+    """Cancel ``task`` when the user presses Esc or Ctrl+C.
+
+    On a terminal, stdin is read in raw mode while the task runs (so Ctrl+C
+    arrives as a key, not a signal). SIGINT is also routed to the task, which
+    covers piped input and keeps Ctrl+C from cancelling the whole REPL.
+
+    Args:
+        task: The streaming task to cancel.
+
+    Yields:
+        None while the keys are being watched.
+    """
+    loop = asyncio.get_running_loop()
+    with ExitStack() as stack:
+        with suppress(NotImplementedError, RuntimeError, ValueError):
+            previous = signal.getsignal(signal.SIGINT)
+            loop.add_signal_handler(signal.SIGINT, task.cancel)
+
+            def restore_sigint() -> None:
+                loop.remove_signal_handler(signal.SIGINT)
+                signal.signal(signal.SIGINT, previous)
+
+            stack.callback(restore_sigint)
+
+        if sys.stdin.isatty():
+            keys_input = create_input()
+
+            def handle(key_presses: list[KeyPress]) -> None:
+                if any(press.key in INTERRUPT_KEYS for press in key_presses):
+                    task.cancel()
+
+            def keys_ready() -> None:
+                handle(keys_input.read_keys())
+                # A lone Esc is only reported once no escape sequence follows it
+                loop.call_later(ESCAPE_KEY_DELAY_SECONDS, lambda: handle(keys_input.flush_keys()))
+
+            stack.enter_context(keys_input.raw_mode())
+            stack.enter_context(keys_input.attach(keys_ready))
+        yield
+
+
+class _StreamDisplay:
+    """Thinking spinner until the first chunk, then live Markdown of the response."""
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._status = console.status("[dim]Thinking...[/dim]", spinner="dots")
+        self._status.start()
+        self._live: Live | None = None
+
+    def append(self, chunk: str) -> None:
+        from rich.markdown import Markdown
+
+        if self._live is None:
+            # Stop spinner BEFORE starting Live (avoid nesting)
+            self._status.stop()
+            self._live = Live("", console=console, refresh_per_second=10, transient=False)
+            self._live.start()
+        self.text += chunk
+        # Render as Markdown during streaming
+        try:
+            self._live.update(Markdown(self.text))
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.debug(f"Markdown rendering error, falling back to plain text: {e}")
+            self._live.update(Text(self.text))
+
+    def stop(self) -> None:
+        if self._live is None:
+            self._status.stop()
+        else:
+            self._live.stop()
+
+
 async def process_ai_input(
     user_input: str,
     agent: Agent[JDODependencies, str],
@@ -294,6 +437,10 @@ async def process_ai_input(
 ) -> str:
     """Process user input through the AI agent with streaming.
 
+    Esc or Ctrl+C while the response streams cancels the run: the HTTP request
+    is aborted, writes made by the agent's tools are rolled back, and the
+    partial response is returned marked as interrupted.
+
     Args:
         user_input: The user's input text.
         agent: The PydanticAI agent.
@@ -301,59 +448,76 @@ async def process_ai_input(
         session: Current session state.
 
     Returns:
-        The complete AI response text.
+        The complete AI response text (marked if interrupted, empty on error).
     """
-    # Show animated thinking spinner
-    status = console.status("[dim]Thinking...[/dim]", spinner="dots")
-    status.start()
-
-    response_text = ""
-    first_chunk = True
-    live = None
+    from jdo.ai.context import mark_interrupted, stream_response
+
+    display = _StreamDisplay()
+
+    async def render_stream() -> None:
+        stream = stream_response(
+            agent,
+            user_input,
+            deps,
+            message_history=session.message_history,
+            model_history=session.get_model_history(),
+            on_complete=session.add_model_messages,
+            context=_build_turn_context(session, deps),
+        )
+        async with aclosing(stream):
+            async for chunk in stream:
+                display.append(chunk)
 
+    stream_task = asyncio.create_task(render_stream())
     try:
-        async with asyncio.timeout(AI_STREAM_TIMEOUT_SECONDS):
-            async for chunk in stream_response(
-                agent,
-                user_input,
-                deps,
-                message_history=session.message_history,
-            ):
-                if first_chunk:
-                    # Stop spinner BEFORE starting Live (avoid nesting)
-                    status.stop()
-                    live = Live("", console=console, refresh_per_second=10, transient=False)
-                    live.start()
-                    first_chunk = False
-
-                response_text += chunk
-                # Render as Markdown during streaming
-                try:
-                    live.update(Markdown(response_text))
-                except (ValueError, TypeError, AttributeError) as e:
-                    logger.debug(f"Markdown rendering error, falling back to plain text: {e}")
-                    live.update(Text(response_text))
-
-        # Stop live display if it was started
-        if live:
-            live.stop()
-
+        with _interrupt_keys(stream_task):
+            async with asyncio.timeout(AI_STREAM_TIMEOUT_SECONDS):
+                await stream_task
+    except asyncio.CancelledError:
+        current = asyncio.current_task()
+        if current is not None and current.cancelling():
+            # The REPL itself is being cancelled, not just this response
+            raise
+        display.stop()
+        console.print("[dim]Interrupted.[/dim]")
+        return mark_interrupted(display.text)
     except TimeoutError:
         console.print("[yellow]The AI took too long to respond. Please try again.[/yellow]")
-        return ""
+        return mark_interrupted(display.text) if display.text else ""
     except (OSError, ConnectionError) as e:
         # Handle network-related errors specifically
         console.print(f"[red]Error communicating with AI: {e}[/red]")
         return ""
     finally:
-        # Always ensure spinner is stopped
-        if first_chunk:
-            status.stop()
-        if live:
-            live.stop()
+        # Always ensure spinner and live display are stopped
+        display.stop()
 
     console.print()  # Newline after response
-    return response_text
+    return display.text
+
+
+def _build_handler_context(
+    parsed: ParsedCommand, session: Session, db_session: DBSession
+) -> dict[str, Any]:
+    """Build the context passed to a command handler.
+
+    Args:
+        parsed: The parsed command.
+        session: Current session state.
+        db_session: Database session.
+
+    Returns:
+        Handler context (plus the triage queue for /triage).
+    """
+    from jdo.commands.parser import CommandType
+
+    context: dict[str, Any] = {
+        "db_session": db_session,
+        "session": session,
+    }
+    if parsed.command_type == CommandType.TRIAGE:
+        context["triage_items"] = _get_triage_queue(db_session)
+    return context
 
 
 async def handle_slash_command(
@@ -374,8 +538,8 @@ async def handle_slash_command(
     Returns:
         True (commands are always considered handled).
     """
-    from jdo.commands.handlers import get_handler  # noqa: PLC0415
-    from jdo.commands.parser import CommandType, ParseError, parse_command  # noqa: PLC0415
+    from jdo.commands.handlers import get_handler
+    from jdo.commands.parser import CommandType, ParseError, parse_command
 
     try:
         parsed = parse_command(user_input)
@@ -385,6 +549,10 @@ async def handle_slash_command(
 
     # Handle async /commit command specially (uses AI extraction)
     if parsed.command_type == CommandType.COMMIT:
+        if parsed.args and parsed.args[0] == BATCH_FLAG:
+            # Keep the pasted block's line structure (args are whitespace-split)
+            await _handle_commit_batch(parsed.raw_text.split(BATCH_FLAG, 1)[1], session)
+            return True
         args = " ".join(parsed.args) if parsed.args else ""
         await _handle_commit(args, session, db_session)
         return True
@@ -401,14 +569,8 @@ async def handle_slash_command(
         _show_unknown_command_error(f"Unknown command: {user_input}")
         return True
 
-    # Build context for handler
-    context: dict[str, Any] = {
-        "db_session": db_session,
-        "session": session,
-    }
-
     # Execute handler
-    result = handler.execute(parsed, context)
+    result = handler.execute(parsed, _build_handler_context(parsed, session, db_session))
 
     # Display message if present and non-empty
     if result.message:
@@ -449,6 +611,7 @@ _COMMAND_DESCRIPTIONS: dict[str, str] = {
     "cleanup": "view/update cleanup plan",
     "integrity": "show integrity dashboard",
     "hours": "set available hours for time coaching",
+    "jobs": "show background maintenance job timings",
     "review": "review visions due for quarterly review",
     "edit": "edit an existing item",
     "help": "show available commands",
@@ -467,7 +630,7 @@ def _get_fuzzy_suggestions(user_cmd: str) -> list[str]:
     Returns:
         List of suggestion strings with format "/<cmd> (<description>)".
     """
-    from rapidfuzz import fuzz  # noqa: PLC0415
+    from rapidfuzz import fuzz
 
     suggestions = []
     for cmd, description in _COMMAND_DESCRIPTIONS.items():
@@ -489,7 +652,7 @@ def _show_unknown_command_error(error_msg: str) -> None:
     console.print(f"[yellow]{error_msg}[/yellow]")
 
     # Try to extract the command name from error message (e.g. "Unknown command: /xyz")
-    import re  # noqa: PLC0415
+    import re
 
     match = re.search(r"/(\w+)", error_msg)
     if match:
@@ -503,15 +666,36 @@ def _show_unknown_command_error(error_msg: str) -> None:
         console.print("[dim]Type /help for available commands.[/dim]")
 
 
-async def _handle_commit(args: str, session: Session, _db_session: DBSession) -> None:
+def _warn_near_duplicates(db_session: DBSession, text: str) -> None:
+    """Flag active commitments that look like the one being created.
+
+    Args:
+        db_session: Database session.
+        text: The new commitment's description.
+    """
+    try:
+        duplicates = find_near_duplicates(db_session, text, kinds=("commitment",))
+    except SQLAlchemyError as e:
+        logger.warning(f"Near-duplicate lookup failed: {e}")
+        return
+    for duplicate in duplicates[:MAX_DUPLICATES_SHOWN]:
+        console.print(
+            f"[yellow]Similar commitment already exists: {duplicate.text} "
+            f"({duplicate.similarity:.0%} similar)[/yellow]"
+        )
+
+
+async def _handle_commit(args: str, session: Session, db_session: DBSession) -> None:
     """Handle /commit command.
 
+    Extracts the whole plan (commitments, their tasks, goal/milestone links and
+    recurring commitments) in a single AI call and shows it for one confirmation.
+
     Args:
         args: The commitment description text.
         session: Session state for pending draft.
-        _db_session: Database session (reserved for future direct DB operations).
+        db_session: Database session for loading link candidates.
     """
-    del _db_session  # Reserved for future direct DB operations
     if not args:
         console.print("[yellow]Usage: /commit <description>[/yellow]")
         console.print('[dim]Example: /commit "send report to Sarah by Friday"[/dim]')
@@ -523,34 +707,33 @@ async def _handle_commit(args: str, session: Session, _db_session: DBSession) ->
     # Strip quotes if present
     text = args.strip("\"'")
 
+    _warn_near_duplicates(db_session, text)
     console.print("[dim]Extracting commitment details...[/dim]")
 
+    from jdo.ai.extraction import extract_plan
+    from jdo.ai.linkage import apply_resolved_link, select_link_candidates
+
     try:
-        # Use AI extraction to parse the commitment
+        selection = select_link_candidates(db_session, text)
         model = get_model_identifier()
         messages = [{"role": "user", "content": text}]
-        extracted = await extract_commitment(messages, model)
+        plan = await extract_plan(messages, model, link_candidates=selection.candidates)
+        if selection.resolved:
+            apply_resolved_link(plan, selection.resolved)
+        if not plan.commitments and not plan.recurring_commitments:
+            console.print("[yellow]No commitments found in that description.[/yellow]")
+            console.print("[dim]Try being more specific, e.g.: 'report to Sarah by Friday'[/dim]")
+            session.clear_activity()
+            return
 
         # Store as pending draft for confirmation
-        session.set_pending_draft(
-            action="create",
-            entity_type="commitment",
-            data={
-                "deliverable": extracted.deliverable,
-                "stakeholder": extracted.stakeholder_name,
-                "due_date": extracted.due_date.isoformat(),
-                "due_time": extracted.due_time.isoformat() if extracted.due_time else None,
-            },
-        )
+        plan_data = plan.to_draft_data()
+        session.set_pending_draft(action="create", entity_type="plan", data=plan_data)
 
         # Show proposal
-        panel = format_commitment_proposal(
-            deliverable=extracted.deliverable,
-            stakeholder=extracted.stakeholder_name,
-            due_date=extracted.due_date,
-            due_time=extracted.due_time.strftime("%H:%M") if extracted.due_time else None,
-        )
-        console.print(panel)
+        offered = [*selection.candidates, *filter(None, [selection.resolved])]
+        link_titles = {str(c.entity_id): c.title for c in offered}
+        console.print(format_plan_proposal(plan_data, link_titles=link_titles))
 
         # Update activity to indicate awaiting confirmation
         session.set_activity("Confirm Commitment")
@@ -569,6 +752,49 @@ async def _handle_commit(args: str, session: Session, _db_session: DBSession) ->
         session.clear_activity()
 
 
+async def _handle_commit_batch(text: str, session: Session) -> None:
+    """Handle /commit --batch: extract a pasted block of items concurrently.
+
+    Every item is extracted in parallel and the whole batch is shown in one
+    table; confirming saves it in a single transaction.
+
+    Args:
+        text: The pasted block (one item per line, indented lines are tasks).
+        session: Session state for pending draft.
+    """
+    from jdo.ai.batch import batch_to_plan_data, extract_batch, split_batch_items
+
+    items = split_batch_items(text)
+    if not items:
+        console.print("[yellow]Usage: /commit --batch <one item per line>[/yellow]")
+        console.print("[dim]Indent a line under an item to make it a task of that item.[/dim]")
+        return
+
+    session.set_activity("Drafting New Commitments")
+    console.print(f"[dim]Extracting {len(items)} items...[/dim]")
+
+    settings = get_settings()
+    results = await extract_batch(
+        items,
+        get_model_identifier(),
+        concurrency=settings.batch_concurrency,
+        item_timeout=settings.batch_item_timeout,
+    )
+    plan_data, failures = batch_to_plan_data(results)
+    console.print(
+        format_batch_proposal(plan_data, [(f.item.text, f.error or "failed") for f in failures])
+    )
+
+    if not plan_data["commitments"]:
+        console.print("[red]Could not extract any commitments. Please try again.[/red]")
+        session.clear_activity()
+        return
+
+    session.set_pending_draft(action="create", entity_type="plan", data=plan_data)
+    console.print("[dim]Save these commitments? (yes/no)[/dim]")
+    session.set_activity("Confirm Commitments")
+
+
 def _handle_confirmation(
     user_input: str,
     session: Session,
@@ -591,11 +817,11 @@ def _handle_confirmation(
     lower_input = user_input.lower().strip()
 
     # Check for affirmative responses
-    if lower_input in ("yes", "y", "correct", "do it", "looks good", "ok", "okay"):
+    if lower_input in AFFIRMATIVE_RESPONSES:
         return _confirm_draft(draft, session, db_session)
 
     # Check for negative responses
-    if lower_input in ("no", "n", "cancel", "never mind", "nope"):
+    if lower_input in NEGATIVE_RESPONSES:
         session.clear_pending_draft()
         session.clear_activity()
         console.print("[dim]Cancelled.[/dim]")
@@ -640,11 +866,131 @@ def _confirm_draft(
             session.clear_activity()
             return True
 
+    if draft.entity_type == "plan":
+        return _confirm_plan(draft, session, db_session)
+
     console.print(f"[yellow]Unknown draft type: {draft.entity_type}[/yellow]")
     session.clear_pending_draft()
     return True
 
 
+def _confirm_plan(
+    draft: PendingDraft,
+    session: Session,
+    db_session: DBSession,
+) -> bool:
+    """Save a confirmed plan draft in a single transaction.
+
+    Args:
+        draft: The pending plan draft.
+        session: Session state.
+        db_session: Database session.
+
+    Returns:
+        True (the confirmation was handled).
+    """
+    try:
+        saved = PersistenceService(db_session).save_plan(draft.data)
+        db_session.commit()
+    except ValidationError as e:
+        db_session.rollback()
+        logger.warning(f"Invalid plan draft: {e}")
+        console.print(f"[red]Could not save plan: {e}[/red]")
+        return True
+    except (OSError, SQLAlchemyError) as e:
+        db_session.rollback()
+        logger.error(f"Failed to save plan: {e}")
+        console.print("[red]Error saving plan. Please try again.[/red]")
+        return True
+    else:
+        for commitment in saved.commitments:
+            console.print(
+                f"[green]Created commitment #{str(commitment.id)[:6]}: "
+                f"{commitment.deliverable}[/green]"
+            )
+        for recurring in saved.recurring_commitments:
+            console.print(
+                f"[green]Created recurring commitment: {recurring.deliverable_template}[/green]"
+            )
+        if saved.tasks:
+            console.print(f"[dim]Added {len(saved.tasks)} task(s).[/dim]")
+        _update_dashboard_cache(session, db_session)
+        session.clear_pending_draft()
+        session.clear_activity()
+        return True
+
+
+def _start_speculation(session: Session, db_session: DBSession) -> None:
+    """Extract the just-proposed commitment in the background.
+
+    Args:
+        session: Session state; the proposal is the last assistant message.
+        db_session: Database session for loading link candidates.
+    """
+    from jdo.ai.extraction import extract_plan
+    from jdo.ai.linkage import apply_resolved_link, select_link_candidates
+
+    transcript = list(session.message_history)
+    try:
+        selection = select_link_candidates(db_session, transcript[-1]["content"])
+    except SQLAlchemyError as e:
+        logger.warning(f"Link candidate lookup failed: {e}")
+        return
+    model = get_model_identifier()
+
+    async def extract(usage: RunUsage) -> ExtractedPlan:
+        plan = await extract_plan(
+            transcript, model, link_candidates=selection.candidates, usage=usage
+        )
+        if selection.resolved:
+            apply_resolved_link(plan, selection.resolved)
+        return plan
+
+    session.speculation.start(extract)
+
+
+async def _confirm_speculated_plan(
+    user_input: str, session: Session, db_session: DBSession
+) -> bool:
+    """Save the speculatively extracted plan the user just confirmed.
+
+    Args:
+        user_input: The user's affirmative answer.
+        session: Session state holding the speculation.
+        db_session: Database session.
+
+    Returns:
+        True if the confirmation was handled, False if the speculation was
+        unusable and the AI should handle the answer instead.
+    """
+    if not session.speculation.ready:
+        console.print("[dim]Finishing commitment details...[/dim]")
+    plan = await session.speculation.take()
+    if plan is None:
+        return False
+
+    from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+
+    session.set_pending_draft(action="create", entity_type="plan", data=plan.to_draft_data())
+    _confirm_plan(session.pending_draft, session, db_session)  # type: ignore[arg-type]
+    if session.has_pending_draft:
+        # Saving failed; the draft stays pending so "yes" can retry it
+        return True
+
+    saved = [c.deliverable for c in plan.commitments]
+    saved.extend(r.deliverable_template for r in plan.recurring_commitments)
+    reply = f"Saved: {'; '.join(saved)}"
+    session.add_user_message(user_input)
+    session.add_assistant_message(reply)
+    session.add_model_messages(
+        [
+            ModelRequest(parts=[UserPromptPart(content=user_input)]),
+            ModelResponse(parts=[TextPart(content=reply)]),
+        ]
+    )
+    return True
+
+
 def _handle_help() -> None:
     """Display help message."""
     console.print(
@@ -656,6 +1002,7 @@ def _handle_help() -> None:
 [cyan]/list goals[/cyan]              - List all goals
 [cyan]/list visions[/cyan]            - List all visions
 [cyan]/commit "..."[/cyan]            - Create a new commitment
+[cyan]/commit --batch[/cyan]          - Create commitments from a pasted list
 [cyan]/complete <id>[/cyan]           - Mark a commitment as complete
 [cyan]/review[/cyan]                  - Review visions due for quarterly review
 [cyan]/exit[/cyan] or [cyan]/quit[/cyan]          - Exit the REPL
@@ -886,7 +1233,7 @@ async def _process_user_input(
     user_input: str,
     session: Session,
     db_session: DBSession,
-    agent: Agent[JDODependencies, str],
+    agent: Agent[JDODependencies, str] | asyncio.Future[Agent[JDODependencies, str]],
     deps: JDODependencies,
 ) -> bool:
     """Process a single user input.
@@ -895,7 +1242,7 @@ async def _process_user_input(
         user_input: The user's input text.
         session: Current session state.
         db_session: Database session.
-        agent: The PydanticAI agent.
+        agent: The PydanticAI agent, or a future still creating it.
         deps: Agent dependencies.
 
     Returns:
@@ -913,6 +1260,12 @@ async def _process_user_input(
         console.print(GOODBYE_MESSAGE)
         return False
 
+    # Anything but a plain "yes" to a speculated proposal means the user moved on
+    if session.speculation.active and (
+        session.has_pending_draft or lower_input.strip() not in AFFIRMATIVE_RESPONSES
+    ):
+        session.speculation.discard()
+
     # Handle slash commands (bypass AI for queries)
     if user_input.startswith("/"):
         await handle_slash_command(user_input, session, db_session)
@@ -922,6 +1275,12 @@ async def _process_user_input(
     if session.has_pending_draft and _handle_confirmation(user_input, session, db_session):
         return True
 
+    # A confirmed proposal whose plan was extracted speculatively saves without the AI
+    if session.speculation.active and await _confirm_speculated_plan(
+        user_input, session, db_session
+    ):
+        return True
+
     # Clear screen and show fresh dashboard before AI responds
     # This gives a clean view: dashboard + user's request + AI response
     console.clear()
@@ -931,12 +1290,16 @@ async def _process_user_input(
     # Add user message to history
     session.add_user_message(user_input)
 
-    # Process through AI
+    # Process through AI, waiting for the agent if it is still being created
+    if isinstance(agent, asyncio.Future):
+        agent = await agent
     response = await process_ai_input(user_input, agent, deps, session)
 
     # Add assistant response to history
     if response:
         session.add_assistant_message(response)
+        if get_settings().ai_speculative_extraction and looks_like_commitment_proposal(response):
+            _start_speculation(session, db_session)
 
     return True
 
@@ -966,8 +1329,18 @@ def _update_dashboard_cache(session: Session, db_session: DBSession) -> None:
         session: REPL session state.
         db_session: Database session.
     """
-    from jdo.repl.session import DashboardCacheUpdate  # noqa: PLC0415
+    session.update_dashboard_cache(_collect_dashboard_update(db_session))
+
 
+def _collect_dashboard_update(db_session: DBSession) -> DashboardCacheUpdate:
+    """Query everything the dashboard shows.
+
+    Args:
+        db_session: Database session.
+
+    Returns:
+        Dashboard data for the session cache.
+    """
     # Fetch dashboard data from database
     commitments = get_dashboard_commitments(db_session)
     goals = get_dashboard_goals(db_session)
@@ -990,8 +1363,7 @@ def _update_dashboard_cache(session: Session, db_session: DBSession) -> None:
         # Log error but continue with fallback values - dashboard should not crash
         logger.warning("Failed to calculate integrity metrics for dashboard")
 
-    # Update session cache
-    update = DashboardCacheUpdate(
+    return DashboardCacheUpdate(
         commitments=commitments,
         goals=goals,
         triage_count=triage_count,
@@ -1000,7 +1372,31 @@ def _update_dashboard_cache(session: Session, db_session: DBSession) -> None:
         integrity_trend=integrity_trend,
         streak_weeks=streak_weeks,
     )
-    session.update_dashboard_cache(update)
+
+
+def _dashboard_job(db_session: DBSession) -> JobResult:
+    """Maintenance job: rebuild the dashboard data off the input path."""
+    update = _collect_dashboard_update(db_session)
+    count = len(update.commitments or [])
+    return JobResult(f"{count} commitment(s) on the dashboard", dashboard=update)
+
+
+def _create_maintenance_scheduler(session: Session) -> MaintenanceScheduler:
+    """Create the background maintenance scheduler from settings.
+
+    Args:
+        session: REPL session whose dashboard cache the jobs refresh.
+
+    Returns:
+        The scheduler (not yet started).
+    """
+    settings = get_settings()
+    jobs = default_jobs(
+        _dashboard_job,
+        intervals=settings.maintenance_intervals,
+        jitter=settings.maintenance_jitter,
+    )
+    return MaintenanceScheduler(jobs, session=session)
 
 
 def _build_dashboard_data(session: Session) -> DashboardData:
@@ -1064,22 +1460,35 @@ def _show_dashboard(session: Session) -> None:
         console.print(dashboard)
 
 
-def _initialize_agent() -> Agent[JDODependencies, str]:
-    """Initialize database, check credentials, and create AI agent.
+def _initialize_agent() -> asyncio.Task[Agent[JDODependencies, str]]:
+    """Bring the database schema up to date, check credentials, and start creating the agent.
+
+    The agent is created in a worker thread: importing PydanticAI and the
+    provider SDKs takes longer than drawing the dashboard and first prompt,
+    so it loads while the user reads them.
 
     Returns:
-        The created AI agent.
+        Task resolving to the created AI agent.
 
     Raises:
         SystemExit: If credentials are not configured.
     """
-    create_db_and_tables()
+    ensure_schema()
 
     if not check_credentials():
         console.print(NO_CREDENTIALS_MESSAGE)
         sys.exit(1)
 
-    return create_agent()
+    return asyncio.create_task(asyncio.to_thread(create_agent))
+
+
+async def _summarize_history(
+    previous_summary: str | None, messages: list[dict[str, str]], model: str
+) -> str:
+    """Fold evicted messages into the rolling summary (see jdo.ai.summary)."""
+    from jdo.ai.summary import summarize_history
+
+    return await summarize_history(previous_summary, messages, model=model)
 
 
 def _setup_session_state(
@@ -1094,7 +1503,15 @@ def _setup_session_state(
         Tuple of (session state, agent dependencies).
     """
     deps = JDODependencies(session=db_session)
-    session = Session()
+    settings = get_settings()
+    token_counter = get_tiktoken_counter(settings.ai_model)
+    if token_counter is not None:
+        # Load (and possibly download) the encoding while the user reads the dashboard
+        asyncio.get_running_loop().run_in_executor(None, token_counter.load)
+    session = Session(
+        token_counter=token_counter,
+        summarizer=partial(_summarize_history, model=get_model_identifier()),
+    )
 
     # Initialize dashboard cache with full data
     _update_dashboard_cache(session, db_session)
@@ -1199,7 +1616,7 @@ async def _main_repl_loop(
     prompt_session: PromptSession[str],
     session: Session,
     db_session: DBSession,
-    agent: Agent[JDODependencies, str],
+    agent: Agent[JDODependencies, str] | asyncio.Future[Agent[JDODependencies, str]],
     deps: JDODependencies,
 ) -> None:
     """Run the main REPL loop processing user input.
@@ -1208,7 +1625,7 @@ async def _main_repl_loop(
         prompt_session: Prompt session for getting user input.
         session: Current session state.
         db_session: Database session.
-        agent: The PydanticAI agent.
+        agent: The PydanticAI agent, or a future still creating it.
         deps: Agent dependencies.
     """
     # Show initial dashboard before first prompt
@@ -1239,6 +1656,8 @@ async def _main_repl_loop(
             console.print(GOODBYE_MESSAGE)
             break
 
+    session.speculation.discard()
+
 
 # Slash commands for auto-completion
 SLASH_COMMANDS = [
@@ -1250,6 +1669,7 @@ SLASH_COMMANDS = [
     "/commit",
     "/complete",
     "/review",
+    "/jobs",
     "/exit",
     "/quit",
 ]
@@ -1271,7 +1691,14 @@ async def repl_loop() -> None:
 
         _show_startup_guidance(db_session, session)
 
-        await _main_repl_loop(prompt_session, session, db_session, agent, deps)
+        if get_settings().maintenance_enabled:
+            session.maintenance = _create_maintenance_scheduler(session)
+            session.maintenance.start()
+        try:
+            await _main_repl_loop(prompt_session, session, db_session, agent, deps)
+        finally:
+            if session.maintenance is not None:
+                await session.maintenance.stop()
 
 
 def run_repl() -> None:
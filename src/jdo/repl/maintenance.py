@@ -0,0 +1,334 @@
+"""Background maintenance scheduler for the REPL.
+
+Housekeeping runs on per-job timers, off the input path:
+
+- ``milestones``: mark milestones past their target date as missed
+- ``recurring``: generate due recurring commitment instances
+- ``reviews``: count visions and goals due for review
+- ``drafts``: count drafts past the expiry age (the user is prompted; nothing
+  is deleted)
+- ``dashboard``: rebuild the dashboard data (supplied by the REPL loop)
+
+Jobs run in a worker thread with their own database session. Intervals get
+random jitter so jobs don't line up. A job never overlaps itself
+(single-flight): a run that comes due while the previous one is still going
+is skipped and counted. Dashboard data is published to the REPL session's
+cache from the event loop, so the prompt only ever reads the cache. Jobs
+that write to the database trigger a dashboard rebuild. ``/jobs`` shows
+per-job timings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from sqlmodel import col, func, select
+
+from jdo.db.session import (
+    check_and_generate_recurring_instances,
+    get_goals_due_for_review,
+    get_session,
+    get_visions_due_for_review,
+    update_overdue_milestones,
+)
+from jdo.models.draft import DRAFT_EXPIRY_DAYS, Draft, EntityType
+from jdo.utils.datetime import utc_now
+
+if TYPE_CHECKING:
+    from sqlmodel import Session as DBSession
+
+    from jdo.repl.session import DashboardCacheUpdate, Session
+
+# Job whose results feed the dashboard cache
+DASHBOARD_JOB = "dashboard"
+
+# Default seconds between runs of each job
+DEFAULT_INTERVALS: dict[str, float] = {
+    DASHBOARD_JOB: 60.0,
+    "milestones": 900.0,
+    "recurring": 900.0,
+    "reviews": 3600.0,
+    "drafts": 3600.0,
+}
+
+# Intervals vary by up to this fraction either way
+DEFAULT_JITTER = 0.1
+
+# First runs are spread over this many seconds after startup
+STARTUP_SPREAD_SECONDS = 2.0
+
+Sleep = Callable[[float], Awaitable[None]]
+SessionFactory = Callable[[], AbstractContextManager["DBSession"]]
+
+
+@dataclass(frozen=True)
+class JobResult:
+    """Outcome of one job run.
+
+    Attributes:
+        summary: One-line description shown by /jobs.
+        changed: Whether the job wrote to the database (refreshes the dashboard).
+        dashboard: Dashboard data to publish to the REPL session.
+    """
+
+    summary: str
+    changed: bool = False
+    dashboard: DashboardCacheUpdate | None = None
+
+
+JobFunction = Callable[["DBSession"], JobResult]
+
+
+@dataclass(frozen=True)
+class MaintenanceJob:
+    """A named job and its schedule.
+
+    Attributes:
+        name: Job name (shown by /jobs).
+        run: Function doing the work with a database session.
+        interval: Seconds between runs.
+        jitter: Fraction of the interval by which each wait varies.
+    """
+
+    name: str
+    run: JobFunction
+    interval: float
+    jitter: float = DEFAULT_JITTER
+
+
+@dataclass
+class JobStats:
+    """Run history of one job."""
+
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    total_seconds: float = 0.0
+    last_seconds: float | None = None
+    last_run_at: datetime | None = None
+    last_summary: str = ""
+    last_error: str | None = None
+
+    @property
+    def mean_seconds(self) -> float | None:
+        """Mean run duration, or None before the first run."""
+        return self.total_seconds / self.runs if self.runs else None
+
+
+def mark_overdue_milestones(db_session: DBSession) -> JobResult:
+    """Mark milestones past their target date as missed."""
+    count = update_overdue_milestones(db_session)
+    return JobResult(f"{count} milestone(s) marked missed", changed=count > 0)
+
+
+def generate_recurring_instances(db_session: DBSession) -> JobResult:
+    """Generate due instances of recurring commitments."""
+    generated = check_and_generate_recurring_instances(db_session)
+    return JobResult(f"{len(generated)} instance(s) generated", changed=bool(generated))
+
+
+def count_due_reviews(db_session: DBSession) -> JobResult:
+    """Count visions and goals due for review."""
+    visions = len(get_visions_due_for_review(db_session))
+    goals = len(get_goals_due_for_review(db_session))
+    return JobResult(f"{visions} vision(s), {goals} goal(s) due for review")
+
+
+def count_expired_drafts(db_session: DBSession) -> JobResult:
+    """Count drafts (excluding triage items) old enough to prompt about."""
+    threshold = utc_now() - timedelta(days=DRAFT_EXPIRY_DAYS)
+    count = db_session.exec(
+        select(func.count())
+        .select_from(Draft)
+        .where(Draft.entity_type != EntityType.UNKNOWN, col(Draft.created_at) < threshold)
+    ).one()
+    return JobResult(f"{count} expired draft(s)")
+
+
+_HOUSEKEEPING_JOBS: dict[str, JobFunction] = {
+    "milestones": mark_overdue_milestones,
+    "recurring": generate_recurring_instances,
+    "reviews": count_due_reviews,
+    "drafts": count_expired_drafts,
+}
+
+
+def default_jobs(
+    dashboard: JobFunction | None = None,
+    *,
+    intervals: Mapping[str, float] | None = None,
+    jitter: float = DEFAULT_JITTER,
+) -> list[MaintenanceJob]:
+    """Build the standard job list.
+
+    Args:
+        dashboard: Function rebuilding the dashboard data (omitted if None).
+        intervals: Per-job interval overrides in seconds; 0 disables a job.
+        jitter: Fraction of each interval by which waits vary.
+
+    Returns:
+        Jobs with their intervals.
+    """
+    functions = dict(_HOUSEKEEPING_JOBS)
+    if dashboard is not None:
+        functions[DASHBOARD_JOB] = dashboard
+    overrides = intervals or {}
+    jobs = []
+    for name, function in functions.items():
+        interval = overrides.get(name, DEFAULT_INTERVALS[name])
+        if interval > 0:
+            jobs.append(MaintenanceJob(name, function, interval, jitter))
+    return jobs
+
+
+class MaintenanceScheduler:
+    """Runs maintenance jobs on jittered timers with single-flight locking."""
+
+    def __init__(
+        self,
+        jobs: Iterable[MaintenanceJob],
+        *,
+        session: Session | None = None,
+        session_factory: SessionFactory = get_session,
+        rng: random.Random | None = None,
+        sleep: Sleep = asyncio.sleep,
+    ) -> None:
+        """Initialize the scheduler (call start() to begin running jobs).
+
+        Args:
+            jobs: Jobs to run.
+            session: REPL session whose dashboard cache receives results.
+            session_factory: Context manager factory for a job's database session.
+            rng: Random source for jitter.
+            sleep: Sleep function between runs.
+        """
+        self._jobs = {job.name: job for job in jobs}
+        self._session = session
+        self._session_factory = session_factory
+        self._rng = rng or random.Random()  # noqa: S311 - jitter, not security
+        self._sleep = sleep
+        self._locks = {name: asyncio.Lock() for name in self._jobs}
+        self.stats = {name: JobStats() for name in self._jobs}
+        self._timers: list[asyncio.Task[None]] = []
+        self._followups: set[asyncio.Task[bool]] = set()
+
+    @property
+    def jobs(self) -> list[MaintenanceJob]:
+        """The scheduled jobs."""
+        return list(self._jobs.values())
+
+    @property
+    def running(self) -> bool:
+        """Whether the job timers are running."""
+        return bool(self._timers)
+
+    def start(self) -> None:
+        """Start a timer task per job on the running event loop."""
+        if self._timers:
+            return
+        self._timers = [
+            asyncio.create_task(self._run_forever(job), name=f"maintenance:{job.name}")
+            for job in self._jobs.values()
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the timers and wait for in-flight runs to finish."""
+        tasks = [*self._timers, *self._followups]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._timers = []
+        self._followups.clear()
+
+    def next_delay(self, job: MaintenanceJob) -> float:
+        """Seconds to wait before the job's next run (interval with jitter)."""
+        return job.interval * (1 + self._rng.uniform(-job.jitter, job.jitter))
+
+    async def run_job(self, name: str) -> bool:
+        """Run a job now unless a run of it is already in flight.
+
+        Args:
+            name: Job name.
+
+        Returns:
+            True if the job ran, False if it was skipped.
+
+        Raises:
+            KeyError: If no job has that name.
+        """
+        job = self._jobs[name]
+        lock = self._locks[name]
+        stats = self.stats[name]
+        if lock.locked():
+            stats.skipped += 1
+            return False
+        async with lock:
+            stats.last_run_at = utc_now()
+            started = time.perf_counter()
+            try:
+                result = await asyncio.to_thread(self._execute, job)
+            except Exception as e:
+                stats.failures += 1
+                stats.last_error = str(e) or type(e).__name__
+                logger.warning(f"Maintenance job {name} failed: {e}")
+                return True
+            finally:
+                elapsed = time.perf_counter() - started
+                stats.runs += 1
+                stats.total_seconds += elapsed
+                stats.last_seconds = elapsed
+            stats.last_summary = result.summary
+            stats.last_error = None
+            self._publish(result)
+        return True
+
+    def _execute(self, job: MaintenanceJob) -> JobResult:
+        with self._session_factory() as db_session:
+            return job.run(db_session)
+
+    def _publish(self, result: JobResult) -> None:
+        if result.dashboard is not None and self._session is not None:
+            self._session.update_dashboard_cache(result.dashboard)
+        if result.changed and DASHBOARD_JOB in self._jobs:
+            task = asyncio.create_task(self.run_job(DASHBOARD_JOB))
+            self._followups.add(task)
+            task.add_done_callback(self._followups.discard)
+
+    async def _run_forever(self, job: MaintenanceJob) -> None:
+        await self._sleep(self._rng.uniform(0, STARTUP_SPREAD_SECONDS))
+        while True:
+            await self.run_job(job.name)
+            await self._sleep(self.next_delay(job))
+
+    def format_stats(self) -> str:
+        """Render per-job timings as a plain-text table."""
+        lines = ["Background jobs", "=" * 40]
+        for name, job in self._jobs.items():
+            stats = self.stats[name]
+            if stats.runs == 0:
+                timing = "not run yet"
+            else:
+                timing = (
+                    f"{stats.runs} run(s), last {(stats.last_seconds or 0) * 1000:.0f} ms, "
+                    f"mean {(stats.mean_seconds or 0) * 1000:.0f} ms"
+                )
+            extras = []
+            if stats.failures:
+                extras.append(f"{stats.failures} failed")
+            if stats.skipped:
+                extras.append(f"{stats.skipped} skipped (still running)")
+            suffix = f" ({', '.join(extras)})" if extras else ""
+            lines.append(f"{name:<11} every {job.interval:>5.0f}s  {timing}{suffix}")
+            if stats.last_error:
+                lines.append(f"{'':<11} last error: {stats.last_error}")
+            elif stats.last_summary:
+                lines.append(f"{'':<11} {stats.last_summary}")
+        return "\n".join(lines)
@@ -6,11 +6,29 @@ Implements token-based history pruning per research findings.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import asyncio
+import importlib.util
+import statistics
+import threading
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field, replace
 from datetime import date
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+from loguru import logger
+
+from jdo.ai.snapshot import StateSnapshotCache
+from jdo.ai.speculation import SpeculativeExtraction
+from jdo.ai.usage import PromptCacheStats
+
+if TYPE_CHECKING:
+    # pydantic_ai is imported where messages are handled, after the first prompt
+    from pydantic_ai.messages import ModelMessage
+
+    from jdo.repl.maintenance import MaintenanceScheduler
+
 # Approximate tokens per character (conservative estimate for English text)
 # OpenAI uses ~4 chars per token on average
 CHARS_PER_TOKEN = 4
@@ -21,6 +39,153 @@ MAX_HISTORY_TOKENS = 8000
 # Minimum messages to keep (one user + one assistant exchange)
 MIN_HISTORY_MESSAGES = 2
 
+# Agent runs kept for the tool-calls-per-run median
+TOOL_CALL_WINDOW = 100
+
+# Heading for the rolling summary injected ahead of the retained history
+HISTORY_SUMMARY_HEADING = "## Summary of earlier conversation"
+
+# Counts tokens in a string
+TokenCounter = Callable[[str], int]
+
+# Folds evicted messages into the rolling summary: (previous summary, evicted) -> summary
+HistorySummarizer = Callable[[str | None, list[dict[str, str]]], Awaitable[str]]
+
+
+def estimate_text_tokens(text: str) -> int:
+    """Estimate tokens in a string using the chars-per-token heuristic.
+
+    Args:
+        text: The text to measure.
+
+    Returns:
+        Estimated token count.
+    """
+    return len(text) // CHARS_PER_TOKEN
+
+
+class TiktokenCounter:
+    """Counts tokens with tiktoken, loading the encoding on first use.
+
+    tiktoken downloads the BPE file the first time an encoding is used, so
+    loading it at startup would block the REPL (or fail offline). If loading
+    fails for any reason, counting falls back to estimate_text_tokens.
+    """
+
+    def __init__(self, model_name: str) -> None:
+        """Initialize without loading the encoding.
+
+        Args:
+            model_name: Model name used to select the encoding.
+        """
+        self.model_name = model_name
+        self._count: TokenCounter | None = None
+        self._lock = threading.Lock()
+
+    def load(self) -> TokenCounter:
+        """Load the encoding (once) and return the counting function."""
+        with self._lock:
+            if self._count is None:
+                self._count = self._load_encoding()
+            return self._count
+
+    def _load_encoding(self) -> TokenCounter:
+        import tiktoken
+
+        try:
+            try:
+                encoding = tiktoken.encoding_for_model(self.model_name)
+            except KeyError:
+                encoding = tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            # Usually a failed download of the BPE file (offline, empty cache)
+            logger.warning("tiktoken encoding unavailable, estimating tokens instead: {}", e)
+            return estimate_text_tokens
+
+        def count(text: str) -> int:
+            return len(encoding.encode(text, disallowed_special=()))
+
+        return count
+
+    def __call__(self, text: str) -> int:
+        """Count tokens in a string."""
+        return (self._count or self.load())(text)
+
+
+def get_tiktoken_counter(model_name: str) -> TiktokenCounter | None:
+    """Get a tiktoken-based token counter if tiktoken is installed.
+
+    The encoding is loaded on the first count (see TiktokenCounter).
+
+    Args:
+        model_name: Model name used to select the encoding.
+
+    Returns:
+        A token counter, or None if tiktoken is unavailable.
+    """
+    if importlib.util.find_spec("tiktoken") is None:
+        return None
+    return TiktokenCounter(model_name)
+
+
+def estimate_model_message_tokens(
+    message: ModelMessage,
+    token_counter: TokenCounter = estimate_text_tokens,
+) -> int:
+    """Estimate tokens in a native PydanticAI message.
+
+    Counts text content, tool-call arguments, and tool-return content.
+
+    Args:
+        message: A ModelRequest or ModelResponse.
+        token_counter: Function used to count tokens in each part.
+
+    Returns:
+        Estimated token count.
+    """
+    from pydantic_ai.messages import ToolCallPart, ToolReturnPart
+
+    total = 0
+    for part in message.parts:
+        if isinstance(part, ToolCallPart):
+            total += token_counter(part.args_as_json_str())
+        elif isinstance(part, ToolReturnPart):
+            total += token_counter(part.model_response_str())
+        else:
+            content = getattr(part, "content", "")
+            total += token_counter(content if isinstance(content, str) else str(content))
+    return total
+
+
+def _model_messages_to_transcript(messages: list[ModelMessage]) -> list[dict[str, str]]:
+    """Render the user and assistant text of native messages as role/content dicts.
+
+    Tool calls and returns are skipped; the summary only needs the conversation.
+
+    Args:
+        messages: Native PydanticAI messages.
+
+    Returns:
+        List of message dicts with 'role' and 'content' keys.
+    """
+    from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+
+    transcript: list[dict[str, str]] = []
+    for msg in messages:
+        for part in msg.parts:
+            if isinstance(msg, ModelRequest) and isinstance(part, UserPromptPart):
+                # Multi-item prompts are [user text, per-turn context]; keep the user text
+                content = (
+                    part.content
+                    if isinstance(part.content, str)
+                    else next(iter(part.content), None)
+                )
+                if isinstance(content, str):
+                    transcript.append({"role": "user", "content": content})
+            elif isinstance(msg, ModelResponse) and isinstance(part, TextPart) and part.content:
+                transcript.append({"role": "assistant", "content": part.content})
+    return transcript
+
 
 @dataclass
 class EntityContext:
@@ -104,9 +269,44 @@ class Session:
     and cached counts for toolbar display.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty session state."""
-        self.message_history: list[dict[str, str]] = []
+    def __init__(
+        self,
+        *,
+        token_counter: TokenCounter | None = None,
+        summarizer: HistorySummarizer | None = None,
+    ) -> None:
+        """Initialize empty session state.
+
+        Args:
+            token_counter: Optional real tokenizer (defaults to chars/4 estimate).
+            summarizer: Optional async function that folds evicted turns into
+                the rolling history summary. Without it, evicted turns are dropped.
+        """
+        self._count_tokens: TokenCounter = token_counter or estimate_text_tokens
+        self._summarizer = summarizer
+        # Conversation transcript with a running token total (O(1) append/evict)
+        self.message_history: deque[dict[str, str]] = deque()
+        self._history_tokens = 0
+        # Native PydanticAI history (keeps tool calls/returns between turns).
+        # Stored as whole agent runs so tool-call/return pairs are never split.
+        self.model_messages: deque[ModelMessage] = deque()
+        self._model_turns: deque[tuple[int, int]] = deque()  # (message count, tokens) per run
+        self._model_history_tokens = 0
+        # Rolling summary of runs evicted from the native history
+        self.history_summary: str | None = None
+        self._pending_evictions: list[dict[str, str]] = []
+        self._summary_task: asyncio.Task[None] | None = None
+        # Cached vs uncached input tokens reported by the provider
+        self.prompt_cache = PromptCacheStats()
+        # Background plan extraction for the next confirmation (if enabled)
+        self.speculation = SpeculativeExtraction()
+        # Tool calls made in each recent agent run (target: answer from the snapshot instead)
+        self.tool_calls_per_turn: deque[int] = deque(maxlen=TOOL_CALL_WINDOW)
+        self.total_tool_calls = 0
+        # User-state snapshot sent with each run, rebuilt only after DB writes
+        self.state_snapshot = StateSnapshotCache()
+        # Background maintenance jobs, when running (shown by /jobs)
+        self.maintenance: MaintenanceScheduler | None = None
         self.entity_context = EntityContext()
         self.pending_draft: PendingDraft | None = None
         self.snoozed_vision_ids: set[UUID] = set()
@@ -136,8 +336,7 @@ class Session:
         Args:
             content: The message content.
         """
-        self.message_history.append({"role": "user", "content": content})
-        self._prune_history_if_needed()
+        self._append_message({"role": "user", "content": content})
 
     def add_assistant_message(self, content: str) -> None:
         """Add an assistant message to history.
@@ -145,19 +344,27 @@ class Session:
         Args:
             content: The message content.
         """
-        self.message_history.append({"role": "assistant", "content": content})
+        self._append_message({"role": "assistant", "content": content})
+
+    def _append_message(self, message: dict[str, str]) -> None:
+        """Append a message and update the running token total.
+
+        Args:
+            message: Dict with 'role' and 'content' keys.
+        """
+        self.message_history.append(message)
+        self._history_tokens += self._count_tokens(message["content"])
         self._prune_history_if_needed()
 
     def _estimate_tokens(self) -> int:
         """Estimate total tokens in message history.
 
-        Uses character count divided by average chars per token.
+        Returns the running total maintained on append and eviction.
 
         Returns:
             Estimated token count.
         """
-        total_chars = sum(len(msg["content"]) for msg in self.message_history)
-        return total_chars // CHARS_PER_TOKEN
+        return self._history_tokens
 
     def _prune_history_if_needed(self) -> None:
         """Prune oldest messages if history exceeds token budget.
@@ -166,11 +373,167 @@ class Session:
         Always keeps at least the most recent exchange (user + assistant).
         """
         while (
-            self._estimate_tokens() > MAX_HISTORY_TOKENS
+            self._history_tokens > MAX_HISTORY_TOKENS
             and len(self.message_history) > MIN_HISTORY_MESSAGES
         ):
-            # Remove oldest message
-            self.message_history.pop(0)
+            oldest = self.message_history.popleft()
+            self._history_tokens -= self._count_tokens(oldest["content"])
+
+    def add_model_messages(self, messages: list[ModelMessage]) -> None:
+        """Append the messages produced by one agent run to the native history.
+
+        Args:
+            messages: New messages from the run (``AgentRun.new_messages()``).
+        """
+        if not messages:
+            return
+        from pydantic_ai.messages import ModelResponse, ToolCallPart
+
+        tokens = sum(estimate_model_message_tokens(msg, self._count_tokens) for msg in messages)
+        self.model_messages.extend(messages)
+        self.prompt_cache.record_messages(messages)
+        tool_calls = sum(
+            isinstance(part, ToolCallPart)
+            for msg in messages
+            if isinstance(msg, ModelResponse)
+            for part in msg.parts
+        )
+        self.tool_calls_per_turn.append(tool_calls)
+        self.total_tool_calls += tool_calls
+        self._model_turns.append((len(messages), tokens))
+        self._model_history_tokens += tokens
+        self._prune_model_history_if_needed()
+
+    @property
+    def median_tool_calls(self) -> float:
+        """Median tool calls over the recent agent runs (0.0 before the first run)."""
+        if not self.tool_calls_per_turn:
+            return 0.0
+        return float(statistics.median(self.tool_calls_per_turn))
+
+    def format_agent_stats(self) -> str:
+        """Render prompt-cache and tool-call metrics as plain text (shown by /jobs)."""
+        lines = ["Agent runs", "=" * 40]
+        if not self.tool_calls_per_turn:
+            lines.append("No agent runs yet")
+            return "\n".join(lines)
+        cache = self.prompt_cache
+        lines.append(
+            f"Prompt cache: {cache.hit_ratio:.0%} of {cache.input_tokens} input tokens cached "
+            f"over {cache.responses} response(s)"
+        )
+        lines.append(
+            f"Tool calls:   median {self.median_tool_calls:g} per run over the last "
+            f"{len(self.tool_calls_per_turn)} run(s), {self.total_tool_calls} in total"
+        )
+        return "\n".join(lines)
+
+    def _prune_model_history_if_needed(self) -> None:
+        """Drop the oldest agent runs while the native history exceeds the token budget.
+
+        Whole runs are dropped so tool calls are never separated from their returns.
+        The most recent run is always kept. System prompt parts from the first
+        request are carried over to the new first request, since PydanticAI only
+        adds them when the history is empty. Dropped runs are queued for the
+        rolling summary.
+        """
+        from pydantic_ai.messages import ModelRequest, SystemPromptPart
+
+        evicted: list[ModelMessage] = []
+        while self._model_history_tokens > MAX_HISTORY_TOKENS and len(self._model_turns) > 1:
+            count, tokens = self._model_turns.popleft()
+            dropped = [self.model_messages.popleft() for _ in range(count)]
+            self._model_history_tokens -= tokens
+            evicted.extend(dropped)
+
+            system_parts = [
+                part
+                for msg in dropped
+                if isinstance(msg, ModelRequest)
+                for part in msg.parts
+                if isinstance(part, SystemPromptPart)
+            ]
+            head = self.model_messages[0]
+            if system_parts and isinstance(head, ModelRequest):
+                self.model_messages[0] = replace(head, parts=[*system_parts, *head.parts])
+
+        if evicted:
+            self._queue_for_summary(_model_messages_to_transcript(evicted))
+
+    def _queue_for_summary(self, transcript: list[dict[str, str]]) -> None:
+        """Queue evicted messages and start folding them into the summary.
+
+        Folding runs as a background task on the current event loop so the
+        caller never waits on the summarizer. Without a running loop the
+        messages stay queued until ``flush_summary()`` is awaited.
+
+        Args:
+            transcript: Evicted messages as role/content dicts.
+        """
+        if self._summarizer is None or not transcript:
+            return
+        self._pending_evictions.extend(transcript)
+        if self._summary_task is not None and not self._summary_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._summary_task = loop.create_task(self._fold_pending_evictions())
+
+    async def _fold_pending_evictions(self) -> None:
+        """Fold queued evictions into the rolling summary until the queue is empty."""
+        if self._summarizer is None:
+            return
+        while self._pending_evictions:
+            batch = self._pending_evictions
+            self._pending_evictions = []
+            try:
+                self.history_summary = await self._summarizer(self.history_summary, batch)
+            except Exception as e:
+                # Summary is best-effort; keep the previous one and move on
+                logger.warning("Failed to fold evicted history into summary: {}", e)
+
+    async def flush_summary(self) -> None:
+        """Wait until all evicted messages have been folded into the summary."""
+        if self._summary_task is not None:
+            await self._summary_task
+        await self._fold_pending_evictions()
+
+    def get_model_history(self) -> list[ModelMessage]:
+        """Get the native history to send with the next agent run.
+
+        The rolling summary, when present, is added as a system prompt part
+        after the leading system prompt so the static prefix stays first.
+
+        Returns:
+            List of native PydanticAI messages.
+        """
+        messages = list(self.model_messages)
+        if not self.history_summary or not messages:
+            return messages
+        from pydantic_ai.messages import ModelRequest, SystemPromptPart
+
+        head = messages[0]
+        if not isinstance(head, ModelRequest):
+            return messages
+        summary_part = SystemPromptPart(
+            content=f"{HISTORY_SUMMARY_HEADING}\n{self.history_summary}"
+        )
+        leading = 0
+        while leading < len(head.parts) and isinstance(head.parts[leading], SystemPromptPart):
+            leading += 1
+        parts = [*head.parts[:leading], summary_part, *head.parts[leading:]]
+        messages[0] = replace(head, parts=parts)
+        return messages
+
+    def clear_model_history(self) -> None:
+        """Clear the native PydanticAI history and its rolling summary."""
+        self.model_messages.clear()
+        self._model_turns.clear()
+        self._model_history_tokens = 0
+        self.history_summary = None
+        self._pending_evictions.clear()
 
     def set_entity_context(self, entity_type: str, entity_id: UUID) -> None:
         """Set the current entity context.
@@ -234,7 +597,7 @@ class Session:
         Returns:
             List of message dicts with 'role' and 'content' keys.
         """
-        return self.message_history.copy()
+        return list(self.message_history)
 
     def update_cached_counts(
         self,
@@ -1,15 +1,35 @@
 """UAT (User Acceptance Testing) module for JDO.
 
-Provides utilities for programmatic REPL testing and cleanup.
+Provides utilities for programmatic REPL testing and cleanup, an offline
+model that replays recorded sessions, and a REPL latency benchmark.
 """
 
 from __future__ import annotations
 
+from jdo.uat.benchmark import BenchmarkReport, TurnMeasurement, run_benchmark, seed_benchmark_data
 from jdo.uat.cleanup import cleanup_test_entities, get_entity_counts
 from jdo.uat.harness import REPLTestHarness
+from jdo.uat.replay import (
+    RecordedResponse,
+    RecordedSession,
+    RecordedToolCall,
+    RecordedTurn,
+    ReplayError,
+    SessionReplayer,
+)
 
 __all__ = [
+    "BenchmarkReport",
     "REPLTestHarness",
+    "RecordedResponse",
+    "RecordedSession",
+    "RecordedToolCall",
+    "RecordedTurn",
+    "ReplayError",
+    "SessionReplayer",
+    "TurnMeasurement",
     "cleanup_test_entities",
     "get_entity_counts",
+    "run_benchmark",
+    "seed_benchmark_data",
 ]
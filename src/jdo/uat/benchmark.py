@@ -0,0 +1,275 @@
+"""Offline end-to-end latency benchmark for the REPL.
+
+Drives a scripted conversation through ``_process_user_input`` (via
+REPLTestHarness) with the agent backed by a SessionReplayer, against a real
+seeded SQLite database. Each turn records wall-clock latency, CPU spent
+rendering console output, time spent in database queries and the number of
+tool calls, so pipeline regressions show up without network access.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, cast
+
+from rich.console import Console
+from sqlalchemy import Engine, event
+from sqlmodel import Session
+
+from jdo.models import Commitment, CommitmentStatus, Goal, GoalStatus, Stakeholder, StakeholderType
+from jdo.uat.harness import REPLTestHarness
+from jdo.uat.replay import RecordedSession
+from jdo.utils.datetime import today_date
+
+
+class TimedConsole(Console):
+    """A Console that adds up the CPU time spent printing (rendering) output.
+
+    Live displays refresh from a background thread, so CPU is measured per
+    thread around each print call.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize with a zero render-CPU counter."""
+        super().__init__(*args, **kwargs)
+        self.render_cpu_seconds = 0.0
+        self._render_lock = threading.Lock()
+
+    def print(self, *args: Any, **kwargs: Any) -> None:
+        """Print, counting the calling thread's CPU time."""
+        started = time.thread_time()
+        try:
+            super().print(*args, **kwargs)
+        finally:
+            elapsed = time.thread_time() - started
+            with self._render_lock:
+                self.render_cpu_seconds += elapsed
+
+
+@dataclass
+class QueryTimer:
+    """Cumulative time and count of SQL statements executed on an engine."""
+
+    seconds: float = 0.0
+    queries: int = 0
+    _started: dict[int, float] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def before_execute(self, _conn: object, cursor: object, *_args: object) -> None:
+        """Engine hook: note when a statement starts."""
+        with self._lock:
+            self._started[id(cursor)] = time.perf_counter()
+
+    def after_execute(self, _conn: object, cursor: object, *_args: object) -> None:
+        """Engine hook: add a finished statement's duration."""
+        now = time.perf_counter()
+        with self._lock:
+            started = self._started.pop(id(cursor), now)
+            self.seconds += now - started
+            self.queries += 1
+
+
+@contextmanager
+def time_queries(engine: Engine) -> Iterator[QueryTimer]:
+    """Time every SQL statement executed on an engine inside the block.
+
+    Args:
+        engine: Engine to instrument.
+
+    Yields:
+        The timer, updated as statements run.
+    """
+    timer = QueryTimer()
+    event.listen(engine, "before_cursor_execute", timer.before_execute)
+    event.listen(engine, "after_cursor_execute", timer.after_execute)
+    try:
+        yield timer
+    finally:
+        event.remove(engine, "before_cursor_execute", timer.before_execute)
+        event.remove(engine, "after_cursor_execute", timer.after_execute)
+
+
+@dataclass(frozen=True)
+class TurnMeasurement:
+    """Measurements for one user input.
+
+    Attributes:
+        user_input: What was sent.
+        latency_seconds: Wall-clock time to process the input.
+        render_cpu_seconds: CPU time spent rendering console output.
+        db_seconds: Time spent executing SQL.
+        db_queries: Number of SQL statements executed.
+        tool_calls: Tool calls the agent made (0 for inputs that skip the AI).
+    """
+
+    user_input: str
+    latency_seconds: float
+    render_cpu_seconds: float
+    db_seconds: float
+    db_queries: int
+    tool_calls: int
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile (0.0 for no values).
+
+    Args:
+        values: Samples.
+        fraction: Percentile as a fraction, e.g. 0.95.
+
+    Returns:
+        The percentile value.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+@dataclass
+class BenchmarkReport:
+    """Per-turn measurements of one or more benchmark runs."""
+
+    turns: list[TurnMeasurement] = field(default_factory=list)
+
+    @property
+    def p50_latency(self) -> float:
+        """Median turn latency in seconds."""
+        return percentile([t.latency_seconds for t in self.turns], 0.5)
+
+    @property
+    def p95_latency(self) -> float:
+        """95th percentile turn latency in seconds."""
+        return percentile([t.latency_seconds for t in self.turns], 0.95)
+
+    @property
+    def render_cpu_seconds(self) -> float:
+        """Total CPU time spent rendering."""
+        return sum(t.render_cpu_seconds for t in self.turns)
+
+    @property
+    def db_seconds(self) -> float:
+        """Total time spent in SQL."""
+        return sum(t.db_seconds for t in self.turns)
+
+    @property
+    def db_queries(self) -> int:
+        """Total SQL statements executed."""
+        return sum(t.db_queries for t in self.turns)
+
+    @property
+    def tool_calls(self) -> int:
+        """Total tool calls made by the agent."""
+        return sum(t.tool_calls for t in self.turns)
+
+    def format(self) -> str:
+        """Render the report as a plain-text summary."""
+        return (
+            f"{len(self.turns)} turns: "
+            f"p50 {self.p50_latency * 1000:.1f} ms, p95 {self.p95_latency * 1000:.1f} ms, "
+            f"render CPU {self.render_cpu_seconds * 1000:.1f} ms, "
+            f"DB {self.db_seconds * 1000:.1f} ms ({self.db_queries} queries), "
+            f"{self.tool_calls} tool calls"
+        )
+
+
+def seed_benchmark_data(session: Session, *, commitments: int = 40, goals: int = 5) -> None:
+    """Fill a database with a realistic spread of goals and commitments.
+
+    Commitments are spread over the weeks around today (some overdue) and
+    across a few stakeholders and goals, so snapshots and list tools do real
+    work.
+
+    Args:
+        session: Database session (committed on return).
+        commitments: Number of commitments to create.
+        goals: Number of goals to create.
+    """
+    stakeholders = [
+        Stakeholder(name=name, type=StakeholderType.PERSON)
+        for name in ("Sarah", "Bob", "Priya", "Marcus")
+    ]
+    session.add_all(stakeholders)
+    goal_rows = [
+        Goal(
+            title=f"Benchmark goal {i + 1}",
+            problem_statement="Seeded for the REPL benchmark",
+            solution_vision="Measured turn latency",
+            status=GoalStatus.ACTIVE,
+        )
+        for i in range(goals)
+    ]
+    session.add_all(goal_rows)
+    session.flush()
+
+    today = today_date()
+    statuses = (CommitmentStatus.PENDING, CommitmentStatus.IN_PROGRESS)
+    for i in range(commitments):
+        session.add(
+            Commitment(
+                deliverable=f"Benchmark deliverable {i + 1}",
+                stakeholder_id=stakeholders[i % len(stakeholders)].id,
+                goal_id=goal_rows[i % len(goal_rows)].id if goal_rows and i % 3 else None,
+                due_date=today + timedelta(days=i % 21 - 5),
+                status=statuses[i % len(statuses)],
+            )
+        )
+    session.commit()
+
+
+async def run_benchmark(
+    db_session: Session,
+    inputs: Sequence[str],
+    recording: RecordedSession,
+    *,
+    time_scale: float = 0.0,
+) -> BenchmarkReport:
+    """Send scripted inputs through the REPL with a replayed model and measure each turn.
+
+    Args:
+        db_session: Session on the seeded database (its engine is instrumented).
+        inputs: User inputs in order; those that reach the AI consume the
+            recording's turns in order.
+        recording: Model responses to replay.
+        time_scale: Multiplier for recorded stream delays (0 replays instantly).
+
+    Returns:
+        Measurements for every input.
+
+    Raises:
+        ReplayError: If the conversation went off the recording's script.
+    """
+    harness = REPLTestHarness.offline(
+        db_session, recording, time_scale=time_scale, console_class=TimedConsole
+    )
+    console = cast("TimedConsole", harness.console)
+    engine = cast("Engine", db_session.get_bind())
+    report = BenchmarkReport()
+
+    for user_input in inputs:
+        tool_calls = harness.repl_session.total_tool_calls
+        render_before = console.render_cpu_seconds
+        with time_queries(engine) as queries:
+            started = time.perf_counter()
+            output = await harness.send(user_input)
+            latency = time.perf_counter() - started
+        if output.error is not None:
+            raise output.error
+        report.turns.append(
+            TurnMeasurement(
+                user_input=user_input,
+                latency_seconds=latency,
+                render_cpu_seconds=console.render_cpu_seconds - render_before,
+                db_seconds=queries.seconds,
+                db_queries=queries.queries,
+                tool_calls=harness.repl_session.total_tool_calls - tool_calls,
+            )
+        )
+    return report
@@ -9,8 +9,9 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from loguru import logger
-from sqlmodel import Session, select
+from sqlmodel import Session, SQLModel, col, func, select
 
+from jdo.db.bulk import delete_created_after
 from jdo.models import Commitment, Goal, Milestone, Stakeholder, Task, Vision
 
 
@@ -65,6 +66,25 @@ def get_entity_counts(session: Session) -> EntityCounts:
     )
 
 
+def _count_created_after(session: Session, created_after: datetime) -> EntityCounts:
+    """Count entities created at or after a timestamp."""
+
+    def count(model: type[SQLModel]) -> int:
+        created_at = col(model.created_at)  # type: ignore[attr-defined]
+        return session.exec(
+            select(func.count()).select_from(model).where(created_at >= created_after)
+        ).one()
+
+    return EntityCounts(
+        visions=count(Vision),
+        goals=count(Goal),
+        milestones=count(Milestone),
+        stakeholders=count(Stakeholder),
+        commitments=count(Commitment),
+        tasks=count(Task),
+    )
+
+
 def cleanup_test_entities(
     session: Session,
     created_after: datetime,
@@ -73,7 +93,8 @@ def cleanup_test_entities(
 ) -> EntityCounts:
     """Delete all entities created after a given timestamp.
 
-    Deletes in dependency order to respect foreign keys:
+    Each table is cleared with one bulk DELETE, in dependency order to
+    respect foreign keys:
     1. Tasks (depend on commitments)
     2. Commitments (depend on goals, stakeholders)
     3. Milestones (depend on goals)
@@ -89,62 +110,19 @@ def cleanup_test_entities(
     Returns:
         EntityCounts of deleted entities.
     """
-    deleted = EntityCounts()
-
-    # 1. Delete Tasks
-    tasks = session.exec(select(Task).where(Task.created_at >= created_after)).all()
-    deleted.tasks = len(tasks)
-    if not dry_run:
-        for task in tasks:
-            session.delete(task)
-        logger.debug(f"Deleted {deleted.tasks} tasks")
-
-    # 2. Delete Commitments
-    commitments = session.exec(
-        select(Commitment).where(Commitment.created_at >= created_after)
-    ).all()
-    deleted.commitments = len(commitments)
-    if not dry_run:
-        for commitment in commitments:
-            session.delete(commitment)
-        logger.debug(f"Deleted {deleted.commitments} commitments")
-
-    # 3. Delete Milestones
-    milestones = session.exec(select(Milestone).where(Milestone.created_at >= created_after)).all()
-    deleted.milestones = len(milestones)
-    if not dry_run:
-        for milestone in milestones:
-            session.delete(milestone)
-        logger.debug(f"Deleted {deleted.milestones} milestones")
-
-    # 4. Delete Goals
-    goals = session.exec(select(Goal).where(Goal.created_at >= created_after)).all()
-    deleted.goals = len(goals)
-    if not dry_run:
-        for goal in goals:
-            session.delete(goal)
-        logger.debug(f"Deleted {deleted.goals} goals")
-
-    # 5. Delete Stakeholders
-    stakeholders = session.exec(
-        select(Stakeholder).where(Stakeholder.created_at >= created_after)
-    ).all()
-    deleted.stakeholders = len(stakeholders)
-    if not dry_run:
-        for stakeholder in stakeholders:
-            session.delete(stakeholder)
-        logger.debug(f"Deleted {deleted.stakeholders} stakeholders")
-
-    # 6. Delete Visions
-    visions = session.exec(select(Vision).where(Vision.created_at >= created_after)).all()
-    deleted.visions = len(visions)
-    if not dry_run:
-        for vision in visions:
-            session.delete(vision)
-        logger.debug(f"Deleted {deleted.visions} visions")
-
-    if not dry_run:
-        session.commit()
-        logger.info(f"UAT cleanup complete: {deleted}")
+    if dry_run:
+        return _count_created_after(session, created_after)
+
+    ids = delete_created_after(session, created_after)
+    deleted = EntityCounts(
+        visions=len(ids[Vision]),
+        goals=len(ids[Goal]),
+        milestones=len(ids[Milestone]),
+        stakeholders=len(ids[Stakeholder]),
+        commitments=len(ids[Commitment]),
+        tasks=len(ids[Task]),
+    )
 
+    session.commit()
+    logger.info(f"UAT cleanup complete: {deleted}")
     return deleted
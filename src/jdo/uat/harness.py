@@ -15,8 +15,9 @@ from pydantic_ai import Agent
 from rich.console import Console
 from sqlmodel import Session
 
-from jdo.ai.agent import JDODependencies, create_agent
+from jdo.ai.agent import JDODependencies, create_agent, create_agent_with_model
 from jdo.repl.session import Session as REPLSession
+from jdo.uat.replay import RecordedSession, SessionReplayer
 
 
 @dataclass
@@ -33,7 +34,8 @@ class REPLTestHarness:
     """Harness for programmatic REPL UAT testing.
 
     Allows sending inputs to the REPL and capturing outputs without
-    running the full interactive loop.
+    running the full interactive loop. Use ``REPLTestHarness.offline()`` to
+    replay a recorded session instead of calling a real provider.
 
     Example:
         ```python
@@ -49,6 +51,7 @@ class REPLTestHarness:
 
     db_session: Session
     repl_session: REPLSession = field(default_factory=REPLSession)
+    console_class: type[Console] = Console
     _agent: Agent[JDODependencies, str] | None = field(default=None)
     _deps: JDODependencies | None = field(default=None)
     _output_buffer: StringIO = field(default_factory=StringIO)
@@ -63,12 +66,48 @@ class REPLTestHarness:
             self._agent = create_agent()
         if self._deps is None:
             self._deps = JDODependencies(session=self.db_session)
-        self._console = Console(
+        self._console = self.console_class(
             file=self._output_buffer,
             force_terminal=True,
             width=100,
         )
 
+    @classmethod
+    def offline(
+        cls,
+        db_session: Session,
+        recording: RecordedSession,
+        *,
+        time_scale: float = 1.0,
+        console_class: type[Console] = Console,
+    ) -> REPLTestHarness:
+        """Create a harness whose agent replays a recorded session.
+
+        No credentials or network access are needed; the real tools still run
+        against ``db_session``'s database.
+
+        Args:
+            db_session: Database session.
+            recording: Model responses to replay, in order.
+            time_scale: Multiplier for recorded stream delays (0 replays instantly).
+            console_class: Console type used to capture output.
+
+        Returns:
+            The harness.
+        """
+        replayer = SessionReplayer(recording, time_scale=time_scale)
+        return cls(
+            db_session,
+            console_class=console_class,
+            _agent=create_agent_with_model(replayer.model()),
+        )
+
+    @property
+    def console(self) -> Console:
+        """The console REPL output is captured with."""
+        assert self._console is not None, "Console not initialized"
+        return self._console
+
     @property
     def start_time(self) -> datetime:
         """Return the time this harness was created (for cleanup)."""
@@ -0,0 +1,276 @@
+"""Offline fake model that replays recorded AI sessions.
+
+A RecordedSession lists, for every AI turn, the model responses the agent
+received: text split into the chunks the provider streamed (with the delay
+before each chunk) and the tool calls it made. SessionReplayer serves those
+responses through a PydanticAI FunctionModel, so the real agent, tools and
+REPL pipeline run deterministically without credentials or network access.
+
+Recordings are JSON (see RecordedSession.load); RecordedSession.from_messages
+turns a live session's ``Session.model_messages`` into one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    ToolCallPart,
+    UserPromptPart,
+)
+from pydantic_ai.models.function import AgentInfo, DeltaToolCall, DeltaToolCalls, FunctionModel
+
+from jdo.exceptions import AIError
+
+# Chunk size used when a recording is built from messages without stream timings
+DEFAULT_CHUNK_CHARS = 12
+
+Sleep = Callable[[float], Awaitable[None]]
+
+
+class ReplayError(AIError):
+    """The agent asked for more responses than the recording holds, or went off script."""
+
+
+class RecordedToolCall(BaseModel):
+    """A tool call the model made."""
+
+    tool_name: str
+    args: dict[str, Any] = Field(default_factory=dict)
+
+
+class RecordedResponse(BaseModel):
+    """One model response: streamed text chunks and/or tool calls.
+
+    Attributes:
+        chunks: Text in the chunks the provider streamed it in.
+        tool_calls: Tool calls, sent after any text.
+        first_token_delay: Seconds before the first chunk (or tool call).
+        chunk_delays: Seconds before each later chunk (missing entries are 0).
+    """
+
+    chunks: list[str] = Field(default_factory=list)
+    tool_calls: list[RecordedToolCall] = Field(default_factory=list)
+    first_token_delay: float = 0.0
+    chunk_delays: list[float] = Field(default_factory=list)
+
+    @classmethod
+    def from_text(
+        cls,
+        text: str,
+        *,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+        first_token_delay: float = 0.0,
+        chunk_delay: float = 0.0,
+    ) -> RecordedResponse:
+        """Build a text response split into equal chunks.
+
+        Args:
+            text: The response text.
+            chunk_chars: Characters per chunk.
+            first_token_delay: Seconds before the first chunk.
+            chunk_delay: Seconds between chunks.
+
+        Returns:
+            The recorded response.
+        """
+        chunks = [text[i : i + chunk_chars] for i in range(0, len(text), chunk_chars)]
+        return cls(
+            chunks=chunks,
+            first_token_delay=first_token_delay,
+            chunk_delays=[chunk_delay] * max(len(chunks) - 1, 0),
+        )
+
+    @property
+    def text(self) -> str:
+        """The full response text."""
+        return "".join(self.chunks)
+
+
+class RecordedTurn(BaseModel):
+    """The model responses for one user message (one agent run).
+
+    Attributes:
+        user_input: The user's message; replay fails if the agent is sent another.
+        responses: Responses in order (tool-call rounds, then the final answer).
+    """
+
+    user_input: str
+    responses: list[RecordedResponse]
+
+
+class RecordedSession(BaseModel):
+    """A recorded conversation, one entry per AI turn."""
+
+    turns: list[RecordedTurn]
+
+    @classmethod
+    def load(cls, path: Path) -> RecordedSession:
+        """Load a recording from a JSON file.
+
+        Args:
+            path: Path to the recording.
+
+        Returns:
+            The recorded session.
+        """
+        return cls.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def save(self, path: Path) -> None:
+        """Write the recording as JSON.
+
+        Args:
+            path: Destination path.
+        """
+        path.write_text(self.model_dump_json(indent=2), encoding="utf-8")
+
+    @classmethod
+    def from_messages(
+        cls, messages: Sequence[ModelMessage], *, chunk_chars: int = DEFAULT_CHUNK_CHARS
+    ) -> RecordedSession:
+        """Build a recording from an agent's message history.
+
+        Message history has no stream timings, so text is split into
+        ``chunk_chars`` chunks with no delays; edit the JSON to add them.
+
+        Args:
+            messages: Messages from agent runs (e.g. ``Session.model_messages``).
+            chunk_chars: Characters per text chunk.
+
+        Returns:
+            The recorded session.
+        """
+        turns: list[RecordedTurn] = []
+        for message in messages:
+            if isinstance(message, ModelRequest):
+                prompt = _user_prompt(message)
+                if prompt is not None:
+                    turns.append(RecordedTurn(user_input=prompt, responses=[]))
+                continue
+            if not turns:
+                continue
+            text = "".join(part.content for part in message.parts if isinstance(part, TextPart))
+            response = RecordedResponse.from_text(text, chunk_chars=chunk_chars)
+            response.tool_calls = [
+                RecordedToolCall(tool_name=part.tool_name, args=part.args_as_dict())
+                for part in message.parts
+                if isinstance(part, ToolCallPart)
+            ]
+            turns[-1].responses.append(response)
+        return cls(turns=turns)
+
+
+def _user_prompt(message: ModelRequest) -> str | None:
+    """The user's text in a request (the first text of its user prompt), if any."""
+    for part in message.parts:
+        if isinstance(part, UserPromptPart):
+            content = part.content
+            if isinstance(content, str):
+                return content
+            return next((item for item in content if isinstance(item, str)), "")
+    return None
+
+
+class SessionReplayer:
+    """Serves a recording's responses, in order, as a PydanticAI model.
+
+    Each request that carries a user prompt starts the next recorded turn;
+    requests carrying tool results continue the current one.
+    """
+
+    def __init__(
+        self,
+        recording: RecordedSession,
+        *,
+        time_scale: float = 1.0,
+        sleep: Sleep = asyncio.sleep,
+    ) -> None:
+        """Initialize the replayer.
+
+        Args:
+            recording: The session to replay.
+            time_scale: Multiplier for recorded delays (0 replays without waiting).
+            sleep: Sleep function for delays.
+        """
+        self.recording = recording
+        self.time_scale = time_scale
+        self._sleep = sleep
+        self._turn = -1
+        self._step = 0
+
+    @property
+    def finished(self) -> bool:
+        """Whether every recorded response has been served."""
+        turns = self.recording.turns
+        return self._turn == len(turns) - 1 and self._step >= len(turns[-1].responses)
+
+    def model(self) -> FunctionModel:
+        """Create the model serving this recording."""
+        return FunctionModel(self._respond, stream_function=self._stream, model_name="replay")
+
+    def _next_response(self, messages: list[ModelMessage]) -> RecordedResponse:
+        prompt = _user_prompt(messages[-1]) if isinstance(messages[-1], ModelRequest) else None
+        if prompt is not None:
+            self._turn += 1
+            self._step = 0
+        if self._turn >= len(self.recording.turns):
+            msg = f"Recording has no turn {self._turn + 1} (sent {prompt!r})"
+            raise ReplayError(msg)
+        turn = self.recording.turns[self._turn]
+        if prompt is not None and not prompt.startswith(turn.user_input):
+            msg = f"Turn {self._turn + 1} expected {turn.user_input!r}, got {prompt!r}"
+            raise ReplayError(msg)
+        if self._step >= len(turn.responses):
+            msg = f"Turn {self._turn + 1} has no response {self._step + 1}"
+            raise ReplayError(msg)
+        response = turn.responses[self._step]
+        self._step += 1
+        return response
+
+    async def _wait(self, seconds: float) -> None:
+        if seconds > 0 and self.time_scale > 0:
+            await self._sleep(seconds * self.time_scale)
+
+    def _tool_call_id(self, index: int) -> str:
+        return f"replay-{self._turn}-{self._step}-{index}"
+
+    async def _respond(self, messages: list[ModelMessage], _info: AgentInfo) -> ModelResponse:
+        response = self._next_response(messages)
+        await self._wait(response.first_token_delay + sum(response.chunk_delays))
+        parts: list[TextPart | ToolCallPart] = []
+        if response.text:
+            parts.append(TextPart(content=response.text))
+        parts.extend(
+            ToolCallPart(call.tool_name, call.args, tool_call_id=self._tool_call_id(i))
+            for i, call in enumerate(response.tool_calls)
+        )
+        return ModelResponse(parts=parts, model_name="replay")
+
+    async def _stream(
+        self, messages: list[ModelMessage], _info: AgentInfo
+    ) -> AsyncIterator[str | DeltaToolCalls]:
+        response = self._next_response(messages)
+        await self._wait(response.first_token_delay)
+        for index, chunk in enumerate(response.chunks):
+            if index:
+                delays = response.chunk_delays
+                await self._wait(delays[index - 1] if index - 1 < len(delays) else 0.0)
+            yield chunk
+        if response.tool_calls:
+            yield {
+                i: DeltaToolCall(
+                    name=call.tool_name,
+                    json_args=json.dumps(call.args),
+                    tool_call_id=self._tool_call_id(i),
+                )
+                for i, call in enumerate(response.tool_calls)
+            }
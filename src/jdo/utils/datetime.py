@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import UTC, date, datetime, time
+from datetime import UTC, date, datetime, time, tzinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 DEFAULT_DUE_TIME = time(9, 0)
 DEFAULT_TIMEZONE = "America/New_York"
@@ -24,3 +25,36 @@ def today_date() -> date:
         Today's date.
     """
     return utc_now().date()
+
+
+def as_utc(moment: datetime) -> datetime:
+    """Treat a naive datetime as UTC (SQLite drops the zone on read).
+
+    Args:
+        moment: A naive UTC or timezone-aware datetime.
+
+    Returns:
+        A timezone-aware datetime.
+    """
+    return moment.replace(tzinfo=UTC) if moment.tzinfo is None else moment
+
+
+def deadline_utc(due_date: date, due_time: time | None, timezone: str) -> datetime:
+    """Convert a local deadline to a UTC instant.
+
+    Unknown timezone names fall back to UTC.
+
+    Args:
+        due_date: Local due date.
+        due_time: Local due time (None means DEFAULT_DUE_TIME).
+        timezone: IANA timezone name.
+
+    Returns:
+        The deadline as a timezone-aware UTC datetime.
+    """
+    try:
+        zone: tzinfo = ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        zone = UTC
+    local = datetime.combine(due_date, due_time or DEFAULT_DUE_TIME, tzinfo=zone)
+    return local.astimezone(UTC)
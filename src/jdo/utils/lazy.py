@@ -0,0 +1,67 @@
+"""Deferred imports for a fast CLI cold start.
+
+Importing the AI stack (pydantic_ai, provider SDKs), Alembic or the Sentry SDK
+takes a large share of a second. Most subcommands need none of them, so
+packages re-export their public names lazily and heavy third-party modules
+are loaded on first attribute access.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+from collections.abc import Callable, Mapping
+from types import ModuleType
+from typing import Any
+
+
+def lazy_exports(package: str, exports: Mapping[str, tuple[str, ...]]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` that imports re-exported names on first use.
+
+    Args:
+        package: ``__name__`` of the package doing the re-exporting.
+        exports: Names to re-export, keyed by the submodule defining them.
+
+    Returns:
+        A ``__getattr__`` function for the package (PEP 562).
+    """
+    owners = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = owners.get(name)
+        if module is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(importlib.import_module(module), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import a module whose body runs on first attribute access.
+
+    Args:
+        name: Absolute module name.
+
+    Returns:
+        The module (already loaded if it was imported before).
+
+    Raises:
+        ModuleNotFoundError: If the module cannot be found.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        msg = f"No module named {name!r}"
+        raise ModuleNotFoundError(msg, name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
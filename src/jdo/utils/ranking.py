@@ -0,0 +1,197 @@
+"""Local BM25 text ranking.
+
+Used to narrow linkage candidates (which vision a goal serves, which goal or
+milestone a commitment contributes to) before anything is sent to a model.
+Documents are tokenized once and kept in sparse term-count form; the index
+is updated incrementally as entities change instead of being rebuilt.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+
+# BM25 term-frequency saturation and length normalization
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# A top match resolves a link outright only if it scores at least this much...
+RESOLVE_MIN_SCORE = 1.0
+# ...and at least this many times the runner-up
+RESOLVE_MARGIN = 2.0
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Shorter terms are dropped; only longer terms are plural-stemmed
+MIN_TERM_LENGTH = 2
+MIN_STEM_LENGTH = 4
+
+STOPWORDS = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "i", "in",
+        "into", "is", "it", "me", "my", "of", "on", "or", "our", "so", "that", "the",
+        "this", "to", "we", "will", "with", "your",
+    }
+)  # fmt: skip
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lower-case terms with light plural stemming.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        Terms, without stopwords and single characters.
+    """
+    terms = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        if len(token) < MIN_TERM_LENGTH or token in STOPWORDS:
+            continue
+        term = token
+        if len(term) >= MIN_STEM_LENGTH and term.endswith("s") and not term.endswith("ss"):
+            term = term[:-3] + "y" if term.endswith("ies") else term[:-1]
+        terms.append(term)
+    return terms
+
+
+@dataclass(frozen=True)
+class RankedMatch:
+    """A document and its relevance score for a query.
+
+    Attributes:
+        key: Document key.
+        score: BM25 score (higher is more relevant).
+    """
+
+    key: Hashable
+    score: float
+
+
+class BM25Index:
+    """Incrementally maintained BM25 index over short documents."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._texts: dict[Hashable, str] = {}
+        self._counts: dict[Hashable, Counter[str]] = {}
+        self._lengths: dict[Hashable, int] = {}
+        self._df: Counter[str] = Counter()
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self._texts)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether a document key is indexed."""
+        return key in self._texts
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Add or update a document; unchanged text is a no-op.
+
+        Args:
+            key: Document key (e.g. entity id).
+            text: Document text.
+        """
+        if self._texts.get(key) == text:
+            return
+        self.remove(key)
+        counts = Counter(tokenize(text))
+        length = sum(counts.values())
+        self._texts[key] = text
+        self._counts[key] = counts
+        self._lengths[key] = length
+        self._df.update(counts.keys())
+        self._total_length += length
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a document if present.
+
+        Args:
+            key: Document key.
+        """
+        if key not in self._texts:
+            return
+        del self._texts[key]
+        counts = self._counts.pop(key)
+        self._total_length -= self._lengths.pop(key)
+        self._df.subtract(counts.keys())
+        for term in counts:
+            if self._df[term] <= 0:
+                del self._df[term]
+
+    def sync(self, documents: Mapping[Hashable, str]) -> None:
+        """Bring the index in line with the current documents.
+
+        Only new or changed documents are re-tokenized; missing ones are removed.
+
+        Args:
+            documents: Current document text by key.
+        """
+        for key in [k for k in self._texts if k not in documents]:
+            self.remove(key)
+        for key, text in documents.items():
+            self.add(key, text)
+
+    def rank(self, query: str, keys: Iterable[Hashable] | None = None) -> list[RankedMatch]:
+        """Score documents against a query.
+
+        Args:
+            query: Query text.
+            keys: Restrict scoring to these documents (default: all).
+
+        Returns:
+            Documents with a positive score, best first.
+        """
+        terms = set(tokenize(query))
+        if not terms or not self._texts:
+            return []
+
+        total = len(self._texts)
+        average_length = self._total_length / total or 1.0
+        idf = {
+            term: math.log(1 + (total - self._df[term] + 0.5) / (self._df[term] + 0.5))
+            for term in terms
+            if self._df[term]
+        }
+
+        matches = []
+        for key in self._texts if keys is None else keys:
+            counts = self._counts.get(key)
+            if not counts:
+                continue
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[key] / average_length)
+            score = sum(
+                weight * counts[term] * (BM25_K1 + 1) / (counts[term] + norm)
+                for term, weight in idf.items()
+                if counts[term]
+            )
+            if score > 0:
+                matches.append(RankedMatch(key=key, score=score))
+        matches.sort(key=lambda m: m.score, reverse=True)
+        return matches
+
+
+def is_unambiguous(
+    matches: list[RankedMatch],
+    *,
+    min_score: float = RESOLVE_MIN_SCORE,
+    margin: float = RESOLVE_MARGIN,
+) -> bool:
+    """Whether the top match is strong enough to resolve a link without asking.
+
+    Args:
+        matches: Ranked matches, best first.
+        min_score: Minimum score for the top match.
+        margin: Required ratio between the top match and the runner-up.
+
+    Returns:
+        True if the top match clearly wins.
+    """
+    if not matches or matches[0].score < min_score:
+        return False
+    return len(matches) == 1 or matches[0].score >= margin * matches[1].score
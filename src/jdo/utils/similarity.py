@@ -0,0 +1,167 @@
+"""MinHash near-duplicate index for short texts.
+
+Each text is reduced to its set of terms and a MinHash signature. Signatures
+are split into LSH bands so a lookup only compares against texts that share
+a band, then candidates are confirmed with exact Jaccard similarity. Adding
+or removing a text touches only that text's buckets.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import zlib
+from collections import defaultdict
+from collections.abc import Hashable
+
+from jdo.utils.ranking import tokenize
+
+# Signature length and LSH banding (bands * rows == permutations). Two-row
+# bands make texts with Jaccard similarity >= 0.5 near-certain candidates.
+MINHASH_PERMUTATIONS = 64
+LSH_ROWS_PER_BAND = 2
+LSH_BANDS = MINHASH_PERMUTATIONS // LSH_ROWS_PER_BAND
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def _coefficient(label: str) -> int:
+    """Derive a fixed hash coefficient so signatures are stable across runs."""
+    return int.from_bytes(hashlib.blake2b(label.encode(), digest_size=8).digest(), "big")
+
+
+_PERMUTATIONS = tuple(
+    (_coefficient(f"a{i}") % (_MERSENNE_PRIME - 1) + 1, _coefficient(f"b{i}") % _MERSENNE_PRIME)
+    for i in range(MINHASH_PERMUTATIONS)
+)
+
+
+def term_set(text: str) -> frozenset[str]:
+    """Get the set of terms compared for near-duplicate detection.
+
+    Args:
+        text: Text to reduce.
+
+    Returns:
+        Distinct terms (see jdo.utils.ranking.tokenize).
+    """
+    return frozenset(tokenize(text))
+
+
+def jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    """Jaccard similarity of two term sets.
+
+    Args:
+        left: First term set.
+        right: Second term set.
+
+    Returns:
+        Size of the intersection over size of the union (0.0 when both are empty).
+    """
+    if not left and not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+def minhash_signature(terms: frozenset[str]) -> tuple[int, ...]:
+    """Compute the MinHash signature of a term set.
+
+    Args:
+        terms: Non-empty term set.
+
+    Returns:
+        MINHASH_PERMUTATIONS minimum hash values.
+    """
+    hashes = [zlib.crc32(term.encode()) for term in terms]
+    return tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def _bands(signature: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+    return [
+        (band, signature[band * LSH_ROWS_PER_BAND : (band + 1) * LSH_ROWS_PER_BAND])
+        for band in range(LSH_BANDS)
+    ]
+
+
+class NearDuplicateIndex:
+    """Incrementally maintained MinHash/LSH index of short texts."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._terms: dict[Hashable, frozenset[str]] = {}
+        self._signatures: dict[Hashable, tuple[int, ...]] = {}
+        self._buckets: defaultdict[tuple[int, tuple[int, ...]], set[Hashable]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        """Number of indexed texts."""
+        return len(self._terms)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether a key is indexed."""
+        return key in self._terms
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Add or replace the text for a key.
+
+        Texts without any terms are not indexed.
+
+        Args:
+            key: Entry key.
+            text: Text to index.
+        """
+        terms = term_set(text)
+        if self._terms.get(key) == terms:
+            return
+        self.remove(key)
+        if not terms:
+            return
+        signature = minhash_signature(terms)
+        self._terms[key] = terms
+        self._signatures[key] = signature
+        for band in _bands(signature):
+            self._buckets[band].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a key if present.
+
+        Args:
+            key: Entry key.
+        """
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        del self._terms[key]
+        for band in _bands(signature):
+            bucket = self._buckets[band]
+            bucket.discard(key)
+            if not bucket:
+                del self._buckets[band]
+
+    def query(
+        self,
+        text: str,
+        threshold: float,
+        *,
+        exclude: Hashable | None = None,
+    ) -> list[tuple[Hashable, float]]:
+        """Find indexed texts similar to ``text``.
+
+        Args:
+            text: Text to look up.
+            threshold: Minimum Jaccard similarity.
+            exclude: Key to leave out (e.g. the text's own entry).
+
+        Returns:
+            (key, similarity) pairs, most similar first.
+        """
+        terms = term_set(text)
+        if not terms:
+            return []
+        candidates: set[Hashable] = set()
+        for band in _bands(minhash_signature(terms)):
+            candidates |= self._buckets.get(band, set())
+        candidates.discard(exclude)
+
+        matches = [(key, jaccard(terms, self._terms[key])) for key in candidates]
+        matches = [(key, score) for key, score in matches if score >= threshold]
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
@@ -0,0 +1 @@
+"""AI provider integration tests (local stub servers)."""
@@ -0,0 +1,155 @@
+"""Routing tests against local stub OpenAI-compatible HTTP servers."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from openai import AsyncOpenAI
+from pydantic_ai import Agent
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.providers.openai import OpenAIProvider
+
+from jdo.ai.routing import CircuitState, ModelRouter, Route, RoutedModel
+
+
+@dataclass
+class StubBehavior:
+    """How a stub server answers chat completion requests."""
+
+    text: str = "ok"
+    first_token_delay: float = 0.0
+    status: int = 200
+    requests: int = 0
+
+
+def _chunk(content: str | None, finish_reason: str | None = None) -> bytes:
+    delta = {"role": "assistant", "content": content} if content is not None else {}
+    payload = {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "stub",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return f"data: {json.dumps(payload)}\n\n".encode()
+
+
+def _handler(behavior: StubBehavior) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+        def do_POST(self) -> None:
+            behavior.requests += 1
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if behavior.status != 200:
+                body = b'{"error": {"message": "stub failure"}}'
+                self.send_response(behavior.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.flush()
+            try:
+                time.sleep(behavior.first_token_delay)
+                self.wfile.write(_chunk(behavior.text))
+                self.wfile.write(_chunk(None, "stop"))
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # Client cancelled (hedge lost)
+
+    return Handler
+
+
+@pytest.fixture
+def stub_server() -> Iterator:
+    """Start stub servers on demand; returns (behavior, model) pairs."""
+    servers: list[ThreadingHTTPServer] = []
+
+    def start(behavior: StubBehavior) -> OpenAIChatModel:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(behavior))
+        server.daemon_threads = True
+        servers.append(server)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = AsyncOpenAI(
+            base_url=f"http://127.0.0.1:{server.server_port}/v1",
+            api_key="test-key-123456",
+            max_retries=0,
+        )
+        return OpenAIChatModel("stub", provider=OpenAIProvider(openai_client=client))
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+async def _stream_text(model: RoutedModel) -> str:
+    agent = Agent(model)
+    async with agent.run_stream("hi") as result:
+        return "".join([chunk async for chunk in result.stream_text(delta=True)])
+
+
+class TestRoutingOverHttp:
+    """End-to-end routing through real HTTP streams."""
+
+    async def test_fails_over_and_opens_circuit(self, stub_server) -> None:
+        broken = StubBehavior(status=500)
+        healthy = StubBehavior(text="from backup", first_token_delay=0.2)
+        primary = Route("broken", stub_server(broken))
+        backup = Route("backup", stub_server(healthy))
+        model = RoutedModel(ModelRouter([primary, backup]))
+        # The primary has been fast, so it stays ahead of the (measured) backup
+        # until its circuit opens
+        for _ in range(5):
+            primary.stats.record_latency(0.01)
+
+        for _ in range(4):  # the untried backup is measured first
+            assert await _stream_text(model) == "from backup"
+
+        assert broken.requests == 3
+        assert primary.breaker.state == CircuitState.OPEN
+        assert await _stream_text(model) == "from backup"
+        assert broken.requests == 3  # Open circuit: no further requests
+        assert backup.stats.error_rate == 0.0
+
+    async def test_prefers_faster_route(self, stub_server) -> None:
+        slow = Route("slow", stub_server(StubBehavior(text="slow", first_token_delay=0.3)))
+        fast = Route("fast", stub_server(StubBehavior(text="fast")))
+        model = RoutedModel(ModelRouter([slow, fast], hedge=False))
+
+        assert await _stream_text(model) == "slow"  # configured order first
+        assert await _stream_text(model) == "fast"  # untried route gets measured
+        assert await _stream_text(model) == "fast"  # then the faster one wins
+        assert fast.stats.median_latency < slow.stats.median_latency
+
+    async def test_hedges_slow_first_token(self, stub_server) -> None:
+        primary_behavior = StubBehavior(text="primary")
+        primary = Route("primary", stub_server(primary_behavior))
+        backup = Route("backup", stub_server(StubBehavior(text="backup")))
+        router = ModelRouter([primary, backup])
+        model = RoutedModel(router)
+        for _ in range(5):
+            primary.stats.record_latency(0.01)
+        backup.stats.record_latency(5.0)  # Looks slow, so only used as a hedge
+
+        primary_behavior.first_token_delay = 2.0
+        started = time.perf_counter()
+        text = await _stream_text(model)
+
+        assert text == "backup"
+        assert time.perf_counter() - started < 1.5
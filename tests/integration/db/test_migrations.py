@@ -80,14 +80,14 @@ class TestCreateDbAndTables:
 class TestMigrationCommands:
     """Tests for migration command functions."""
 
-    @patch("jdo.db.migrations.command")
+    @patch("alembic.command")
     def test_get_migration_status_calls_current(self, mock_command: MagicMock) -> None:
         """get_migration_status calls alembic current command."""
         get_migration_status()
 
         mock_command.current.assert_called_once()
 
-    @patch("jdo.db.migrations.command")
+    @patch("alembic.command")
     def test_upgrade_database_calls_upgrade(self, mock_command: MagicMock) -> None:
         """upgrade_database calls alembic upgrade command."""
         upgrade_database("head")
@@ -96,7 +96,7 @@ class TestMigrationCommands:
         call_args = mock_command.upgrade.call_args
         assert call_args[0][1] == "head"  # Second arg is revision
 
-    @patch("jdo.db.migrations.command")
+    @patch("alembic.command")
     def test_downgrade_database_calls_downgrade(self, mock_command: MagicMock) -> None:
         """downgrade_database calls alembic downgrade command."""
         downgrade_database("-1")
@@ -105,7 +105,7 @@ class TestMigrationCommands:
         call_args = mock_command.downgrade.call_args
         assert call_args[0][1] == "-1"
 
-    @patch("jdo.db.migrations.command")
+    @patch("alembic.command")
     def test_create_revision_calls_revision(self, mock_command: MagicMock) -> None:
         """create_revision calls alembic revision command."""
         create_revision("test migration", autogenerate=True)
@@ -453,3 +453,101 @@ class TestRecurringGenerationTriggers:
         # Verify the generated one has recurring link
         recurring_instance = next(c for c in all_commitments if c.deliverable == "Daily standup")
         assert recurring_instance.recurring_commitment_id is not None
+
+
+@pytest.mark.integration
+class TestBatchedGeneration:
+    """Tests for indexed, batched recurring instance generation."""
+
+    def test_catches_up_missed_instances_in_one_call(
+        self, db_session_with_tables: Session, stakeholder: Stakeholder
+    ) -> None:
+        """A daily habit left for two weeks gets every missed instance at once."""
+        session = db_session_with_tables
+        current_date = datetime(2025, 3, 15, 12, tzinfo=UTC)
+        recurring = RecurringCommitment(
+            deliverable_template="Daily journal",
+            stakeholder_id=stakeholder.id,
+            recurrence_type=RecurrenceType.DAILY,
+            last_generated_date=date(2025, 3, 1),
+            instances_generated=1,
+        )
+        session.add(recurring)
+        session.commit()
+
+        generated = check_and_generate_recurring_instances(session, current_date)
+        session.commit()
+
+        due_dates = [commitment.due_date for commitment, _ in generated]
+        assert due_dates == [date(2025, 3, day) for day in range(2, 16)]
+        session.refresh(recurring)
+        assert recurring.instances_generated == 15
+        assert recurring.last_generated_date == date(2025, 3, 15)
+        assert recurring.next_due_date == date(2025, 3, 16)
+
+    def test_repeated_calls_on_the_same_day_do_nothing(
+        self, db_session_with_tables: Session, stakeholder: Stakeholder
+    ) -> None:
+        """The per-day marker stops a second view from generating tomorrow's instance."""
+        session = db_session_with_tables
+        current_date = datetime(2025, 3, 15, 12, tzinfo=UTC)
+        recurring = RecurringCommitment(
+            deliverable_template="Daily standup",
+            stakeholder_id=stakeholder.id,
+            recurrence_type=RecurrenceType.DAILY,
+        )
+        session.add(recurring)
+        session.commit()
+
+        assert len(check_and_generate_recurring_instances(session, current_date)) == 1
+        session.commit()
+        assert check_and_generate_recurring_instances(session, current_date) == []
+
+        # The next day generates again
+        next_day = current_date + timedelta(days=1)
+        generated = check_and_generate_recurring_instances(session, next_day)
+        assert [commitment.due_date for commitment, _ in generated] == [date(2025, 3, 16)]
+
+    def test_templates_outside_the_window_are_not_selected(
+        self, db_session_with_tables: Session, stakeholder: Stakeholder
+    ) -> None:
+        """The range query skips templates whose next instance is far off."""
+        from jdo.db.session import get_recurring_commitments_due
+
+        session = db_session_with_tables
+        monthly = RecurringCommitment(
+            deliverable_template="Monthly invoice",
+            stakeholder_id=stakeholder.id,
+            recurrence_type=RecurrenceType.MONTHLY,
+            day_of_month=1,
+            last_generated_date=date(2025, 3, 1),
+            instances_generated=1,
+        )
+        session.add(monthly)
+        session.commit()
+
+        assert monthly.next_due_date == date(2025, 4, 1)
+        assert get_recurring_commitments_due(session, date(2025, 3, 15)) == []
+        assert get_recurring_commitments_due(session, date(2025, 3, 28)) == [monthly]
+
+    def test_next_due_date_follows_pattern_edits(
+        self, db_session_with_tables: Session, stakeholder: Stakeholder
+    ) -> None:
+        """Changing the pattern recomputes the stored next due date."""
+        session = db_session_with_tables
+        weekly = RecurringCommitment(
+            deliverable_template="Weekly review",
+            stakeholder_id=stakeholder.id,
+            recurrence_type=RecurrenceType.WEEKLY,
+            days_of_week=[0],
+            last_generated_date=date(2025, 3, 3),  # Monday
+            instances_generated=1,
+        )
+        session.add(weekly)
+        session.commit()
+        assert weekly.next_due_date == date(2025, 3, 10)
+
+        weekly.days_of_week = [4]
+        session.commit()
+
+        assert weekly.next_due_date == date(2025, 3, 7)
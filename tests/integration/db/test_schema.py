@@ -0,0 +1,165 @@
+"""Integration tests for the startup schema check."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, inspect, text
+from sqlmodel import Session, select
+
+from jdo.db.engine import get_engine, reset_engine
+from jdo.db.migrations import create_db_and_tables, get_alembic_config
+from jdo.db.schema import (
+    LEGACY_BASELINE_REVISION,
+    SCHEMA_REVISION,
+    ensure_schema,
+    expected_user_version,
+    read_user_version,
+    schema_fingerprint,
+)
+
+
+@pytest.fixture
+def fresh_database(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    """Point settings and the engine at an empty database file."""
+    from jdo.config.settings import reset_settings
+
+    db_path = tmp_path / "schema_test.db"
+    monkeypatch.setenv("JDO_DATABASE_PATH", str(db_path))
+    reset_settings()
+    reset_engine()
+
+    yield db_path
+
+    reset_engine()
+    reset_settings()
+
+
+def _revision() -> str:
+    with get_engine().connect() as connection:
+        return connection.execute(text("SELECT version_num FROM alembic_version")).scalar_one()
+
+
+def _meta() -> dict[str, str]:
+    with get_engine().connect() as connection:
+        return dict(connection.execute(text("SELECT key, value FROM jdo_meta")).all())
+
+
+class TestSchemaRevision:
+    """Tests for SCHEMA_REVISION and the fingerprint."""
+
+    def test_revision_is_alembic_head(self) -> None:
+        """SCHEMA_REVISION names the newest migration."""
+        from alembic.script import ScriptDirectory
+
+        assert ScriptDirectory.from_config(get_alembic_config()).get_current_head() == (
+            SCHEMA_REVISION
+        )
+
+    def test_fingerprint_tracks_ddl(self) -> None:
+        """The fingerprint is stable and changes with any column."""
+        metadata = MetaData()
+        table = Table("things", metadata, Column("id", Integer, primary_key=True))
+        before = schema_fingerprint(metadata)
+
+        assert schema_fingerprint(metadata) == before
+        table.append_column(Column("size", Integer))
+        assert schema_fingerprint(metadata) != before
+
+
+class TestEnsureSchema:
+    """Tests for ensure_schema."""
+
+    def test_new_database_is_created_and_stamped(self, fresh_database: Path) -> None:
+        """An empty database gets every table, the head revision and the meta rows."""
+        assert ensure_schema() is True
+
+        assert {"commitments", "jdo_meta"} <= set(inspect(get_engine()).get_table_names())
+        assert _revision() == SCHEMA_REVISION
+        assert _meta()["schema_revision"] == SCHEMA_REVISION
+        assert _meta()["schema_fingerprint"] == schema_fingerprint()
+        with get_engine().connect() as connection:
+            assert read_user_version(connection) == expected_user_version()
+
+    def test_matching_database_is_left_alone(self, fresh_database: Path) -> None:
+        """Once recorded, later launches only read the pragma."""
+        ensure_schema()
+
+        with (
+            patch("jdo.db.schema.create_db_and_tables") as mock_create,
+            patch("jdo.db.schema.inspect") as mock_inspect,
+        ):
+            assert ensure_schema() is False
+
+        mock_create.assert_not_called()
+        mock_inspect.assert_not_called()
+
+    def test_older_revision_is_migrated(self, fresh_database: Path) -> None:
+        """A database at an older revision has its pending migrations applied."""
+        ensure_schema()
+        with get_engine().begin() as connection:
+            connection.execute(text("DROP TABLE jdo_meta"))
+            connection.execute(text("UPDATE alembic_version SET version_num = 'e18b6f3a9c70'"))
+            connection.execute(text("PRAGMA user_version = 0"))
+
+        assert ensure_schema() is True
+
+        assert _revision() == SCHEMA_REVISION
+        assert _meta()["schema_revision"] == SCHEMA_REVISION
+
+    def test_unversioned_current_database_is_stamped(self, fresh_database: Path) -> None:
+        """A database made by this release's create_all keeps its data and is stamped at head."""
+        create_db_and_tables()
+        with get_engine().begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO stakeholders (id, name, type, created_at, updated_at) "
+                    "VALUES ('0123456789abcdef0123456789abcdef', 'Sarah', 'PERSON', "
+                    "'2026-01-01', '2026-01-01')"
+                )
+            )
+
+        assert ensure_schema() is True
+
+        assert _revision() == SCHEMA_REVISION
+        with get_engine().connect() as connection:
+            assert connection.execute(text("SELECT name FROM stakeholders")).scalar() == "Sarah"
+
+    def test_legacy_database_is_migrated(self, fresh_database: Path) -> None:
+        """A database an older release built with create_all gets the new columns."""
+        from alembic import command
+
+        from jdo.models import Commitment
+
+        # The schema older releases created, with no migration history recorded
+        command.upgrade(get_alembic_config(configure_logging=False), LEGACY_BASELINE_REVISION)
+        with get_engine().begin() as connection:
+            connection.execute(text("DROP TABLE alembic_version"))
+            connection.execute(
+                text(
+                    "INSERT INTO stakeholders (id, name, type, created_at, updated_at) "
+                    "VALUES ('0123456789abcdef0123456789abcdef', 'Sarah', 'PERSON', "
+                    "'2026-01-01', '2026-01-01')"
+                )
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO commitments (id, deliverable, stakeholder_id, due_date, "
+                    "due_time, timezone, status, created_at, updated_at) "
+                    "VALUES ('fedcba9876543210fedcba9876543210', 'Report', "
+                    "'0123456789abcdef0123456789abcdef', '2026-03-02', '09:00:00.000000', "
+                    "'UTC', 'PENDING', '2026-01-01', '2026-01-01')"
+                )
+            )
+
+        assert ensure_schema() is True
+
+        assert _revision() == SCHEMA_REVISION
+        with Session(get_engine()) as session:
+            commitment = session.exec(select(Commitment)).one()
+        assert commitment.deliverable == "Report"
+        assert commitment.due_at is not None
+        assert commitment.due_at.isoformat().startswith("2026-03-02T09:00")
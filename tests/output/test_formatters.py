@@ -11,6 +11,7 @@ from rich.table import Table
 from jdo.models.commitment import Commitment, CommitmentStatus
 from jdo.output.formatters import (
     STATUS_COLORS,
+    format_batch_proposal,
     format_commitment_detail,
     format_commitment_list,
     format_commitment_list_plain,
@@ -21,6 +22,7 @@ from jdo.output.formatters import (
     format_error,
     format_milestones_plain,
     format_overdue_commitments_plain,
+    format_plan_proposal,
     format_relative_date,
     format_success,
     format_visions_plain,
@@ -539,3 +541,66 @@ class TestFormatCommitmentSummary:
         )
         content = str(result.renderable)
         assert "Next" not in content
+
+
+class TestFormatPlanProposal:
+    """Tests for plan proposal formatting."""
+
+    def test_lists_commitments_tasks_links_and_recurring(self):
+        """Panel shows every entity in the plan with one confirmation prompt."""
+        plan = {
+            "commitments": [
+                {
+                    "deliverable": "Pitch deck",
+                    "stakeholder": "Sarah",
+                    "due_date": "2025-12-20",
+                    "due_time": "15:00:00",
+                    "goal_id": "goal-1",
+                    "tasks": [{"title": "Outline", "estimated_hours": 1.5}],
+                }
+            ],
+            "recurring_commitments": [
+                {
+                    "deliverable_template": "Status update",
+                    "stakeholder_name": "Team",
+                    "recurrence_type": "weekly",
+                }
+            ],
+        }
+
+        panel = format_plan_proposal(plan, link_titles={"goal-1": "Grow revenue"})
+
+        content = str(panel.renderable)
+        assert "1. Pitch deck for Sarah, due 2025-12-20 at 15:00" in content
+        assert "Goal: Grow revenue" in content
+        assert "- Outline (1.5h)" in content
+        assert "Recurring: Status update for Team (weekly)" in content
+        assert "1 commitment(s), 1 task(s), 1 recurring" in content
+        assert content.count("Does this look right?") == 1
+
+
+class TestFormatBatchProposal:
+    """Tests for the batch confirmation table."""
+
+    def test_rows_for_commitments_tasks_and_failures(self):
+        """Commitments, their tasks and failed items each get a row."""
+        plan = {
+            "commitments": [
+                {
+                    "deliverable": "Report",
+                    "stakeholder": "Sarah",
+                    "due_date": "2025-12-20",
+                    "tasks": [{"title": "Gather numbers"}],
+                }
+            ]
+        }
+
+        table = format_batch_proposal(plan, [("Slides for Bob", "timed out")])
+
+        assert isinstance(table, Table)
+        assert table.row_count == 3
+        assert list(table.columns[1].cells) == [
+            "Report",
+            "  - Gather numbers",
+            "Slides for Bob (timed out)",
+        ]
@@ -1,6 +1,8 @@
 """Tests for AI integration in the REPL loop."""
 
 import asyncio
+import os
+import signal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -29,6 +31,12 @@ class TestProcessAiInput:
         """Create a test session."""
         return Session()
 
+    @pytest.fixture(autouse=True)
+    def turn_context(self):
+        """Avoid building the state snapshot from the real database."""
+        with patch("jdo.repl.loop._build_turn_context", return_value="## Current Context"):
+            yield
+
     async def test_returns_response_text(self, mock_agent, mock_deps, session):
         """Returns the complete response text."""
 
@@ -38,7 +46,7 @@ class TestProcessAiInput:
                 yield chunk
 
         with (
-            patch("jdo.repl.loop.stream_response", mock_stream),
+            patch("jdo.ai.context.stream_response", mock_stream),
             patch("jdo.repl.loop.console"),  # Suppress console output
         ):
             result = await process_ai_input(
@@ -59,7 +67,7 @@ class TestProcessAiInput:
             yield  # Make it a generator
 
         with (
-            patch("jdo.repl.loop.stream_response", mock_stream),
+            patch("jdo.ai.context.stream_response", mock_stream),
             patch("jdo.repl.loop.console"),
         ):
             result = await process_ai_input(
@@ -79,7 +87,7 @@ class TestProcessAiInput:
             yield  # Make it a generator
 
         with (
-            patch("jdo.repl.loop.stream_response", mock_stream),
+            patch("jdo.ai.context.stream_response", mock_stream),
             patch("jdo.repl.loop.console"),
         ):
             result = await process_ai_input(
@@ -103,7 +111,7 @@ class TestProcessAiInput:
             yield "Response"
 
         with (
-            patch("jdo.repl.loop.stream_response", mock_stream),
+            patch("jdo.ai.context.stream_response", mock_stream),
             patch("jdo.repl.loop.console"),
         ):
             await process_ai_input(
@@ -116,6 +124,75 @@ class TestProcessAiInput:
         assert "message_history" in captured_kwargs
         assert len(captured_kwargs["message_history"]) == 2
 
+    async def test_records_native_history_on_completion(self, mock_agent, mock_deps, session):
+        """Messages reported by the completed run are stored on the session."""
+        from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+
+        run_messages = [
+            ModelRequest(parts=[UserPromptPart(content="test input")]),
+            ModelResponse(parts=[TextPart(content="Response")]),
+        ]
+        captured_kwargs = {}
+
+        async def mock_stream(*args, **kwargs):
+            captured_kwargs.update(kwargs)
+            yield "Response"
+            kwargs["on_complete"](run_messages)
+
+        with (
+            patch("jdo.ai.context.stream_response", mock_stream),
+            patch("jdo.repl.loop.console"),
+        ):
+            await process_ai_input("test input", mock_agent, mock_deps, session)
+
+        assert captured_kwargs["model_history"] == []
+        assert captured_kwargs["context"] == "## Current Context"
+        assert list(session.model_messages) == run_messages
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGINT") or os.name == "nt", reason="POSIX only")
+    async def test_ctrl_c_interrupts_stream_and_keeps_partial(self, mock_agent, mock_deps, session):
+        """Ctrl+C while streaming cancels the response, not the REPL."""
+        from jdo.ai.context import INTERRUPTED_MARKER
+
+        async def mock_stream(*args, **kwargs):
+            yield "Partial answer"
+            os.kill(os.getpid(), signal.SIGINT)
+            await asyncio.sleep(10)
+            yield " never shown"
+
+        previous = signal.getsignal(signal.SIGINT)
+        with (
+            patch("jdo.ai.context.stream_response", mock_stream),
+            patch("jdo.repl.loop.console"),
+        ):
+            result = await asyncio.wait_for(
+                process_ai_input("test input", mock_agent, mock_deps, session), timeout=5
+            )
+
+        assert result == f"Partial answer\n\n{INTERRUPTED_MARKER}"
+        assert signal.getsignal(signal.SIGINT) is previous
+
+    async def test_outer_cancellation_is_not_swallowed(self, mock_agent, mock_deps, session):
+        """Cancelling the caller still propagates instead of returning a partial."""
+        streaming = asyncio.Event()
+
+        async def mock_stream(*args, **kwargs):
+            yield "Partial"
+            streaming.set()
+            await asyncio.sleep(10)
+
+        with (
+            patch("jdo.ai.context.stream_response", mock_stream),
+            patch("jdo.repl.loop.console"),
+        ):
+            task = asyncio.create_task(
+                process_ai_input("test input", mock_agent, mock_deps, session)
+            )
+            await asyncio.wait_for(streaming.wait(), timeout=5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
     async def test_empty_response_clears_thinking_indicator(self, mock_agent, mock_deps, session):
         """Clears thinking indicator even when no chunks received."""
 
@@ -126,7 +203,7 @@ class TestProcessAiInput:
 
         mock_console = MagicMock()
         with (
-            patch("jdo.repl.loop.stream_response", mock_stream),
+            patch("jdo.ai.context.stream_response", mock_stream),
             patch("jdo.repl.loop.console", mock_console),
         ):
             await process_ai_input(
@@ -71,6 +71,52 @@ class TestConfirmDraft:
         assert result is True
         mock_db_session.commit.assert_not_called()
 
+    def test_confirm_draft_with_plan_commits_once(
+        self, mock_db_session: MagicMock, mock_persistence: MagicMock
+    ) -> None:
+        """A confirmed plan is saved with one commit."""
+        mock_commitment = MagicMock()
+        mock_commitment.id = uuid4()
+        mock_commitment.deliverable = "Report"
+        mock_persistence.save_plan.return_value = MagicMock(
+            commitments=[mock_commitment], tasks=[MagicMock()], recurring_commitments=[]
+        )
+        data = {"commitments": [{"deliverable": "Report"}]}
+        draft = PendingDraft(action="create", entity_type="plan", data=data)
+        session = Session()
+
+        with (
+            patch("jdo.repl.loop.PersistenceService", return_value=mock_persistence),
+            patch("jdo.repl.loop._get_active_commitment_count", return_value=1),
+        ):
+            result = _confirm_draft(draft, session, mock_db_session)
+
+        assert result is True
+        mock_persistence.save_plan.assert_called_once_with(data)
+        mock_db_session.commit.assert_called_once()
+        assert session.pending_draft is None
+
+    def test_confirm_draft_with_invalid_plan_rolls_back(
+        self, mock_db_session: MagicMock, mock_persistence: MagicMock
+    ) -> None:
+        """An invalid plan is rolled back and the draft kept for refinement."""
+        from jdo.db.persistence import ValidationError
+
+        mock_persistence.save_plan.side_effect = ValidationError(
+            "Missing required fields: due_date"
+        )
+        draft = PendingDraft(action="create", entity_type="plan", data={"commitments": [{}]})
+        session = Session()
+        session.pending_draft = draft
+
+        with patch("jdo.repl.loop.PersistenceService", return_value=mock_persistence):
+            result = _confirm_draft(draft, session, mock_db_session)
+
+        assert result is True
+        mock_db_session.commit.assert_not_called()
+        mock_db_session.rollback.assert_called_once()
+        assert session.pending_draft is draft
+
     def test_confirm_draft_unknown_entity_type(self, mock_db_session: MagicMock) -> None:
         """Test handling of unknown entity type in draft."""
         draft = PendingDraft(action="create", entity_type="unknown", data={"some": "data"})
@@ -154,3 +200,120 @@ class TestHandleConfirmation:
 
         assert result is True
         assert session.pending_draft is None
+
+
+class TestSpeculativeConfirmation:
+    """Tests for saving a speculatively extracted plan on "yes"."""
+
+    PROPOSAL = (
+        "I'll create this commitment:\n\n  Deliverable: Quarterly report\n"
+        "  Stakeholder: Sarah\n  Due: Friday\n\nDoes this look right? (yes/no/refine)"
+    )
+
+    @pytest.fixture
+    def plan(self):
+        """A plan with one commitment."""
+        from jdo.ai.extraction import ExtractedPlan, ExtractedPlanCommitment
+
+        return ExtractedPlan(
+            commitments=[
+                ExtractedPlanCommitment(
+                    deliverable="Quarterly report",
+                    stakeholder_name="Sarah",
+                    due_date=date(2025, 1, 17),
+                )
+            ]
+        )
+
+    @pytest.fixture
+    def repl(self, plan):
+        """Patch the REPL's AI, persistence and display around _process_user_input."""
+        from pydantic_ai.usage import RunUsage
+
+        calls: list[list[dict[str, str]]] = []
+
+        async def fake_extract_plan(messages, model, *, link_candidates=(), usage=None):
+            calls.append(messages)
+            usage.incr(RunUsage(input_tokens=300, output_tokens=40))
+            return plan
+
+        saved = MagicMock(recurring_commitments=[], tasks=[])
+        saved.commitments = [MagicMock(id=uuid4(), deliverable="Quarterly report")]
+        persistence = MagicMock()
+        persistence.save_plan.return_value = saved
+        process_ai_input = MagicMock(side_effect=self._ai_reply)
+        with (
+            patch("jdo.repl.loop.console"),
+            patch("jdo.repl.loop._show_dashboard"),
+            patch("jdo.repl.loop._update_dashboard_cache"),
+            patch("jdo.repl.loop.get_settings", return_value=MagicMock()),
+            patch("jdo.repl.loop.get_model_identifier", return_value="test"),
+            patch("jdo.ai.linkage.select_link_candidates", return_value=MagicMock(resolved=None)),
+            patch("jdo.ai.extraction.extract_plan", fake_extract_plan),
+            patch("jdo.repl.loop.PersistenceService", return_value=persistence),
+            patch("jdo.repl.loop.process_ai_input", process_ai_input),
+        ):
+            yield MagicMock(extract_calls=calls, persistence=persistence, ai=process_ai_input)
+
+    async def _ai_reply(self, user_input, agent, deps, session):
+        return self.PROPOSAL if "report" in user_input.lower() else "Sure."
+
+    async def test_yes_saves_speculated_plan_without_ai_turn(self, repl) -> None:
+        from jdo.repl.loop import _process_user_input
+
+        session = Session()
+        db_session = MagicMock()
+        await _process_user_input("Report to Sarah by Friday", session, db_session, None, None)
+        assert session.speculation.active
+
+        await _process_user_input("yes", session, db_session, None, None)
+
+        assert repl.ai.call_count == 1
+        assert repl.extract_calls[0][-1]["content"] == self.PROPOSAL
+        repl.persistence.save_plan.assert_called_once()
+        db_session.commit.assert_called_once()
+        assert session.message_history[-1] == {
+            "role": "assistant",
+            "content": "Saved: Quarterly report",
+        }
+        assert len(session.model_messages) == 2
+        assert session.speculation.stats.hits == 1
+        assert session.speculation.stats.used_tokens == 340
+        assert session.speculation.stats.hit_rate == 1.0
+
+    async def test_changing_course_cancels_speculation(self, repl) -> None:
+        from jdo.repl.loop import _process_user_input
+
+        session = Session()
+        await _process_user_input("Report to Sarah by Friday", session, MagicMock(), None, None)
+
+        await _process_user_input("actually make it Monday", session, MagicMock(), None, None)
+
+        assert repl.ai.call_count == 2
+        repl.persistence.save_plan.assert_not_called()
+        assert session.speculation.stats.cancelled == 1
+        assert session.speculation.stats.hit_rate == 0.0
+
+    async def test_empty_speculation_falls_back_to_ai(self, repl, plan) -> None:
+        from jdo.repl.loop import _process_user_input
+
+        plan.commitments.clear()
+        session = Session()
+        await _process_user_input("Report to Sarah by Friday", session, MagicMock(), None, None)
+
+        await _process_user_input("yes", session, MagicMock(), None, None)
+
+        assert repl.ai.call_count == 2
+        repl.persistence.save_plan.assert_not_called()
+        assert session.speculation.stats.misses == 1
+        assert session.speculation.stats.wasted_tokens == 340
+
+    async def test_disabled_by_default(self, repl) -> None:
+        from jdo.config.settings import JDOSettings
+        from jdo.repl.loop import _process_user_input
+
+        session = Session()
+        with patch("jdo.repl.loop.get_settings", return_value=JDOSettings()):
+            await _process_user_input("Report to Sarah by Friday", session, MagicMock(), None, None)
+
+        assert not session.speculation.active
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from prompt_toolkit.formatted_text import HTML
+from sqlmodel import select
 
 from jdo.repl.loop import (
     FIRST_RUN_MESSAGE,
@@ -30,7 +31,7 @@ class TestSessionBasics:
         """Session starts with empty state."""
         session = Session()
 
-        assert session.message_history == []
+        assert list(session.message_history) == []
         assert session.entity_context.is_set is False
         assert session.pending_draft is None
 
@@ -127,6 +128,89 @@ class TestSlashCommands:
 
         assert result is True
 
+    async def test_commit_command_sets_plan_draft(self, mock_db_session):
+        """Commit extracts a plan in one call and stores it as a single draft."""
+        from datetime import date
+
+        from jdo.ai.extraction import ExtractedPlan, ExtractedPlanCommitment
+
+        session = Session()
+        mock_db_session.exec.return_value.all.return_value = []
+        plan = ExtractedPlan(
+            commitments=[
+                ExtractedPlanCommitment(
+                    deliverable="Send report", stakeholder_name="Sarah", due_date=date(2025, 1, 17)
+                )
+            ]
+        )
+
+        with (
+            patch("jdo.repl.loop.get_model_identifier", return_value="test"),
+            patch("jdo.ai.extraction.extract_plan", return_value=plan) as mock_extract,
+        ):
+            result = await handle_slash_command(
+                '/commit "send report to Sarah by Friday"', session, mock_db_session
+            )
+
+        assert result is True
+        mock_extract.assert_awaited_once()
+        assert mock_extract.call_args.kwargs["link_candidates"] == []
+        assert session.pending_draft is not None
+        assert session.pending_draft.entity_type == "plan"
+        assert session.pending_draft.data["commitments"][0]["due_date"] == "2025-01-17"
+
+    async def test_commit_batch_sets_single_plan_draft(self, mock_db_session):
+        """/commit --batch extracts every pasted line and stores one plan draft."""
+        from datetime import date
+
+        from jdo.ai.extraction import ExtractedCommitment
+
+        session = Session()
+
+        async def fake_extract(messages, model):
+            return ExtractedCommitment(
+                deliverable=messages[0]["content"],
+                stakeholder_name="Sarah",
+                due_date=date(2025, 1, 17),
+            )
+
+        with (
+            patch("jdo.repl.loop.get_model_identifier", return_value="test"),
+            patch("jdo.ai.batch.extract_commitment", side_effect=fake_extract),
+        ):
+            result = await handle_slash_command(
+                "/commit --batch\n- Report for Sarah\n- Slides for Sarah", session, mock_db_session
+            )
+
+        assert result is True
+        assert session.pending_draft is not None
+        assert session.pending_draft.entity_type == "plan"
+        deliverables = [c["deliverable"] for c in session.pending_draft.data["commitments"]]
+        assert deliverables == ["Report for Sarah", "Slides for Sarah"]
+
+    async def test_triage_command_loads_queue_and_merges_duplicate(self, db_session):
+        """/triage reads the captured items and /triage m drops a near-duplicate."""
+        from jdo.db.duplicates import reset_duplicate_index
+        from jdo.models.draft import Draft, EntityType
+
+        reset_duplicate_index()
+        for text in ("email Bob re contract", "contract email for Bob"):
+            db_session.add(Draft(entity_type=EntityType.UNKNOWN, partial_data={"raw_text": text}))
+            db_session.commit()
+        session = Session()
+
+        with patch("jdo.repl.loop.console") as mock_console:
+            await handle_slash_command("/triage", session, db_session)
+            await handle_slash_command("/triage m", session, db_session)
+        reset_duplicate_index()
+
+        shown = [call.args[0] for call in mock_console.print.call_args_list]
+        assert "Triage item 1 of 2" in shown[0]
+        assert "Looks like a duplicate of draft" in shown[0]
+        assert "Merged into draft" in shown[1]
+        remaining = db_session.exec(select(Draft)).all()
+        assert [d.partial_data["raw_text"] for d in remaining] == ["contract email for Bob"]
+
     async def test_complete_command_without_args(self, mock_db_session):
         """Complete command without args shows usage message."""
         session = Session()
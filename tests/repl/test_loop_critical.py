@@ -55,6 +55,37 @@ class TestGetAtRiskCommitments:
 
         assert len(result) == 1
 
+    def test_selects_open_commitments_due_by_end_of_today(self, db_session) -> None:
+        """Open commitments due today or earlier are returned, by their UTC due_at."""
+        from datetime import timedelta
+
+        from jdo.models import Commitment, CommitmentStatus, Stakeholder, StakeholderType
+        from jdo.utils.datetime import today_date
+
+        sarah = Stakeholder(name="Sarah", type=StakeholderType.PERSON)
+        db_session.add(sarah)
+        today = today_date()
+        for deliverable, days, status in [
+            ("overdue", -3, CommitmentStatus.PENDING),
+            ("today", 0, CommitmentStatus.AT_RISK),
+            ("tomorrow", 1, CommitmentStatus.IN_PROGRESS),
+            ("done", -3, CommitmentStatus.COMPLETED),
+        ]:
+            db_session.add(
+                Commitment(
+                    deliverable=deliverable,
+                    stakeholder_id=sarah.id,
+                    due_date=today + timedelta(days=days),
+                    timezone="UTC",
+                    status=status,
+                )
+            )
+        db_session.commit()
+
+        result = _get_at_risk_commitments(db_session)
+
+        assert sorted(c.deliverable for c in result) == ["overdue", "today"]
+
 
 class TestGetVisionReviewMessage:
     """Tests for _get_vision_review_message function."""
@@ -0,0 +1,237 @@
+"""Tests for the background maintenance scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import timedelta
+
+import pytest
+from sqlmodel import Session as DBSession
+
+from jdo.commands.handlers import get_handler
+from jdo.commands.parser import CommandType, parse_command
+from jdo.models.draft import Draft, EntityType
+from jdo.repl.maintenance import (
+    DASHBOARD_JOB,
+    DEFAULT_INTERVALS,
+    JobResult,
+    MaintenanceJob,
+    MaintenanceScheduler,
+    count_expired_drafts,
+    default_jobs,
+)
+from jdo.repl.session import DashboardCacheUpdate, Session
+from jdo.utils.datetime import utc_now
+
+
+@contextmanager
+def _no_db() -> Iterator[DBSession]:
+    yield None  # type: ignore[misc]
+
+
+def _scheduler(*jobs: MaintenanceJob, session: Session | None = None) -> MaintenanceScheduler:
+    return MaintenanceScheduler(jobs, session=session, session_factory=_no_db)
+
+
+class TestRunJob:
+    """Tests for running a single job."""
+
+    async def test_records_timing_and_summary(self) -> None:
+        """A run updates the job's stats."""
+        scheduler = _scheduler(MaintenanceJob("noop", lambda _db: JobResult("done"), 60))
+
+        assert await scheduler.run_job("noop") is True
+
+        stats = scheduler.stats["noop"]
+        assert stats.runs == 1
+        assert stats.last_summary == "done"
+        assert stats.last_seconds is not None
+        assert stats.last_run_at is not None
+
+    async def test_single_flight_skips_overlapping_run(self) -> None:
+        """A run that comes due while the job is still running is skipped."""
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow(_db: DBSession) -> JobResult:
+            started.set()
+            release.wait(5)
+            return JobResult("slow")
+
+        scheduler = _scheduler(MaintenanceJob("slow", slow, 60))
+        first = asyncio.create_task(scheduler.run_job("slow"))
+        await asyncio.to_thread(started.wait, 5)
+
+        assert await scheduler.run_job("slow") is False
+        release.set()
+        assert await first is True
+        assert scheduler.stats["slow"].runs == 1
+        assert scheduler.stats["slow"].skipped == 1
+
+    async def test_failure_is_recorded(self) -> None:
+        """A failing job is counted and its error kept for /jobs."""
+
+        def broken(_db: DBSession) -> JobResult:
+            msg = "database is locked"
+            raise RuntimeError(msg)
+
+        scheduler = _scheduler(MaintenanceJob("broken", broken, 60))
+
+        await scheduler.run_job("broken")
+
+        stats = scheduler.stats["broken"]
+        assert stats.failures == 1
+        assert stats.last_error == "database is locked"
+        assert "last error: database is locked" in scheduler.format_stats()
+
+    async def test_publishes_dashboard_to_session(self) -> None:
+        """Dashboard results land in the REPL session's cache."""
+        session = Session()
+        update = DashboardCacheUpdate(commitments=[{"deliverable": "Report"}], triage_count=2)
+        scheduler = _scheduler(
+            MaintenanceJob(DASHBOARD_JOB, lambda _db: JobResult("ok", dashboard=update), 60),
+            session=session,
+        )
+
+        await scheduler.run_job(DASHBOARD_JOB)
+
+        assert session.cached_dashboard_commitments == [{"deliverable": "Report"}]
+        assert session.cached_triage_count == 2
+
+    async def test_database_change_refreshes_dashboard(self) -> None:
+        """A job that wrote to the database triggers a dashboard rebuild."""
+
+        def dashboard(_db: DBSession) -> JobResult:
+            return JobResult("rebuilt")
+
+        scheduler = _scheduler(
+            MaintenanceJob("writer", lambda _db: JobResult("wrote", changed=True), 60),
+            MaintenanceJob(DASHBOARD_JOB, dashboard, 60),
+        )
+
+        await scheduler.run_job("writer")
+        for _ in range(100):
+            if scheduler.stats[DASHBOARD_JOB].runs:
+                break
+            await asyncio.sleep(0.01)
+
+        assert scheduler.stats[DASHBOARD_JOB].last_summary == "rebuilt"
+        await scheduler.stop()
+
+
+class TestScheduling:
+    """Tests for timers, jitter and job configuration."""
+
+    def test_next_delay_within_jitter(self) -> None:
+        """Waits vary by at most the job's jitter fraction."""
+        job = MaintenanceJob("noop", lambda _db: JobResult(""), 100, jitter=0.2)
+        scheduler = MaintenanceScheduler([job], rng=random.Random(7))  # noqa: S311
+
+        delays = [scheduler.next_delay(job) for _ in range(200)]
+
+        assert min(delays) >= 80
+        assert max(delays) <= 120
+        assert len(set(delays)) > 1
+
+    def test_default_jobs_apply_overrides(self) -> None:
+        """Interval overrides apply by name and 0 disables a job."""
+        jobs = {
+            job.name: job
+            for job in default_jobs(
+                lambda _db: JobResult(""), intervals={"recurring": 30, "drafts": 0}
+            )
+        }
+
+        assert set(jobs) == set(DEFAULT_INTERVALS) - {"drafts"}
+        assert jobs["recurring"].interval == 30
+        assert jobs["milestones"].interval == DEFAULT_INTERVALS["milestones"]
+
+    async def test_start_runs_jobs_until_stopped(self) -> None:
+        """Timers run each job repeatedly until stop()."""
+        runs = threading.Semaphore(0)
+
+        def tick(_db: DBSession) -> JobResult:
+            runs.release()
+            return JobResult("tick")
+
+        async def no_wait(_seconds: float) -> None:
+            await asyncio.sleep(0)
+
+        scheduler = MaintenanceScheduler(
+            [MaintenanceJob("tick", tick, 60)], session_factory=_no_db, sleep=no_wait
+        )
+        scheduler.start()
+        assert scheduler.running
+        for _ in range(3):
+            assert await asyncio.to_thread(runs.acquire, timeout=5)
+        await scheduler.stop()
+
+        assert not scheduler.running
+        assert scheduler.stats["tick"].runs >= 3
+
+
+class TestHousekeepingJobs:
+    """Tests for the built-in job functions."""
+
+    def test_count_expired_drafts(self, db_session: DBSession) -> None:
+        """Only non-triage drafts older than the expiry age are counted."""
+        old = utc_now() - timedelta(days=8)
+        db_session.add_all(
+            [
+                Draft(entity_type=EntityType.COMMITMENT, created_at=old),
+                Draft(entity_type=EntityType.UNKNOWN, created_at=old),
+                Draft(entity_type=EntityType.GOAL),
+            ]
+        )
+        db_session.commit()
+
+        assert count_expired_drafts(db_session).summary == "1 expired draft(s)"
+
+
+class TestJobsCommand:
+    """Tests for the /jobs command."""
+
+    @pytest.fixture
+    def handler(self):
+        """The /jobs handler."""
+        return get_handler(CommandType.JOBS)
+
+    def test_not_running(self, handler) -> None:
+        """Without a scheduler, /jobs says maintenance is off."""
+        result = handler.execute(parse_command("/jobs"), {"session": Session()})
+
+        assert result.message.startswith("Background maintenance is not running.")
+
+    async def test_shows_job_timings(self, handler) -> None:
+        """With a scheduler, /jobs lists each job's runs and summary."""
+        session = Session()
+        session.maintenance = _scheduler(
+            MaintenanceJob("reviews", lambda _db: JobResult("2 goal(s) due"), 3600),
+            MaintenanceJob("drafts", lambda _db: JobResult(""), 3600),
+        )
+        await session.maintenance.run_job("reviews")
+
+        message = handler.execute(parse_command("/jobs"), {"session": session}).message
+
+        assert "reviews" in message
+        assert "1 run(s)" in message
+        assert "2 goal(s) due" in message
+        assert "not run yet" in message
+
+    def test_shows_agent_metrics(self, handler) -> None:
+        """/jobs also reports the prompt-cache and tool-call metrics."""
+        session = Session()
+        session.tool_calls_per_turn.extend([2, 0, 1])
+        session.prompt_cache.input_tokens = 1000
+        session.prompt_cache.cached_input_tokens = 250
+
+        message = handler.execute(parse_command("/jobs"), {"session": session}).message
+
+        assert "Prompt cache: 25% of 1000 input tokens cached" in message
+        assert "median 1 per run over the last 3 run(s)" in message
+        assert "Speculative extraction" in message
+        assert "AI request queue" in message
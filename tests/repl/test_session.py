@@ -1,16 +1,29 @@
 """Tests for the REPL session state module."""
 
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from pydantic_ai.messages import (
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
 
 from jdo.repl.session import (
     CHARS_PER_TOKEN,
     MAX_HISTORY_TOKENS,
     MIN_HISTORY_MESSAGES,
+    TOOL_CALL_WINDOW,
     EntityContext,
     PendingDraft,
     Session,
+    TiktokenCounter,
+    estimate_text_tokens,
 )
 
 
@@ -85,7 +98,7 @@ class TestSession:
         """Session starts with empty state."""
         session = Session()
 
-        assert session.message_history == []
+        assert list(session.message_history) == []
         assert session.entity_context.is_set is False
         assert session.pending_draft is None
         assert session.has_pending_draft is False
@@ -248,3 +261,318 @@ class TestTokenPruning:
 
         # First messages should be gone
         assert not any(m["content"] == "FIRST" for m in session.message_history)
+
+
+def _tool_turn(prompt: str, tool_result: str = "ok", *, system: str | None = None) -> list:
+    """Build the messages of one agent run that used a tool."""
+    request_parts = [UserPromptPart(content=prompt)]
+    if system is not None:
+        request_parts.insert(0, SystemPromptPart(content=system))
+    return [
+        ModelRequest(parts=request_parts),
+        ModelResponse(parts=[ToolCallPart(tool_name="query", args={}, tool_call_id="c1")]),
+        ModelRequest(
+            parts=[ToolReturnPart(tool_name="query", content=tool_result, tool_call_id="c1")]
+        ),
+        ModelResponse(parts=[TextPart(content="done")]),
+    ]
+
+
+class TestNativeModelHistory:
+    """Tests for the native PydanticAI message store."""
+
+    def test_initially_empty(self):
+        session = Session()
+
+        assert list(session.model_messages) == []
+
+    def test_add_model_messages_appends_run(self):
+        session = Session()
+        turn = _tool_turn("first")
+
+        session.add_model_messages(turn)
+
+        assert list(session.model_messages) == turn
+
+    def test_keeps_tool_call_parts(self):
+        session = Session()
+        session.add_model_messages(_tool_turn("first"))
+
+        kinds = [part.part_kind for msg in session.model_messages for part in msg.parts]
+
+        assert "tool-call" in kinds
+        assert "tool-return" in kinds
+
+    def test_empty_run_is_ignored(self):
+        session = Session()
+
+        session.add_model_messages([])
+
+        assert list(session.model_messages) == []
+
+    def test_prunes_whole_runs_over_budget(self):
+        session = Session()
+        big_result = "r" * (CHARS_PER_TOKEN * (MAX_HISTORY_TOKENS // 2))
+
+        session.add_model_messages(_tool_turn("one", big_result))
+        session.add_model_messages(_tool_turn("two", big_result))
+        session.add_model_messages(_tool_turn("three", big_result))
+
+        # Every remaining tool call still has its return
+        calls = [
+            part.tool_call_id
+            for msg in session.model_messages
+            for part in msg.parts
+            if isinstance(part, ToolCallPart)
+        ]
+        returns = [
+            part.tool_call_id
+            for msg in session.model_messages
+            for part in msg.parts
+            if isinstance(part, ToolReturnPart)
+        ]
+        assert calls == returns
+        assert len(session.model_messages) % 4 == 0
+        first = session.model_messages[0]
+        assert isinstance(first, ModelRequest)
+        assert first.parts[-1].content != "one"
+
+    def test_keeps_latest_run_even_if_over_budget(self):
+        session = Session()
+        huge_result = "h" * (CHARS_PER_TOKEN * MAX_HISTORY_TOKENS * 2)
+
+        session.add_model_messages(_tool_turn("only", huge_result))
+
+        assert len(session.model_messages) == 4
+
+    def test_pruning_carries_system_prompt_forward(self):
+        session = Session()
+        big_result = "r" * (CHARS_PER_TOKEN * MAX_HISTORY_TOKENS)
+
+        session.add_model_messages(_tool_turn("one", big_result, system="SYSTEM"))
+        session.add_model_messages(_tool_turn("two"))
+
+        head = session.model_messages[0]
+        assert isinstance(head.parts[0], SystemPromptPart)
+        assert head.parts[0].content == "SYSTEM"
+        assert head.parts[1].content == "two"
+
+    def test_clear_model_history(self):
+        session = Session()
+        session.add_model_messages(_tool_turn("first"))
+
+        session.clear_model_history()
+
+        assert list(session.model_messages) == []
+
+
+class TestRunningTokenTotal:
+    """Tests for the O(1) running token total."""
+
+    def test_running_total_matches_recount(self):
+        session = Session()
+        for i in range(50):
+            session.add_user_message("u" * (i * 37))
+            session.add_assistant_message("a" * (i * 53))
+
+        recount = sum(len(m["content"]) // CHARS_PER_TOKEN for m in session.message_history)
+        assert session._estimate_tokens() == recount
+
+    def test_custom_token_counter(self):
+        session = Session(token_counter=lambda text: len(text.split()))
+
+        session.add_user_message("one two three")
+
+        assert session._estimate_tokens() == 3
+
+
+class TestTiktokenCounter:
+    """Tests for the lazily loaded tiktoken counter."""
+
+    def test_encoding_loaded_on_first_count(self):
+        pytest.importorskip("tiktoken")
+        with patch("tiktoken.encoding_for_model") as mock_encoding:
+            mock_encoding.return_value.encode.return_value = [1, 2]
+            counter = TiktokenCounter("gpt-5.1-mini")
+            mock_encoding.assert_not_called()
+
+            assert counter("hello there") == 2
+            assert counter("again") == 2
+
+        mock_encoding.assert_called_once()
+
+    def test_falls_back_when_encoding_cannot_load(self):
+        pytest.importorskip("tiktoken")
+        offline = ConnectionError("Failed to download BPE file")
+        with patch("tiktoken.encoding_for_model", side_effect=offline):
+            counter = TiktokenCounter("gpt-5.1-mini")
+
+            assert counter("x" * 40) == estimate_text_tokens("x" * 40)
+
+
+class TestRollingSummary:
+    """Tests for folding evicted runs into a rolling summary."""
+
+    @staticmethod
+    def _big_turn(prompt: str) -> list:
+        return _tool_turn(prompt, "r" * (CHARS_PER_TOKEN * MAX_HISTORY_TOKENS))
+
+    async def test_evicted_runs_are_summarized(self):
+        calls = []
+
+        async def summarizer(previous, messages):
+            calls.append((previous, messages))
+            return "user promised report to Sarah"
+
+        session = Session(summarizer=summarizer)
+        session.add_model_messages(self._big_turn("I promised Sarah the report"))
+        session.add_model_messages(_tool_turn("next"))
+        await session.flush_summary()
+
+        assert session.history_summary == "user promised report to Sarah"
+        previous, messages = calls[0]
+        assert previous is None
+        assert {"role": "user", "content": "I promised Sarah the report"} in messages
+        assert {"role": "assistant", "content": "done"} in messages
+
+    async def test_summary_folds_into_previous(self):
+        async def summarizer(previous, messages):
+            return f"{previous or ''}+{messages[0]['content']}"
+
+        session = Session(summarizer=summarizer)
+        session.add_model_messages(self._big_turn("a"))
+        session.add_model_messages(self._big_turn("b"))
+        await session.flush_summary()
+        session.add_model_messages(_tool_turn("c"))
+        await session.flush_summary()
+
+        assert session.history_summary == "+a+b"
+
+    async def test_summarizer_failure_keeps_previous_summary(self):
+        async def summarizer(previous, messages):
+            raise RuntimeError("boom")
+
+        session = Session(summarizer=summarizer)
+        session.history_summary = "earlier"
+        session.add_model_messages(self._big_turn("a"))
+        session.add_model_messages(_tool_turn("b"))
+        await session.flush_summary()
+
+        assert session.history_summary == "earlier"
+
+    def test_without_summarizer_evictions_are_dropped(self):
+        session = Session()
+        session.add_model_messages(self._big_turn("a"))
+        session.add_model_messages(_tool_turn("b"))
+
+        assert session.history_summary is None
+        assert session._pending_evictions == []
+
+    def test_summary_injected_after_system_prompt(self):
+        session = Session()
+        session.add_model_messages(_tool_turn("hello", system="SYSTEM"))
+        session.history_summary = "- promised report"
+
+        history = session.get_model_history()
+
+        head_parts = history[0].parts
+        assert head_parts[0].content == "SYSTEM"
+        assert isinstance(head_parts[1], SystemPromptPart)
+        assert "promised report" in head_parts[1].content
+        assert head_parts[2].content == "hello"
+        # Stored history is not modified
+        assert len(session.model_messages[0].parts) == 2
+
+    def test_history_without_summary_is_unchanged(self):
+        session = Session()
+        turn = _tool_turn("hello")
+        session.add_model_messages(turn)
+
+        assert session.get_model_history() == turn
+
+    async def test_summary_transcript_omits_turn_context(self):
+        calls = []
+
+        async def summarizer(previous, messages):
+            calls.append(messages)
+            return "summary"
+
+        session = Session(summarizer=summarizer)
+        turn = self._big_turn("ignored")
+        turn[0] = ModelRequest(parts=[UserPromptPart(content=["my words", "## Current Context"])])
+        session.add_model_messages(turn)
+        session.add_model_messages(_tool_turn("next"))
+        await session.flush_summary()
+
+        assert {"role": "user", "content": "my words"} in calls[0]
+        assert all("Current Context" not in msg["content"] for msg in calls[0])
+
+
+class TestPromptCacheAccounting:
+    """Tests for recording cached vs uncached input tokens per response."""
+
+    def test_add_model_messages_records_response_usage(self):
+        from pydantic_ai.usage import RequestUsage
+
+        session = Session()
+        session.add_model_messages(
+            [
+                ModelRequest(parts=[UserPromptPart(content="hi")]),
+                ModelResponse(
+                    parts=[TextPart(content="hello")],
+                    usage=RequestUsage(input_tokens=500, cache_read_tokens=400),
+                ),
+            ]
+        )
+
+        assert session.prompt_cache.responses == 1
+        assert session.prompt_cache.cached_input_tokens == 400
+        assert session.prompt_cache.uncached_input_tokens == 100
+
+
+class TestToolCallStats:
+    """Tests for per-run tool call counts."""
+
+    def test_counts_tool_calls_per_run(self):
+        session = Session()
+        session.add_model_messages(_tool_turn("first"))
+        session.add_model_messages(
+            [
+                ModelRequest(parts=[UserPromptPart(content="hi")]),
+                ModelResponse(parts=[TextPart(content="hello")]),
+            ]
+        )
+
+        assert list(session.tool_calls_per_turn) == [1, 0]
+        assert session.median_tool_calls == 0.5
+
+    def test_median_is_zero_before_first_run(self):
+        assert Session().median_tool_calls == 0.0
+
+    def test_keeps_only_recent_runs(self):
+        session = Session()
+        for i in range(TOOL_CALL_WINDOW + 1):
+            session.add_model_messages(_tool_turn(f"run {i}"))
+
+        assert len(session.tool_calls_per_turn) == TOOL_CALL_WINDOW
+        assert session.total_tool_calls == TOOL_CALL_WINDOW + 1
+
+    def test_format_agent_stats(self):
+        from pydantic_ai.usage import RequestUsage
+
+        session = Session()
+        assert "No agent runs yet" in session.format_agent_stats()
+
+        session.add_model_messages(
+            [
+                ModelRequest(parts=[UserPromptPart(content="hi")]),
+                ModelResponse(
+                    parts=[TextPart(content="hello")],
+                    usage=RequestUsage(input_tokens=500, cache_read_tokens=400),
+                ),
+            ]
+        )
+        text = session.format_agent_stats()
+
+        assert "Prompt cache: 80% of 500 input tokens cached over 1 response(s)" in text
+        assert "Tool calls:   median 0 per run over the last 1 run(s), 0 in total" in text
@@ -14,7 +14,7 @@ import re
 
 import pytest
 
-from jdo.ai.agent import SYSTEM_PROMPT_TEMPLATE, get_agent_system_prompt
+from jdo.ai.agent import SYSTEM_PROMPT, get_agent_system_prompt, get_current_context
 
 
 class TestSystemPromptConstraints:
@@ -349,19 +349,24 @@ class TestAgentBehaviorIntegration:
             "Review the design spec and provide feedback to the team",
         ]
 
-    def test_system_prompt_injected_correctly(self):
-        """Verify system prompt is generated with current date/time."""
+    def test_system_prompt_is_static(self):
+        """System prompt carries no per-turn data so it can be cached as a prefix."""
         prompt = get_agent_system_prompt()
 
-        # Should contain date placeholders filled in
+        assert prompt == SYSTEM_PROMPT
         assert "{current_date}" not in prompt
-        assert "{current_time}" not in prompt
-        assert "{day_of_week}" not in prompt
+        assert "## Current Context" not in prompt
 
-        # Should contain actual date info
+    def test_current_context_injected_correctly(self):
+        """Current context is generated with the current date/time."""
         import re
 
-        assert re.search(r"\d{4}-\d{2}-\d{2}", prompt), "Should contain formatted date"
+        context = get_current_context()
+
+        assert "{current_date}" not in context
+        assert "{current_time}" not in context
+        assert "{day_of_week}" not in context
+        assert re.search(r"\d{4}-\d{2}-\d{2}", context), "Should contain formatted date"
 
     def test_prompt_template_has_all_constraints(self):
         """Verify the template contains all required constraint sections."""
@@ -375,4 +380,4 @@ class TestAgentBehaviorIntegration:
         ]
 
         for section in required_sections:
-            assert section in SYSTEM_PROMPT_TEMPLATE, f"Missing required section: {section}"
+            assert section in SYSTEM_PROMPT, f"Missing required section: {section}"
@@ -0,0 +1,67 @@
+"""Offline REPL latency benchmark.
+
+Replays a recorded conversation through ``_process_user_input`` against a
+seeded database and checks the per-turn budgets. Run with ``-m benchmark -s``
+to see the report in the log.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from loguru import logger
+from sqlmodel import Session
+
+from jdo.db.engine import get_engine, reset_engine
+from jdo.db.migrations import create_db_and_tables
+from jdo.uat import RecordedSession, run_benchmark, seed_benchmark_data
+from jdo.uat.benchmark import percentile
+
+RECORDING = Path(__file__).parent / "recordings" / "weekly_review.json"
+
+INPUTS = ["What's due this week?", "/list", "Anything overdue?", "Not yet, thanks"]
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture
+def seeded_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Session, None, None]:
+    """A temporary database filled by seed_benchmark_data."""
+    from jdo.config.settings import reset_settings
+
+    monkeypatch.setenv("JDO_DATABASE_PATH", str(tmp_path / "bench.db"))
+    reset_settings()
+    reset_engine()
+    create_db_and_tables()
+    session = Session(get_engine())
+    try:
+        seed_benchmark_data(session)
+        yield session
+    finally:
+        session.close()
+        reset_engine()
+
+
+def test_percentile_nearest_rank() -> None:
+    values = [5.0, 1.0, 4.0, 2.0, 3.0]
+
+    assert percentile(values, 0.5) == 3.0
+    assert percentile(values, 0.95) == 5.0
+    assert percentile([], 0.5) == 0.0
+
+
+async def test_scripted_conversation_stays_within_budget(seeded_db: Session) -> None:
+    recording = RecordedSession.load(RECORDING)
+
+    report = await run_benchmark(seeded_db, INPUTS, recording)
+    logger.info(f"REPL benchmark: {report.format()}")
+
+    assert [turn.user_input for turn in report.turns] == INPUTS
+    assert [turn.tool_calls for turn in report.turns] == [1, 0, 2, 0]
+    assert report.turns[0].db_queries > 0
+    assert report.turns[0].render_cpu_seconds > 0
+    # Generous bounds: the replay is instant, so this only catches pathological regressions
+    assert report.p95_latency < 5.0
+    assert max(turn.db_queries for turn in report.turns) < 200
@@ -45,6 +45,12 @@ class TestClearScreenBehavior:
         s._integrity_data = None
         return s
 
+    @pytest.fixture(autouse=True)
+    def turn_context(self):
+        """Avoid building the state snapshot from the real database."""
+        with patch("jdo.repl.loop._build_turn_context", return_value=""):
+            yield
+
     async def test_screen_clears_before_ai_response(
         self, mock_agent, mock_deps, mock_db_session, session
     ):
@@ -60,7 +66,7 @@ class TestClearScreenBehavior:
         mock_console.print = MagicMock(side_effect=lambda *a, **kw: call_order.append("print"))
 
         with (
-            patch("jdo.repl.loop.stream_response", mock_stream),
+            patch("jdo.ai.context.stream_response", mock_stream),
             patch("jdo.repl.loop.console", mock_console),
             patch(
                 "jdo.repl.loop._show_dashboard",
@@ -99,7 +105,7 @@ class TestClearScreenBehavior:
         mock_console.print = MagicMock(side_effect=capture_print)
 
         with (
-            patch("jdo.repl.loop.stream_response", mock_stream),
+            patch("jdo.ai.context.stream_response", mock_stream),
             patch("jdo.repl.loop.console", mock_console),
             patch("jdo.repl.loop._show_dashboard"),
         ):
@@ -0,0 +1,150 @@
+"""Tests for the offline session replayer."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import (
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    ToolCallPart,
+    UserPromptPart,
+)
+from pydantic_ai.models.test import TestModel
+
+from jdo.uat.replay import (
+    RecordedResponse,
+    RecordedSession,
+    RecordedToolCall,
+    RecordedTurn,
+    ReplayError,
+    SessionReplayer,
+)
+
+
+def _agent(replayer: SessionReplayer, calls: list[str]) -> Agent[None, str]:
+    agent: Agent[None, str] = Agent(replayer.model())
+
+    @agent.tool_plain
+    def lookup(name: str) -> str:
+        calls.append(name)
+        return f"{name} is due Friday"
+
+    return agent
+
+
+def _recording() -> RecordedSession:
+    return RecordedSession(
+        turns=[
+            RecordedTurn(
+                user_input="When is the report due?",
+                responses=[
+                    RecordedResponse(
+                        tool_calls=[RecordedToolCall(tool_name="lookup", args={"name": "report"})],
+                        first_token_delay=0.5,
+                    ),
+                    RecordedResponse(
+                        chunks=["It is due ", "on Friday."],
+                        first_token_delay=0.25,
+                        chunk_delays=[0.1],
+                    ),
+                ],
+            )
+        ]
+    )
+
+
+class TestRecordedResponse:
+    """Tests for building recorded responses."""
+
+    def test_from_text_splits_into_chunks(self) -> None:
+        response = RecordedResponse.from_text("abcdefghij", chunk_chars=4, chunk_delay=0.05)
+
+        assert response.chunks == ["abcd", "efgh", "ij"]
+        assert response.chunk_delays == [0.05, 0.05]
+        assert response.text == "abcdefghij"
+
+    def test_recording_round_trips_through_json(self, tmp_path) -> None:
+        path = tmp_path / "session.json"
+        _recording().save(path)
+
+        assert RecordedSession.load(path) == _recording()
+
+
+class TestSessionReplayer:
+    """Tests for replaying a recording through an agent."""
+
+    async def test_streamed_replay_runs_tools_and_honours_delays(self) -> None:
+        delays: list[float] = []
+
+        async def sleep(seconds: float) -> None:
+            delays.append(seconds)
+
+        replayer = SessionReplayer(_recording(), time_scale=2.0, sleep=sleep)
+        calls: list[str] = []
+        agent = _agent(replayer, calls)
+
+        chunks: list[str] = []
+        async with agent.run_stream("When is the report due?") as result:
+            chunks.extend([delta async for delta in result.stream_text(delta=True)])
+
+        assert "".join(chunks) == "It is due on Friday."
+        assert calls == ["report"]
+        assert delays == [1.0, 0.5, 0.2]
+        assert replayer.finished
+
+    async def test_non_streamed_replay(self) -> None:
+        replayer = SessionReplayer(_recording(), time_scale=0)
+        calls: list[str] = []
+
+        result = await _agent(replayer, calls).run("When is the report due?")
+
+        assert result.output == "It is due on Friday."
+        assert calls == ["report"]
+
+    async def test_off_script_prompt_raises(self) -> None:
+        replayer = SessionReplayer(_recording(), time_scale=0)
+
+        with pytest.raises(ReplayError, match="expected"):
+            await _agent(replayer, []).run("Something else")
+
+    async def test_running_past_the_recording_raises(self) -> None:
+        replayer = SessionReplayer(_recording(), time_scale=0)
+        agent = _agent(replayer, [])
+        await agent.run("When is the report due?")
+
+        with pytest.raises(ReplayError, match="no turn 2"):
+            await agent.run("And the next one?")
+
+
+class TestFromMessages:
+    """Tests for building recordings from message history."""
+
+    async def test_from_messages_captures_turns_and_tool_calls(self) -> None:
+        agent: Agent[None, str] = Agent(TestModel(custom_output_text="All done"))
+
+        @agent.tool_plain
+        def lookup(name: str) -> str:
+            return name
+
+        result = await agent.run("Check the report")
+        recording = RecordedSession.from_messages(result.all_messages())
+
+        assert len(recording.turns) == 1
+        turn = recording.turns[0]
+        assert turn.user_input == "Check the report"
+        assert [call.tool_name for call in turn.responses[0].tool_calls] == ["lookup"]
+        assert turn.responses[-1].text == "All done"
+
+    def test_prompt_with_context_parts_uses_user_text(self) -> None:
+        messages = [
+            ModelRequest(parts=[UserPromptPart(content=["Hi there", "<context/>"])]),
+            ModelResponse(parts=[TextPart(content="Hello"), ToolCallPart("lookup", {"name": "x"})]),
+        ]
+
+        recording = RecordedSession.from_messages(messages)
+
+        assert recording.turns[0].user_input == "Hi there"
+        assert recording.turns[0].responses[0].text == "Hello"
+        assert recording.turns[0].responses[0].tool_calls[0].args == {"name": "x"}
@@ -69,7 +69,8 @@ class TestCreateAgent:
         # The system prompt should contain key coaching content
         system_prompt = agent._system_prompts[0]
         assert "commitment integrity coach" in system_prompt
-        assert "Today's date" in system_prompt  # Dynamic date injection
+        # Date/time is sent per turn, not baked into the cacheable prefix
+        assert "Today's date" not in system_prompt
 
     def test_agent_has_user_led_interaction_style(self) -> None:
         """Agent system prompt contains user-led interaction style section."""
@@ -84,6 +85,15 @@ class TestCreateAgent:
         assert "Ask, don't suggest" in system_prompt
         assert "Never generate ideas" in system_prompt
 
+    def test_system_prompt_is_identical_across_agents(self) -> None:
+        """System prompt is byte-identical so providers can cache it."""
+        from jdo.ai.agent import create_agent_with_model
+
+        first = create_agent_with_model(TestModel(), with_tools=False)
+        second = create_agent_with_model(TestModel(), with_tools=False)
+
+        assert first._system_prompts == second._system_prompts
+
     async def test_agent_can_run_with_test_model(self) -> None:
         """Agent can be run with TestModel for testing."""
         from jdo.ai.agent import JDODependencies, create_agent_with_model
@@ -123,6 +133,23 @@ class TestCreateAgent:
         assert len(list(toolset.tools)) == 0
 
 
+class TestCurrentContext:
+    """Tests for the volatile per-turn context block."""
+
+    def test_renders_given_moment(self) -> None:
+        """Context shows the date, time and weekday of the given moment."""
+        from datetime import UTC, datetime
+
+        from jdo.ai.agent import get_current_context
+
+        context = get_current_context(datetime(2025, 1, 17, 9, 30, tzinfo=UTC))
+
+        assert context.startswith("## Current Context")
+        assert "2025-01-17" in context
+        assert "09:30" in context
+        assert "Friday" in context
+
+
 class TestJDODependencies:
     """Tests for JDODependencies dataclass."""
 
@@ -0,0 +1,131 @@
+"""Tests for parallel batch extraction."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+from jdo.ai.batch import (
+    BatchItem,
+    BatchResult,
+    batch_to_plan_data,
+    extract_batch,
+    split_batch_items,
+)
+from jdo.ai.extraction import ExtractedCommitment, ExtractedTask
+
+
+def _commitment(text: str) -> ExtractedCommitment:
+    return ExtractedCommitment(
+        deliverable=text, stakeholder_name="Sarah", due_date=date(2025, 12, 20)
+    )
+
+
+class TestSplitBatchItems:
+    """Tests for split_batch_items."""
+
+    def test_lines_with_bullets_and_indented_tasks(self) -> None:
+        text = """
+        - Send report to Sarah by Friday
+            - Gather numbers
+            * Write summary
+        2) Book venue for Bob by next week
+        [ ] Review PR for Ana tomorrow
+        """
+
+        items = split_batch_items(text)
+
+        assert items == [
+            BatchItem("Send report to Sarah by Friday"),
+            BatchItem("Gather numbers", parent=0),
+            BatchItem("Write summary", parent=0),
+            BatchItem("Book venue for Bob by next week"),
+            BatchItem("Review PR for Ana tomorrow"),
+        ]
+
+    def test_single_line_splits_on_semicolons(self) -> None:
+        items = split_batch_items("report to Sarah friday; slides for Bob monday;")
+
+        assert [i.text for i in items] == ["report to Sarah friday", "slides for Bob monday"]
+
+    def test_blank_input(self) -> None:
+        assert split_batch_items("  \n - \n") == []
+
+
+class TestExtractBatch:
+    """Tests for concurrent extraction."""
+
+    async def test_runs_concurrently_within_limit(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def fake_extract(messages, model):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _commitment(messages[0]["content"])
+
+        items = [BatchItem(f"item {i}") for i in range(6)]
+        with patch("jdo.ai.batch.extract_commitment", side_effect=fake_extract):
+            results = await extract_batch(items, concurrency=2)
+
+        assert peak == 2
+        assert [r.output.deliverable for r in results] == [f"item {i}" for i in range(6)]
+
+    async def test_tasks_use_task_extraction(self) -> None:
+        async def fake_task(messages, model):
+            return ExtractedTask(title=messages[0]["content"], scope="scope")
+
+        items = [BatchItem("Report"), BatchItem("Gather numbers", parent=0)]
+        with (
+            patch("jdo.ai.batch.extract_commitment", return_value=_commitment("Report")),
+            patch("jdo.ai.batch.extract_task", side_effect=fake_task),
+        ):
+            results = await extract_batch(items)
+
+        assert isinstance(results[1].output, ExtractedTask)
+
+    async def test_timeout_and_failure_are_per_item(self) -> None:
+        async def fake_extract(messages, model):
+            text = messages[0]["content"]
+            if text == "slow":
+                await asyncio.sleep(1)
+            if text == "bad":
+                msg = "no due date"
+                raise ValueError(msg)
+            return _commitment(text)
+
+        items = [BatchItem("ok"), BatchItem("slow"), BatchItem("bad")]
+        with patch("jdo.ai.batch.extract_commitment", side_effect=fake_extract):
+            results = await extract_batch(items, item_timeout=0.05)
+
+        assert results[0].output is not None
+        assert results[1].error == "timed out"
+        assert results[2].error == "no due date"
+
+
+class TestBatchToPlanData:
+    """Tests for building the plan draft."""
+
+    def test_attaches_tasks_and_reports_orphans(self) -> None:
+        results = [
+            BatchResult(BatchItem("Report"), output=_commitment("Report")),
+            BatchResult(
+                BatchItem("Numbers", parent=0), output=ExtractedTask(title="Numbers", scope="s")
+            ),
+            BatchResult(BatchItem("Slides"), error="timed out"),
+            BatchResult(BatchItem("Outline", parent=2), output=ExtractedTask(title="O", scope="s")),
+        ]
+
+        plan, failures = batch_to_plan_data(results)
+
+        assert len(plan["commitments"]) == 1
+        assert plan["commitments"][0]["due_date"] == "2025-12-20"
+        assert plan["commitments"][0]["tasks"] == [{"title": "Numbers", "scope": "s"}]
+        assert [(f.item.text, f.error) for f in failures] == [
+            ("Slides", "timed out"),
+            ("Outline", "commitment not extracted"),
+        ]
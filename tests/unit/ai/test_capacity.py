@@ -0,0 +1,221 @@
+"""Tests for the forward capacity forecast."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from sqlmodel import Session
+
+from jdo.ai.capacity import Bucket, CapacityForecast, forecast_capacity, format_forecast_for_ai
+from jdo.models.commitment import Commitment, CommitmentStatus
+from jdo.models.recurring_commitment import (
+    RecurrenceType,
+    RecurringCommitment,
+    RecurringCommitmentStatus,
+)
+from jdo.models.stakeholder import Stakeholder, StakeholderType
+from jdo.models.task import Task, TaskStatus
+
+# A Monday
+START = date(2026, 10, 19)
+
+
+@pytest.fixture
+def stakeholder(db_session: Session) -> Stakeholder:
+    """A stakeholder for test commitments."""
+    row = Stakeholder(name="Client", type=StakeholderType.PERSON)
+    db_session.add(row)
+    db_session.commit()
+    return row
+
+
+def _commitment(
+    session: Session,
+    stakeholder: Stakeholder,
+    due: date,
+    estimates: list[float | None],
+    *,
+    status: CommitmentStatus = CommitmentStatus.PENDING,
+    recurring: RecurringCommitment | None = None,
+) -> Commitment:
+    commitment = Commitment(
+        deliverable="Deliverable",
+        stakeholder_id=stakeholder.id,
+        due_date=due,
+        status=status,
+        recurring_commitment_id=recurring.id if recurring else None,
+    )
+    session.add(commitment)
+    session.flush()
+    session.add_all(
+        Task(
+            commitment_id=commitment.id,
+            title=f"Task {order}",
+            scope="Scope",
+            order=order,
+            estimated_hours=hours,
+            status=TaskStatus.PENDING,
+        )
+        for order, hours in enumerate(estimates, start=1)
+    )
+    session.commit()
+    return commitment
+
+
+def _weekly_template(
+    session: Session, stakeholder: Stakeholder, **fields: object
+) -> RecurringCommitment:
+    recurring = RecurringCommitment(
+        deliverable_template="Weekly report",
+        stakeholder_id=stakeholder.id,
+        recurrence_type=RecurrenceType.WEEKLY,
+        days_of_week=[4],
+        **fields,
+    )
+    session.add(recurring)
+    session.commit()
+    return recurring
+
+
+class TestForecastCapacity:
+    """Tests for forecast_capacity."""
+
+    def test_empty_database_has_zero_buckets(self, db_session: Session) -> None:
+        """Every bucket is zero when nothing is planned."""
+        forecast = forecast_capacity(db_session, start=START)
+
+        assert len(forecast) == 8
+        assert list(forecast.total_hours) == [0.0] * 8
+
+    def test_committed_hours_grouped_by_due_week(
+        self, db_session: Session, stakeholder: Stakeholder
+    ) -> None:
+        """Task estimates land in the week their commitment is due."""
+        _commitment(db_session, stakeholder, date(2026, 10, 20), [2.0, 1.5])
+        _commitment(db_session, stakeholder, date(2026, 10, 25), [1.0])
+        _commitment(db_session, stakeholder, date(2026, 11, 3), [4.0, None])
+
+        forecast = forecast_capacity(db_session, start=START)
+
+        assert list(forecast.committed_hours[:3]) == [4.5, 0.0, 4.0]
+        assert forecast.tasks_without_estimates == 1
+
+    def test_daily_buckets(self, db_session: Session, stakeholder: Stakeholder) -> None:
+        """Daily buckets hold one due date each."""
+        _commitment(db_session, stakeholder, date(2026, 10, 21), [3.0])
+
+        forecast = forecast_capacity(db_session, start=START, horizon_days=7, bucket=Bucket.DAY)
+
+        assert list(forecast.committed_hours) == [0.0, 0.0, 3.0, 0.0, 0.0, 0.0, 0.0]
+        assert forecast.bucket_starts[2] == date(2026, 10, 21)
+
+    def test_overdue_work_lands_in_first_bucket(
+        self, db_session: Session, stakeholder: Stakeholder
+    ) -> None:
+        """Open work past its due date still needs doing now."""
+        _commitment(db_session, stakeholder, date(2026, 10, 1), [2.0])
+
+        forecast = forecast_capacity(db_session, start=START)
+
+        assert forecast.committed_hours[0] == 2.0
+
+    def test_excludes_inactive_commitments_and_beyond_horizon(
+        self, db_session: Session, stakeholder: Stakeholder
+    ) -> None:
+        """Completed commitments and work past the horizon are not counted."""
+        _commitment(
+            db_session, stakeholder, date(2026, 10, 20), [5.0], status=CommitmentStatus.COMPLETED
+        )
+        _commitment(db_session, stakeholder, date(2027, 3, 1), [5.0])
+
+        forecast = forecast_capacity(db_session, start=START)
+
+        assert sum(forecast.total_hours) == 0.0
+
+    def test_projects_recurring_from_template_estimates(
+        self, db_session: Session, stakeholder: Stakeholder
+    ) -> None:
+        """Each future occurrence costs the template's estimated hours."""
+        _weekly_template(
+            db_session,
+            stakeholder,
+            task_templates=[
+                {"title": "Draft", "scope": "Draft it", "order": 1, "estimated_hours": 1.0},
+                {"title": "Send", "scope": "Send it", "order": 2, "estimated_hours": 0.5},
+            ],
+        )
+
+        forecast = forecast_capacity(db_session, start=START, horizon_days=28)
+
+        assert list(forecast.projected_hours) == [1.5, 1.5, 1.5, 1.5]
+
+    def test_projects_recurring_from_instance_history(
+        self, db_session: Session, stakeholder: Stakeholder
+    ) -> None:
+        """Without template estimates, past instances set the per-occurrence cost."""
+        recurring = _weekly_template(
+            db_session,
+            stakeholder,
+            last_generated_date=date(2026, 10, 23),
+            instances_generated=2,
+        )
+        _commitment(
+            db_session,
+            stakeholder,
+            date(2026, 10, 16),
+            [2.0],
+            status=CommitmentStatus.COMPLETED,
+            recurring=recurring,
+        )
+        _commitment(db_session, stakeholder, date(2026, 10, 23), [3.0, 1.0], recurring=recurring)
+
+        forecast = forecast_capacity(db_session, start=START, horizon_days=21)
+
+        # The generated Friday instance is committed work, not a projection
+        assert list(forecast.committed_hours) == [4.0, 0.0, 0.0]
+        assert list(forecast.projected_hours) == [0.0, 3.0, 3.0]
+
+    def test_unestimated_and_paused_templates(
+        self, db_session: Session, stakeholder: Stakeholder
+    ) -> None:
+        """Unestimated occurrences are counted; paused templates are skipped."""
+        _weekly_template(db_session, stakeholder)
+        _weekly_template(
+            db_session,
+            stakeholder,
+            status=RecurringCommitmentStatus.PAUSED,
+            task_templates=[{"title": "T", "scope": "S", "order": 1, "estimated_hours": 2.0}],
+        )
+
+        forecast = forecast_capacity(db_session, start=START, horizon_days=14)
+
+        assert sum(forecast.projected_hours) == 0.0
+        assert forecast.unestimated_occurrences == 2
+
+
+class TestCapacityForecast:
+    """Tests for CapacityForecast helpers and formatting."""
+
+    def _forecast(self) -> CapacityForecast:
+        from array import array
+
+        return CapacityForecast(
+            start=START,
+            bucket=Bucket.WEEK,
+            committed_hours=array("d", [30.0, 10.0]),
+            projected_hours=array("d", [6.0, 2.0]),
+        )
+
+    def test_over_allocated_uses_bucket_width(self) -> None:
+        """A week is over-allocated when it exceeds seven days of capacity."""
+        assert self._forecast().over_allocated(5.0) == [0]
+        assert self._forecast().over_allocated(6.0) == []
+
+    def test_format_flags_over_allocated_weeks(self) -> None:
+        """Formatted output marks over-allocated weeks."""
+        text = format_forecast_for_ai(self._forecast(), hours_per_day=5.0)
+
+        assert "2026-10-19 | 30.0 | 6.0 | 36.0 OVER" in text
+        assert "2026-10-26 | 10.0 | 2.0 | 12.0\n" in text
+        assert "Over-allocated weeks (>35.0h): 1" in text
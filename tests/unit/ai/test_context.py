@@ -3,11 +3,15 @@
 Phase 10.1/10.2: AI Context for the conversational TUI.
 """
 
+import asyncio
 from datetime import datetime
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import pytest
+from pydantic_ai.messages import TextPart
+
 
 class TestMessageFormatting:
     """Tests for conversation message formatting for AI API."""
@@ -253,6 +257,133 @@ class TestStreamingSupport:
         assert len(chunks) == 0
 
 
+class TestNativeHistory:
+    """Tests for passing native PydanticAI history through stream_response."""
+
+    async def test_model_history_is_passed_without_conversion(self) -> None:
+        """Native history is handed to the agent unchanged, including tool parts."""
+        from pydantic_ai import Agent
+        from pydantic_ai.messages import (
+            ModelRequest,
+            ModelResponse,
+            ToolCallPart,
+            ToolReturnPart,
+            UserPromptPart,
+        )
+        from pydantic_ai.models.test import TestModel
+
+        from jdo.ai.context import stream_response
+
+        agent = Agent(TestModel(custom_output_text="ok"))
+        history = [
+            ModelRequest(parts=[UserPromptPart(content="hi")]),
+            ModelResponse(parts=[ToolCallPart(tool_name="query", args={}, tool_call_id="c1")]),
+            ModelRequest(parts=[ToolReturnPart(tool_name="query", content="x", tool_call_id="c1")]),
+            ModelResponse(parts=[TextPart(content="answer")]),
+        ]
+        produced: list = []
+
+        chunks = [
+            chunk
+            async for chunk in stream_response(
+                agent,
+                "again",
+                MagicMock(),
+                model_history=history,
+                on_complete=produced.extend,
+            )
+        ]
+
+        assert "".join(chunks) == "ok"
+        # Only this run's messages are reported, not the replayed history
+        assert produced[0].parts[0].content == "again"
+        assert isinstance(produced[-1], ModelResponse)
+
+    async def test_on_complete_receives_tool_calls(self) -> None:
+        """Messages reported on completion include tool calls made during the run."""
+        from pydantic_ai import Agent
+        from pydantic_ai.messages import ToolCallPart, ToolReturnPart
+        from pydantic_ai.models.test import TestModel
+
+        from jdo.ai.context import stream_response
+
+        agent = Agent(TestModel())
+
+        @agent.tool_plain
+        def query_state() -> str:
+            """Return state."""
+            return "state"
+
+        produced: list = []
+        async for _chunk in stream_response(
+            agent, "go", MagicMock(), model_history=[], on_complete=produced.extend
+        ):
+            pass
+
+        parts = [part for msg in produced for part in msg.parts]
+        assert any(isinstance(part, ToolCallPart) for part in parts)
+        assert any(isinstance(part, ToolReturnPart) for part in parts)
+
+    async def test_context_is_sent_after_prompt(self) -> None:
+        """Per-turn context follows the user's prompt in the final request."""
+        from pydantic_ai import Agent, capture_run_messages
+        from pydantic_ai.messages import SystemPromptPart, UserPromptPart
+        from pydantic_ai.models.test import TestModel
+
+        from jdo.ai.context import stream_response
+
+        agent = Agent(TestModel(custom_output_text="ok"), system_prompt="static")
+
+        with capture_run_messages() as sent:
+            async for _chunk in stream_response(
+                agent,
+                "hello",
+                MagicMock(),
+                model_history=[],
+                context="## Current Context\n- today",
+            ):
+                pass
+
+        parts = sent[0].parts
+        assert isinstance(parts[0], SystemPromptPart)
+        assert parts[0].content == "static"
+        assert isinstance(parts[-1], UserPromptPart)
+        assert parts[-1].content == ["hello", "## Current Context\n- today"]
+
+    async def test_stored_history_omits_context(self) -> None:
+        """Only the newest request carries a snapshot; stored turns keep the prompt."""
+        from pydantic_ai import Agent, capture_run_messages
+        from pydantic_ai.messages import ModelRequest, UserPromptPart
+        from pydantic_ai.models.test import TestModel
+
+        from jdo.ai.context import stream_response
+
+        agent = Agent(TestModel(custom_output_text="ok"))
+        history: list = []
+
+        for turn in ("first", "second"):
+            with capture_run_messages() as sent:
+                async for _chunk in stream_response(
+                    agent,
+                    turn,
+                    MagicMock(),
+                    model_history=list(history),
+                    on_complete=history.extend,
+                    context=f"snapshot for {turn}",
+                ):
+                    pass
+
+        prompts = [
+            part.content
+            for message in sent
+            if isinstance(message, ModelRequest)
+            for part in message.parts
+            if isinstance(part, UserPromptPart)
+        ]
+        assert prompts == ["first", ["second", "snapshot for second"]]
+        assert history[-2].parts[-1].content == "second"
+
+
 class TestConversationContext:
     """Tests for building conversation context for AI."""
 
@@ -379,3 +510,131 @@ def async_context_manager(result: Any):
             pass
 
     return AsyncCM()
+
+
+class TestInterruptedRuns:
+    """Tests for cancelling a streaming run."""
+
+    def _agent(self):
+        """Agent that creates a commitment, then streams until cancelled."""
+        from pydantic_ai.models.function import DeltaToolCall, FunctionModel
+
+        from jdo.ai.agent import create_agent_with_model
+
+        async def stream_fn(messages, info):
+            if len(messages) == 1:
+                yield {
+                    0: DeltaToolCall(
+                        name="create_commitment",
+                        json_args=(
+                            '{"deliverable": "Send report", "stakeholder": "Sarah", '
+                            '"due_date": "2025-12-20"}'
+                        ),
+                    )
+                }
+                return
+            yield "Created the "
+            await asyncio.sleep(10)
+            yield "commitment."
+
+        return create_agent_with_model(FunctionModel(stream_function=stream_fn))
+
+    def _deps(self, db_engine):
+        from sqlmodel import Session
+
+        from jdo.ai.agent import JDODependencies
+        from jdo.db.staging import StagedMutations
+
+        return JDODependencies(
+            session=MagicMock(), mutations=StagedMutations(lambda: Session(db_engine))
+        )
+
+    async def test_cancel_rolls_back_tool_writes_and_keeps_partial(self, db_engine) -> None:
+        """Cancelling mid-stream discards the run's writes and records the partial text."""
+        from pydantic_ai.messages import ModelResponse
+        from sqlmodel import Session, select
+
+        from jdo.ai.context import INTERRUPTED_MARKER, stream_response
+        from jdo.models import Commitment
+
+        started = asyncio.Event()
+        produced: list = []
+        chunks: list[str] = []
+
+        async def consume() -> None:
+            async for chunk in stream_response(
+                self._agent(),
+                "report for Sarah",
+                self._deps(db_engine),
+                model_history=[],
+                on_complete=produced.extend,
+            ):
+                chunks.append(chunk)
+                started.set()
+
+        task = asyncio.create_task(consume())
+        await asyncio.wait_for(started.wait(), timeout=5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        with Session(db_engine) as session:
+            assert session.exec(select(Commitment)).all() == []
+        assert chunks == ["Created the "]
+        assert len(produced) == 2
+        assert produced[0].parts[-1].content == "report for Sarah"
+        assert isinstance(produced[1], ModelResponse)
+        assert produced[1].parts[0].content == f"Created the\n\n{INTERRUPTED_MARKER}"
+
+    async def test_completed_run_commits_tool_writes(self, db_engine) -> None:
+        """Writes staged by tools are committed when the run finishes."""
+        from pydantic_ai.models.function import DeltaToolCall, FunctionModel
+        from sqlmodel import Session, select
+
+        from jdo.ai.agent import create_agent_with_model
+        from jdo.ai.context import stream_response
+        from jdo.models import Commitment
+
+        async def stream_fn(messages, info):
+            if len(messages) == 1:
+                yield {
+                    0: DeltaToolCall(
+                        name="create_commitment",
+                        json_args=(
+                            '{"deliverable": "Send report", "stakeholder": "Sarah", '
+                            '"due_date": "2025-12-20"}'
+                        ),
+                    )
+                }
+                return
+            yield "Done."
+
+        agent = create_agent_with_model(FunctionModel(stream_function=stream_fn))
+        chunks = [chunk async for chunk in stream_response(agent, "go", self._deps(db_engine))]
+
+        assert "".join(chunks) == "Done."
+        with Session(db_engine) as session:
+            assert [c.deliverable for c in session.exec(select(Commitment))] == ["Send report"]
+
+
+class TestInterruptedMessages:
+    """Tests for reducing an interrupted run to valid history."""
+
+    def test_keeps_prompt_and_partial_text_only(self) -> None:
+        from pydantic_ai.messages import (
+            ModelRequest,
+            ModelResponse,
+            ToolCallPart,
+            UserPromptPart,
+        )
+
+        from jdo.ai.context import INTERRUPTED_MARKER, interrupted_messages
+
+        request = ModelRequest(parts=[UserPromptPart(content="hi")])
+        run = [request, ModelResponse(parts=[ToolCallPart(tool_name="q", args={})])]
+
+        messages = interrupted_messages(run, "")
+
+        assert messages[0] is request
+        assert messages[1].parts == [TextPart(content=INTERRUPTED_MARKER)]
+        assert interrupted_messages([], "partial") == []
@@ -433,3 +433,126 @@ class TestRecurringCommitmentExtraction:
 
         assert "stakeholder_name" in missing
         assert "recurrence_type" in missing
+
+
+class TestPlanExtraction:
+    """Tests for single-call plan extraction."""
+
+    @staticmethod
+    def _candidates() -> list:
+        from uuid import UUID
+
+        from jdo.ai.extraction import LinkCandidate
+
+        goal_id = UUID(int=1)
+        return [
+            LinkCandidate(key="g1", kind="goal", entity_id=goal_id, title="Grow revenue"),
+            LinkCandidate(
+                key="m1",
+                kind="milestone",
+                entity_id=UUID(int=2),
+                title="Close Q1 deals",
+                goal_id=goal_id,
+            ),
+        ]
+
+    async def test_extract_plan_resolves_link_keys(self) -> None:
+        """Candidate keys become entity ids; milestones imply their goal; unknown keys drop."""
+        from jdo.ai.extraction import ExtractedPlan, ExtractedPlanCommitment, extract_plan
+
+        plan = ExtractedPlan(
+            commitments=[
+                ExtractedPlanCommitment(
+                    deliverable="Pitch deck",
+                    stakeholder_name="Sarah",
+                    due_date=date(2025, 12, 20),
+                    goal_id="g1",
+                ),
+                ExtractedPlanCommitment(
+                    deliverable="Contract",
+                    stakeholder_name="Acme",
+                    due_date=date(2025, 12, 22),
+                    milestone_id="M1",
+                ),
+                ExtractedPlanCommitment(
+                    deliverable="Notes",
+                    stakeholder_name="Bob",
+                    due_date=date(2025, 12, 23),
+                    goal_id="g9",
+                ),
+            ]
+        )
+
+        with patch("jdo.ai.extraction.create_extraction_agent") as mock_create:
+            mock_agent = MagicMock()
+            mock_result = MagicMock()
+            mock_result.output = plan
+            mock_agent.run = AsyncMock(return_value=mock_result)
+            mock_create.return_value = mock_agent
+
+            result = await extract_plan(
+                [{"role": "user", "content": "deck for Sarah"}], link_candidates=self._candidates()
+            )
+
+        prompt_parts = mock_agent.run.call_args.args[0]
+        assert prompt_parts[1].startswith("Link candidates:")
+        assert "m1|milestone|Close Q1 deals" in prompt_parts[1]
+        first, second, third = result.commitments
+        assert first.goal_id == str(self._candidates()[0].entity_id)
+        assert first.milestone_id is None
+        assert second.milestone_id == str(self._candidates()[1].entity_id)
+        assert second.goal_id == first.goal_id
+        assert third.goal_id is None
+
+    async def test_extract_plan_with_test_model(self) -> None:
+        """The plan schema round-trips through a real agent run."""
+        from jdo.ai.extraction import ExtractedPlan, extract_plan
+
+        with patch("jdo.ai.extraction.create_extraction_agent") as mock_create:
+            from pydantic_ai import Agent
+
+            mock_create.return_value = Agent(TestModel(), output_type=ExtractedPlan)
+
+            result = await extract_plan([{"role": "user", "content": "weekly report"}])
+
+        assert isinstance(result, ExtractedPlan)
+
+    def test_to_draft_data(self) -> None:
+        """Draft data uses ISO strings and lower-case recurrence types."""
+        from jdo.ai.extraction import (
+            ExtractedPlan,
+            ExtractedPlanCommitment,
+            ExtractedPlanTask,
+            ExtractedRecurringCommitment,
+        )
+
+        plan = ExtractedPlan(
+            commitments=[
+                ExtractedPlanCommitment(
+                    deliverable="Report",
+                    stakeholder_name="Sarah",
+                    due_date=date(2025, 12, 20),
+                    due_time=time(15, 0),
+                    tasks=[ExtractedPlanTask(title="Gather data", estimated_hours=2)],
+                )
+            ],
+            recurring_commitments=[
+                ExtractedRecurringCommitment(
+                    deliverable_template="Standup notes",
+                    stakeholder_name="Team",
+                    recurrence_type="Daily",
+                    due_time=time(9, 30),
+                )
+            ],
+        )
+
+        data = plan.to_draft_data()
+
+        commitment = data["commitments"][0]
+        assert commitment["stakeholder"] == "Sarah"
+        assert commitment["due_date"] == "2025-12-20"
+        assert commitment["due_time"] == "15:00:00"
+        assert commitment["tasks"][0]["title"] == "Gather data"
+        recurring = data["recurring_commitments"][0]
+        assert recurring["recurrence_type"] == "daily"
+        assert recurring["due_time"] == "09:30:00"
@@ -18,6 +18,7 @@ from jdo.ai.extraction import (
     ExtractedGoal,
     create_extraction_agent,
 )
+from jdo.ai.scheduler import ScheduledModel
 
 
 class TestExtractionAgentCredentials:
@@ -65,8 +66,10 @@ class TestExtractionAgentCredentials:
 
             # Agent should be created successfully
             assert agent is not None
-            # Model should be OpenRouterModel (not the original string)
-            assert isinstance(agent.model, OpenRouterModel)
+            # Model should be OpenRouterModel (not the original string),
+            # behind the provider's rate-limit scheduler
+            assert isinstance(agent.model, ScheduledModel)
+            assert isinstance(agent.model.wrapped, OpenRouterModel)
 
     def test_create_extraction_agent_with_test_model_works(self) -> None:
         """Extraction agent works with 'test' model (no credentials needed)."""
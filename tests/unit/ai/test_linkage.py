@@ -0,0 +1,109 @@
+"""Tests for local link candidate pre-ranking."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from jdo.ai.extraction import ExtractedPlan, ExtractedPlanCommitment
+from jdo.ai.linkage import apply_resolved_link, select_link_candidates
+from jdo.models import Goal, Milestone
+from jdo.models.goal import GoalStatus
+
+
+def _goal(db_session, title: str, problem: str, **kwargs) -> Goal:
+    goal = Goal(title=title, problem_statement=problem, solution_vision=title, **kwargs)
+    db_session.add(goal)
+    db_session.flush()
+    return goal
+
+
+def _commitment(deliverable: str) -> ExtractedPlanCommitment:
+    return ExtractedPlanCommitment(
+        deliverable=deliverable, stakeholder_name="Sarah", due_date=date(2025, 12, 20)
+    )
+
+
+class TestSelectLinkCandidates:
+    """Tests for select_link_candidates."""
+
+    def test_no_goals(self, db_session) -> None:
+        selection = select_link_candidates(db_session, "report for Sarah")
+
+        assert selection.candidates == []
+        assert selection.resolved is None
+
+    def test_unrelated_goals_are_not_offered(self, db_session) -> None:
+        _goal(db_session, "Run a marathon", "Out of shape")
+        _goal(db_session, "Learn Spanish", "Can't talk to family")
+
+        selection = select_link_candidates(db_session, "send invoice to Acme")
+
+        assert selection.candidates == []
+        assert selection.resolved is None
+
+    def test_clear_goal_match_resolves_without_candidates(self, db_session) -> None:
+        goal = _goal(db_session, "Grow enterprise revenue", "Revenue is flat")
+        _goal(db_session, "Run a marathon", "Out of shape")
+        _goal(db_session, "Learn Spanish", "Can't talk to family")
+        _goal(db_session, "Old revenue goal", "Done", status=GoalStatus.ACHIEVED)
+
+        selection = select_link_candidates(db_session, "enterprise revenue forecast for the CFO")
+
+        assert selection.candidates == []
+        assert selection.resolved is not None
+        assert selection.resolved.entity_id == goal.id
+
+    def test_close_matches_offer_top_candidates(self, db_session) -> None:
+        first = _goal(db_session, "Improve sales pipeline", "Pipeline is thin")
+        second = _goal(db_session, "Improve sales training", "Reps are new")
+        _goal(db_session, "Run a marathon", "Out of shape")
+
+        selection = select_link_candidates(db_session, "sales deck", limit=1)
+
+        assert selection.resolved is None
+        assert len(selection.candidates) == 1
+        assert selection.candidates[0].entity_id in {first.id, second.id}
+        assert selection.candidates[0].key == "g1"
+
+    def test_milestone_match_resolves_with_parent_goal(self, db_session) -> None:
+        goal = _goal(db_session, "Launch product", "No product yet")
+        _goal(db_session, "Run a marathon", "Out of shape")
+        milestone = Milestone(goal_id=goal.id, title="Private beta", target_date=date(2026, 1, 1))
+        other = Milestone(goal_id=goal.id, title="Public launch", target_date=date(2026, 3, 1))
+        db_session.add_all([milestone, other])
+        db_session.flush()
+
+        selection = select_link_candidates(db_session, "invite private beta testers")
+
+        assert selection.resolved is not None
+        assert selection.resolved.kind == "milestone"
+        assert selection.resolved.entity_id == milestone.id
+        assert selection.resolved.goal_id == goal.id
+
+
+class TestApplyResolvedLink:
+    """Tests for apply_resolved_link."""
+
+    def test_single_commitment_is_linked(self, db_session) -> None:
+        goal = _goal(db_session, "Grow enterprise revenue", "Revenue is flat")
+        _goal(db_session, "Run a marathon", "Out of shape")
+        selection = select_link_candidates(db_session, "enterprise revenue forecast")
+        plan = ExtractedPlan(commitments=[_commitment("Forecast")])
+
+        apply_resolved_link(plan, selection.resolved)
+
+        assert plan.commitments[0].goal_id == str(goal.id)
+        assert plan.commitments[0].milestone_id is None
+
+    def test_multiple_commitments_link_only_matching_ones(self, db_session) -> None:
+        goal = _goal(db_session, "Grow enterprise revenue", "Revenue is flat")
+        _goal(db_session, "Run a marathon", "Out of shape")
+        selection = select_link_candidates(db_session, "enterprise revenue forecast; book dentist")
+        plan = ExtractedPlan(
+            commitments=[_commitment("Enterprise revenue forecast"), _commitment("Book dentist")]
+        )
+
+        apply_resolved_link(plan, selection.resolved)
+
+        assert plan.commitments[0].goal_id == str(goal.id)
+        assert plan.commitments[1].goal_id is None
@@ -0,0 +1,211 @@
+"""Tests for latency-aware provider routing."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelAPIError
+from pydantic_ai.messages import ModelResponse, TextPart
+from pydantic_ai.models.function import FunctionModel
+
+from jdo.ai.routing import (
+    CircuitBreaker,
+    CircuitState,
+    ModelRouter,
+    Route,
+    RoutedModel,
+    RouteStats,
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _model(text: str) -> FunctionModel:
+    return FunctionModel(lambda messages, info: ModelResponse(parts=[TextPart(content=text)]))
+
+
+def _failing_model() -> FunctionModel:
+    def fail(messages, info):
+        raise httpx.ConnectError("refused")
+
+    return FunctionModel(fail)
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold_then_allows_one_trial(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, cooldown=30, clock=clock)
+
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+
+        clock.now = 30
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()  # Only one trial at a time
+
+    def test_trial_outcome_closes_or_reopens(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        clock.now = 20
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_released_trial_can_be_claimed_again(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=0, clock=clock)
+        breaker.record_failure()
+
+        assert breaker.allow()
+        breaker.release()
+        assert breaker.allow()
+
+
+class TestRouteStats:
+    """Tests for RouteStats."""
+
+    def test_percentile_and_error_rate(self) -> None:
+        stats = RouteStats()
+        for latency in [0.1, 0.2, 0.3, 0.4, 1.0]:
+            stats.record_latency(latency)
+        stats.record_outcome(ok=True)
+        stats.record_outcome(ok=False)
+
+        assert stats.latency_percentile(0.9) == 1.0
+        assert stats.latency_percentile(0.5) == 0.3
+        assert stats.median_latency == 0.3
+        assert stats.error_rate == 0.5
+
+    def test_window_is_bounded(self) -> None:
+        stats = RouteStats()
+        for _ in range(100):
+            stats.record_latency(1.0)
+
+        assert len(stats.latencies) == 20
+
+
+class TestModelRouter:
+    """Tests for route ranking and hedging thresholds."""
+
+    def test_ranks_by_expected_latency_and_skips_open_circuits(self) -> None:
+        slow, fast, failing, down = (Route(name, _model(name)) for name in "abcd")
+        slow.record_success(1.0)
+        fast.record_success(0.2)
+        failing.record_failure()
+        for _ in range(3):
+            down.record_failure()
+
+        router = ModelRouter([slow, fast, failing, down])
+
+        assert [route.name for route in router.ranked()] == ["b", "a", "c"]
+
+    def test_errors_inflate_expected_latency(self) -> None:
+        flaky, steady = Route("flaky", _model("x")), Route("steady", _model("y"))
+        flaky.record_success(0.2)
+        flaky.record_failure()
+        steady.record_success(0.5)
+
+        assert ModelRouter([flaky, steady]).ranked()[0] is steady
+
+    def test_hedge_delay_needs_samples_and_has_a_floor(self) -> None:
+        route = Route("a", _model("a"))
+        router = ModelRouter([route])
+        for _ in range(4):
+            route.record_success(0.01)
+        assert router.hedge_delay(route) is None
+
+        route.record_success(0.01)
+        assert router.hedge_delay(route) == 0.25
+        assert ModelRouter([route], hedge=False).hedge_delay(route) is None
+
+    def test_requires_a_route(self) -> None:
+        with pytest.raises(ValueError, match="route"):
+            ModelRouter([])
+
+
+class TestRoutedModel:
+    """Tests for RoutedModel requests."""
+
+    async def test_request_fails_over_to_next_route(self) -> None:
+        primary = Route("primary", _failing_model())
+        backup = Route("backup", _model("from backup"))
+        agent = Agent(RoutedModel(ModelRouter([primary, backup])))
+
+        result = await agent.run("hi")
+
+        assert result.output == "from backup"
+        assert primary.stats.error_rate == 1.0
+        assert backup.stats.latencies
+
+    async def test_fails_fast_when_every_circuit_is_open(self) -> None:
+        primary = Route("primary", _failing_model())
+        agent = Agent(RoutedModel(ModelRouter([primary])))
+        for _ in range(3):
+            with pytest.raises(httpx.ConnectError):
+                await agent.run("hi")
+
+        with pytest.raises(ModelAPIError, match="circuits open"):
+            await agent.run("hi")
+
+    async def test_other_errors_propagate_without_failover(self) -> None:
+        def broken(messages, info):
+            msg = "bug"
+            raise RuntimeError(msg)
+
+        backup = Route("backup", _model("unused"))
+        agent = Agent(RoutedModel(ModelRouter([Route("primary", FunctionModel(broken)), backup])))
+
+        with pytest.raises(RuntimeError, match="bug"):
+            await agent.run("hi")
+        assert not backup.stats.outcomes
+
+
+class TestCreateAgentRouting:
+    """Tests for wiring fallback models into create_agent."""
+
+    def test_fallback_models_enable_routing(self) -> None:
+        from jdo.ai.agent import create_agent
+
+        settings = MagicMock(
+            ai_provider="openai",
+            ai_model="gpt-5.1-mini",
+            ai_fallback_models=["openrouter:openai/gpt-5.1-mini", "bogus", "nope:model"],
+            ai_hedge_requests=True,
+        )
+        creds = MagicMock(api_key="sk-test-key-1234567890")
+        with (
+            patch("jdo.ai.agent.get_settings", return_value=settings),
+            patch("jdo.ai.agent.get_credentials", return_value=creds),
+        ):
+            agent = create_agent()
+
+        assert isinstance(agent.model, RoutedModel)
+        assert [route.name for route in agent.model.router.routes] == [
+            "openai:gpt-5.1-mini",
+            "openrouter:openai/gpt-5.1-mini",
+        ]
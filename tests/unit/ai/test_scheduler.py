@@ -0,0 +1,273 @@
+"""Tests for the AI call rate limiter and priority scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelResponse, TextPart
+from pydantic_ai.models.function import FunctionModel
+from pydantic_ai.usage import RequestUsage
+
+from jdo.ai.scheduler import (
+    RATE_LIMIT_BACKOFF_SECONDS,
+    RATE_WINDOW_SECONDS,
+    Priority,
+    ProviderScheduler,
+    RateBudget,
+    ScheduledModel,
+    background_priority,
+    current_priority,
+    format_scheduler_metrics,
+    get_scheduler,
+    reset_schedulers,
+    scheduler_metrics,
+)
+from jdo.ai.timeout import run_sync_with_timeout
+
+
+class FakeTime:
+    """Clock and sleep where sleeping advances the clock instantly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+def _scheduler(fake: FakeTime, **budget: int) -> ProviderScheduler:
+    return ProviderScheduler("openai", RateBudget(**budget), clock=fake.clock, sleep=fake.sleep)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_schedulers():
+    reset_schedulers()
+    yield
+    reset_schedulers()
+
+
+class TestProviderScheduler:
+    """Tests for ProviderScheduler admission."""
+
+    async def test_unlimited_budget_admits_immediately(self) -> None:
+        fake = FakeTime()
+        scheduler = _scheduler(fake)
+
+        for _ in range(100):
+            await scheduler.acquire(Priority.INTERACTIVE, 10_000)
+
+        metrics = scheduler.metrics()[Priority.INTERACTIVE]
+        assert metrics.admitted == 100
+        assert metrics.delayed == 0
+        assert fake.now == 0
+
+    async def test_requests_per_minute_delays_until_window_frees(self) -> None:
+        fake = FakeTime()
+        scheduler = _scheduler(fake, requests_per_minute=2)
+
+        await scheduler.acquire(Priority.INTERACTIVE, 1)
+        fake.now = 10
+        await scheduler.acquire(Priority.INTERACTIVE, 1)
+        await scheduler.acquire(Priority.INTERACTIVE, 1)
+
+        # The third request waits for the first to leave the window
+        assert fake.now == pytest.approx(RATE_WINDOW_SECONDS)
+        metrics = scheduler.metrics()[Priority.INTERACTIVE]
+        assert metrics.delayed == 1
+        assert metrics.max_wait_seconds == pytest.approx(RATE_WINDOW_SECONDS - 10)
+
+    async def test_tokens_per_minute_uses_settled_usage(self) -> None:
+        fake = FakeTime()
+        scheduler = _scheduler(fake, tokens_per_minute=1000)
+
+        grant = await scheduler.acquire(Priority.INTERACTIVE, 900)
+        # The provider reported far fewer tokens than estimated
+        scheduler.settle(grant, 200)
+        await scheduler.acquire(Priority.INTERACTIVE, 700)
+        assert fake.now == 0
+
+        await scheduler.acquire(Priority.INTERACTIVE, 500)
+        assert fake.now == pytest.approx(RATE_WINDOW_SECONDS)
+
+    async def test_oversized_request_waits_for_empty_window(self) -> None:
+        fake = FakeTime()
+        scheduler = _scheduler(fake, tokens_per_minute=100)
+
+        await scheduler.acquire(Priority.INTERACTIVE, 50)
+        await scheduler.acquire(Priority.INTERACTIVE, 5000)
+
+        assert fake.now == pytest.approx(RATE_WINDOW_SECONDS)
+
+    async def test_background_keeps_headroom_for_interactive(self) -> None:
+        fake = FakeTime()
+        scheduler = _scheduler(fake, requests_per_minute=5)
+
+        for _ in range(4):
+            await scheduler.acquire(Priority.BACKGROUND, 1)
+        assert fake.now == 0
+
+        # Interactive may use the last slot; background may not
+        await scheduler.acquire(Priority.INTERACTIVE, 1)
+        assert fake.now == 0
+        await scheduler.acquire(Priority.BACKGROUND, 1)
+        assert fake.now == pytest.approx(RATE_WINDOW_SECONDS)
+
+    async def test_interactive_is_admitted_before_queued_background(self) -> None:
+        fake = FakeTime()
+        scheduler = _scheduler(fake, requests_per_minute=1)
+        await scheduler.acquire(Priority.INTERACTIVE, 1)
+        order: list[Priority] = []
+
+        async def request(priority: Priority) -> None:
+            await scheduler.acquire(priority, 1)
+            order.append(priority)
+
+        background = asyncio.create_task(request(Priority.BACKGROUND))
+        await asyncio.sleep(0)
+        await request(Priority.INTERACTIVE)
+        await background
+
+        assert order == [Priority.INTERACTIVE, Priority.BACKGROUND]
+        assert scheduler.metrics()[Priority.BACKGROUND].max_depth == 1
+
+    async def test_rate_limit_response_pauses_background_only(self) -> None:
+        fake = FakeTime()
+        scheduler = _scheduler(fake)
+        scheduler.record_rate_limited()
+
+        await scheduler.acquire(Priority.INTERACTIVE, 1)
+        assert fake.now == 0
+        await scheduler.acquire(Priority.BACKGROUND, 1)
+        assert fake.now == pytest.approx(RATE_LIMIT_BACKOFF_SECONDS)
+
+    async def test_metrics_report_queue_depth_while_waiting(self) -> None:
+        fake = FakeTime()
+        scheduler = _scheduler(fake, requests_per_minute=1)
+        await scheduler.acquire(Priority.INTERACTIVE, 1)
+        released = asyncio.Event()
+
+        async def gated_sleep(seconds: float) -> None:
+            await released.wait()
+            fake.now += seconds
+
+        scheduler.sleep = gated_sleep
+        waiting = asyncio.create_task(scheduler.acquire(Priority.INTERACTIVE, 1))
+        await asyncio.sleep(0)
+
+        assert scheduler.metrics()[Priority.INTERACTIVE].depth == 1
+        fake.now = RATE_WINDOW_SECONDS
+        released.set()
+        await waiting
+        assert scheduler.metrics()[Priority.INTERACTIVE].depth == 0
+
+
+class TestPriorityContext:
+    """Tests for the background priority context."""
+
+    def test_default_is_interactive(self) -> None:
+        assert current_priority() == Priority.INTERACTIVE
+
+    def test_background_block_is_restored(self) -> None:
+        with background_priority():
+            assert current_priority() == Priority.BACKGROUND
+        assert current_priority() == Priority.INTERACTIVE
+
+    def test_priority_carries_into_sync_worker_thread(self) -> None:
+        with background_priority():
+            assert run_sync_with_timeout(current_priority) == Priority.BACKGROUND
+
+
+class TestScheduledModel:
+    """Tests for ScheduledModel."""
+
+    async def test_requests_are_admitted_and_settled(self) -> None:
+        scheduler = ProviderScheduler("openai")
+
+        def reply(messages, info):
+            return ModelResponse(
+                parts=[TextPart(content="ok")],
+                usage=RequestUsage(input_tokens=30, output_tokens=12),
+            )
+
+        agent = Agent(ScheduledModel(FunctionModel(reply), scheduler))
+        with background_priority():
+            await agent.run("hi")
+
+        metrics = scheduler.metrics()
+        assert metrics[Priority.BACKGROUND].admitted == 1
+        assert metrics[Priority.INTERACTIVE].admitted == 0
+        assert [grant.tokens for grant in scheduler._window] == [42]
+
+    async def test_streamed_requests_are_admitted(self) -> None:
+        scheduler = ProviderScheduler("openai")
+
+        async def stream(messages, info):
+            yield "hello"
+
+        agent = Agent(ScheduledModel(FunctionModel(stream_function=stream), scheduler))
+        async with agent.run_stream("hi") as result:
+            assert await result.get_output() == "hello"
+
+        assert scheduler.metrics()[Priority.INTERACTIVE].admitted == 1
+
+    async def test_provider_rate_limit_triggers_backoff(self) -> None:
+        scheduler = ProviderScheduler("openai")
+
+        def limited(messages, info):
+            raise ModelHTTPError(429, "gpt-5.1-mini")
+
+        agent = Agent(ScheduledModel(FunctionModel(limited), scheduler))
+        with pytest.raises(ModelHTTPError):
+            await agent.run("hi")
+
+        assert scheduler._backoff_until > 0
+
+
+class TestSchedulerRegistry:
+    """Tests for the per-provider scheduler registry."""
+
+    def test_budget_comes_from_settings(self) -> None:
+        settings = MagicMock(
+            ai_requests_per_minute={"openai": 500}, ai_tokens_per_minute={"openai": 200_000}
+        )
+        with patch("jdo.ai.scheduler.get_settings", return_value=settings):
+            openai = get_scheduler("openai")
+            openrouter = get_scheduler("openrouter")
+
+        assert openai.budget == RateBudget(500, 200_000)
+        assert openrouter.budget == RateBudget()
+        assert get_scheduler("openai") is openai
+        assert set(scheduler_metrics()) == {"openai", "openrouter"}
+
+    async def test_format_scheduler_metrics(self) -> None:
+        assert "No AI requests yet" in format_scheduler_metrics()
+
+        with patch(
+            "jdo.ai.scheduler.get_settings",
+            return_value=MagicMock(ai_requests_per_minute={}, ai_tokens_per_minute={}),
+        ):
+            scheduler = get_scheduler("openai")
+        await scheduler.acquire(Priority.INTERACTIVE, 10)
+        text = format_scheduler_metrics()
+
+        assert "openai interactive 1 sent" in text
+        assert "openai background  0 sent, 0 delayed" in text
+
+    def test_provider_models_share_the_provider_scheduler(self) -> None:
+        from jdo.ai.agent import _create_provider_model
+
+        creds = MagicMock(api_key="sk-test-key-1234567890")
+        with patch("jdo.ai.agent.get_credentials", return_value=creds):
+            first = _create_provider_model("openai", "gpt-5.1-mini")
+            second = _create_provider_model("openai", "gpt-5.1")
+
+        assert isinstance(first, ScheduledModel)
+        assert first.scheduler is second.scheduler
@@ -0,0 +1,129 @@
+"""Tests for the pre-computed user-state snapshot."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import SQLModel
+
+from jdo.ai.agent import JDODependencies
+from jdo.ai.snapshot import SNAPSHOT_HEADING, StateSnapshotCache, render_state_snapshot
+from jdo.ai.tool_output import IdAliases
+from jdo.models import Commitment, CommitmentStatus, Stakeholder, StakeholderType
+from jdo.utils.datetime import today_date
+
+
+@pytest.fixture
+def snapshot_db(tmp_path: Path):
+    """File database reachable through get_session()."""
+    from jdo.db.engine import get_engine, reset_engine
+
+    reset_engine()
+    with patch("jdo.db.engine.get_settings") as mock_settings:
+        mock_settings.return_value.database_path = tmp_path / "test.db"
+        SQLModel.metadata.create_all(get_engine())
+        yield tmp_path / "test.db"
+    reset_engine()
+
+
+def _add_commitment(deliverable: str, days_from_today: int, status=CommitmentStatus.PENDING):
+    from jdo.db.session import get_session
+
+    with get_session() as session:
+        stakeholder = Stakeholder(name="Sarah", type=StakeholderType.PERSON)
+        session.add(stakeholder)
+        session.add(
+            Commitment(
+                deliverable=deliverable,
+                stakeholder_id=stakeholder.id,
+                due_date=today_date() + timedelta(days=days_from_today),
+                status=status,
+            )
+        )
+
+
+class TestRenderStateSnapshot:
+    """Tests for render_state_snapshot."""
+
+    def test_summarizes_active_and_overdue(self, snapshot_db) -> None:
+        from jdo.db.session import get_session
+
+        _add_commitment("Late report", -2)
+        _add_commitment("Deck", 3, CommitmentStatus.AT_RISK)
+        _add_commitment("Done thing", 1, CommitmentStatus.COMPLETED)
+        aliases = IdAliases()
+
+        with get_session() as session:
+            text = render_state_snapshot(session, aliases, available_hours=6.0, version=4)
+
+        lines = text.splitlines()
+        assert lines[0] == f"{SNAPSHOT_HEADING} (v4)"
+        assert "Active commitments: 2 (1 overdue, 1 at risk)" in lines
+        assert lines[2].startswith("Capacity: 6.0h available")
+        assert lines[3].startswith("Integrity: ")
+        assert "id|deliverable|stakeholder|due|status" in lines
+        assert any(line.startswith("c1|Late report|Sarah|") and "overdue" in line for line in lines)
+        assert "Done thing" not in text
+        assert len(aliases) == 2
+
+    def test_capacity_without_available_hours(self, snapshot_db) -> None:
+        from jdo.db.session import get_session
+
+        with get_session() as session:
+            text = render_state_snapshot(session, IdAliases())
+
+        assert "Capacity: available hours not set" in text
+        assert "Active commitments: 0 (0 overdue, 0 at risk)" in text
+
+
+class TestStateSnapshotCache:
+    """Tests for rebuilding the snapshot only when inputs change."""
+
+    def test_reused_until_database_changes(self, snapshot_db) -> None:
+        cache = StateSnapshotCache()
+        deps = JDODependencies(session=MagicMock())
+        _add_commitment("Report", 2)
+
+        first = cache.get(deps)
+        second = cache.get(deps)
+        _add_commitment("Slides", 4)
+        third = cache.get(deps)
+
+        assert first is second
+        assert first.version == 1
+        assert third.version == 2
+        assert "Slides" in third.text
+
+    def test_rebuilt_after_write_by_another_process(self, snapshot_db: Path) -> None:
+        cache = StateSnapshotCache()
+        deps = JDODependencies(session=MagicMock())
+        _add_commitment("Report", 2)
+        _add_commitment("Slides", 4)
+        first = cache.get(deps)
+
+        # A separate connection stands in for `jdo capture` in another process
+        with sqlite3.connect(snapshot_db) as other:
+            other.execute("DELETE FROM commitments WHERE deliverable = 'Slides'")
+        second = cache.get(deps)
+        with sqlite3.connect(snapshot_db) as other:
+            other.execute("UPDATE commitments SET deliverable = 'Memo', updated_at = '2999-01-01'")
+        third = cache.get(deps)
+
+        assert "Slides" in first.text
+        assert "Slides" not in second.text
+        assert "Memo" in third.text
+
+    def test_rebuilt_when_available_hours_change(self, snapshot_db) -> None:
+        cache = StateSnapshotCache()
+        deps = JDODependencies(session=MagicMock())
+
+        first = cache.get(deps)
+        deps.set_available_hours(5)
+        second = cache.get(deps)
+
+        assert second.version == first.version + 1
+        assert "5.0h available" in second.text
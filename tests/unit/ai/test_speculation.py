@@ -0,0 +1,166 @@
+"""Tests for speculative plan extraction."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+
+import pytest
+from pydantic_ai.usage import RunUsage
+
+from jdo.ai.context import mark_interrupted
+from jdo.ai.extraction import ExtractedPlan, ExtractedPlanCommitment
+from jdo.ai.scheduler import Priority, current_priority
+from jdo.ai.speculation import (
+    SpeculationStats,
+    SpeculativeExtraction,
+    looks_like_commitment_proposal,
+)
+
+PROPOSAL = (
+    "I'll create this commitment:\n\n  Deliverable: Quarterly report\n"
+    "  Stakeholder: Sarah\n  Due: 2025-01-17\n\nDoes this look right? (yes/no/refine)"
+)
+
+
+def _plan() -> ExtractedPlan:
+    return ExtractedPlan(
+        commitments=[
+            ExtractedPlanCommitment(
+                deliverable="Quarterly report", stakeholder_name="Sarah", due_date=date(2025, 1, 17)
+            )
+        ]
+    )
+
+
+class TestLooksLikeCommitmentProposal:
+    """Tests for the proposal heuristic."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            PROPOSAL,
+            "Shall I create a commitment to send Bob the slides by Monday?",
+            "Want me to add that as a commitment for Sarah?",
+        ],
+    )
+    def test_detects_proposals(self, text: str) -> None:
+        assert looks_like_commitment_proposal(text)
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "Who is this commitment for?",
+            "Does this look right?",
+            "You have 3 active commitments.",
+        ],
+    )
+    def test_ignores_other_responses(self, text: str) -> None:
+        assert not looks_like_commitment_proposal(text)
+
+    def test_ignores_interrupted_proposal(self) -> None:
+        assert not looks_like_commitment_proposal(mark_interrupted(PROPOSAL))
+
+
+class TestSpeculationStats:
+    """Tests for SpeculationStats."""
+
+    def test_hit_rate_counts_cancelled_and_misses(self) -> None:
+        stats = SpeculationStats(launched=4, hits=1, misses=1, cancelled=2)
+
+        assert stats.hit_rate == 0.25
+
+    def test_hit_rate_without_outcomes(self) -> None:
+        assert SpeculationStats().hit_rate == 0.0
+
+
+class TestFormatStats:
+    """Tests for the /jobs rendering of speculation outcomes."""
+
+    def test_nothing_launched(self) -> None:
+        assert "None launched yet" in SpeculativeExtraction().format_stats()
+
+    def test_outcomes_and_tokens(self) -> None:
+        speculation = SpeculativeExtraction()
+        speculation.stats = SpeculationStats(
+            launched=4, hits=1, misses=1, cancelled=2, used_tokens=120, wasted_tokens=300
+        )
+
+        text = speculation.format_stats()
+
+        assert "4 launched: 1 hit(s), 1 miss(es), 2 cancelled (hit rate 25%)" in text
+        assert "Tokens: 120 used, 300 wasted" in text
+
+
+class TestSpeculativeExtraction:
+    """Tests for SpeculativeExtraction."""
+
+    async def test_take_returns_plan_and_counts_hit(self) -> None:
+        priorities = []
+
+        async def extract(usage: RunUsage) -> ExtractedPlan:
+            priorities.append(current_priority())
+            usage.incr(RunUsage(input_tokens=100, output_tokens=20))
+            return _plan()
+
+        speculation = SpeculativeExtraction()
+        speculation.start(extract)
+        plan = await speculation.take()
+
+        assert plan is not None
+        assert plan.commitments[0].deliverable == "Quarterly report"
+        assert priorities == [Priority.BACKGROUND]
+        assert current_priority() == Priority.INTERACTIVE
+        assert not speculation.active
+        assert speculation.stats == SpeculationStats(launched=1, hits=1, used_tokens=120)
+
+    async def test_failed_extraction_is_a_miss(self) -> None:
+        async def extract(usage: RunUsage) -> ExtractedPlan:
+            usage.incr(RunUsage(input_tokens=50))
+            raise TimeoutError
+
+        speculation = SpeculativeExtraction()
+        speculation.start(extract)
+
+        assert await speculation.take() is None
+        assert speculation.stats == SpeculationStats(launched=1, misses=1, wasted_tokens=50)
+
+    async def test_discard_cancels_running_extraction(self) -> None:
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def extract(usage: RunUsage) -> ExtractedPlan:
+            usage.incr(RunUsage(input_tokens=80))
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return _plan()
+
+        speculation = SpeculativeExtraction()
+        speculation.start(extract)
+        await started.wait()
+        speculation.discard()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=5)
+        assert not speculation.active
+        assert speculation.stats == SpeculationStats(launched=1, cancelled=1, wasted_tokens=80)
+
+    async def test_new_speculation_replaces_old(self) -> None:
+        async def extract(usage: RunUsage) -> ExtractedPlan:
+            await asyncio.sleep(10)
+            return _plan()
+
+        async def quick(usage: RunUsage) -> ExtractedPlan:
+            return _plan()
+
+        speculation = SpeculativeExtraction()
+        speculation.start(extract)
+        speculation.start(quick)
+
+        assert await speculation.take() is not None
+        assert speculation.stats.cancelled == 1
+        assert speculation.stats.hits == 1
@@ -0,0 +1,43 @@
+"""Tests for rolling conversation summary."""
+
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.models.test import TestModel
+
+from jdo.ai.summary import HISTORY_SUMMARY_PROMPT, HistorySummary, summarize_history
+
+
+class TestSummarizeHistory:
+    """Tests for summarize_history."""
+
+    async def test_returns_summary_text(self):
+        model = TestModel(custom_output_args={"summary": "- report to Sarah by Friday"})
+
+        result = await summarize_history(
+            None,
+            [{"role": "user", "content": "I promised Sarah the report by Friday"}],
+            model,
+        )
+
+        assert result == "- report to Sarah by Friday"
+
+    async def test_includes_previous_summary_in_prompt(self):
+        prompts = []
+
+        def respond(messages, info: AgentInfo) -> ModelResponse:
+            prompts.append(messages[-1].parts[-1].content)
+            return ModelResponse(
+                parts=[ToolCallPart(info.output_tools[0].name, {"summary": "updated"})]
+            )
+
+        result = await summarize_history(
+            "- old item", [{"role": "user", "content": "new"}], FunctionModel(respond)
+        )
+
+        assert result == "updated"
+        assert "- old item" in prompts[0]
+        assert "USER: new" in prompts[0]
+
+    def test_prompt_preserves_commitments(self):
+        assert "Commitments" in HISTORY_SUMMARY_PROMPT
+        assert "summary" in HistorySummary.model_fields
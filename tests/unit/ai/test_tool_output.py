@@ -0,0 +1,163 @@
+"""Tests for compact, token-budgeted tool output."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time
+from uuid import uuid4
+
+import pytest
+
+from jdo.ai.tool_output import (
+    COMMITMENT_ALIAS,
+    GOAL_ALIAS,
+    MIN_TOOL_TOKEN_BUDGET,
+    IdAliases,
+    estimate_tokens,
+    fit_to_budget,
+    format_cell,
+    format_compact_table,
+    like_contains,
+)
+from jdo.models import CommitmentStatus
+
+
+class TestIdAliases:
+    """Tests for short id aliases."""
+
+    def test_aliases_are_numbered_per_prefix(self) -> None:
+        aliases = IdAliases()
+
+        assert aliases.alias(COMMITMENT_ALIAS, uuid4()) == "c1"
+        assert aliases.alias(COMMITMENT_ALIAS, uuid4()) == "c2"
+        assert aliases.alias(GOAL_ALIAS, uuid4()) == "g1"
+
+    def test_same_id_keeps_its_alias(self) -> None:
+        aliases = IdAliases()
+        entity_id = uuid4()
+
+        first = aliases.alias(COMMITMENT_ALIAS, entity_id)
+        aliases.alias(COMMITMENT_ALIAS, uuid4())
+
+        assert aliases.alias(COMMITMENT_ALIAS, str(entity_id)) == first
+
+    def test_resolve_alias_and_uuid(self) -> None:
+        aliases = IdAliases()
+        entity_id = uuid4()
+        alias = aliases.alias(COMMITMENT_ALIAS, entity_id)
+        other = uuid4()
+
+        assert aliases.resolve(alias) == entity_id
+        assert aliases.resolve(f" {alias.upper()} ") == entity_id
+        assert aliases.resolve(str(other)) == other
+
+    def test_resolve_unknown_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown id 'c9'"):
+            IdAliases().resolve("c9")
+
+    def test_concurrent_aliases_are_unique(self) -> None:
+        aliases = IdAliases()
+        ids = [uuid4() for _ in range(500)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            result = list(pool.map(lambda i: aliases.alias(COMMITMENT_ALIAS, i), ids))
+
+        assert len(set(result)) == len(ids)
+        assert all(aliases.resolve(a) == i for a, i in zip(result, ids, strict=True))
+
+
+class TestLikeContains:
+    """Tests for literal LIKE patterns."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("report", "%report%"),
+            ("100%", "%100\\%%"),
+            ("q_1", "%q\\_1%"),
+            ("a\\b", "%a\\\\b%"),
+        ],
+    )
+    def test_escapes_wildcards(self, text: str, expected: str) -> None:
+        assert like_contains(text) == expected
+
+
+class TestFitToBudget:
+    """Tests for trimming free-form tool output."""
+
+    def test_text_within_budget_is_unchanged(self) -> None:
+        text = "line one\nline two"
+
+        assert fit_to_budget(text) == text
+
+    def test_truncates_whole_lines_with_tail(self) -> None:
+        text = "\n".join(f"- entry {i}: " + "x" * 40 for i in range(100))
+
+        result = fit_to_budget(text, MIN_TOOL_TOKEN_BUDGET)
+
+        lines = result.splitlines()
+        assert estimate_tokens(result) <= MIN_TOOL_TOKEN_BUDGET
+        assert lines[0] == text.splitlines()[0]
+        assert lines[-1] == f"... {100 - (len(lines) - 1)} more lines"
+
+    def test_long_first_line_is_cut(self) -> None:
+        result = fit_to_budget("y" * 2000, MIN_TOOL_TOKEN_BUDGET)
+
+        assert result.endswith("...")
+        assert estimate_tokens(result) <= MIN_TOOL_TOKEN_BUDGET
+
+
+class TestFormatCell:
+    """Tests for cell encoding."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, ""),
+            (date(2025, 1, 17), "2025-01-17"),
+            (time(14, 30), "14:30"),
+            (CommitmentStatus.AT_RISK, "at_risk"),
+            (2.5, "2.5"),
+            ("a|b\nc", "a/b c"),
+        ],
+    )
+    def test_encodes_values(self, value: object, expected: str) -> None:
+        assert format_cell(value) == expected
+
+
+class TestFormatCompactTable:
+    """Tests for the compact table encoder."""
+
+    def test_header_then_rows(self) -> None:
+        result = format_compact_table(
+            ("id", "due"), [("c1", date(2025, 1, 17)), ("c2", date(2025, 1, 18))]
+        )
+
+        assert result.splitlines() == ["id|due", "c1|2025-01-17", "c2|2025-01-18"]
+
+    def test_empty_rows_return_message(self) -> None:
+        assert format_compact_table(("id",), [], empty_message="Nothing.") == "Nothing."
+
+    def test_limit_adds_tail_with_filters(self) -> None:
+        rows = [(f"c{i}",) for i in range(10)]
+
+        result = format_compact_table(("id",), rows, limit=3, filters=("stakeholder", "search"))
+
+        lines = result.splitlines()
+        assert lines[1:4] == ["c0", "c1", "c2"]
+        assert lines[-1] == "... 7 more, refine with filters: stakeholder, search"
+
+    def test_token_budget_truncates(self) -> None:
+        rows = [(f"c{i}", "x" * 200) for i in range(200)]
+
+        result = format_compact_table(
+            ("id", "text"), rows, token_budget=MIN_TOOL_TOKEN_BUDGET, limit=200
+        )
+
+        assert estimate_tokens(result) <= MIN_TOOL_TOKEN_BUDGET
+        assert result.splitlines()[-1].startswith("... ")
+
+    def test_first_row_always_included(self) -> None:
+        result = format_compact_table(("text",), [("y" * 2000,)], token_budget=100)
+
+        assert result.splitlines()[1] == "y" * 2000
@@ -151,6 +151,126 @@ class TestGetCurrentCommitments:
         reset_engine()
 
 
+class TestCurrentCommitmentFilters:
+    """Tests for filter arguments on current commitment queries and tools."""
+
+    @pytest.fixture
+    def populated_db(self, tmp_path: Path):
+        """Database with commitments for two stakeholders."""
+        from jdo.db.engine import get_engine, reset_engine
+        from jdo.db.session import get_session
+
+        reset_engine()
+        with patch("jdo.db.engine.get_settings") as mock_settings:
+            mock_settings.return_value.database_path = tmp_path / "test.db"
+            SQLModel.metadata.create_all(get_engine())
+
+            alice = Stakeholder(name="Alice", type=StakeholderType.PERSON)
+            bob = Stakeholder(name="Bob", type=StakeholderType.PERSON)
+            with get_session() as session:
+                session.add(alice)
+                session.add(bob)
+                for day in range(1, 31):
+                    session.add(
+                        Commitment(
+                            deliverable=f"Report {day}",
+                            stakeholder_id=alice.id if day % 2 else bob.id,
+                            due_date=date(2030, 1, day),
+                            status=CommitmentStatus.PENDING,
+                        )
+                    )
+            yield
+        reset_engine()
+
+    @staticmethod
+    def _tool(name: str):
+        agent = create_agent_with_model(TestModel(), with_tools=False)
+        from jdo.ai.tools import register_tools
+
+        register_tools(agent)
+        return agent._function_toolset.tools[name].function
+
+    def test_filters_by_stakeholder_and_due_range(self, populated_db) -> None:
+        from jdo.ai.tools import get_current_commitments
+        from jdo.db.session import get_session
+
+        with get_session() as session:
+            result = get_current_commitments(
+                session,
+                stakeholder="ali",
+                due_after=date(2030, 1, 10),
+                due_before=date(2030, 1, 15),
+            )
+
+        assert [c["deliverable"] for c in result] == ["Report 11", "Report 13", "Report 15"]
+
+    def test_filters_by_deliverable_search(self, populated_db) -> None:
+        from jdo.ai.tools import get_current_commitments
+        from jdo.db.session import get_session
+
+        with get_session() as session:
+            result = get_current_commitments(session, search="report 2")
+
+        assert len(result) == 11  # Report 2, 20-29
+
+    def test_search_wildcards_match_literally(self, populated_db) -> None:
+        from jdo.ai.tools import get_current_commitments
+        from jdo.db.session import get_session
+
+        with get_session() as session:
+            assert get_current_commitments(session, search="%") == []
+            assert get_current_commitments(session, stakeholder="_") == []
+
+    def test_tool_returns_compact_table_with_aliases(self, populated_db) -> None:
+        tool = self._tool("query_current_commitments")
+        ctx = MagicMock()
+        ctx.deps = JDODependencies(session=MagicMock())
+
+        result = tool(ctx, limit=5)
+
+        lines = result.splitlines()
+        assert lines[0] == "id|deliverable|stakeholder|due|status|goal"
+        assert lines[1] == "c1|Report 1|Alice|2030-01-01T09:00|pending|"
+        assert lines[-1].startswith("... 25 more, refine with filters: stakeholder")
+        assert "-" * 4 not in result  # no UUIDs
+        assert ctx.deps.id_aliases.resolve("c1") is not None
+
+    def test_tool_rejects_bad_filter(self, populated_db) -> None:
+        tool = self._tool("query_current_commitments")
+        ctx = MagicMock()
+        ctx.deps = JDODependencies(session=MagicMock())
+
+        assert tool(ctx, due_before="friday").startswith("Invalid filter: due_before")
+        assert tool(ctx, status="done").startswith("Invalid filter: status")
+
+    def test_rollup_tool_reports_unknown_alias(self, populated_db) -> None:
+        tool = self._tool("query_commitment_time_rollup")
+        ctx = MagicMock()
+        ctx.deps = JDODependencies(session=MagicMock())
+
+        assert tool(ctx, "c42") == "Invalid argument: Unknown id 'c42'"
+
+    def test_task_history_tool_honours_token_budget(self, populated_db) -> None:
+        from jdo.ai.tool_output import MIN_TOOL_TOKEN_BUDGET, estimate_tokens
+
+        tool = self._tool("query_task_history")
+        ctx = MagicMock()
+        ctx.deps = JDODependencies(session=MagicMock())
+        entries = [MagicMock() for _ in range(100)]
+        history = "\n".join(
+            f"- completed: 2030-01-{i % 28 + 1:02d} (est: 2.0h)" for i in range(100)
+        )
+
+        with (
+            patch("jdo.ai.tools._get_recent_task_history", return_value=entries),
+            patch("jdo.ai.tools._format_task_history_entries", return_value=history),
+        ):
+            result = tool(ctx, limit=100, token_budget=MIN_TOOL_TOKEN_BUDGET)
+
+        assert estimate_tokens(result) <= MIN_TOOL_TOKEN_BUDGET
+        assert result.splitlines()[-1].endswith("more lines")
+
+
 class TestGetOverdueCommitments:
     """Tests for get_overdue_commitments tool."""
 
@@ -423,6 +543,7 @@ class TestAgentToolIntegration:
         assert "query_visions_due_for_review" in tool_names
         # New time coaching tools
         assert "query_user_time_context" in tool_names
+        assert "query_capacity_forecast" in tool_names
         assert "query_task_history" in tool_names
         assert "query_commitment_time_rollup" in tool_names
         assert "query_integrity_with_context" in tool_names
@@ -0,0 +1,50 @@
+"""Tests for prompt-cache usage accounting."""
+
+from __future__ import annotations
+
+from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+from pydantic_ai.usage import RequestUsage
+
+from jdo.ai.usage import PromptCacheStats
+
+
+class TestPromptCacheStats:
+    """Tests for PromptCacheStats."""
+
+    def test_starts_empty(self) -> None:
+        """New stats have no tokens and a zero hit ratio."""
+        stats = PromptCacheStats()
+
+        assert stats.responses == 0
+        assert stats.uncached_input_tokens == 0
+        assert stats.hit_ratio == 0.0
+
+    def test_record_splits_cached_and_uncached(self) -> None:
+        """Cached tokens are counted separately from the full-rate remainder."""
+        stats = PromptCacheStats()
+
+        stats.record(RequestUsage(input_tokens=1000, cache_read_tokens=800, output_tokens=50))
+        stats.record(RequestUsage(input_tokens=1000, cache_read_tokens=0, output_tokens=50))
+
+        assert stats.responses == 2
+        assert stats.input_tokens == 2000
+        assert stats.cached_input_tokens == 800
+        assert stats.uncached_input_tokens == 1200
+        assert stats.hit_ratio == 0.4
+
+    def test_record_messages_only_counts_responses(self) -> None:
+        """Requests carry no usage; each model response is recorded once."""
+        stats = PromptCacheStats()
+        messages = [
+            ModelRequest(parts=[UserPromptPart(content="hi")]),
+            ModelResponse(
+                parts=[TextPart(content="hello")],
+                usage=RequestUsage(input_tokens=100, cache_read_tokens=64),
+            ),
+        ]
+
+        stats.record_messages(messages)
+
+        assert stats.responses == 1
+        assert stats.cached_input_tokens == 64
+        assert stats.uncached_input_tokens == 36
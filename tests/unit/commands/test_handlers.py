@@ -306,6 +306,34 @@ class TestGoalHandler:
         # Should ask about linking to a vision
         assert "vision" in result.message.lower()
 
+    def test_goal_links_matching_vision_from_database(self, db_session) -> None:
+        """Test: /goal ranks the active visions in the database and links a clear match."""
+        from jdo.commands.handlers import GoalHandler
+        from jdo.models.vision import Vision, VisionStatus
+
+        family = Vision(title="Present for my family", narrative="Evenings and weekends at home")
+        business = Vision(title="Thriving consulting business", narrative="Steady client revenue")
+        retired = Vision(
+            title="Consulting revenue", narrative="Old plan", status=VisionStatus.ABANDONED
+        )
+        db_session.add_all([family, business, retired])
+        db_session.commit()
+
+        context = {
+            "extracted": {
+                "title": "Grow consulting revenue",
+                "problem_statement": "Too few consulting clients",
+                "solution_vision": "Steady revenue from repeat clients",
+            },
+            "db_session": db_session,
+        }
+
+        result = GoalHandler().execute(ParsedCommand(CommandType.GOAL, [], "/goal"), context)
+
+        assert result.draft_data is not None
+        assert result.draft_data["vision_id"] == business.id
+        assert result.needs_confirmation is True
+
     def test_goal_needs_confirmation_with_complete_data(self) -> None:
         """Test: /goal with complete data needs confirmation."""
         from jdo.commands.handlers import GoalHandler
@@ -1102,6 +1130,61 @@ class TestHandlerRegistry:
 class TestAtRiskHandler:
     """Tests for the /atrisk command handler."""
 
+    def test_all_overdue_marks_in_bulk(self) -> None:
+        """Test: /atrisk --all-overdue marks every overdue commitment in one call."""
+        from unittest.mock import Mock, patch
+
+        from jdo.commands.handlers import AtRiskHandler
+
+        ids = [uuid4(), uuid4()]
+        mock_service = Mock()
+        mock_service.get_overdue_commitment_ids.return_value = ids
+        mock_service.mark_commitments_at_risk_bulk.return_value = [
+            Mock(commitment=Mock(deliverable=name, due_date=date(2025, 1, 10)))
+            for name in ("Send report", "Review docs")
+        ]
+
+        with (
+            patch("jdo.commands.handlers.commitment_handlers.get_session"),
+            patch(
+                "jdo.commands.handlers.commitment_handlers.IntegrityService",
+                return_value=mock_service,
+            ),
+        ):
+            cmd = ParsedCommand(
+                CommandType.ATRISK,
+                ["--all-overdue", "Back", "from", "leave"],
+                "/atrisk --all-overdue Back from leave",
+            )
+            result = AtRiskHandler().execute(cmd, {})
+
+        args = mock_service.mark_commitments_at_risk_bulk.call_args.args
+        assert args[1:] == (ids, "Back from leave")
+        assert "Marked 2 overdue commitment(s)" in result.message
+        assert "Review docs (due 2025-01-10)" in result.message
+
+    def test_all_overdue_without_overdue_commitments(self) -> None:
+        """Test: /atrisk --all-overdue with nothing overdue changes nothing."""
+        from unittest.mock import Mock, patch
+
+        from jdo.commands.handlers import AtRiskHandler
+
+        mock_service = Mock()
+        mock_service.get_overdue_commitment_ids.return_value = []
+
+        with (
+            patch("jdo.commands.handlers.commitment_handlers.get_session"),
+            patch(
+                "jdo.commands.handlers.commitment_handlers.IntegrityService",
+                return_value=mock_service,
+            ),
+        ):
+            cmd = ParsedCommand(CommandType.ATRISK, ["--all-overdue"], "/atrisk --all-overdue")
+            result = AtRiskHandler().execute(cmd, {})
+
+        assert "No overdue commitments" in result.message
+        mock_service.mark_commitments_at_risk_bulk.assert_not_called()
+
     def test_atrisk_without_commitment_prompts_for_selection(self) -> None:
         """Test: /atrisk without commitment context prompts for selection."""
         from jdo.commands.handlers import AtRiskHandler
@@ -2257,3 +2340,49 @@ class TestHelpHandlerRecoverCommand:
         assert "recover" in result.message.lower()
         assert "at-risk" in result.message.lower()
         assert "in-progress" in result.message.lower() or "in_progress" in result.message.lower()
+
+
+class TestGoalVisionRanking:
+    """Tests for local vision ranking in the /goal handler."""
+
+    def _context(self, visions: list[dict]) -> dict:
+        return {
+            "extracted": {
+                "title": "Ship the mobile app",
+                "problem_statement": "Customers can't use us on their phones",
+                "solution_vision": "A mobile app in both app stores",
+            },
+            "available_visions": visions,
+        }
+
+    def test_clear_match_links_vision_without_prompting(self) -> None:
+        from jdo.commands.handlers import GoalHandler
+
+        mobile_id = uuid4()
+        visions = [
+            {"id": mobile_id, "title": "Mobile first", "narrative": "Every customer uses our app"},
+            {"id": uuid4(), "title": "Healthy team", "narrative": "Sustainable pace"},
+            {"id": uuid4(), "title": "Profitable", "narrative": "Revenue covers costs"},
+        ]
+
+        result = GoalHandler().execute(
+            ParsedCommand(CommandType.GOAL, [], "/goal"), self._context(visions)
+        )
+
+        assert result.needs_confirmation is True
+        assert result.draft_data["vision_id"] == mobile_id
+        assert "Serves vision: Mobile first" in result.message
+
+    def test_prompt_lists_only_top_visions(self) -> None:
+        from jdo.commands.handlers import GoalHandler
+        from jdo.commands.handlers.goal_handlers import VISION_PROMPT_LIMIT
+
+        visions = [{"id": uuid4(), "title": f"Vision {i}"} for i in range(VISION_PROMPT_LIMIT + 3)]
+
+        result = GoalHandler().execute(
+            ParsedCommand(CommandType.GOAL, [], "/goal"), self._context(visions)
+        )
+
+        assert result.needs_confirmation is False
+        assert f"{VISION_PROMPT_LIMIT}. Vision" in result.message
+        assert f"{VISION_PROMPT_LIMIT + 1}. Vision" not in result.message
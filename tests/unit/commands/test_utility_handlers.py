@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from jdo.commands.handlers.utility_handlers import (
@@ -541,6 +543,100 @@ class TestTriageHandler:
         assert result.panel_update is not None
         assert result.panel_update["needs_analysis"] is True
 
+    def test_triage_flags_near_duplicate_without_analysis(self) -> None:
+        """Test /triage offers merge for a near-duplicate instead of analyzing it."""
+        from uuid import uuid4
+
+        from jdo.db.duplicates import DuplicateMatch
+
+        item_id = uuid4()
+        existing = DuplicateMatch("commitment", uuid4(), "Send contract email to Bob", 0.6)
+        handler = TriageHandler()
+        cmd = make_command("triage")
+        context: dict[str, object] = {
+            "triage_items": [{"id": str(item_id), "raw_text": "email Bob re contract"}],
+            "triage_index": 0,
+            "db_session": MagicMock(),
+        }
+
+        with patch(
+            "jdo.commands.handlers.utility_handlers.find_near_duplicates",
+            return_value=[DuplicateMatch("draft", item_id, "email Bob re contract", 1.0), existing],
+        ):
+            result = handler.execute(cmd, context)
+
+        assert "Looks like a duplicate of commitment" in result.message
+        assert "[m] Merge" in result.message
+        assert result.panel_update is not None
+        assert result.panel_update["needs_analysis"] is False
+        assert result.panel_update["duplicate_of"]["id"] == str(existing.entity_id)
+
+    def test_triage_merge_deletes_item_and_shows_next(self) -> None:
+        """Test /triage m drops the duplicate item and moves on to the next one."""
+        from uuid import uuid4
+
+        from jdo.db.duplicates import DuplicateMatch
+
+        item_id = uuid4()
+        draft = MagicMock()
+        db_session = MagicMock()
+        db_session.get.return_value = draft
+        existing = DuplicateMatch("commitment", uuid4(), "Send contract email to Bob", 0.6)
+        handler = TriageHandler()
+        context: dict[str, object] = {
+            "triage_items": [
+                {"id": str(item_id), "raw_text": "email Bob re contract"},
+                {"id": str(uuid4()), "raw_text": "Buy milk"},
+            ],
+            "triage_index": 0,
+            "db_session": db_session,
+        }
+
+        with patch(
+            "jdo.commands.handlers.utility_handlers.find_near_duplicates",
+            side_effect=[[existing], []],
+        ):
+            result = handler.execute(make_command("triage", ["m"]), context)
+
+        db_session.delete.assert_called_once_with(draft)
+        assert 'Merged into commitment: "Send contract email to Bob"' in result.message
+        assert "Triage item 1 of 1" in result.message
+        assert '"Buy milk"' in result.message
+        assert result.panel_update is not None
+        assert result.panel_update["merged_id"] == str(item_id)
+        assert result.panel_update["needs_analysis"] is True
+
+    def test_triage_merge_without_duplicate_changes_nothing(self) -> None:
+        """Test /triage merge when the item has no near-duplicate."""
+        db_session = MagicMock()
+        handler = TriageHandler()
+        context: dict[str, object] = {
+            "triage_items": [{"id": 1, "raw_text": "Buy milk"}],
+            "db_session": db_session,
+        }
+
+        with patch("jdo.commands.handlers.utility_handlers.find_near_duplicates", return_value=[]):
+            result = handler.execute(make_command("triage", ["merge"]), context)
+
+        assert "Nothing to merge" in result.message
+        db_session.delete.assert_not_called()
+
+    def test_triage_keep_skips_duplicate_check(self) -> None:
+        """Test /triage k analyzes a flagged item instead of offering the merge again."""
+        handler = TriageHandler()
+        context: dict[str, object] = {
+            "triage_items": [{"id": 1, "raw_text": "email Bob re contract"}],
+            "db_session": MagicMock(),
+        }
+
+        with patch("jdo.commands.handlers.utility_handlers.find_near_duplicates") as mock_find:
+            result = handler.execute(make_command("triage", ["k"]), context)
+
+        mock_find.assert_not_called()
+        assert "Analyzing" in result.message
+        assert result.panel_update is not None
+        assert result.panel_update["needs_analysis"] is True
+
     def test_triage_with_analysis_confident(self) -> None:
         """Test /triage shows analysis when confident."""
         handler = TriageHandler()
@@ -0,0 +1,154 @@
+"""Tests for set-based bulk maintenance operations."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+from sqlmodel import Session, select
+
+from jdo.db.bulk import (
+    delete_created_after,
+    delete_expired_drafts,
+    mark_overdue_milestones_missed,
+)
+from jdo.db.session import get_data_version
+from jdo.models import Commitment, Draft, Goal, Milestone, Stakeholder, Task
+from jdo.models.draft import EntityType
+from jdo.models.milestone import MilestoneStatus
+from jdo.models.stakeholder import StakeholderType
+from jdo.utils.datetime import utc_now
+
+TODAY = date(2026, 10, 18)
+
+
+@pytest.fixture
+def goal(db_session: Session) -> Goal:
+    """A goal to hang milestones and commitments on."""
+    row = Goal(title="Ship", problem_statement="Not shipped", solution_vision="Shipped")
+    db_session.add(row)
+    db_session.commit()
+    return row
+
+
+def _milestones(session: Session, goal: Goal, count: int, **fields: object) -> list[Milestone]:
+    rows = [
+        Milestone(goal_id=goal.id, title=f"Milestone {i}", **fields)  # type: ignore[arg-type]
+        for i in range(count)
+    ]
+    session.add_all(rows)
+    session.commit()
+    return rows
+
+
+class TestMarkOverdueMilestonesMissed:
+    """Tests for mark_overdue_milestones_missed."""
+
+    def test_marks_only_open_overdue_milestones(self, db_session: Session, goal: Goal) -> None:
+        """Open milestones past their target date become missed; others are untouched."""
+        overdue = _milestones(db_session, goal, 2, target_date=TODAY - timedelta(days=1))
+        _milestones(db_session, goal, 1, target_date=TODAY)
+        _milestones(
+            db_session,
+            goal,
+            1,
+            target_date=TODAY - timedelta(days=5),
+            status=MilestoneStatus.COMPLETED,
+        )
+        before = utc_now()
+
+        ids = mark_overdue_milestones_missed(db_session, today=TODAY)
+
+        assert set(ids) == {milestone.id for milestone in overdue}
+        for milestone in overdue:
+            # Loaded objects are synchronized and updated_at is stamped
+            assert milestone.status == MilestoneStatus.MISSED
+            assert milestone.updated_at >= before
+        statuses = db_session.exec(select(Milestone.status)).all()
+        assert statuses.count(MilestoneStatus.MISSED) == 2
+
+    def test_chunked_matches_single_statement(self, db_session: Session, goal: Goal) -> None:
+        """Chunking writes every matching row, a few at a time."""
+        overdue = _milestones(db_session, goal, 7, target_date=TODAY - timedelta(days=3))
+
+        ids = mark_overdue_milestones_missed(db_session, today=TODAY, chunk_size=3)
+
+        assert sorted(ids) == sorted(milestone.id for milestone in overdue)
+        assert mark_overdue_milestones_missed(db_session, today=TODAY, chunk_size=3) == []
+
+    def test_bumps_data_version(self, db_session: Session, goal: Goal) -> None:
+        """Caches see the bulk write."""
+        _milestones(db_session, goal, 1, target_date=TODAY - timedelta(days=1))
+        version = get_data_version()
+
+        mark_overdue_milestones_missed(db_session, today=TODAY)
+
+        assert get_data_version() > version
+
+    def test_rejects_non_positive_chunk_size(self, db_session: Session) -> None:
+        """A chunk size below one is an error."""
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            mark_overdue_milestones_missed(db_session, chunk_size=0)
+
+
+class TestDeleteExpiredDrafts:
+    """Tests for delete_expired_drafts."""
+
+    def test_deletes_what_is_expired_reports(self, db_session: Session) -> None:
+        """Exactly the drafts whose is_expired() is true are deleted; triage is kept."""
+        old = utc_now() - timedelta(days=8)
+        drafts = [
+            Draft(entity_type=EntityType.COMMITMENT, created_at=old),
+            Draft(entity_type=EntityType.GOAL, created_at=old),
+            Draft(entity_type=EntityType.TASK),
+            Draft(entity_type=EntityType.UNKNOWN, created_at=old),
+        ]
+        db_session.add_all(drafts)
+        db_session.commit()
+        expected = {d.id for d in drafts if d.is_expired() and d.entity_type != EntityType.UNKNOWN}
+
+        ids = delete_expired_drafts(db_session, chunk_size=1)
+
+        assert set(ids) == expected
+        remaining = db_session.exec(select(Draft.entity_type)).all()
+        assert sorted(remaining) == sorted([EntityType.TASK, EntityType.UNKNOWN])
+
+
+class TestDeleteCreatedAfter:
+    """Tests for delete_created_after."""
+
+    def test_deletes_new_rows_and_unlinks_old_commitments(self, db_session: Session) -> None:
+        """New rows go in dependency order; older commitments lose their deleted goal."""
+        stakeholder = Stakeholder(name="Client", type=StakeholderType.PERSON)
+        db_session.add(stakeholder)
+        db_session.commit()
+        old_commitment = Commitment(
+            deliverable="Old", stakeholder_id=stakeholder.id, due_date=TODAY
+        )
+        db_session.add(old_commitment)
+        db_session.commit()
+
+        cutoff = utc_now()
+        goal = Goal(title="New", problem_statement="P", solution_vision="S")
+        db_session.add(goal)
+        db_session.flush()
+        old_commitment.goal_id = goal.id
+        new_commitment = Commitment(
+            deliverable="New", stakeholder_id=stakeholder.id, due_date=TODAY, goal_id=goal.id
+        )
+        db_session.add(new_commitment)
+        db_session.flush()
+        db_session.add(
+            Task(commitment_id=new_commitment.id, title="T", scope="S", order=1),
+        )
+        db_session.commit()
+        new_ids = (new_commitment.id, goal.id)
+
+        deleted = delete_created_after(db_session, cutoff)
+        db_session.commit()
+
+        assert len(deleted[Task]) == 1
+        assert (*deleted[Commitment], *deleted[Goal]) == new_ids
+        assert deleted[Stakeholder] == []
+        db_session.refresh(old_commitment)
+        assert old_commitment.goal_id is None
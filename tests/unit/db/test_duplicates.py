@@ -0,0 +1,130 @@
+"""Tests for near-duplicate detection over drafts and commitments."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from jdo.db.duplicates import find_near_duplicates, reset_duplicate_index, same_text
+from jdo.models import Commitment, Draft, Stakeholder, StakeholderType
+from jdo.models.commitment import CommitmentStatus
+from jdo.models.draft import EntityType
+
+
+@pytest.fixture(autouse=True)
+def _fresh_index():
+    reset_duplicate_index()
+    yield
+    reset_duplicate_index()
+
+
+def _capture(db_session, text: str) -> Draft:
+    draft = Draft(entity_type=EntityType.UNKNOWN, partial_data={"raw_text": text})
+    db_session.add(draft)
+    db_session.commit()
+    return draft
+
+
+def _commitment(db_session, deliverable: str) -> Commitment:
+    stakeholder = Stakeholder(name="Bob", type=StakeholderType.PERSON)
+    commitment = Commitment(
+        deliverable=deliverable, stakeholder_id=stakeholder.id, due_date=date(2025, 12, 20)
+    )
+    db_session.add_all([stakeholder, commitment])
+    db_session.commit()
+    return commitment
+
+
+class TestFindNearDuplicates:
+    """Tests for find_near_duplicates."""
+
+    def test_loads_existing_drafts_and_commitments(self, db_session) -> None:
+        draft = _capture(db_session, "email Bob re contract")
+        commitment = _commitment(db_session, "Send contract email to Bob")
+
+        matches = find_near_duplicates(db_session, "send Bob the contract email")
+
+        assert [(m.kind, m.entity_id) for m in matches] == [
+            ("commitment", commitment.id),
+            ("draft", draft.id),
+        ]
+        assert matches[0].similarity == 1.0
+
+    def test_kinds_and_exclude(self, db_session) -> None:
+        draft = _capture(db_session, "email Bob re contract")
+        _commitment(db_session, "Send contract email to Bob")
+
+        matches = find_near_duplicates(
+            db_session, "email Bob re contract", exclude=draft.id, kinds=("draft",)
+        )
+
+        assert matches == []
+
+    def test_committed_writes_update_loaded_index(self, db_session) -> None:
+        find_near_duplicates(db_session, "warm up")
+        commitment = _commitment(db_session, "Renew passport")
+
+        assert find_near_duplicates(db_session, "renew my passport")[0].entity_id == commitment.id
+
+        commitment.status = CommitmentStatus.COMPLETED
+        db_session.add(commitment)
+        db_session.commit()
+
+        assert find_near_duplicates(db_session, "renew my passport") == []
+
+    def test_reloaded_after_write_by_another_process(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.db"
+        engine = create_engine(f"sqlite:///{path}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            draft_id = _capture(session, "email Bob re contract").id
+            assert len(find_near_duplicates(session, "contract email")) == 1
+
+            # A separate connection stands in for `jdo capture` in another process
+            with sqlite3.connect(path) as other:
+                other.execute("DELETE FROM drafts")
+            assert find_near_duplicates(session, "contract email") == []
+
+            with sqlite3.connect(path) as other:
+                other.execute(
+                    "INSERT INTO drafts (id, entity_type, partial_data, created_at, updated_at) "
+                    "VALUES (?, 'UNKNOWN', '{\"raw_text\": \"renew passport\"}', "
+                    "'2025-01-01', '2025-01-01')",
+                    (draft_id.hex,),
+                )
+            matches = find_near_duplicates(session, "renew my passport")
+        engine.dispose()
+
+        assert [m.entity_id for m in matches] == [draft_id]
+
+    def test_rolled_back_writes_are_ignored(self, db_session) -> None:
+        find_near_duplicates(db_session, "warm up")
+        db_session.add(
+            Draft(entity_type=EntityType.UNKNOWN, partial_data={"raw_text": "plan offsite"})
+        )
+        db_session.flush()
+        db_session.rollback()
+
+        assert find_near_duplicates(db_session, "plan the offsite") == []
+
+    def test_deleted_draft_is_removed(self, db_session) -> None:
+        draft = _capture(db_session, "call mom about birthday")
+        find_near_duplicates(db_session, "warm up")
+
+        db_session.delete(draft)
+        db_session.commit()
+
+        assert find_near_duplicates(db_session, "call mom about birthday") == []
+
+
+class TestSameText:
+    """Tests for same_text."""
+
+    def test_ignores_case_and_whitespace_only(self) -> None:
+        assert same_text("Buy  milk ", "buy milk")
+        assert not same_text("Buy milk", "Buy milks")
+        assert not same_text("Pay invoice 5", "Pay invoice 6")
@@ -537,3 +537,86 @@ class TestHelperMethods:
         """Invalid string returns None."""
         result = service._parse_uuid("not-a-uuid")
         assert result is None
+
+
+class TestSavePlan:
+    """Tests for save_plan (single-transaction plan persistence)."""
+
+    @staticmethod
+    def _plan(**overrides: Any) -> dict[str, Any]:
+        plan: dict[str, Any] = {
+            "commitments": [
+                {
+                    "deliverable": "Draft proposal",
+                    "stakeholder": "Sarah",
+                    "due_date": "2025-12-19",
+                    "due_time": "14:00:00",
+                    "tasks": [
+                        {"title": "Outline", "estimated_hours": 1.0},
+                        {"title": "Write", "scope": "Write all sections"},
+                    ],
+                },
+                {"deliverable": "Send slides", "stakeholder": "sarah", "due_date": "2025-12-20"},
+            ],
+            "recurring_commitments": [
+                {
+                    "deliverable_template": "Status update",
+                    "stakeholder_name": "Team",
+                    "recurrence_type": "weekly",
+                    "days_of_week": [0],
+                }
+            ],
+        }
+        plan.update(overrides)
+        return plan
+
+    def test_saves_commitments_tasks_and_recurring(self, db_session) -> None:
+        """Whole plan is saved; tasks keep plan order and get history entries."""
+        from sqlmodel import select
+
+        from jdo.models.task_history import TaskEventType, TaskHistoryEntry
+
+        saved = PersistenceService(db_session).save_plan(self._plan())
+        db_session.commit()
+
+        assert [c.deliverable for c in saved.commitments] == ["Draft proposal", "Send slides"]
+        assert saved.commitments[0].due_time == time(14, 0)
+        assert saved.commitments[1].due_time == time(9, 0)
+        assert [(t.title, t.order) for t in saved.tasks] == [("Outline", 0), ("Write", 1)]
+        assert saved.tasks[0].scope == "Outline"
+        assert len(saved.recurring_commitments) == 1
+
+        history = db_session.exec(select(TaskHistoryEntry)).all()
+        assert {h.task_id for h in history} == {t.id for t in saved.tasks}
+        assert all(h.event_type == TaskEventType.CREATED for h in history)
+
+    def test_stakeholders_resolved_once_case_insensitively(self, db_session) -> None:
+        """Existing stakeholders are reused and repeated names create one row."""
+        from sqlmodel import select
+
+        existing = Stakeholder(name="SARAH", type=StakeholderType.PERSON)
+        db_session.add(existing)
+        db_session.flush()
+
+        saved = PersistenceService(db_session).save_plan(self._plan(recurring_commitments=[]))
+
+        assert {c.stakeholder_id for c in saved.commitments} == {existing.id}
+        assert len(db_session.exec(select(Stakeholder)).all()) == 1
+
+    def test_invalid_entry_writes_nothing(self, db_session) -> None:
+        """A bad entry anywhere in the plan is rejected before any write."""
+        from sqlmodel import select
+
+        plan = self._plan()
+        plan["recurring_commitments"][0]["recurrence_type"] = "hourly"
+
+        with pytest.raises(ValidationError, match="Invalid recurrence_type"):
+            PersistenceService(db_session).save_plan(plan)
+
+        assert db_session.exec(select(Commitment)).all() == []
+        assert db_session.exec(select(Stakeholder)).all() == []
+
+    def test_empty_plan_raises(self, service: PersistenceService) -> None:
+        """A plan with nothing in it is rejected."""
+        with pytest.raises(ValidationError, match="no commitments"):
+            service.save_plan({"commitments": [], "recurring_commitments": []})
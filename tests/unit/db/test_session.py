@@ -1,10 +1,13 @@
 """Tests for database session management - TDD Red phase."""
 
+from datetime import timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from sqlmodel import Session, select
+from sqlmodel import Session, select, update
+
+from jdo.models import Goal, Stakeholder, StakeholderType
 
 
 class TestGetSession:
@@ -109,3 +112,46 @@ class TestGetSession:
             # After context exits, session transaction is committed/closed
             # SQLAlchemy sessions can still execute after close (they reconnect),
             # but we verify the context manager properly yields a working session
+
+
+class TestDataVersion:
+    """Tests for the in-process database change counter."""
+
+    def test_writes_bump_version_reads_do_not(self, db_session: Session) -> None:
+        """Flushing changes bumps the version; plain queries do not."""
+        from jdo.db.session import get_data_version
+
+        before = get_data_version()
+        list(db_session.exec(select(Stakeholder)).all())
+        assert get_data_version() == before
+
+        db_session.add(Stakeholder(name="Alice", type=StakeholderType.PERSON))
+        db_session.flush()
+        assert get_data_version() > before
+
+    def test_bulk_update_bumps_version(self, db_session: Session) -> None:
+        """Bulk UPDATE statements bypass flush but still bump the version."""
+        from jdo.db.session import get_data_version
+
+        before = get_data_version()
+        db_session.exec(update(Stakeholder).values(name="Bob"))  # type: ignore[call-overload]
+
+        assert get_data_version() > before
+
+    def test_table_versions_track_count_and_updated_at(self, db_session: Session) -> None:
+        """Table versions change on insert and on updated_at changes."""
+        from jdo.db.session import get_table_versions
+
+        empty = get_table_versions(db_session, [Stakeholder, Goal])
+        stakeholder = Stakeholder(name="Alice", type=StakeholderType.PERSON)
+        db_session.add(stakeholder)
+        db_session.flush()
+        inserted = get_table_versions(db_session, [Stakeholder, Goal])
+        stakeholder.updated_at = stakeholder.updated_at + timedelta(seconds=1)
+        db_session.flush()
+        updated = get_table_versions(db_session, [Stakeholder, Goal])
+
+        assert empty == ((0, None), (0, None))
+        assert inserted[0][0] == 1
+        assert inserted[1] == (0, None)
+        assert updated[0][1] > inserted[0][1]
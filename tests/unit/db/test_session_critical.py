@@ -93,19 +93,18 @@ class TestUpdateOverdueMilestones:
 
     def test_returns_count(self) -> None:
         """Returns count of updated milestones."""
-        mock_milestone = MagicMock()
         mock_session = MagicMock()
-        mock_session.exec.return_value.all.return_value = [mock_milestone]
+        mock_session.exec.return_value.scalars.return_value = [uuid4()]
 
         result = update_overdue_milestones(mock_session)
 
         assert result == 1
-        assert mock_milestone.mark_missed.called
+        assert mock_session.exec.call_count == 1
 
     def test_empty_list(self) -> None:
         """Returns 0 when no overdue milestones."""
         mock_session = MagicMock()
-        mock_session.exec.return_value.all.return_value = []
+        mock_session.exec.return_value.scalars.return_value = []
 
         result = update_overdue_milestones(mock_session)
 
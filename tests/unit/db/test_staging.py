@@ -0,0 +1,120 @@
+"""Tests for staged agent writes."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from jdo.db.bulk import delete_expired_drafts
+from jdo.db.staging import StagedMutations
+from jdo.models import Commitment, Draft, EntityType, Stakeholder, StakeholderType
+from jdo.utils.datetime import utc_now
+
+
+def _names(engine) -> list[str]:
+    with Session(engine) as session:
+        return [s.name for s in session.exec(select(Stakeholder))]
+
+
+class TestStagedMutations:
+    """Tests for StagedMutations."""
+
+    def test_commit_persists_staged_writes(self, db_engine) -> None:
+        staged = StagedMutations(lambda: Session(db_engine))
+
+        with staged.session() as session:
+            session.add(Stakeholder(name="Sarah", type=StakeholderType.PERSON))
+            session.flush()
+        assert staged.has_pending
+
+        staged.commit()
+
+        assert not staged.has_pending
+        assert _names(db_engine) == ["Sarah"]
+
+    def test_rollback_discards_staged_writes(self, db_engine) -> None:
+        staged = StagedMutations(lambda: Session(db_engine))
+
+        with staged.session() as session:
+            session.add(Stakeholder(name="Sarah", type=StakeholderType.PERSON))
+            session.flush()
+        staged.rollback()
+
+        assert not staged.has_pending
+        assert _names(db_engine) == []
+
+    def test_no_session_is_opened_until_used(self, db_engine) -> None:
+        opened: list[Session] = []
+
+        def factory() -> Session:
+            opened.append(Session(db_engine))
+            return opened[-1]
+
+        staged = StagedMutations(factory)
+        staged.commit()
+        staged.rollback()
+
+        assert opened == []
+
+    def test_failed_tool_call_records_nothing(self, db_engine) -> None:
+        staged = StagedMutations(lambda: Session(db_engine))
+
+        with pytest.raises(RuntimeError), staged.session() as session:
+            session.add(Stakeholder(name="Sarah", type=StakeholderType.PERSON))
+            session.flush()
+            raise RuntimeError
+
+        assert not staged.has_pending
+        assert _names(db_engine) == []
+
+
+@pytest.fixture
+def file_engine(tmp_path: Path):
+    """File database that fails fast on lock contention, with foreign keys on."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'staging.db'}", connect_args={"timeout": 0.1})
+    event.listen(engine, "connect", lambda dbapi, _record: dbapi.execute("PRAGMA foreign_keys=ON"))
+    SQLModel.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+class TestStagedMutationsConcurrency:
+    """A staged run must not block other writers between tool calls."""
+
+    def test_maintenance_job_runs_while_run_is_in_progress(self, file_engine) -> None:
+        staged = StagedMutations(lambda: Session(file_engine))
+        with Session(file_engine) as session:
+            session.add(
+                Draft(
+                    entity_type=EntityType.GOAL,
+                    created_at=utc_now() - timedelta(days=30),
+                )
+            )
+            session.commit()
+
+        # One tool call creates a stakeholder and a commitment for it
+        with staged.session() as session:
+            sarah = Stakeholder(name="Sarah", type=StakeholderType.PERSON)
+            session.add(sarah)
+            session.flush()
+            session.add(
+                Commitment(deliverable="Report", stakeholder_id=sarah.id, due_date=date.today())
+            )
+
+        # Background maintenance writes before the run finishes
+        with Session(file_engine) as session:
+            assert len(delete_expired_drafts(session)) == 1
+            session.commit()
+
+        staged.rollback()
+
+        with Session(file_engine) as session:
+            assert session.exec(select(Commitment)).all() == []
+            assert session.exec(select(Stakeholder)).all() == []
+            assert session.exec(select(Draft)).all() == []
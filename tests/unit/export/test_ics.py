@@ -0,0 +1,281 @@
+"""Tests for the iCalendar export."""
+
+from __future__ import annotations
+
+import io
+from datetime import date, time
+from pathlib import Path
+
+import pytest
+from sqlmodel import Session
+
+from jdo.export.ics import (
+    IcsOptions,
+    RecurringMode,
+    compute_etag,
+    escape_text,
+    export_ics_feed,
+    fold_line,
+    manifest_path,
+    to_rrule,
+    write_ics,
+)
+from jdo.models import (
+    Commitment,
+    CommitmentStatus,
+    EndType,
+    RecurrenceType,
+    RecurringCommitment,
+    Stakeholder,
+    StakeholderType,
+)
+from jdo.utils.datetime import utc_now
+
+TODAY = date(2025, 3, 10)  # Monday
+
+
+@pytest.fixture
+def stakeholder(db_session: Session) -> Stakeholder:
+    sarah = Stakeholder(name="Sarah", type=StakeholderType.PERSON)
+    db_session.add(sarah)
+    db_session.commit()
+    return sarah
+
+
+def _export(session: Session, options: IcsOptions | None = None) -> str:
+    stream = io.StringIO(newline="")
+    write_ics(session, stream, options, today=TODAY)
+    return stream.getvalue()
+
+
+def _unfolded(text: str) -> list[str]:
+    return text.replace("\r\n ", "").split("\r\n")
+
+
+class TestFormatting:
+    """Tests for RFC 5545 text handling."""
+
+    def test_escape_text(self) -> None:
+        assert escape_text("a,b;c\\d\ne") == "a\\,b\\;c\\\\d\\ne"
+
+    def test_long_lines_fold_at_75_octets(self) -> None:
+        line = "SUMMARY:" + "é" * 80
+
+        folded = fold_line(line)
+
+        physical = folded.removesuffix("\r\n").split("\r\n")
+        assert all(len(part.encode()) <= 75 for part in physical)
+        assert all(part.startswith(" ") for part in physical[1:])
+        assert folded.replace("\r\n ", "") == line + "\r\n"
+
+
+class TestRrule:
+    """Tests for translating recurrence patterns."""
+
+    @pytest.mark.parametrize(
+        ("fields", "expected"),
+        [
+            ({"recurrence_type": RecurrenceType.DAILY, "interval": 2}, "FREQ=DAILY;INTERVAL=2"),
+            (
+                {"recurrence_type": RecurrenceType.WEEKLY, "days_of_week": [3, 0]},
+                "FREQ=WEEKLY;BYDAY=MO,TH;WKST=MO",
+            ),
+            (
+                {"recurrence_type": RecurrenceType.MONTHLY, "day_of_month": 31},
+                "FREQ=MONTHLY;BYMONTHDAY=-1",
+            ),
+            (
+                {
+                    "recurrence_type": RecurrenceType.MONTHLY,
+                    "week_of_month": -1,
+                    "days_of_week": [4],
+                },
+                "FREQ=MONTHLY;BYDAY=-1FR",
+            ),
+            (
+                {"recurrence_type": RecurrenceType.YEARLY, "month_of_year": 2, "day_of_month": 30},
+                "FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=-1",
+            ),
+        ],
+    )
+    def test_exact_patterns(self, fields: dict, expected: str) -> None:
+        recurring = RecurringCommitment(deliverable_template="x", **fields)
+
+        assert to_rrule(recurring) == expected
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            {"recurrence_type": RecurrenceType.MONTHLY, "day_of_month": 30},
+            {"recurrence_type": RecurrenceType.MONTHLY, "week_of_month": 5, "days_of_week": [0]},
+        ],
+    )
+    def test_clamped_patterns_are_expanded(self, fields: dict) -> None:
+        assert to_rrule(RecurringCommitment(deliverable_template="x", **fields)) is None
+
+    def test_count_is_remaining_instances(self) -> None:
+        recurring = RecurringCommitment(
+            deliverable_template="x",
+            recurrence_type=RecurrenceType.DAILY,
+            end_type=EndType.AFTER_COUNT,
+            end_after_count=10,
+            instances_generated=4,
+        )
+
+        assert to_rrule(recurring) == "FREQ=DAILY;COUNT=6"
+
+
+class TestWriteIcs:
+    """Tests for the streamed calendar."""
+
+    def test_commitments_become_events_at_their_utc_deadline(
+        self, db_session: Session, stakeholder: Stakeholder
+    ) -> None:
+        db_session.add(
+            Commitment(
+                deliverable="Send report, final",
+                stakeholder_id=stakeholder.id,
+                due_date=date(2025, 3, 14),
+                due_time=time(17, 0),
+                timezone="Europe/Berlin",
+            )
+        )
+        db_session.add(
+            Commitment(
+                deliverable="Dropped",
+                stakeholder_id=stakeholder.id,
+                due_date=date(2025, 3, 14),
+                status=CommitmentStatus.ABANDONED,
+            )
+        )
+        db_session.commit()
+
+        lines = _unfolded(_export(db_session))
+
+        assert lines[0] == "BEGIN:VCALENDAR"
+        assert lines.count("BEGIN:VEVENT") == 1
+        assert "DTSTART:20250314T160000Z" in lines
+        assert "BEGIN:VTIMEZONE" not in lines
+        assert "SUMMARY:Send report\\, final" in lines
+        assert "DESCRIPTION:For Sarah" in lines
+        assert "CATEGORIES:pending" in lines
+
+    def test_recurring_rrule_starts_at_next_ungenerated_instance(
+        self, db_session: Session, stakeholder: Stakeholder
+    ) -> None:
+        db_session.add(
+            RecurringCommitment(
+                deliverable_template="Weekly update",
+                stakeholder_id=stakeholder.id,
+                recurrence_type=RecurrenceType.WEEKLY,
+                days_of_week=[4],
+                last_generated_date=date(2025, 3, 7),
+                instances_generated=1,
+            )
+        )
+        db_session.commit()
+
+        lines = _unfolded(_export(db_session))
+
+        assert "DTSTART;TZID=America/New_York:20250314T090000" in lines
+        assert "RRULE:FREQ=WEEKLY;BYDAY=FR;WKST=MO" in lines
+        # The TZID is defined in the calendar, with the DST change on March 9
+        assert lines.index("TZID:America/New_York") < lines.index("BEGIN:VEVENT")
+        assert "RDATE:20250309T020000" in "".join(lines)
+
+    def test_vtimezone_lists_offset_changes(self) -> None:
+        from jdo.export.ics import _vtimezone
+
+        lines = list(_vtimezone("Europe/Berlin", date(2025, 1, 1), date(2026, 1, 1)))
+
+        assert lines[:2] == ["BEGIN:VTIMEZONE", "TZID:Europe/Berlin"]
+        daylight = lines[lines.index("BEGIN:DAYLIGHT") : lines.index("END:DAYLIGHT")]
+        assert daylight[1:] == [
+            "DTSTART:20250330T020000",
+            "TZOFFSETFROM:+0100",
+            "TZOFFSETTO:+0200",
+            "TZNAME:CEST",
+        ]
+        assert "DTSTART:20251026T030000" in lines
+        assert lines[-1] == "END:VTIMEZONE"
+
+    def test_expand_mode_lists_occurrences_in_window(
+        self, db_session: Session, stakeholder: Stakeholder
+    ) -> None:
+        db_session.add(
+            RecurringCommitment(
+                deliverable_template="Weekly update",
+                stakeholder_id=stakeholder.id,
+                recurrence_type=RecurrenceType.WEEKLY,
+                days_of_week=[4],
+            )
+        )
+        db_session.commit()
+
+        options = IcsOptions(recurring=RecurringMode.EXPAND, window_days=14)
+        lines = _unfolded(_export(db_session, options))
+
+        starts = [line for line in lines if line.startswith("DTSTART")]
+        assert starts == ["DTSTART:20250314T130000Z", "DTSTART:20250321T130000Z"]
+        assert not any(line.startswith("RRULE") for line in lines)
+
+
+class TestFeed:
+    """Tests for the feed file and its manifest."""
+
+    def test_feed_is_rewritten_only_when_rows_change(
+        self, db_session: Session, stakeholder: Stakeholder, tmp_path: Path
+    ) -> None:
+        commitment = Commitment(
+            deliverable="Send report", stakeholder_id=stakeholder.id, due_date=date(2025, 3, 14)
+        )
+        db_session.add(commitment)
+        db_session.commit()
+        feed = tmp_path / "jdo.ics"
+
+        first = export_ics_feed(db_session, feed, today=TODAY)
+        second = export_ics_feed(db_session, feed, today=TODAY)
+        commitment.status = CommitmentStatus.COMPLETED
+        db_session.commit()
+        third = export_ics_feed(db_session, feed, today=TODAY)
+
+        assert (first.written, second.written, third.written) == (True, False, True)
+        assert first.events == 1
+        assert third.etag != first.etag
+        assert "CATEGORIES:completed" in feed.read_text(encoding="utf-8")
+        assert third.etag in manifest_path(feed).read_text(encoding="utf-8")
+
+    def test_etag_depends_on_options(self, db_session: Session) -> None:
+        rrule = compute_etag(db_session, IcsOptions(), today=TODAY)
+        expand = compute_etag(db_session, IcsOptions(recurring=RecurringMode.EXPAND), today=TODAY)
+
+        assert rrule != expand
+
+    def test_etag_changes_with_row_count(
+        self, db_session: Session, stakeholder: Stakeholder
+    ) -> None:
+        before = compute_etag(db_session, today=TODAY)
+        db_session.add(
+            Commitment(deliverable="Call", stakeholder_id=stakeholder.id, due_date=TODAY)
+        )
+        db_session.commit()
+
+        assert compute_etag(db_session, today=TODAY) != before
+
+    def test_etag_changes_when_commitment_is_completed(
+        self, db_session: Session, stakeholder: Stakeholder
+    ) -> None:
+        commitment = Commitment(
+            deliverable="Send report", stakeholder_id=stakeholder.id, due_date=TODAY
+        )
+        db_session.add(commitment)
+        db_session.commit()
+        before = compute_etag(db_session, today=TODAY)
+
+        # As /complete does: status and completed_at only
+        commitment.status = CommitmentStatus.COMPLETED
+        commitment.completed_at = utc_now()
+        db_session.add(commitment)
+        db_session.commit()
+
+        assert compute_etag(db_session, today=TODAY) != before
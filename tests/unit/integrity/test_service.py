@@ -6,6 +6,7 @@ from datetime import UTC, date, datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
 from uuid import uuid4
+from zoneinfo import ZoneInfo
 
 import pytest
 from sqlmodel import Session, SQLModel, create_engine, select
@@ -21,6 +22,7 @@ from jdo.models.cleanup_plan import CleanupPlan, CleanupPlanStatus
 from jdo.models.commitment import Commitment, CommitmentStatus
 from jdo.models.stakeholder import Stakeholder, StakeholderType
 from jdo.models.task import Task, TaskStatus
+from jdo.models.task_history import TaskEventType, TaskHistoryEntry
 
 
 @pytest.fixture(name="session")
@@ -288,6 +290,106 @@ class TestMarkCommitmentAtRisk:
         assert len(plans) == 1
 
 
+class TestMarkCommitmentsAtRiskBulk:
+    """Tests for marking many commitments as at-risk at once."""
+
+    @pytest.fixture
+    def commitments(self, session: Session) -> list[Commitment]:
+        """Three overdue commitments for two stakeholders."""
+        alice = Stakeholder(name="Alice", type=StakeholderType.PERSON)
+        bob = Stakeholder(name="Bob", type=StakeholderType.PERSON)
+        session.add_all([alice, bob])
+        session.commit()
+        rows = [
+            Commitment(
+                deliverable=f"Deliverable {i}",
+                stakeholder_id=(alice if i < 2 else bob).id,
+                due_date=date(2025, 1, 10 + i),
+                status=CommitmentStatus.IN_PROGRESS,
+            )
+            for i in range(3)
+        ]
+        session.add_all(rows)
+        session.commit()
+        return rows
+
+    def test_marks_all_and_creates_plans_and_tasks(
+        self, session: Session, commitments: list[Commitment]
+    ) -> None:
+        """Each commitment gets at_risk status, a cleanup plan and a notification task."""
+        ids = [c.id for c in commitments]
+
+        with patch.object(session, "commit", wraps=session.commit) as commit:
+            results = IntegrityService().mark_commitments_at_risk_bulk(
+                session, ids, "Back from vacation"
+            )
+
+        assert commit.call_count == 1
+        assert [r.commitment.id for r in results] == ids
+        for result in results:
+            assert result.commitment.status == CommitmentStatus.AT_RISK
+            assert result.cleanup_plan.notification_task_id == result.notification_task.id
+            assert result.notification_task.order == 0
+            assert "Back from vacation" in result.notification_task.scope
+        assert results[2].notification_task.title == "Notify Bob about at-risk commitment"
+        assert len(session.exec(select(CleanupPlan)).all()) == 3
+
+    def test_reuses_existing_plan_and_task(
+        self, session: Session, commitments: list[Commitment]
+    ) -> None:
+        """Existing cleanup plans and notification tasks are kept, like the single path."""
+        first, second, _ = commitments
+        service = IntegrityService()
+        existing = service.mark_commitment_at_risk(session, first.id, "Earlier")
+        lone_plan = CleanupPlan(commitment_id=second.id, status=CleanupPlanStatus.PLANNED)
+        session.add(lone_plan)
+        session.commit()
+
+        results = service.mark_commitments_at_risk_bulk(
+            session, [c.id for c in commitments], "Later"
+        )
+
+        assert results[0].cleanup_plan.id == existing.cleanup_plan.id
+        assert results[0].notification_task.id == existing.notification_task.id
+        assert results[1].cleanup_plan.id == lone_plan.id
+        assert lone_plan.notification_task_id == results[1].notification_task.id
+        assert len(session.exec(select(CleanupPlan)).all()) == 3
+        notification_tasks = session.exec(
+            select(Task).where(Task.is_notification_task == True)  # noqa: E712
+        ).all()
+        assert len(notification_tasks) == 3
+
+    def test_unknown_id_raises_without_changes(
+        self, session: Session, commitments: list[Commitment]
+    ) -> None:
+        """An unknown id fails the whole batch before anything is written."""
+        with pytest.raises(ValueError, match="Commitments not found"):
+            IntegrityService().mark_commitments_at_risk_bulk(
+                session, [commitments[0].id, uuid4()], "Late"
+            )
+
+        session.refresh(commitments[0])
+        assert commitments[0].status == CommitmentStatus.IN_PROGRESS
+
+    def test_get_overdue_commitment_ids(
+        self, session: Session, commitments: list[Commitment]
+    ) -> None:
+        """Only pending/in-progress commitments past due are returned, oldest first."""
+        commitments[1].status = CommitmentStatus.COMPLETED
+        session.add(
+            Commitment(
+                deliverable="Future",
+                stakeholder_id=commitments[0].stakeholder_id,
+                due_date=date.today() + timedelta(days=30),
+            )
+        )
+        session.commit()
+
+        ids = IntegrityService().get_overdue_commitment_ids(session)
+
+        assert ids == [commitments[0].id, commitments[2].id]
+
+
 class TestCalculateIntegrityMetrics:
     """Tests for calculating integrity metrics."""
 
@@ -529,12 +631,14 @@ class TestDetectRisks:
         session.commit()
         session.refresh(stakeholder)
 
-        # Due today (within 24h) - use UTC to match service
-        utc_today = datetime.now(UTC).date()
+        # Due in a few hours (within 24h); deadlines compare as UTC instants
+        due_at = datetime.now(UTC) + timedelta(hours=3)
         due_soon = Commitment(
             deliverable="Due today",
             stakeholder_id=stakeholder.id,
-            due_date=utc_today,
+            due_date=due_at.date(),
+            due_time=due_at.time(),
+            timezone="UTC",
             status=CommitmentStatus.PENDING,
         )
         session.add(due_soon)
@@ -546,6 +650,30 @@ class TestDetectRisks:
         assert len(summary.due_soon_commitments) == 1
         assert summary.due_soon_commitments[0].deliverable == "Due today"
 
+    def test_overdue_uses_deadline_time_and_zone(self, session: Session) -> None:
+        """A commitment due earlier today in its own timezone is already overdue."""
+        stakeholder = Stakeholder(name="Test", type=StakeholderType.PERSON)
+        session.add(stakeholder)
+        session.commit()
+
+        past = datetime.now(UTC) - timedelta(hours=1)
+        local = past.astimezone(ZoneInfo("Asia/Tokyo"))
+        session.add(
+            Commitment(
+                deliverable="Missed by an hour",
+                stakeholder_id=stakeholder.id,
+                due_date=local.date(),
+                due_time=local.time(),
+                timezone="Asia/Tokyo",
+            )
+        )
+        session.commit()
+
+        summary = IntegrityService().detect_risks(session)
+
+        assert [c.deliverable for c in summary.overdue_commitments] == ["Missed by an hour"]
+        assert summary.due_soon_commitments == []
+
     def test_ignores_due_soon_in_progress_commitments(self, session: Session) -> None:
         """Does not flag in_progress as due_soon (they're being worked on)."""
         stakeholder = Stakeholder(name="Test", type=StakeholderType.PERSON)
@@ -553,12 +681,14 @@ class TestDetectRisks:
         session.commit()
         session.refresh(stakeholder)
 
-        # Due today but in progress - use UTC to match service
-        utc_today = datetime.now(UTC).date()
+        # Due in a few hours but in progress
+        due_at = datetime.now(UTC) + timedelta(hours=3)
         in_progress = Commitment(
             deliverable="Working on it",
             stakeholder_id=stakeholder.id,
-            due_date=utc_today,
+            due_date=due_at.date(),
+            due_time=due_at.time(),
+            timezone="UTC",
             status=CommitmentStatus.IN_PROGRESS,
         )
         session.add(in_progress)
@@ -595,6 +725,105 @@ class TestDetectRisks:
         assert len(summary.stalled_commitments) == 1
         assert summary.stalled_commitments[0].deliverable == "Stalled task"
 
+    def _in_progress_due_tomorrow(self, session: Session, deliverable: str) -> Commitment:
+        stakeholder = Stakeholder(name="Test", type=StakeholderType.PERSON)
+        session.add(stakeholder)
+        commitment = Commitment(
+            deliverable=deliverable,
+            stakeholder_id=stakeholder.id,
+            due_date=datetime.now(UTC).date() + timedelta(days=1),
+            status=CommitmentStatus.IN_PROGRESS,
+            updated_at=datetime.now(UTC) - timedelta(hours=48),
+        )
+        session.add(commitment)
+        session.commit()
+        return commitment
+
+    def test_recent_task_update_is_not_stalled(self, session: Session) -> None:
+        """Task activity counts, even when the commitment row is old."""
+        commitment = self._in_progress_due_tomorrow(session, "Busy")
+        session.add(Task(commitment_id=commitment.id, title="Work", scope="Do it", order=1))
+        session.commit()
+
+        summary = IntegrityService().detect_risks(session)
+
+        assert summary.stalled_commitments == []
+
+    def test_recent_task_history_is_not_stalled(self, session: Session) -> None:
+        """A recent task history event counts as activity."""
+        old = datetime.now(UTC) - timedelta(hours=72)
+        commitment = self._in_progress_due_tomorrow(session, "Logged")
+        task = Task(
+            commitment_id=commitment.id,
+            title="Work",
+            scope="Do it",
+            order=1,
+            created_at=old,
+            updated_at=old,
+        )
+        session.add(task)
+        session.commit()
+        session.add(
+            TaskHistoryEntry(
+                task_id=task.id,
+                commitment_id=commitment.id,
+                event_type=TaskEventType.STARTED,
+                new_status=TaskStatus.IN_PROGRESS,
+            )
+        )
+        session.commit()
+
+        summary = IntegrityService().detect_risks(session)
+
+        assert summary.stalled_commitments == []
+
+    def test_incremental_checks_only_changed_commitments(self, session: Session) -> None:
+        """With since, untouched commitments are skipped until touched again."""
+        commitment = self._in_progress_due_tomorrow(session, "Stalled task")
+        service = IntegrityService()
+        first = service.detect_risks(session)
+        assert [c.deliverable for c in first.stalled_commitments] == ["Stalled task"]
+
+        second = service.detect_risks(session, since=first.checked_at)
+        assert second.stalled_commitments == []
+        assert second.cleared_ids == set()
+
+        commitment.due_date = datetime.now(UTC).date() - timedelta(days=1)
+        session.add(commitment)
+        session.commit()
+        third = service.detect_risks(session, since=second.checked_at)
+
+        assert [c.deliverable for c in third.overdue_commitments] == ["Stalled task"]
+
+    def test_incremental_reports_commitment_completed_since(self, session: Session) -> None:
+        """A commitment completed between two runs is listed as cleared."""
+        commitment = self._in_progress_due_tomorrow(session, "Stalled task")
+        service = IntegrityService()
+        first = service.detect_risks(session)
+        assert [c.id for c in first.stalled_commitments] == [commitment.id]
+
+        commitment.status = CommitmentStatus.COMPLETED
+        commitment.completed_at = datetime.now(UTC)
+        session.add(commitment)
+        session.commit()
+        second = service.detect_risks(session, since=first.checked_at)
+
+        assert second.total_risks == 0
+        assert second.cleared_ids == {commitment.id}
+
+    def test_incremental_reports_commitment_active_again(self, session: Session) -> None:
+        """A stalled commitment with new task activity is listed as cleared."""
+        commitment = self._in_progress_due_tomorrow(session, "Stalled task")
+        service = IntegrityService()
+        first = service.detect_risks(session)
+
+        session.add(Task(commitment_id=commitment.id, title="Work", scope="Do it", order=1))
+        session.commit()
+        second = service.detect_risks(session, since=first.checked_at)
+
+        assert second.stalled_commitments == []
+        assert second.cleared_ids == {commitment.id}
+
     def test_returns_empty_when_no_risks(self, session: Session) -> None:
         """Returns empty RiskSummary when all commitments are healthy."""
         stakeholder = Stakeholder(name="Test", type=StakeholderType.PERSON)
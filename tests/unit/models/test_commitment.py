@@ -632,3 +632,60 @@ class TestCommitmentOrphanTracking:
                 assert result[0].deliverable == "Orphan task"
 
         reset_engine()
+
+
+class TestCommitmentDueAt:
+    """Tests for the persisted UTC deadline (due_at)."""
+
+    def test_due_at_set_on_insert(self, db_session) -> None:
+        """due_at is the local deadline converted to UTC."""
+        from datetime import datetime
+
+        from jdo.models.stakeholder import Stakeholder, StakeholderType
+
+        stakeholder = Stakeholder(name="Client", type=StakeholderType.PERSON)
+        db_session.add(stakeholder)
+        commitment = Commitment(
+            deliverable="Report",
+            stakeholder_id=stakeholder.id,
+            due_date=date(2026, 1, 15),
+            due_time=time(17, 30),
+            timezone="America/New_York",
+        )
+        db_session.add(commitment)
+        db_session.commit()
+
+        assert commitment.due_at is not None
+        assert commitment.due_at.replace(tzinfo=UTC) == datetime(2026, 1, 15, 22, 30, tzinfo=UTC)
+
+    def test_due_at_follows_updates(self, db_session) -> None:
+        """Changing the due date, time or zone recomputes due_at on flush."""
+        from datetime import datetime
+
+        from jdo.models.stakeholder import Stakeholder, StakeholderType
+
+        stakeholder = Stakeholder(name="Client", type=StakeholderType.PERSON)
+        db_session.add(stakeholder)
+        commitment = Commitment(
+            deliverable="Report", stakeholder_id=stakeholder.id, due_date=date(2026, 7, 1)
+        )
+        db_session.add(commitment)
+        db_session.commit()
+
+        commitment.due_date = date(2026, 7, 2)
+        commitment.timezone = "UTC"
+        db_session.add(commitment)
+        db_session.commit()
+
+        assert commitment.due_at is not None
+        assert commitment.due_at.replace(tzinfo=UTC) == datetime(2026, 7, 2, 9, 0, tzinfo=UTC)
+
+    def test_unknown_timezone_treated_as_utc(self) -> None:
+        """An unrecognised timezone name falls back to UTC."""
+        from datetime import datetime
+
+        from jdo.utils.datetime import deadline_utc
+
+        assert deadline_utc(date(2026, 3, 1), time(8, 0), "Not/AZone") == datetime(
+            2026, 3, 1, 8, 0, tzinfo=UTC
+        )
@@ -0,0 +1,161 @@
+"""Tests for compiled recurrence rules, including a differential test against the calculator."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from jdo.models.recurring_commitment import (
+    EndType,
+    RecurrenceType,
+    RecurringCommitment,
+    RecurringCommitmentStatus,
+)
+from jdo.recurrence.calculator import get_next_due_date
+from jdo.recurrence.rule import RecurrenceRule, compile_rule, occurrences_between
+
+
+def _recurring(**fields: Any) -> RecurringCommitment:
+    return RecurringCommitment(
+        deliverable_template="Recurring report",
+        stakeholder_id=uuid4(),
+        **fields,
+    )
+
+
+@st.composite
+def recurring_commitments(draw: st.DrawFn) -> RecurringCommitment:
+    """Valid recurring commitments covering every pattern and end condition."""
+    recurrence_type = draw(st.sampled_from(RecurrenceType))
+    fields: dict[str, Any] = {
+        "recurrence_type": recurrence_type,
+        "interval": draw(st.integers(min_value=1, max_value=4)),
+        "status": draw(st.sampled_from(RecurringCommitmentStatus)),
+    }
+    if recurrence_type == RecurrenceType.WEEKLY:
+        fields["days_of_week"] = draw(
+            st.lists(st.integers(min_value=0, max_value=6), min_size=1, max_size=7, unique=True)
+        )
+    elif recurrence_type in (RecurrenceType.MONTHLY, RecurrenceType.YEARLY):
+        if draw(st.booleans()):
+            fields["day_of_month"] = draw(st.integers(min_value=1, max_value=31))
+        else:
+            fields["week_of_month"] = draw(st.sampled_from([1, 2, 3, 4, 5, -1]))
+            fields["days_of_week"] = [draw(st.integers(min_value=0, max_value=6))]
+        if recurrence_type == RecurrenceType.YEARLY:
+            fields["month_of_year"] = draw(st.integers(min_value=1, max_value=12))
+
+    end_type = draw(st.sampled_from(EndType))
+    fields["end_type"] = end_type
+    if end_type == EndType.AFTER_COUNT:
+        fields["end_after_count"] = draw(st.integers(min_value=1, max_value=30))
+        fields["instances_generated"] = draw(st.integers(min_value=0, max_value=10))
+    elif end_type == EndType.BY_DATE:
+        fields["end_by_date"] = draw(
+            st.dates(min_value=date(2020, 1, 1), max_value=date(2032, 12, 31))
+        )
+    return _recurring(**fields)
+
+
+def _chain_calculator(recurring: RecurringCommitment, start: date, end: date) -> list[date]:
+    """Expand a range the old way: call get_next_due_date in a loop, counting instances."""
+    dates: list[date] = []
+    after = start - timedelta(days=1)
+    while (next_due := get_next_due_date(recurring, after)) is not None and next_due <= end:
+        dates.append(next_due)
+        recurring.instances_generated += 1
+        after = next_due
+    return dates
+
+
+class TestDifferentialAgainstCalculator:
+    """The compiled rule must agree with repeated get_next_due_date calls."""
+
+    @given(
+        recurring_commitments(),
+        st.dates(min_value=date(2020, 1, 1), max_value=date(2030, 12, 31)),
+        st.integers(min_value=0, max_value=800),
+    )
+    @settings(max_examples=300, deadline=None)
+    def test_occurrences_match_chained_calculator(
+        self, recurring: RecurringCommitment, start: date, span_days: int
+    ) -> None:
+        end = start + timedelta(days=span_days)
+
+        compiled = occurrences_between(recurring, start, end)
+
+        assert compiled == _chain_calculator(recurring, start, end)
+
+    @given(
+        recurring_commitments(),
+        st.dates(min_value=date(2020, 1, 1), max_value=date(2030, 12, 31)),
+    )
+    @settings(max_examples=300, deadline=None)
+    def test_next_after_matches_calculator(
+        self, recurring: RecurringCommitment, after: date
+    ) -> None:
+        recurring.status = RecurringCommitmentStatus.ACTIVE
+        recurring.end_type = EndType.NEVER
+
+        assert compile_rule(recurring).next_after(after) == get_next_due_date(recurring, after)
+
+
+class TestRecurrenceRule:
+    """Tests for RecurrenceRule expansion and caching."""
+
+    def test_weekly_expansion_over_a_quarter(self) -> None:
+        rule = RecurrenceRule(RecurrenceType.WEEKLY, interval=2, days_of_week=(0, 3))
+
+        dates = rule.occurrences_between(date(2025, 1, 7), date(2025, 2, 9))
+
+        # Mon/Thu every other week, starting with the first pattern day in the range
+        assert dates == [
+            date(2025, 1, 9),
+            date(2025, 1, 20),
+            date(2025, 1, 23),
+            date(2025, 2, 3),
+            date(2025, 2, 6),
+        ]
+
+    def test_iter_occurrences_is_lazy(self) -> None:
+        rule = RecurrenceRule(RecurrenceType.DAILY)
+
+        occurrences = rule.iter_occurrences(date(2025, 1, 1), date(9999, 12, 1))
+
+        assert next(occurrences) == date(2025, 1, 1)
+        assert next(occurrences) == date(2025, 1, 2)
+
+    def test_count_limit_applies_to_remaining_instances(self) -> None:
+        rule = RecurrenceRule(RecurrenceType.DAILY, end_after_count=5)
+
+        dates = rule.occurrences_between(date(2025, 1, 1), date(2025, 12, 31), already_generated=3)
+
+        assert dates == [date(2025, 1, 1), date(2025, 1, 2)]
+
+    def test_paused_rule_has_no_occurrences(self) -> None:
+        rule = RecurrenceRule(RecurrenceType.DAILY, active=False)
+
+        assert rule.occurrences_between(date(2025, 1, 1), date(2025, 1, 31)) == []
+
+    def test_missing_pattern_fields_are_rejected(self) -> None:
+        with pytest.raises(ValueError, match="requires month_of_year"):
+            RecurrenceRule(RecurrenceType.YEARLY, day_of_month=1)
+
+    def test_compiled_rules_are_shared_and_refreshed_on_update(self) -> None:
+        recurring = _recurring(recurrence_type=RecurrenceType.WEEKLY, days_of_week=[0])
+        twin = _recurring(recurrence_type=RecurrenceType.WEEKLY, days_of_week=[0])
+
+        rule = compile_rule(recurring)
+        assert compile_rule(recurring) is rule
+        assert compile_rule(twin) is rule
+
+        recurring.days_of_week = [2]
+        updated = compile_rule(recurring)
+
+        assert updated is not rule
+        assert updated.next_after(date(2025, 1, 6)) == date(2025, 1, 8)
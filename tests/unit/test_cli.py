@@ -19,18 +19,76 @@ class TestCliCapture:
         runner = CliRunner()
 
         with (
-            patch("jdo.cli.create_db_and_tables") as mock_create,
-            patch("jdo.cli.get_session") as mock_session,
+            patch("jdo.db.schema.ensure_schema") as mock_ensure,
+            patch("jdo.db.session.get_session") as mock_session,
         ):
             mock_session.return_value.__enter__ = MagicMock(return_value=mock_session)
             mock_session.return_value.__exit__ = MagicMock(return_value=False)
 
             result = runner.invoke(cli, ["capture", "Test capture text"])
 
-            mock_create.assert_called_once()
+            mock_ensure.assert_called_once()
             assert result.exit_code == 0
             assert "Captured: Test capture text" in result.output
 
+    def test_capture_skips_exact_duplicate_and_flags_near_ones(self) -> None:
+        """Test that an identical queued item is not captured twice."""
+        from uuid import uuid4
+
+        from click.testing import CliRunner
+
+        from jdo.cli import cli
+        from jdo.db.duplicates import DuplicateMatch
+
+        runner = CliRunner()
+        exact = DuplicateMatch("draft", uuid4(), "email Bob re  contract", 1.0)
+        near = DuplicateMatch("commitment", uuid4(), "Send contract email to Bob", 0.6)
+
+        with (
+            patch("jdo.db.schema.ensure_schema"),
+            patch("jdo.db.session.get_session") as mock_session,
+            patch("jdo.db.duplicates.find_near_duplicates", side_effect=[[exact, near], [near]]),
+        ):
+            session = MagicMock()
+            mock_session.return_value.__enter__ = MagicMock(return_value=session)
+            mock_session.return_value.__exit__ = MagicMock(return_value=False)
+
+            merged = runner.invoke(cli, ["capture", "Email Bob re contract"])
+            captured = runner.invoke(cli, ["capture", "contract email for Bob"])
+
+        assert "Already captured: email Bob re  contract" in merged.output
+        assert "Captured: contract email for Bob" in captured.output
+        assert "Possible duplicate of commitment: Send contract email to Bob" in captured.output
+        session.add.assert_called_once()
+
+    def test_capture_saves_item_with_same_terms_but_different_text(self) -> None:
+        """Test that matching terms alone do not drop a capture."""
+        from uuid import uuid4
+
+        from click.testing import CliRunner
+
+        from jdo.cli import cli
+        from jdo.db.duplicates import DuplicateMatch
+
+        runner = CliRunner()
+        # Single-character tokens are not terms, so these compare as identical
+        earlier = DuplicateMatch("draft", uuid4(), "Pay invoice 5", 1.0)
+
+        with (
+            patch("jdo.db.schema.ensure_schema"),
+            patch("jdo.db.session.get_session") as mock_session,
+            patch("jdo.db.duplicates.find_near_duplicates", return_value=[earlier]),
+        ):
+            session = MagicMock()
+            mock_session.return_value.__enter__ = MagicMock(return_value=session)
+            mock_session.return_value.__exit__ = MagicMock(return_value=False)
+
+            result = runner.invoke(cli, ["capture", "Pay invoice 6"])
+
+        assert "Captured: Pay invoice 6" in result.output
+        assert "Possible duplicate of draft: Pay invoice 5" in result.output
+        session.add.assert_called_once()
+
     def test_capture_requires_text_argument(self) -> None:
         """Test that capture fails without text argument."""
         from click.testing import CliRunner
@@ -54,7 +112,7 @@ class TestCliDbCommands:
 
         runner = CliRunner()
 
-        with patch("jdo.cli.get_migration_status") as mock_status:
+        with patch("jdo.db.migrations.get_migration_status") as mock_status:
             result = runner.invoke(cli, ["db", "status"])
 
             assert result.exit_code == 0
@@ -69,7 +127,7 @@ class TestCliDbCommands:
 
         runner = CliRunner()
 
-        with patch("jdo.cli.upgrade_database") as mock_upgrade:
+        with patch("jdo.db.migrations.upgrade_database") as mock_upgrade:
             result = runner.invoke(cli, ["db", "upgrade"])
 
             assert result.exit_code == 0
@@ -84,7 +142,7 @@ class TestCliDbCommands:
 
         runner = CliRunner()
 
-        with patch("jdo.cli.upgrade_database") as mock_upgrade:
+        with patch("jdo.db.migrations.upgrade_database") as mock_upgrade:
             result = runner.invoke(cli, ["db", "upgrade", "-r", "abcd1234"])
 
             assert result.exit_code == 0
@@ -99,7 +157,7 @@ class TestCliDbCommands:
 
         runner = CliRunner()
 
-        with patch("jdo.cli.downgrade_database") as mock_downgrade:
+        with patch("jdo.db.migrations.downgrade_database") as mock_downgrade:
             result = runner.invoke(cli, ["db", "downgrade"])
 
             assert result.exit_code == 0
@@ -114,7 +172,7 @@ class TestCliDbCommands:
 
         runner = CliRunner()
 
-        with patch("jdo.cli.downgrade_database") as mock_downgrade:
+        with patch("jdo.db.migrations.downgrade_database") as mock_downgrade:
             result = runner.invoke(cli, ["db", "downgrade", "-r", "abcd1234"])
 
             assert result.exit_code == 0
@@ -140,7 +198,7 @@ class TestCliDbCommands:
 
         runner = CliRunner()
 
-        with patch("jdo.cli.create_revision") as mock_create:
+        with patch("jdo.db.migrations.create_revision") as mock_create:
             mock_create.return_value = "abcd1234"
             result = runner.invoke(cli, ["db", "revision", "-m", "test message"])
 
@@ -156,7 +214,7 @@ class TestCliDbCommands:
 
         runner = CliRunner()
 
-        with patch("jdo.cli.create_revision") as mock_create:
+        with patch("jdo.db.migrations.create_revision") as mock_create:
             mock_create.return_value = None
             result = runner.invoke(
                 cli, ["db", "revision", "-m", "test message", "--no-autogenerate"]
@@ -173,7 +231,7 @@ class TestCliDbCommands:
 
         runner = CliRunner()
 
-        with patch("jdo.cli.create_revision") as mock_create:
+        with patch("jdo.db.migrations.create_revision") as mock_create:
             mock_create.return_value = None
             result = runner.invoke(cli, ["db", "revision", "-m", "test message"])
 
@@ -210,3 +268,127 @@ class TestCliGroup:
         assert "upgrade" in result.output
         assert "downgrade" in result.output
         assert "revision" in result.output
+
+
+class TestCliIngest:
+    """Tests for the ingest command."""
+
+    def test_ingest_extracts_and_saves_in_one_transaction(self, tmp_path) -> None:
+        from datetime import date
+
+        from click.testing import CliRunner
+
+        from jdo.ai.batch import BatchItem, BatchResult
+        from jdo.ai.extraction import ExtractedCommitment
+        from jdo.cli import cli
+
+        notes = tmp_path / "notes.txt"
+        notes.write_text("- Report for Sarah friday\n- Slides for Bob monday\n")
+        results = [
+            BatchResult(
+                BatchItem(text),
+                output=ExtractedCommitment(
+                    deliverable=text, stakeholder_name="Sarah", due_date=date(2025, 12, 20)
+                ),
+            )
+            for text in ("Report", "Slides")
+        ]
+        saved = MagicMock(commitments=[MagicMock(), MagicMock()], tasks=[])
+
+        with (
+            patch("jdo.ai.batch.extract_batch", return_value=results) as mock_extract,
+            patch("jdo.ai.agent.get_model_identifier", return_value="test"),
+            patch("jdo.db.schema.ensure_schema"),
+            patch("jdo.db.session.get_session") as mock_session,
+            patch("jdo.db.persistence.PersistenceService") as mock_service,
+        ):
+            mock_service.return_value.save_plan.return_value = saved
+            result = CliRunner().invoke(cli, ["ingest", str(notes), "--yes", "-j", "3"])
+
+        assert result.exit_code == 0, result.output
+        items = mock_extract.call_args.args[0]
+        assert [i.text for i in items] == ["Report for Sarah friday", "Slides for Bob monday"]
+        assert mock_extract.call_args.kwargs["concurrency"] == 3
+        mock_service.return_value.save_plan.assert_called_once()
+        mock_session.assert_called_once()
+        assert "Saved 2 commitment(s)" in result.output
+
+    def test_ingest_declined_saves_nothing(self, tmp_path) -> None:
+        from datetime import date
+
+        from click.testing import CliRunner
+
+        from jdo.ai.batch import BatchItem, BatchResult
+        from jdo.ai.extraction import ExtractedCommitment
+        from jdo.cli import cli
+
+        notes = tmp_path / "notes.txt"
+        notes.write_text("Report for Sarah friday\n")
+        results = [
+            BatchResult(
+                BatchItem("Report"),
+                output=ExtractedCommitment(
+                    deliverable="Report", stakeholder_name="Sarah", due_date=date(2025, 12, 20)
+                ),
+            )
+        ]
+
+        with (
+            patch("jdo.ai.batch.extract_batch", return_value=results),
+            patch("jdo.ai.agent.get_model_identifier", return_value="test"),
+            patch("jdo.db.session.get_session") as mock_session,
+        ):
+            result = CliRunner().invoke(cli, ["ingest", str(notes)], input="n\n")
+
+        assert result.exit_code == 0
+        assert "Cancelled." in result.output
+        mock_session.assert_not_called()
+
+
+class TestCliExportIcs:
+    """Tests for the export ics command."""
+
+    def test_streams_calendar_to_stdout(self, db_session) -> None:
+        """Without an output file the calendar goes to stdout."""
+        from contextlib import contextmanager
+
+        from click.testing import CliRunner
+
+        from jdo.cli import cli
+
+        @contextmanager
+        def session_scope():
+            yield db_session
+
+        with (
+            patch("jdo.db.schema.ensure_schema"),
+            patch("jdo.db.session.get_session", session_scope),
+        ):
+            result = CliRunner().invoke(cli, ["export", "ics"])
+
+        assert result.exit_code == 0
+        assert result.stdout_bytes.startswith(b"BEGIN:VCALENDAR\r\n")
+        assert result.stdout_bytes.endswith(b"END:VCALENDAR\r\n")
+
+    def test_feed_reports_up_to_date(self, db_session, tmp_path) -> None:
+        """A second export with unchanged data leaves the feed alone."""
+        from contextlib import contextmanager
+
+        from click.testing import CliRunner
+
+        from jdo.cli import cli
+
+        @contextmanager
+        def session_scope():
+            yield db_session
+
+        feed = tmp_path / "feed.ics"
+        with (
+            patch("jdo.db.schema.ensure_schema"),
+            patch("jdo.db.session.get_session", session_scope),
+        ):
+            first = CliRunner().invoke(cli, ["export", "ics", "-o", str(feed)])
+            second = CliRunner().invoke(cli, ["export", "ics", "-o", str(feed)])
+
+        assert "Wrote 0 event(s)" in first.output
+        assert "is up to date" in second.output
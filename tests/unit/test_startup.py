@@ -0,0 +1,84 @@
+"""Import-time budget for CLI cold start.
+
+Each case runs in a fresh interpreter with ``python -X importtime`` and checks
+which modules were imported and how long importing took. Heavy modules must
+stay out of paths that don't use them; the time budgets are generous and only
+catch large regressions.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# "import time: self [us] | cumulative | imported package", nesting by indent
+IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( +)(\S+)")
+
+# Modules only the AI conversation, migrations or error reporting need
+AI_MODULES = ("pydantic_ai", "openai", "rich.markdown")
+DEFERRED_MODULES = ("alembic", "sentry_sdk")
+
+
+def _run_with_importtime(code: str, tmp_path: Path) -> tuple[set[str], float]:
+    """Run code in a fresh interpreter and profile its imports.
+
+    Returns:
+        Imported module names and the total import time in seconds.
+    """
+    env = {**os.environ, "JDO_DATABASE_PATH": str(tmp_path / "jdo.db")}
+    result = subprocess.run(  # noqa: S603 - our own interpreter and code
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+        timeout=60,
+    )
+    modules: set[str] = set()
+    total_us = 0
+    for match in IMPORTTIME_LINE.finditer(result.stderr):
+        cumulative, indent, name = match.groups()
+        modules.add(name)
+        if len(indent) == 1:
+            total_us += int(cumulative)
+    return modules, total_us / 1_000_000
+
+
+def _cli(*args: str) -> str:
+    return f"import sys; from jdo.cli import main; sys.argv = ['jdo', *{list(args)!r}]; main()"
+
+
+@pytest.mark.slow
+class TestStartupImports:
+    """What each entry point imports before doing its work."""
+
+    def test_help(self, tmp_path: Path) -> None:
+        """`jdo --help` loads click and little else."""
+        modules, seconds = _run_with_importtime(_cli("--help"), tmp_path)
+
+        assert not modules & {"sqlalchemy", "sqlmodel", *AI_MODULES, *DEFERRED_MODULES}
+        assert seconds < 0.4
+
+    def test_capture(self, tmp_path: Path) -> None:
+        """`jdo capture` loads the database layer but not the AI stack."""
+        # The first launch creates the schema, which needs Alembic
+        first, _ = _run_with_importtime(_cli("capture", "Call mom"), tmp_path)
+        modules, seconds = _run_with_importtime(_cli("capture", "Call dad"), tmp_path)
+
+        assert "alembic" in first
+        assert "sqlmodel" in modules
+        assert not modules & {*AI_MODULES, *DEFERRED_MODULES}
+        assert seconds < 1.5
+
+    def test_repl_first_prompt(self, tmp_path: Path) -> None:
+        """The REPL reaches its first prompt before the agent is loaded."""
+        modules, seconds = _run_with_importtime("from jdo.repl.loop import run_repl", tmp_path)
+
+        assert "prompt_toolkit" in modules
+        assert not modules & {*AI_MODULES, *DEFERRED_MODULES}
+        assert seconds < 1.5
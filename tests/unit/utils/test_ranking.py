@@ -0,0 +1,81 @@
+"""Tests for local BM25 ranking."""
+
+from __future__ import annotations
+
+from jdo.utils.ranking import BM25Index, RankedMatch, is_unambiguous, tokenize
+
+
+def _index() -> BM25Index:
+    index = BM25Index()
+    index.add("revenue", "Grow revenue: increase recurring revenue through enterprise sales")
+    index.add("fitness", "Get fit: run a marathon and improve health")
+    index.add("app", "Launch mobile app: ship the iOS and Android apps")
+    return index
+
+
+class TestTokenize:
+    """Tests for tokenize."""
+
+    def test_lowercases_drops_stopwords_and_stems_plurals(self) -> None:
+        assert tokenize("Send the Reports to my Stories team!") == [
+            "send",
+            "report",
+            "story",
+            "team",
+        ]
+
+    def test_keeps_double_s(self) -> None:
+        assert tokenize("business class") == ["business", "class"]
+
+
+class TestBM25Index:
+    """Tests for BM25Index."""
+
+    def test_ranks_relevant_document_first(self) -> None:
+        matches = _index().rank("pitch enterprise sales for revenue")
+
+        assert matches[0].key == "revenue"
+        assert all(m.key != "fitness" for m in matches)
+
+    def test_no_overlap_returns_nothing(self) -> None:
+        assert _index().rank("email bob") == []
+
+    def test_update_and_remove_are_incremental(self) -> None:
+        index = _index()
+
+        index.add("app", "Write a cookbook")
+        index.remove("fitness")
+
+        assert index.rank("marathon") == []
+        assert index.rank("cookbook")[0].key == "app"
+        assert len(index) == 2
+
+    def test_sync_adds_changes_and_removes(self) -> None:
+        index = _index()
+
+        index.sync({"revenue": "Grow revenue", "garden": "Plant a vegetable garden"})
+
+        assert "app" not in index
+        assert "fitness" not in index
+        assert index.rank("garden")[0].key == "garden"
+
+    def test_restrict_to_keys(self) -> None:
+        matches = _index().rank("revenue marathon", keys=["fitness"])
+
+        assert [m.key for m in matches] == ["fitness"]
+
+
+class TestIsUnambiguous:
+    """Tests for is_unambiguous."""
+
+    def test_clear_winner(self) -> None:
+        assert is_unambiguous([RankedMatch("a", 3.0), RankedMatch("b", 1.0)])
+
+    def test_close_runner_up(self) -> None:
+        assert not is_unambiguous([RankedMatch("a", 3.0), RankedMatch("b", 2.0)])
+
+    def test_weak_single_match(self) -> None:
+        assert not is_unambiguous([RankedMatch("a", 0.3)])
+
+    def test_empty(self) -> None:
+        assert not is_unambiguous([])
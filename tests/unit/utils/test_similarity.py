@@ -0,0 +1,59 @@
+"""Tests for the MinHash near-duplicate index."""
+
+from __future__ import annotations
+
+from jdo.utils.similarity import NearDuplicateIndex, jaccard, minhash_signature, term_set
+
+
+class TestSignatures:
+    """Tests for term sets and signatures."""
+
+    def test_word_order_does_not_matter(self) -> None:
+        assert term_set("email Bob contract") == term_set("contract: Bob email")
+
+    def test_signature_is_deterministic(self) -> None:
+        terms = term_set("send contract email to Bob")
+
+        assert minhash_signature(terms) == minhash_signature(frozenset(sorted(terms)))
+
+    def test_jaccard(self) -> None:
+        assert jaccard(frozenset({"a", "b"}), frozenset({"b", "c"})) == 1 / 3
+        assert jaccard(frozenset(), frozenset()) == 0.0
+
+
+class TestNearDuplicateIndex:
+    """Tests for NearDuplicateIndex."""
+
+    def test_finds_reworded_duplicate(self) -> None:
+        index = NearDuplicateIndex()
+        index.add("a", "send contract email to Bob")
+        index.add("b", "book flights for the offsite")
+
+        matches = index.query("email Bob re contract", 0.5)
+
+        assert matches == [("a", 0.6)]
+
+    def test_threshold_and_exclude(self) -> None:
+        index = NearDuplicateIndex()
+        index.add("a", "quarterly report for finance")
+
+        assert index.query("quarterly report for finance", 0.5, exclude="a") == []
+        assert index.query("report", 0.5) == []
+
+    def test_update_and_remove(self) -> None:
+        index = NearDuplicateIndex()
+        index.add("a", "call mom about birthday")
+
+        index.add("a", "renew passport")
+        assert index.query("call mom about birthday", 0.5) == []
+        assert index.query("renew my passport", 0.5)[0][0] == "a"
+
+        index.remove("a")
+        assert len(index) == 0
+        assert index.query("renew passport", 0.5) == []
+
+    def test_text_without_terms_is_not_indexed(self) -> None:
+        index = NearDuplicateIndex()
+        index.add("a", "to the")
+
+        assert "a" not in index